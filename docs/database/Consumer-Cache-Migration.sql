@@ -0,0 +1,50 @@
+/********************************************************************************
+* Eclipse Tractus-X - Industry Core Hub                                      
+*                                                                             
+* Copyright (c) 2025 Contributors to the Eclipse Foundation                   
+*                                                                             
+* See the NOTICE file(s) distributed with this work for additional            
+* information regarding copyright ownership.                                  
+*                                                                             
+* This program and the accompanying materials are made available under the    
+* terms of the Apache License, Version 2.0 which is available at              
+* https://www.apache.org/licenses/LICENSE-2.0.                                
+*                                                                             
+* Unless required by applicable law or agreed to in writing, software         
+* distributed under the License is distributed on an "AS IS" BASIS, WITHOUT   
+* WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the    
+* License for the specific language governing permissions and limitations     
+* under the License.                                                          
+*                                                                             
+* SPDX-License-Identifier: Apache-2.0                                         
+*********************************************************************************/
+
+/*
+* Migration of the consumer cache tables, for databases where the backend is not allowed to
+* change the schema itself. The statements use the default table names of the
+* Postgres cache managers (known_connectors, known_dtrs).
+*
+* The backend creates missing tables at startup and rebuilds a known_dtrs table that still
+* has bpnl alone as primary key, so running this script is only needed without those rights.
+*/
+
+-- known_dtrs: one row per DTR, a partner can have several DTRs
+ALTER TABLE public.known_dtrs DROP CONSTRAINT IF EXISTS known_dtrs_pkey;
+ALTER TABLE public.known_dtrs ADD CONSTRAINT known_dtrs_pkey PRIMARY KEY (bpnl, asset_id);
+
+-- Change logs, read by the other replicas to reload only the partners that changed
+CREATE TABLE IF NOT EXISTS public.known_connectors_changes (
+    id SERIAL NOT NULL,
+    bpnl character varying,
+    changed_at timestamp without time zone NOT NULL,
+    CONSTRAINT known_connectors_changes_pkey PRIMARY KEY (id)
+);
+CREATE INDEX IF NOT EXISTS ix_known_connectors_changes_changed_at ON public.known_connectors_changes USING btree (changed_at);
+
+CREATE TABLE IF NOT EXISTS public.known_dtrs_changes (
+    id SERIAL NOT NULL,
+    bpnl character varying,
+    changed_at timestamp without time zone NOT NULL,
+    CONSTRAINT known_dtrs_changes_pkey PRIMARY KEY (id)
+);
+CREATE INDEX IF NOT EXISTS ix_known_dtrs_changes_changed_at ON public.known_dtrs_changes USING btree (changed_at);
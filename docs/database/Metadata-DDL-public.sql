@@ -34,6 +34,10 @@ SET row_security = off;
 SET default_table_access_method = heap;
 
 
+DROP TABLE IF EXISTS public.serialized_part_twin_bulk_job_item;
+DROP TABLE IF EXISTS public.serialized_part_twin_bulk_job;
+DROP TABLE IF EXISTS public.passport_index_failure;
+DROP TABLE IF EXISTS public.passport;
 DROP TABLE IF EXISTS public.serialized_part;
 DROP TABLE IF EXISTS public.jis_part;
 DROP TABLE IF EXISTS public.batch_business_partner;
@@ -135,6 +139,49 @@ CREATE TABLE public.twin_aspect (
     twin_id integer NOT NULL
 );
 
+CREATE TABLE public.passport (
+    twin_aspect_id integer NOT NULL,
+    twin_id integer NOT NULL,
+    catalog_part_id integer,
+    part_type character varying,
+    part_instance_id character varying,
+    passport_id character varying,
+    issue_date date,
+    expiration_date date,
+    modified_date timestamp without time zone DEFAULT (now() AT TIME ZONE 'utc'::text) NOT NULL
+);
+
+CREATE TABLE public.passport_index_failure (
+    twin_aspect_id integer NOT NULL,
+    attempts integer DEFAULT 0 NOT NULL,
+    error character varying,
+    modified_date timestamp without time zone DEFAULT (now() AT TIME ZONE 'utc'::text) NOT NULL
+);
+
+CREATE TABLE public.serialized_part_twin_bulk_job (
+    job_id character varying NOT NULL,
+    status character varying NOT NULL,
+    total integer DEFAULT 0 NOT NULL,
+    auto_create_serial_part_aspect boolean DEFAULT false NOT NULL,
+    created_date timestamp without time zone DEFAULT (now() AT TIME ZONE 'utc'::text) NOT NULL,
+    modified_date timestamp without time zone DEFAULT (now() AT TIME ZONE 'utc'::text) NOT NULL
+);
+
+CREATE TABLE public.serialized_part_twin_bulk_job_item (
+    job_id character varying NOT NULL,
+    part_index integer NOT NULL,
+    manufacturer_id character varying NOT NULL,
+    manufacturer_part_id character varying NOT NULL,
+    part_instance_id character varying NOT NULL,
+    requested_global_id uuid,
+    requested_dtr_aas_id uuid,
+    global_id uuid,
+    dtr_aas_id uuid,
+    status character varying DEFAULT 'pending'::character varying NOT NULL,
+    error character varying,
+    duplicate boolean DEFAULT false NOT NULL
+);
+
 CREATE TABLE public.twin_aspect_registration (
     twin_aspect_id integer NOT NULL,
     enablement_service_stack_id integer NOT NULL,
@@ -321,6 +368,18 @@ ALTER TABLE ONLY public.twin
 ALTER TABLE ONLY public.twin_aspect
     ADD CONSTRAINT pk_twin_aspect PRIMARY KEY (id);
 
+ALTER TABLE ONLY public.passport
+    ADD CONSTRAINT pk_passport PRIMARY KEY (twin_aspect_id);
+
+ALTER TABLE ONLY public.passport_index_failure
+    ADD CONSTRAINT pk_passport_index_failure PRIMARY KEY (twin_aspect_id);
+
+ALTER TABLE ONLY public.serialized_part_twin_bulk_job
+    ADD CONSTRAINT pk_serialized_part_twin_bulk_job PRIMARY KEY (job_id);
+
+ALTER TABLE ONLY public.serialized_part_twin_bulk_job_item
+    ADD CONSTRAINT pk_serialized_part_twin_bulk_job_item PRIMARY KEY (job_id, part_index);
+
 ALTER TABLE ONLY public.twin_aspect_registration
     ADD CONSTRAINT pk_twin_aspect_registration PRIMARY KEY (twin_aspect_id, enablement_service_stack_id);
 
@@ -401,6 +460,16 @@ CREATE INDEX idx_partner_catalog_part_business_partner_id ON public.partner_cata
 CREATE INDEX idx_partner_catalog_part_catalog_part_id ON public.partner_catalog_part USING btree (catalog_part_id);
 CREATE INDEX idx_partner_catalog_part_customer_part_id ON public.partner_catalog_part USING btree (customer_part_id) WITH (deduplicate_items='true');
 
+CREATE INDEX idx_passport_twin_id ON public.passport USING btree (twin_id);
+CREATE INDEX idx_passport_catalog_part_id ON public.passport USING btree (catalog_part_id);
+CREATE INDEX idx_passport_part_type ON public.passport USING btree (part_type);
+CREATE INDEX idx_passport_passport_id ON public.passport USING btree (passport_id);
+CREATE INDEX idx_passport_issue_date ON public.passport USING btree (issue_date);
+CREATE INDEX idx_passport_expiration_date ON public.passport USING btree (expiration_date);
+
+CREATE INDEX idx_serialized_part_twin_bulk_job_status ON public.serialized_part_twin_bulk_job USING btree (status);
+CREATE INDEX idx_serialized_part_twin_bulk_job_created_date ON public.serialized_part_twin_bulk_job USING btree (created_date);
+
 CREATE INDEX idx_serialized_part_part_instance_id ON public.serialized_part USING btree (part_instance_id) WITH (deduplicate_items='true');
 CREATE INDEX idx_serialized_part_partner_catalog_part_id ON public.serialized_part USING btree (partner_catalog_part_id);
 CREATE INDEX idx_serialized_part_van ON public.serialized_part USING btree (van) WITH (deduplicate_items='true');
@@ -415,6 +484,7 @@ CREATE INDEX idx_twin_aspect_twin_id ON public.twin_aspect USING btree (twin_id)
 
 CREATE INDEX idx_twin_created_date ON public.twin USING btree (created_date) WITH (deduplicate_items='true');
 CREATE INDEX idx_twin_modified_date ON public.twin USING btree (modified_date) WITH (deduplicate_items='true');
+CREATE INDEX idx_twin_created_date_id ON public.twin USING btree (created_date, id);
 
 CREATE INDEX idx_twin_exchange_data_exchange_agreement_id ON public.twin_exchange USING btree (data_exchange_agreement_id);
 CREATE INDEX idx_twin_exchange_twin_id ON public.twin_exchange USING btree (twin_id);
@@ -459,6 +529,19 @@ ALTER TABLE ONLY public.serialized_part
 ALTER TABLE ONLY public.twin_aspect
     ADD CONSTRAINT fk_twin_aspect_twin_id FOREIGN KEY (twin_id) REFERENCES public.twin(id) ON UPDATE RESTRICT ON DELETE RESTRICT;
 
+ALTER TABLE ONLY public.passport
+    ADD CONSTRAINT fk_passport_twin_aspect_id FOREIGN KEY (twin_aspect_id) REFERENCES public.twin_aspect(id) ON UPDATE RESTRICT ON DELETE CASCADE;
+ALTER TABLE ONLY public.passport
+    ADD CONSTRAINT fk_passport_twin_id FOREIGN KEY (twin_id) REFERENCES public.twin(id) ON UPDATE RESTRICT ON DELETE RESTRICT;
+ALTER TABLE ONLY public.passport
+    ADD CONSTRAINT fk_passport_catalog_part_id FOREIGN KEY (catalog_part_id) REFERENCES public.catalog_part(id) ON UPDATE RESTRICT ON DELETE SET NULL;
+
+ALTER TABLE ONLY public.passport_index_failure
+    ADD CONSTRAINT fk_passport_index_failure_twin_aspect_id FOREIGN KEY (twin_aspect_id) REFERENCES public.twin_aspect(id) ON UPDATE RESTRICT ON DELETE CASCADE;
+
+ALTER TABLE ONLY public.serialized_part_twin_bulk_job_item
+    ADD CONSTRAINT fk_serialized_part_twin_bulk_job_item_job_id FOREIGN KEY (job_id) REFERENCES public.serialized_part_twin_bulk_job(job_id) ON UPDATE RESTRICT ON DELETE CASCADE;
+
 ALTER TABLE ONLY public.twin_aspect_registration
     ADD CONSTRAINT fk_twin_aspect_registration_twin_aspect_id FOREIGN KEY (twin_aspect_id) REFERENCES public.twin_aspect(id) ON UPDATE RESTRICT ON DELETE RESTRICT;
 ALTER TABLE ONLY public.twin_aspect_registration
@@ -68,6 +68,7 @@ try:
     provider_api_key_header = ConfigManager.get_config("provider.connector.controlplane.apiKeyHeader")
     provider_api_key = ConfigManager.get_config("provider.connector.controlplane.apiKey")
     provider_dataspace_version = ConfigManager.get_config("provider.connector.dataspace.version", default="jupiter")
+    provider_registration_cache_ttl = ConfigManager.get_config("provider.connector.registration_cache.ttl_seconds", default=300)
 
 
     ichub_url = ConfigManager.get_config("hostname")
@@ -104,7 +105,8 @@ try:
             path_submodel_dispatcher=path_submodel_dispatcher,
             authorization=authorization_enabled,
             backend_api_key=backend_api_key,
-            backend_api_key_value=backend_api_key_value
+            backend_api_key_value=backend_api_key_value,
+            registration_cache_ttl=provider_registration_cache_ttl
         )
     
     
@@ -167,13 +169,20 @@ try:
 
 
     # Create the consumer manager
+    cache_sync_config = ConfigManager.get_config("consumer.cache_sync", default={}) or {}
+    cache_refresh_config = ConfigManager.get_config("consumer.cache_refresh", default={}) or {}
     connector_consumer_manager = ConsumerConnectorSyncPostgresMemoryManager(
         connector_consumer_service=consumer_connector_service,
         engine=engine,
         connector_discovery=connector_discovery_service,
         expiration_time=60,  # 60 minutes cache expiration
         logger=logger,
-        verbose=True
+        verbose=True,
+        persist_interval=cache_sync_config.get("persist_interval", 5),
+        sync_mode=cache_sync_config.get("mode", "incremental"),
+        change_retention=cache_sync_config.get("change_retention_seconds", 3600),
+        stale_grace=cache_refresh_config.get("stale_grace_seconds", 300),
+        refresh_jitter=cache_refresh_config.get("jitter", 0.1)
     )
 
     # Create the main connector manager
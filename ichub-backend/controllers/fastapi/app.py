@@ -22,6 +22,7 @@
 # SPDX-License-Identifier: Apache-2.0
 #################################################################################
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, APIRouter
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
@@ -31,7 +32,9 @@ import os
 
 from tools.exceptions import BaseError, ValidationError
 from tools.constants import API_V1
+from utils.pagination import NEXT_CURSOR_HEADER, TOTAL_COUNT_HEADER
 from managers.config.config_manager import ConfigManager
+from managers.enablement_services.submodel_service_manager import SubmodelServiceManagerRegistry
 
 from tractusx_sdk.dataspace.tools import op
 
@@ -87,7 +90,13 @@ tags_metadata = [
     }
 ]
 
-app = FastAPI(title="Industry Core Hub Backend API", version="0.0.1", openapi_tags=tags_metadata)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Close the pooled connections to the submodel services
+    SubmodelServiceManagerRegistry.close_all()
+
+app = FastAPI(title="Industry Core Hub Backend API", version="0.0.1", openapi_tags=tags_metadata, lifespan=lifespan)
 
 # Configure CORS middleware based on environment and configuration
 def get_cors_origins():
@@ -146,6 +155,8 @@ if cors_enabled:
         allow_credentials=True,
         allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"],
         allow_headers=["*"],
+        # Pagination headers of the listing endpoints
+        expose_headers=[NEXT_CURSOR_HEADER, TOTAL_COUNT_HEADER],
     )
 
 ## Include here all the routers for the application.
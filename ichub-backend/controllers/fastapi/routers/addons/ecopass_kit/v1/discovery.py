@@ -20,12 +20,19 @@
 # SPDX-License-Identifier: Apache-2.0
 #################################################################################
 
+import asyncio
+
+from typing import AsyncIterator
+
 from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from fastapi.responses import StreamingResponse
 
 from controllers.fastapi.routers.authentication.auth_api import get_authentication_dependency
 from managers.config.log_manager import LoggingManager
-from managers.addons_service.ecopass_kit.v1 import discovery_manager
-from models.services.addons.ecopass_kit.v1 import DiscoverDppRequest, DiscoveryStatus, DiscoverDppResponse
+from managers.addons_service.ecopass_kit.v1 import discovery_manager, batch_discovery_manager
+from managers.config.config_manager import ConfigManager
+from models.services.addons.ecopass_kit.v1 import DiscoverDppRequest, DiscoveryStatus, DiscoverDppResponse, BatchDiscoverDppRequest, BatchDiscoveryResult
+from utils.streaming import NDJSON_MEDIA_TYPE
 
 logger = LoggingManager.get_logger(__name__)
 
@@ -65,7 +72,7 @@ async def discover_dpp(request: DiscoverDppRequest, background_tasks: Background
         task_id = discovery_manager.generate_task_id()
         
         # Initialize task status
-        discovery_manager.task_manager.create_task(task_id)
+        await asyncio.to_thread(discovery_manager.task_manager.create_task, task_id)
         
         # Validate ID format
         try:
@@ -108,6 +115,60 @@ async def discover_dpp(request: DiscoverDppRequest, background_tasks: Background
         )
 
 
+@router.post(
+    "/batch",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": "One BatchDiscoveryResult per identifier, streamed one JSON object per line as soon as it is known",
+            "content": {NDJSON_MEDIA_TYPE: {}}
+        }
+    }
+)
+async def discover_dpp_batch(request: BatchDiscoverDppRequest) -> StreamingResponse:
+    """
+    Discover the Digital Product Passports of many identifiers in one request.
+    
+    The identifiers are grouped by manufacturerPartId: the BPN owners of every part are looked
+    up once, the shells of its instances are read with one paged lookup per owner, and the DTR
+    and submodel asset contracts are negotiated once for the whole batch.
+    
+    The results are streamed as NDJSON in the order they complete, each line carrying the
+    aggregate progress of the batch (processed, failed and total identifiers). The stream ends
+    once every identifier was processed.
+    
+    Args:
+        request: BatchDiscoverDppRequest with the ids and semanticId
+        
+    Returns:
+        StreamingResponse with one BatchDiscoveryResult per line
+        
+    Raises:
+        HTTPException: If the batch has more identifiers than allowed
+    """
+    max_ids = int(ConfigManager.get_config("consumer.discovery.dpp_discovery.batch.max_ids", default=10000))
+    if len(request.ids) > max_ids:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"A batch can contain at most {max_ids} identifiers, {len(request.ids)} were given"
+        )
+    
+    async def stream() -> AsyncIterator[bytes]:
+        results = batch_discovery_manager.discover(
+            request.ids,
+            request.semantic_id,
+            dtr_policies=request.dtr_policies,
+            governance=request.governance
+        )
+        try:
+            async for result in results:
+                yield BatchDiscoveryResult(**result).model_dump_json(by_alias=True).encode("utf-8") + b"\n"
+        finally:
+            await results.aclose()
+    
+    return StreamingResponse(stream(), media_type=NDJSON_MEDIA_TYPE)
+
+
 @router.get("/{task_id}/status", response_model=DiscoverDppResponse)
 async def get_discovery_status(task_id: str):
     """
@@ -122,14 +183,14 @@ async def get_discovery_status(task_id: str):
     Raises:
         HTTPException: If the task ID is not found
     """
-    if not discovery_manager.task_manager.task_exists(task_id):
+    task = await asyncio.to_thread(discovery_manager.task_manager.get_task, task_id)
+    
+    if task is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Discovery task not found: {task_id}"
         )
     
-    task = discovery_manager.task_manager.get_task(task_id)
-    
     return DiscoverDppResponse(
         taskId=task_id,
         status=DiscoveryStatus(
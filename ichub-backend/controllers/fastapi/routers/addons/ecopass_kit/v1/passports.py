@@ -20,12 +20,16 @@
 # SPDX-License-Identifier: Apache-2.0
 #################################################################################
 
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import date
+from typing import List, Literal, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 
 from controllers.fastapi.routers.authentication.auth_api import get_authentication_dependency
 from managers.addons_service.ecopass_kit.v1 import passports_manager
 from models.services.addons.ecopass_kit.v1 import DigitalProductPassport
+from tools.exceptions import InvalidError
+from utils.async_utils import run_blocking
+from utils.pagination import PageQuery, set_page_headers
 
 router = APIRouter(
     prefix="/passports",
@@ -34,21 +38,49 @@ router = APIRouter(
 
 
 @router.get("", response_model=List[DigitalProductPassport])
-async def get_all_passports():
+async def get_all_passports(
+    response: Response,
+    page: PageQuery = Depends(),
+    status: Optional[Literal["active", "shared"]] = Query(None, description="Only the passports with this status."),
+    manufacturer_part_id: Optional[str] = Query(None, alias="manufacturerPartId", description="Only the passports of this manufacturer part ID."),
+    part_type: Optional[Literal["catalog", "serialized", "batch"]] = Query(None, alias="partType", description="Only the passports of this type of part."),
+    part_instance_id: Optional[str] = Query(None, alias="partInstanceId", description="Only the passports of this part instance ID."),
+    issued_from: Optional[date] = Query(None, alias="issuedFrom", description="Only the passports issued on or after this ISO 8601 date."),
+    issued_before: Optional[date] = Query(None, alias="issuedBefore", description="Only the passports issued before this ISO 8601 date."),
+    expires_from: Optional[date] = Query(None, alias="expiresFrom", description="Only the passports expiring on or after this ISO 8601 date."),
+    expires_before: Optional[date] = Query(None, alias="expiresBefore", description="Only the passports expiring before this ISO 8601 date."),
+):
     """
-    Retrieve all Digital Product Passports (DPPs) from the system.
+    Retrieve the Digital Product Passports (DPPs) from the system.
 
-    This endpoint fetches all twins that have DPP aspects (digital_product_passport semantic ID)
-    and returns them in the standardized DPP format.
+    This endpoint lists the twins that have DPP aspects (digital_product_passport semantic ID)
+    in the standardized DPP format, from the passport metadata stored when the DPPs were written.
+    Without limit and cursor all the matching passports are returned.
 
     Returns:
-        List[DigitalProductPassport]: A list of all Digital Product Passports in the system
+        List[DigitalProductPassport]: The matching Digital Product Passports
 
     Raises:
         HTTPException: If there's an error retrieving the passports
     """
     try:
-        return passports_manager.get_all_passports()
+        result = await run_blocking(
+            passports_manager.get_passports_page,
+            status=status,
+            manufacturer_part_id=manufacturer_part_id,
+            part_type=part_type,
+            part_instance_id=part_instance_id,
+            min_incl_issue_date=issued_from,
+            max_excl_issue_date=issued_before,
+            min_incl_expiration_date=expires_from,
+            max_excl_expiration_date=expires_before,
+            limit=page.get_limit(),
+            cursor=page.cursor,
+            include_total=page.include_total
+        )
+    except InvalidError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error retrieving DPPs: {str(e)}")
-
+    set_page_headers(response, result)
+    return result.items
@@ -27,6 +27,7 @@ from managers.config.log_manager import LoggingManager
 from managers.addons_service.ecopass_kit.v1.provision import provision_manager
 from tools.exceptions import DppNotFoundError, DppShareError
 from models.services.addons.ecopass_kit.v1 import ShareDppRequest, ShareDppResponse
+from utils.async_utils import run_blocking
 
 logger = LoggingManager.get_logger(__name__)
 
@@ -57,13 +58,15 @@ async def share_dpp(request: ShareDppRequest):
     """
     try:
         # Share the DPP using the provision manager
-        result = provision_manager.share_dpp(
+        result = await run_blocking(
+            provision_manager.share_dpp,
             dpp_id=request.dpp_id,
             business_partner_number=request.business_partner_number,
         )
 
         # Register in BPN Discovery
-        bpn_registered = provision_manager.register_in_bpn_discovery(
+        bpn_registered = await run_blocking(
+            provision_manager.register_in_bpn_discovery,
             result["twin_data"]["manufacturer_part_id"]
         )
 
@@ -58,6 +58,21 @@ async def discover_registries(request: DiscoverRegistriesRequest) -> Response:
     )
     return result
 
+@router.get("/metrics")
+async def get_discovery_metrics() -> Response:
+    """
+    Get runtime metrics of the consumer discovery, such as the usage of the
+    shared shell descriptor fetch pool.
+    
+    Returns:
+        Response containing the metrics grouped by component
+    """
+    return Response(
+        content=json.dumps(dtr_manager.consumer.get_metrics(), indent=2),
+        media_type="application/json",
+        status_code=200
+    )
+
 @router.post("/shells")
 async def discover_shells(search_request: DiscoverShellsRequest) -> Response:
     """
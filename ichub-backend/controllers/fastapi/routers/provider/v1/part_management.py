@@ -20,7 +20,7 @@
 # SPDX-License-Identifier: Apache-2.0
 #################################################################################
 
-from fastapi import APIRouter, Query, Depends
+from fastapi import APIRouter, Query, Depends, Request, Response
 from typing import List, Optional
 
 from services.provider.part_management_service import PartManagementService
@@ -38,6 +38,9 @@ from models.services.provider.part_management import (
 )
 from tools.exceptions import exception_responses
 from fastapi.responses import JSONResponse
+from utils.async_utils import AsyncManagerWrapper
+from utils.pagination import PageQuery, set_page_headers
+from utils.streaming import accepts_ndjson, ndjson_response, ndjson_responses
 from controllers.fastapi.routers.authentication.auth_api import get_authentication_dependency
 
 router = APIRouter(
@@ -47,53 +50,67 @@ router = APIRouter(
 )
 part_management_service = PartManagementService()
 
+async_part_service = AsyncManagerWrapper(part_management_service, "PartManagement")
+
 
 @router.get("/catalog-part/{manufacturer_id}/{manufacturer_part_id}", response_model=CatalogPartDetailsReadWithStatus, responses=exception_responses)
 async def part_management_get_catalog_part_details(manufacturer_id: str, manufacturer_part_id: str) -> Optional[CatalogPartDetailsReadWithStatus]:
-    return part_management_service.get_catalog_part_details(manufacturer_id, manufacturer_part_id)
+    return await async_part_service.get_catalog_part_details(manufacturer_id, manufacturer_part_id)
 
-@router.get("/catalog-part", response_model=List[CatalogPartReadWithStatus], responses=exception_responses)
-async def part_management_get_catalog_parts() -> List[CatalogPartReadWithStatus]:
-    return part_management_service.get_catalog_parts()
+@router.get("/catalog-part", response_model=List[CatalogPartReadWithStatus], responses={**exception_responses, **ndjson_responses})
+async def part_management_get_catalog_parts(request: Request, response: Response, page: PageQuery = Depends()) -> List[CatalogPartReadWithStatus]:
+    if accepts_ndjson(request):
+        return ndjson_response(part_management_service.iter_catalog_parts(), CatalogPartReadWithStatus)
+    result = await async_part_service.get_catalog_parts_page(limit=page.get_limit(), cursor=page.cursor, include_total=page.include_total)
+    set_page_headers(response, result)
+    return result.items
 
 @router.post("/catalog-part", response_model=CatalogPartDetailsReadWithStatus, responses=exception_responses)
 async def part_management_create_catalog_part(catalog_part_create: CatalogPartCreate) -> CatalogPartDetailsReadWithStatus:
-    return part_management_service.create_catalog_part(catalog_part_create)
+    return await async_part_service.create_catalog_part(catalog_part_create)
 
 @router.post("/catalog-part/create-partner-mapping", response_model=PartnerCatalogPartRead, responses=exception_responses)
 async def part_management_create_partner_mapping(partner_catalog_part_create: PartnerCatalogPartCreate) -> PartnerCatalogPartRead:
-    return part_management_service.create_partner_catalog_part_mapping(partner_catalog_part_create)
+    return await async_part_service.create_partner_catalog_part_mapping(partner_catalog_part_create)
 
 @router.put("/catalog-part/{manufacturer_id}/{manufacturer_part_id}", response_model=CatalogPartDetailsReadWithStatus, responses=exception_responses)
 async def part_management_update_catalog_part(manufacturer_id: str, manufacturer_part_id: str, catalog_part_update: CatalogPartUpdate) -> CatalogPartDetailsReadWithStatus:
-    return part_management_service.update_catalog_part(manufacturer_id, manufacturer_part_id, catalog_part_update)
+    return await async_part_service.update_catalog_part(manufacturer_id, manufacturer_part_id, catalog_part_update)
 
 @router.delete("/catalog-part/{manufacturer_id}/{manufacturer_part_id}", responses=exception_responses)
 async def part_management_delete_catalog_part(manufacturer_id: str, manufacturer_part_id: str) -> JSONResponse:
-    if part_management_service.delete_catalog_part(manufacturer_id, manufacturer_part_id):
+    if await async_part_service.delete_catalog_part(manufacturer_id, manufacturer_part_id):
         return JSONResponse(status_code=204, content={"description":"Deleted catalog part successfully"})
     else:
         return JSONResponse(status_code=404, content={"description":"Catalog part not found"})
 
-@router.get("/serialized-part", response_model=List[SerializedPartRead], responses=exception_responses)
-async def part_management_get_serialized_parts() -> List[SerializedPartRead]:
-    return part_management_service.get_serialized_parts()
+@router.get("/serialized-part", response_model=List[SerializedPartRead], responses={**exception_responses, **ndjson_responses})
+async def part_management_get_serialized_parts(request: Request, response: Response, page: PageQuery = Depends()) -> List[SerializedPartRead]:
+    if accepts_ndjson(request):
+        return ndjson_response(part_management_service.iter_serialized_parts(), SerializedPartRead)
+    result = await async_part_service.get_serialized_parts_page(limit=page.get_limit(), cursor=page.cursor, include_total=page.include_total)
+    set_page_headers(response, result)
+    return result.items
 
-@router.post("/serialized-part/query", response_model=List[SerializedPartRead], responses=exception_responses)
-async def part_management_query_serialized_parts(query: SerializedPartQuery) -> List[SerializedPartRead]:
-    return part_management_service.get_serialized_parts(query)
+@router.post("/serialized-part/query", response_model=List[SerializedPartRead], responses={**exception_responses, **ndjson_responses})
+async def part_management_query_serialized_parts(query: SerializedPartQuery, request: Request, response: Response, page: PageQuery = Depends()) -> List[SerializedPartRead]:
+    if accepts_ndjson(request):
+        return ndjson_response(part_management_service.iter_serialized_parts(query), SerializedPartRead)
+    result = await async_part_service.get_serialized_parts_page(query, limit=page.get_limit(), cursor=page.cursor, include_total=page.include_total)
+    set_page_headers(response, result)
+    return result.items
 
 @router.post("/serialized-part", response_model=SerializedPartRead, responses=exception_responses)
 async def part_management_create_serialized_part(serialized_part_create: SerializedPartCreate,  auto_generate_catalog_part: bool = Query(False, alias="autoGenerateCatalogPart", description="Automatically create the catalog part for this serialized part"), auto_generate_partner_part: bool = Query(True, alias="autoGeneratePartnerPart", description="Automatically create a catalog partner part")) -> SerializedPartRead:
-    return part_management_service.create_serialized_part(serialized_part_create, auto_generate_catalog_part=auto_generate_catalog_part, auto_generate_partner_part=auto_generate_partner_part)
+    return await async_part_service.create_serialized_part(serialized_part_create, auto_generate_catalog_part=auto_generate_catalog_part, auto_generate_partner_part=auto_generate_partner_part)
 
 @router.put("/serialized-part/{partner_catalog_part_id}/{part_instance_id}", response_model=SerializedPartRead, responses=exception_responses)
 async def part_management_update_serialized_part(partner_catalog_part_id: int, part_instance_id: str, serialized_part_update: SerializedPartUpdate) -> SerializedPartRead:
-    return part_management_service.update_serialized_part(partner_catalog_part_id, part_instance_id, serialized_part_update)
+    return await async_part_service.update_serialized_part(partner_catalog_part_id, part_instance_id, serialized_part_update)
 
 @router.delete("/serialized-part/{partner_catalog_part_id}/{part_instance_id}", responses=exception_responses)
 async def part_management_delete_serialized_part(partner_catalog_part_id: int, part_instance_id: str) -> JSONResponse:
-    if part_management_service.delete_serialized_part(partner_catalog_part_id, part_instance_id):
+    if await async_part_service.delete_serialized_part(partner_catalog_part_id, part_instance_id):
         return JSONResponse(status_code=204, content={"description":"Deleted serialized part successfully"})
     else:
         return JSONResponse(status_code=404, content={"description":"Serialized part not found"})
@@ -20,13 +20,14 @@
 # SPDX-License-Identifier: Apache-2.0
 #################################################################################
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 from typing import Optional, List
 
 from services.provider.partner_management_service import PartnerManagementService
 from models.services.provider.partner_management import BusinessPartnerRead, BusinessPartnerCreate, DataExchangeAgreementRead
 from tools.exceptions import exception_responses
 from utils.async_utils import AsyncManagerWrapper
+from utils.pagination import PageQuery, set_page_headers
 from controllers.fastapi.routers.authentication.auth_api import get_authentication_dependency
 
 router = APIRouter(
@@ -40,9 +41,10 @@ partner_management_service = PartnerManagementService()
 async_partner_service = AsyncManagerWrapper(partner_management_service, "PartnerManagement")
 
 @router.get("/business-partner", response_model=List[BusinessPartnerRead], responses=exception_responses)
-async def partner_management_get_business_partners() -> List[BusinessPartnerRead]:
-    # Clean, simple async call - no manual thread pool management needed!
-    return await async_partner_service.list_business_partners()
+async def partner_management_get_business_partners(response: Response, page: PageQuery = Depends()) -> List[BusinessPartnerRead]:
+    result = await async_partner_service.list_business_partners_page(limit=page.get_limit(), cursor=page.cursor, include_total=page.include_total)
+    set_page_headers(response, result)
+    return result.items
 
 @router.get("/business-partner/{business_partner_number}", response_model=Optional[BusinessPartnerRead], responses=exception_responses)
 async def partner_management_get_business_partner(business_partner_number: str) -> Optional[BusinessPartnerRead]:
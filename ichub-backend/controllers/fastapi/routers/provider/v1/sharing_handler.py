@@ -28,6 +28,7 @@ from models.services.provider.sharing_management import (
     ShareCatalogPart,
 )
 from tools.exceptions import exception_responses
+from utils.async_utils import AsyncManagerWrapper
 from controllers.fastapi.routers.authentication.auth_api import get_authentication_dependency
 
 router = APIRouter(
@@ -37,8 +38,10 @@ router = APIRouter(
 )
 part_sharing_service = SharingService()
 
+async_part_sharing_service = AsyncManagerWrapper(part_sharing_service, "Sharing")
+
 @router.post("/catalog-part", response_model=SharedPartBase, responses=exception_responses)
 async def share_catalog_part(catalog_part_to_share: ShareCatalogPart) -> SharedPartBase:
-    return part_sharing_service.share_catalog_part(
+    return await async_part_sharing_service.share_catalog_part(
         catalog_part_to_share=catalog_part_to_share
     )
\ No newline at end of file
@@ -20,13 +20,17 @@
 # SPDX-License-Identifier: Apache-2.0
 #################################################################################
 
-from fastapi import APIRouter, Body, Header, Depends
+from datetime import datetime
+from email.utils import format_datetime
+from fastapi import APIRouter, Body, Header, Depends, Response
+from fastapi.responses import StreamingResponse
 from typing import Any, Dict, Optional
 from uuid import UUID
 
 from services.provider.submodel_dispatcher_service import SubmodelDispatcherService
 from managers.config.config_manager import ConfigManager
 from tools.exceptions import exception_responses
+from utils.async_utils import AsyncManagerWrapper
 from controllers.fastapi.routers.authentication.auth_api import get_authentication_dependency
 
 path_submodel_dispatcher = ConfigManager.get_config("provider.submodel_dispatcher.apiPath", default="/submodel-dispatcher")
@@ -37,6 +41,8 @@ router = APIRouter(
 )
 submodel_dispatcher_service = SubmodelDispatcherService()
 
+async_submodel_dispatcher_service = AsyncManagerWrapper(submodel_dispatcher_service, "SubmodelDispatcher")
+
 @router.get("/{semantic_id}/{submodel_id}/submodel/$value", response_model=Dict[str, Any], responses=exception_responses)
 @router.get("/{semantic_id}/{submodel_id}/submodel", response_model=Dict[str, Any], responses=exception_responses)
 @router.get("/{semantic_id}/{submodel_id}", response_model=Dict[str, Any], responses=exception_responses)
@@ -44,10 +50,32 @@ async def submodel_dispatcher_get_submodel_content_submodel_value(
     semantic_id: str,
     submodel_id: UUID,
     edc_bpn: Optional[str] = Header(default=None, alias="Edc-Bpn", description="The BPN of the consumer delivered by the EDC Data Plane"),
-    edc_contract_agreement_id: Optional[str] = Header(default=None, alias="Edc-Contract-Agreement-Id", description="The contract agreement id of the consumer delivered by the EDC Data Plane")
+    edc_contract_agreement_id: Optional[str] = Header(default=None, alias="Edc-Contract-Agreement-Id", description="The contract agreement id of the consumer delivered by the EDC Data Plane"),
+    if_none_match: Optional[str] = Header(default=None, alias="If-None-Match", description="Entity tags of the submodel versions the consumer already has")
     ) -> Dict[str, Any]:
 
-    return submodel_dispatcher_service.get_submodel_content(edc_bpn, edc_contract_agreement_id, semantic_id, submodel_id)
+    if submodel_dispatcher_service.serves_files:
+        # Stored files are sent as they are, without parsing and serializing them again
+        submodel_file = await async_submodel_dispatcher_service.get_submodel_file(edc_bpn, edc_contract_agreement_id, semantic_id, submodel_id)
+        headers = _get_validator_headers(submodel_file.etag, submodel_file.last_modified)
+        if submodel_file.matches(if_none_match):
+            submodel_file.close()
+            return Response(status_code=304, headers=headers)
+        if submodel_file.body is not None:
+            return Response(content=submodel_file.body, media_type="application/json", headers=headers)
+        # Streamed from the descriptor the entity tag was computed from, not reopened by path
+        headers["Content-Length"] = str(submodel_file.size)
+        return StreamingResponse(submodel_file.iter_content(), media_type="application/json", headers=headers)
+
+    # Cached documents are served without leaving the event loop
+    document = submodel_dispatcher_service.peek_submodel_document(semantic_id, submodel_id)
+    if document is None:
+        document = await async_submodel_dispatcher_service.get_submodel_document(edc_bpn, edc_contract_agreement_id, semantic_id, submodel_id)
+
+    headers = _get_validator_headers(document.etag, document.last_modified)
+    if document.matches(if_none_match):
+        return Response(status_code=304, headers=headers)
+    return Response(content=document.body, media_type="application/json", headers=headers)
 
 
 @router.post("/{semantic_id}/{submodel_id}/submodel", status_code=204, responses=exception_responses)
@@ -56,11 +84,21 @@ async def submodel_dispatcher_upload_submodel(
     submodel_id: UUID,
     submodel_payload: Dict[str, Any] = Body(..., description="The submodel JSON payload")
 ) -> None:
-    return submodel_dispatcher_service.upload_submodel(submodel_id, semantic_id, submodel_payload)
+    return await async_submodel_dispatcher_service.upload_submodel(submodel_id, semantic_id, submodel_payload)
 
 @router.delete("/{semantic_id}/{submodel_id}/submodel", status_code=204, responses=exception_responses)
 async def submodel_dispatcher_delete_submodel(
     semantic_id: str,
     submodel_id: UUID
 ) -> None:
-    return submodel_dispatcher_service.delete_submodel(submodel_id, semantic_id)
\ No newline at end of file
+    return await async_submodel_dispatcher_service.delete_submodel(submodel_id, semantic_id)
+
+
+def _get_validator_headers(etag: str, last_modified: datetime) -> Dict[str, str]:
+    return {
+        "ETag": etag,
+        "Last-Modified": format_datetime(last_modified, usegmt=True),
+        # Clients may keep the submodel but have to revalidate it on every use
+        "Cache-Control": "no-cache"
+    }
+
@@ -21,22 +21,24 @@
 # SPDX-License-Identifier: Apache-2.0
 #################################################################################
 
-from fastapi import APIRouter, Query, Depends
+from fastapi import APIRouter, Query, Depends, BackgroundTasks, Request, Response, status
 from fastapi.responses import JSONResponse
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from services.provider.twin_management_service import TwinManagementService
+from services.provider.twin_management_service import TwinManagementService, SERIALIZED_PART_TWINS_PAGE_SIZE
 from models.services.provider.twin_management import (
-    TwinRead, TwinAspectRead, TwinAspectCreate,
+    TwinRead, TwinAspectRead, TwinAspectCreate, TwinAspectBulkCreateResult,
     CatalogPartTwinRead, CatalogPartTwinDetailsRead,
     CatalogPartTwinCreate, CatalogPartTwinShareCreate,
     SerializedPartTwinRead, SerializedPartTwinDetailsRead,
     SerializedPartTwinCreate, SerializedPartTwinShareCreate,
-    SerializedPartTwinUnshareCreate
+    SerializedPartTwinUnshareCreate, SerializedPartTwinBulkJobRead
 )
 from tools.exceptions import exception_responses
 from utils.async_utils import AsyncManagerWrapper
+from utils.pagination import PageQuery, set_page_headers
+from utils.streaming import accepts_ndjson, ndjson_response, ndjson_responses
 from controllers.fastapi.routers.authentication.auth_api import get_authentication_dependency
 
 router = APIRouter(
@@ -49,10 +51,21 @@ twin_management_service = TwinManagementService()
 # Create universal async wrapper - works with any service!
 async_twin_service = AsyncManagerWrapper(twin_management_service, "TwinManagement")
 
-@router.get("/catalog-part-twin", response_model=List[CatalogPartTwinRead], responses=exception_responses)
-async def twin_management_get_catalog_part_twins(include_data_exchange_agreements: bool = False) -> List[CatalogPartTwinRead]:
-    # Clean, simple async call!
-    return await async_twin_service.get_catalog_part_twins(include_data_exchange_agreements=include_data_exchange_agreements)
+@router.get("/catalog-part-twin", response_model=List[CatalogPartTwinRead], responses={**exception_responses, **ndjson_responses})
+async def twin_management_get_catalog_part_twins(request: Request, response: Response, include_data_exchange_agreements: bool = False, page: PageQuery = Depends()) -> List[CatalogPartTwinRead]:
+    if accepts_ndjson(request):
+        return ndjson_response(
+            twin_management_service.iter_catalog_part_twins(include_data_exchange_agreements=include_data_exchange_agreements),
+            CatalogPartTwinRead
+        )
+    result = await async_twin_service.get_catalog_part_twins_page(
+        include_data_exchange_agreements=include_data_exchange_agreements,
+        limit=page.get_limit(),
+        cursor=page.cursor,
+        include_total=page.include_total
+    )
+    set_page_headers(response, result)
+    return result.items
 
 @router.get("/catalog-part-twin/{global_id}", response_model=Optional[CatalogPartTwinDetailsRead], responses=exception_responses)
 async def twin_management_get_catalog_part_twin(global_id: UUID) -> Optional[CatalogPartTwinDetailsRead]:
@@ -61,14 +74,14 @@ async def twin_management_get_catalog_part_twin(global_id: UUID) -> Optional[Cat
 
 @router.get("/catalog-part-twin/{manufacturer_id}/{manufacturer_part_id}", response_model=Optional[CatalogPartTwinDetailsRead], responses=exception_responses)
 async def twin_management_get_catalog_part_twin_from_manufacturer(manufacturer_id: str, manufacturer_part_id: str) -> Optional[CatalogPartTwinDetailsRead]:
-    return twin_management_service.get_catalog_part_twin_details(manufacturer_id, manufacturer_part_id)
+    return await async_twin_service.get_catalog_part_twin_details(manufacturer_id, manufacturer_part_id)
 
 @router.post("/catalog-part-twin", response_model=TwinRead, responses=exception_responses)
 async def twin_management_create_catalog_part_twin(
     catalog_part_twin_create: CatalogPartTwinCreate,
     auto_create_part_type_information: bool = Query(True, alias="autoCreatePartTypeInformation", description="Automatically create part type information submodel if not present.")
 ) -> TwinRead:
-    return twin_management_service.create_catalog_part_twin(
+    return await async_twin_service.create_catalog_part_twin(
         catalog_part_twin_create,
         auto_create_part_type_information
     )
@@ -79,20 +92,23 @@ async def twin_management_create_catalog_part_twin(
     **exception_responses
 })
 async def twin_management_share_catalog_part_twin(catalog_part_twin_share: CatalogPartTwinShareCreate):
-    if twin_management_service.create_catalog_part_twin_share(catalog_part_twin_share):
+    if await async_twin_service.create_catalog_part_twin_share(catalog_part_twin_share):
         return JSONResponse(status_code=201, content={"description":"Catalog part twin shared successfully"})
     else:
         return JSONResponse(status_code=204, content={"description":"Catalog part twin already shared"})
 
-@router.get("/serialized-part-twin", response_model=List[SerializedPartTwinRead], responses=exception_responses)
+@router.get("/serialized-part-twin", response_model=List[SerializedPartTwinRead], responses={**exception_responses, **ndjson_responses})
 async def twin_management_get_all_serialized_part_twins(
+    request: Request,
+    response: Response,
     include_data_exchange_agreements: bool = False,
     manufacturerId: Optional[str] = None,
     manufacturerPartId: Optional[str] = None,
     customerPartId: Optional[str] = None,
     partInstanceId: Optional[str] = None,
     van: Optional[str] = None,
-    businessPartnerNumber: Optional[str] = None
+    businessPartnerNumber: Optional[str] = None,
+    page: PageQuery = Depends()
 ) -> List[SerializedPartTwinRead]:
     from models.services.provider.part_management import SerializedPartQuery
     
@@ -115,25 +131,68 @@ async def twin_management_get_all_serialized_part_twins(
             query_data[field_name] = value
     
     query = SerializedPartQuery(**query_data)
+
+    if accepts_ndjson(request):
+        # The export streams all the matching twins, not only a page of the newest ones
+        return ndjson_response(
+            twin_management_service.iter_serialized_part_twins(query, include_data_exchange_agreements=include_data_exchange_agreements),
+            SerializedPartTwinRead
+        )
     
-    return twin_management_service.get_serialized_part_twins(
+    result = await async_twin_service.get_serialized_part_twins_page(
         serialized_part_query=query,
-        include_data_exchange_agreements=include_data_exchange_agreements
+        include_data_exchange_agreements=include_data_exchange_agreements,
+        limit=page.get_limit(default=SERIALIZED_PART_TWINS_PAGE_SIZE),
+        cursor=page.cursor,
+        include_total=page.include_total
     )
+    set_page_headers(response, result)
+    return result.items
 
 @router.get("/serialized-part-twin/{global_id}", response_model=Optional[SerializedPartTwinDetailsRead], responses=exception_responses)
 async def twin_management_get_serialized_part_twin(global_id: UUID) -> Optional[SerializedPartTwinDetailsRead]:
-    return twin_management_service.get_serialized_part_twin_details(global_id)
+    return await async_twin_service.get_serialized_part_twin_details(global_id)
 
 @router.post("/serialized-part-twin", response_model=TwinRead, responses=exception_responses)
 async def twin_management_create_serialized_part_twin(serialized_part_twin_create: SerializedPartTwinCreate, auto_create_serial_part: bool = Query(True, alias="autoCreatePartTypeInformation", description="Automatically create part type information submodel if not present.")) -> TwinRead:
-    return twin_management_service.create_serialized_part_twin(serialized_part_twin_create, auto_create_serial_part)
+    return await async_twin_service.create_serialized_part_twin(serialized_part_twin_create, auto_create_serial_part)
+
+@router.post("/serialized-part-twin/bulk", response_model=SerializedPartTwinBulkJobRead, status_code=status.HTTP_202_ACCEPTED, responses=exception_responses)
+async def twin_management_create_serialized_part_twins(serialized_part_twin_creates: List[SerializedPartTwinCreate], background_tasks: BackgroundTasks, auto_create_serial_part: bool = Query(True, alias="autoCreatePartTypeInformation", description="Automatically create the SerialPart submodel of every registered twin, as for a single serialized part twin.")) -> SerializedPartTwinBulkJobRead:
+    job = await async_twin_service.create_serialized_part_twins_job(serialized_part_twin_creates, auto_create_serial_part)
+    background_tasks.add_task(twin_management_service.run_serialized_part_twins_job, job.job_id)
+    return job
+
+@router.get("/serialized-part-twin/bulk/{job_id}", response_model=SerializedPartTwinBulkJobRead, responses=exception_responses)
+async def twin_management_get_serialized_part_twins_job(job_id: str) -> SerializedPartTwinBulkJobRead:
+    return await async_twin_service.get_serialized_part_twins_job(job_id)
+
+@router.post("/serialized-part-twin/bulk/{job_id}/resume", response_model=SerializedPartTwinBulkJobRead, status_code=status.HTTP_202_ACCEPTED, responses=exception_responses)
+async def twin_management_resume_serialized_part_twins_job(job_id: str, background_tasks: BackgroundTasks) -> SerializedPartTwinBulkJobRead:
+    job = await async_twin_service.resume_serialized_part_twins_job(job_id)
+    background_tasks.add_task(twin_management_service.run_serialized_part_twins_job, job_id)
+    return job
 
 @router.post("/twin-aspect", response_model=TwinAspectRead, responses=exception_responses)
 async def twin_management_create_twin_aspect(twin_aspect_create: TwinAspectCreate, default: bool = True) -> TwinAspectRead:
     if default:
-        return twin_management_service.create_twin_aspect(twin_aspect_create)
-    return twin_management_service.create_or_update_twin_aspect_not_default(twin_aspect_create)
+        return await async_twin_service.create_twin_aspect(twin_aspect_create)
+    return await async_twin_service.create_or_update_twin_aspect_not_default(twin_aspect_create)
+
+@router.post("/twin-aspect/bulk", response_model=List[TwinAspectBulkCreateResult], responses=exception_responses)
+async def twin_management_create_twin_aspects(twin_aspect_creates: List[TwinAspectCreate], update: bool = False) -> List[TwinAspectBulkCreateResult]:
+    """
+    Create many twin aspects at once. Aspects already stored in the submodel service are left
+    unchanged, unless update is set: then their payload is uploaded again.
+    """
+    return await async_twin_service.create_twin_aspects(twin_aspect_creates, update=update)
+
+@router.get("/offer-registration/metrics", response_model=Dict[str, Any], responses=exception_responses)
+async def twin_management_get_offer_registration_metrics() -> Dict[str, Any]:
+    """
+    Get the counters of the cache of the assets, policies and contracts registered in the provider connector.
+    """
+    return twin_management_service.get_offer_registration_metrics()
 
 @router.post("/serialized-part-twin/share", responses={
     201: {"description": "Catalog part twin shared successfully"},
@@ -141,7 +200,7 @@ async def twin_management_create_twin_aspect(twin_aspect_create: TwinAspectCreat
     **exception_responses
 })
 async def twin_management_share_serialized_part_twin(serialized_part_twin_share: SerializedPartTwinShareCreate):
-    if twin_management_service.create_serialized_part_twin_share(serialized_part_twin_share):
+    if await async_twin_service.create_serialized_part_twin_share(serialized_part_twin_share):
         return JSONResponse(status_code=201, content={"description":"Serialized part twin shared successfully"})
     else:
         return JSONResponse(status_code=204, content=None)
@@ -152,7 +211,7 @@ async def twin_management_share_serialized_part_twin(serialized_part_twin_share:
     **exception_responses
 })
 async def twin_management_unshare_serialized_part_twin(serialized_part_twin_unshare: SerializedPartTwinUnshareCreate):
-    if twin_management_service.part_twin_unshare(serialized_part_twin_unshare):
+    if await async_twin_service.part_twin_unshare(serialized_part_twin_unshare):
         return JSONResponse(status_code=201, content={"description":"Serialized part twin unshared successfully"})
     else:
         return JSONResponse(status_code=204, content=None)
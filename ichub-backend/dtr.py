@@ -22,7 +22,7 @@
 
 from managers.enablement_services import DtrManager
 
-from managers.enablement_services.consumer import DtrConsumerSyncPostgresMemoryManager
+from managers.enablement_services.consumer import DtrConsumerSyncPostgresMemoryManager, ShellFetchExecutor
 from managers.enablement_services.provider import DtrProviderManager
 
 import logging
@@ -49,10 +49,21 @@ try:
     dtr_filter_operand_left = ConfigManager.get_config('consumer.discovery.digitalTwinRegistry.dct_type_filter.operandLeft')
     dtr_filter_operator = ConfigManager.get_config('consumer.discovery.digitalTwinRegistry.dct_type_filter.operator')
     dtr_dct_type = ConfigManager.get_config('consumer.discovery.digitalTwinRegistry.dct_type_filter.operandRight')
+    dtr_shell_discovery_config = ConfigManager.get_config('consumer.discovery.digitalTwinRegistry.shell_discovery', default={}) or {}
+    cache_sync_config = ConfigManager.get_config('consumer.cache_sync', default={}) or {}
+    cache_refresh_config = ConfigManager.get_config('consumer.cache_refresh', default={}) or {}
+    dtr_submodel_fetch_config = ConfigManager.get_config('consumer.discovery.digitalTwinRegistry.submodel_fetch', default={}) or {}
     if(engine is None or connector_manager is None or connector_manager.consumer is None):
         dtr_start_up_error = True
 
     if(not dtr_start_up_error):
+        # One shell fetch pool for the whole process, shared by every discovery request
+        shell_fetch_executor = ShellFetchExecutor(
+            max_workers=dtr_shell_discovery_config.get("fetch_pool_size", 32),
+            max_per_dataplane=dtr_shell_discovery_config.get("max_requests_per_dataplane", 8)
+        )
+        ShellFetchExecutor.set_shared(shell_fetch_executor)
+
         dtr_consumer_manager = DtrConsumerSyncPostgresMemoryManager(
             engine=engine,
             connector_consumer_manager=connector_manager.consumer,
@@ -61,7 +72,23 @@ try:
             dct_type_id=dtr_dct_type_id,
             dct_type_key=dtr_filter_operand_left,
             operator=dtr_filter_operator,
-            dct_type=dtr_dct_type
+            dct_type=dtr_dct_type,
+            parallel_dtr_discovery=dtr_shell_discovery_config.get("parallel", True),
+            max_dtr_workers=dtr_shell_discovery_config.get("max_workers", 5),
+            dtr_timeout=dtr_shell_discovery_config.get("dtr_timeout", 60),
+            shell_fetch_executor=shell_fetch_executor,
+            batch_fetch_threshold=dtr_shell_discovery_config.get("batch_fetch_threshold", 50),
+            batch_page_size=dtr_shell_discovery_config.get("batch_page_size", 100),
+            shell_cache_max_entries=dtr_shell_discovery_config.get("cache_max_entries", 10000),
+            shell_cache_ttl=dtr_shell_discovery_config.get("cache_ttl_seconds", 300),
+            persist_interval=cache_sync_config.get("persist_interval", 5),
+            sync_mode=cache_sync_config.get("mode", "incremental"),
+            change_retention=cache_sync_config.get("change_retention_seconds", 3600),
+            stale_grace=cache_refresh_config.get("stale_grace_seconds", 300),
+            refresh_jitter=cache_refresh_config.get("jitter", 0.1),
+            edr_refresh_margin=dtr_submodel_fetch_config.get("edr_refresh_margin_seconds", 30),
+            negotiation_backoff_base=dtr_submodel_fetch_config.get("negotiation_backoff_base_seconds", 1),
+            negotiation_backoff_max=dtr_submodel_fetch_config.get("negotiation_backoff_max_seconds", 60)
         )
 
     """
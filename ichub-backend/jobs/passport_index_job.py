@@ -0,0 +1,71 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+from typing import TYPE_CHECKING
+
+from managers.config.log_manager import LoggingManager
+
+if TYPE_CHECKING:
+    # Only for the type hint: importing the EcoPass managers connects to the consumer services
+    from managers.addons_service.ecopass_kit.v1.passports import PassportsManager
+
+logger = LoggingManager.get_logger(__name__)
+
+
+class PassportIndexJob:
+    """
+    Kubernetes Job that stores the metadata of the Digital Product Passports that have none yet,
+    e.g. the ones written before the passport table existed.
+
+    Runs once per deployment instead of in every backend worker. Passports that keep failing
+    are recorded and no longer retried, see PassportsManager.index_missing_passports.
+    """
+
+    def __init__(self, passports_manager: "PassportsManager", enabled: bool = True):
+        """
+        Initialize the passport index job.
+
+        Args:
+            passports_manager: The passports manager indexing the passports
+            enabled (bool): Whether the index job is enabled. Defaults to True.
+        """
+        self.passports_manager = passports_manager
+        self.enabled = enabled
+
+    def run(self) -> int:
+        """
+        Execute the indexing process.
+
+        Runs synchronously - designed for Kubernetes Job execution.
+
+        Returns:
+            int: The number of passports indexed
+        """
+        if not self.enabled:
+            logger.info("[PassportIndexJob] Passport indexing is disabled.")
+            return 0
+
+        logger.info("[PassportIndexJob] Indexing the passports without metadata...")
+        indexed = self.passports_manager.index_missing_passports()
+        logger.info(f"[PassportIndexJob] Passport indexing completed, {indexed} passports indexed.")
+        return indexed
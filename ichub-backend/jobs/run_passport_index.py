@@ -0,0 +1,86 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import modules
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+sys.dont_write_bytecode = True
+
+from managers.config.log_manager import LoggingManager
+from managers.config.config_manager import ConfigManager
+
+LoggingManager.init_logging()
+logger = LoggingManager.get_logger(__name__)
+
+ConfigManager.load_config()
+
+from database import wait_for_db_connection
+from managers.addons_service.ecopass_kit.v1 import passports_manager
+from managers.enablement_services.submodel_service_manager import SubmodelServiceManagerRegistry
+from jobs.passport_index_job import PassportIndexJob
+
+
+def run_passport_index_job():
+    """
+    Run the passport index job.
+
+    This function initializes only the components needed to index the passports
+    (database and submodel service), without starting the FastAPI application.
+
+    Returns:
+        int: Exit code - 0 for success, 1 for failure.
+    """
+    try:
+        logger.info("=" * 60)
+        logger.info("Starting passport index job...")
+        logger.info("=" * 60)
+
+        try:
+            wait_for_db_connection()
+            logger.info("✓ Database connection established")
+        except Exception as e:
+            logger.error(f"✗ Database connection failed: {e}", exc_info=True)
+            return 1
+
+        PassportIndexJob(passports_manager=passports_manager, enabled=True).run()
+
+        logger.info("=" * 60)
+        logger.info("✓ Passport index job completed successfully.")
+        logger.info("=" * 60)
+        return 0
+
+    except Exception as e:
+        logger.error("=" * 60)
+        logger.error(f"✗ Passport index job failed with exception: {e}", exc_info=True)
+        logger.error("=" * 60)
+        return 1
+    finally:
+        # Close the pooled connections to the submodel services
+        SubmodelServiceManagerRegistry.close_all()
+
+
+if __name__ == "__main__":
+    exit_code = run_passport_index_job()
+    sys.exit(exit_code)
@@ -21,4 +21,5 @@
 #################################################################################
 
 from .discovery import discovery_manager
+from .batch_discovery import batch_discovery_manager
 from .passports import passports_manager
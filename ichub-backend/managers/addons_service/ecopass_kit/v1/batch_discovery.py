@@ -0,0 +1,281 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Set
+
+from managers.addons_service.ecopass_kit.v1.discovery import DiscoveryManager, discovery_manager
+from managers.config.config_manager import ConfigManager
+from managers.config.log_manager import LoggingManager
+from dtr import dtr_manager
+
+logger = LoggingManager.get_logger(__name__)
+
+
+class BatchDiscoveryManager:
+    """
+    Discovers the Digital Product Passports of many identifiers in one request.
+    
+    The identifiers are grouped by manufacturerPartId. The BPNs owning each part are looked up
+    once, and the shells of the instances of a part are read from the DTR of each BPN with one
+    paged shellsByAssetLink lookup by manufacturerPartId, instead of one lookup per identifier.
+    The first lookup against a BPN runs alone, so the DTR contract of the partner is negotiated
+    once and reused by all the other lookups of the batch. The submodel reads share one
+    negotiation per submodel asset through the EDR token cache of the DTR consumer.
+    """
+    
+    def __init__(self, discovery_manager: DiscoveryManager, max_concurrency: int = 8, page_size: int = 100) -> None:
+        """
+        Initialize the batch discovery manager.
+        
+        Args:
+            discovery_manager: Discovery manager used to parse the identifiers and look up the BPNs
+            max_concurrency: Maximum number of DTR lookups and submodel reads running at the same time
+            page_size: Number of shells read per page of a shellsByAssetLink lookup
+        """
+        self.discovery_manager = discovery_manager
+        self.max_concurrency = max(1, max_concurrency)
+        self.page_size = page_size
+    
+    async def discover(
+        self,
+        ids: List[str],
+        semantic_id: str,
+        dtr_policies: Optional[List[Dict[str, Any]]] = None,
+        governance: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Discover the passports of the identifiers, yielding every result as soon as it is known.
+        
+        Args:
+            ids: Identifiers in the format CX:<manufacturerPartId>:<partInstanceId>, duplicates are discovered once
+            semantic_id: The semantic ID of the submodel to retrieve
+            dtr_policies: Optional policies to apply for DTR access
+            governance: Optional governance policies for submodel consumption
+            
+        Yields:
+            One result per identifier, with its status, the shell and submodel data found or the error,
+            and the aggregate progress of the batch
+        """
+        unique_ids = list(dict.fromkeys(ids))
+        batch = _BatchRun(self, semantic_id, dtr_policies, governance, total=len(unique_ids))
+        
+        # Group the instances by manufacturerPartId
+        parts: Dict[str, Dict[str, str]] = {}
+        for id_str in unique_ids:
+            try:
+                manufacturer_part_id, part_instance_id = self.discovery_manager.parse_id(id_str)
+            except ValueError as e:
+                batch.fail(id_str, str(e))
+                continue
+            parts.setdefault(manufacturer_part_id, {})[part_instance_id] = id_str
+        
+        logger.info(f"[Batch Discovery] Discovering {len(unique_ids)} identifier(s) of {len(parts)} manufacturerPartId(s)")
+        
+        part_tasks = [asyncio.create_task(batch.discover_part(manufacturer_part_id, instances)) for manufacturer_part_id, instances in parts.items()]
+        try:
+            while batch.processed < batch.total:
+                yield await batch.results.get()
+        finally:
+            # The client disconnected or the batch is complete, nothing is left running
+            for part_task in part_tasks:
+                part_task.cancel()
+
+
+class _BatchRun:
+    """State of one batch discovery: the pending results, the concurrency limit and the negotiated registries."""
+    
+    def __init__(self, manager: BatchDiscoveryManager, semantic_id: str, dtr_policies: Optional[List[Dict[str, Any]]], governance: Optional[Dict[str, Any]], total: int) -> None:
+        self.manager = manager
+        self.semantic_id = semantic_id
+        self.dtr_policies = dtr_policies
+        self.governance = governance
+        self.total = total
+        self.processed = 0
+        self.failed = 0
+        self.results: asyncio.Queue = asyncio.Queue()
+        self.semaphore = asyncio.Semaphore(manager.max_concurrency)
+        self._registries_ready: Dict[str, asyncio.Event] = {}
+        self._emitted: Set[str] = set()
+    
+    def _emit(self, id_str: str, status: str, bpn: Optional[str] = None, digital_twin: Optional[Dict[str, Any]] = None, data: Optional[Dict[str, Any]] = None, error: Optional[str] = None) -> None:
+        # Every identifier is reported exactly once, the stream ends once all of them are
+        if id_str in self._emitted:
+            return
+        self._emitted.add(id_str)
+        self.processed += 1
+        if status == "failed":
+            self.failed += 1
+        self.results.put_nowait({
+            "id": id_str,
+            "status": status,
+            "bpn": bpn,
+            "digital_twin": digital_twin,
+            "data": data,
+            "error": error,
+            "processed": self.processed,
+            "failed": self.failed,
+            "total": self.total
+        })
+    
+    def fail(self, id_str: str, error: str, bpn: Optional[str] = None) -> None:
+        self._emit(id_str, "failed", bpn=bpn, error=error)
+    
+    @asynccontextmanager
+    async def _registry(self, bpn: str) -> AsyncIterator[None]:
+        """Let the first lookup against a BPN run alone, the others wait until its DTR was negotiated."""
+        ready = self._registries_ready.get(bpn)
+        if ready is None:
+            ready = self._registries_ready[bpn] = asyncio.Event()
+            try:
+                yield
+            finally:
+                ready.set()
+        else:
+            await ready.wait()
+            yield
+    
+    async def discover_part(self, manufacturer_part_id: str, instances: Dict[str, str]) -> None:
+        """
+        Discover the passports of the instances of one part, across the BPNs owning it.
+        
+        Any error escaping the discovery fails the instances not reported yet, so the batch always completes.
+        """
+        remaining = dict(instances)
+        submodel_tasks: List[asyncio.Task] = []
+        try:
+            try:
+                bpn_list = await self.manager.discovery_manager.discover_bpn(manufacturer_part_id)
+            except ValueError as e:
+                bpn_list, error = [], str(e)
+            else:
+                error = f"No BPN found for manufacturerPartId: {manufacturer_part_id}"
+            
+            for bpn in bpn_list:
+                if not remaining:
+                    break
+                try:
+                    shells = await self._lookup_shells(bpn, manufacturer_part_id, set(remaining))
+                except Exception as e:
+                    logger.warning(f"[Batch Discovery] Shell lookup of {manufacturer_part_id} in BPN {bpn} failed: {str(e)}")
+                    continue
+                for part_instance_id, shell in shells.items():
+                    submodel_tasks.append(asyncio.create_task(self._consume(bpn, remaining.pop(part_instance_id), shell)))
+            
+            if bpn_list:
+                error = f"Digital twin shell with semanticId '{self.semantic_id}' not found across {len(bpn_list)} BPN(s)"
+            for id_str in remaining.values():
+                self.fail(id_str, error)
+            await asyncio.gather(*submodel_tasks)
+        except Exception as e:
+            logger.error(f"[Batch Discovery] Discovery of {manufacturer_part_id} failed: {str(e)}")
+            for id_str in instances.values():
+                self.fail(id_str, f"Discovery failed: {str(e)}")
+        finally:
+            for submodel_task in submodel_tasks:
+                submodel_task.cancel()
+    
+    async def _lookup_shells(self, bpn: str, manufacturer_part_id: str, part_instance_ids: Set[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Find the shells of the instances of a part in the DTRs of a BPN, page by page.
+        
+        Returns:
+            The shells carrying the requested semantic ID, by partInstanceId
+        """
+        query_spec = [{"key": "manufacturerPartId", "value": manufacturer_part_id}]
+        found: Dict[str, Dict[str, Any]] = {}
+        cursor = None
+        while True:
+            async with self._registry(bpn), self.semaphore:
+                result = await asyncio.to_thread(
+                    dtr_manager.consumer.discover_shells,
+                    counter_party_id=bpn,
+                    query_spec=query_spec,
+                    dtr_policies=self.dtr_policies,
+                    limit=self.manager.page_size,
+                    cursor=cursor
+                )
+            if result.get("error"):
+                logger.warning(f"[Batch Discovery] Shell lookup of {manufacturer_part_id} in BPN {bpn} failed: {result['error']}")
+                return found
+            
+            for shell in result.get("shellDescriptors", []):
+                part_instance_id = get_specific_asset_id(shell, "partInstanceId")
+                if part_instance_id in part_instance_ids and part_instance_id not in found \
+                        and self.manager.discovery_manager.find_matching_submodel(shell, self.semantic_id):
+                    found[part_instance_id] = shell
+            
+            cursor = (result.get("pagination") or {}).get("next")
+            if not cursor or len(found) == len(part_instance_ids):
+                return found
+    
+    async def _consume(self, bpn: str, id_str: str, shell: Dict[str, Any]) -> None:
+        """Read the passport of one shell."""
+        try:
+            submodel = self.manager.discovery_manager.find_matching_submodel(shell, self.semantic_id)
+            async with self.semaphore:
+                submodel_result = await asyncio.to_thread(
+                    dtr_manager.consumer.discover_submodel,
+                    counter_party_id=bpn,
+                    id=shell.get("id"),
+                    dtr_policies=self.dtr_policies,
+                    governance=self.governance,
+                    submodel_id=submodel.get("id")
+                )
+        except Exception as e:
+            self.fail(id_str, f"Submodel discovery failed: {str(e)}", bpn=bpn)
+            return
+        
+        submodel_data = submodel_result.get("submodel")
+        if not submodel_data:
+            self.fail(id_str, submodel_result.get("error") or "No submodel data retrieved", bpn=bpn)
+            return
+        self._emit(id_str, "completed", bpn=bpn, digital_twin=shell, data=submodel_data)
+
+
+def get_specific_asset_id(shell: Dict[str, Any], name: str) -> Optional[str]:
+    """
+    Get the value of a specific asset ID of a shell descriptor.
+    
+    Args:
+        shell: The shell descriptor
+        name: Name of the specific asset ID, e.g. partInstanceId
+        
+    Returns:
+        The value or None if the shell has no such specific asset ID
+    """
+    for specific_asset_id in shell.get("specificAssetIds", []):
+        if specific_asset_id.get("name") == name:
+            return specific_asset_id.get("value")
+    return None
+
+
+_batch_config = ConfigManager.get_config("consumer.discovery.dpp_discovery.batch", default={}) or {}
+
+# Module-level singleton for convenience
+batch_discovery_manager = BatchDiscoveryManager(
+    discovery_manager,
+    max_concurrency=int(_batch_config.get("max_concurrency", 8)),
+    page_size=int(_batch_config.get("lookup_page_size", 100))
+)
@@ -0,0 +1,143 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import threading
+from typing import Any, Dict, List, Optional
+
+from connector import discovery_oauth
+from tractusx_sdk.industry.services.discovery.bpn_discovery_service import BpnDiscoveryService
+from tractusx_sdk.dataspace.services.discovery import DiscoveryFinderService
+
+from managers.addons_service.ecopass_kit.v1.bpn_discovery_cache import BpnDiscoveryCache
+from managers.config.config_manager import ConfigManager
+from managers.config.log_manager import LoggingManager
+
+logger = LoggingManager.get_logger(__name__)
+
+
+class BpnDiscoveryClient:
+    """
+    Long-lived BPN Discovery client of the EcoPass KIT.
+
+    The Discovery Finder and BPN Discovery services are created once, so the BPN Discovery
+    endpoint resolved by the Discovery Finder and the HTTP session are reused between lookups.
+    The BPNs found for an identifier are cached (see BpnDiscoveryCache), registering an
+    identifier through this client invalidates its entry.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the client, the discovery services are created on first use."""
+        self._service: Optional[BpnDiscoveryService] = None
+        self._lock = threading.Lock()
+
+        bpn_discovery_config = ConfigManager.get_config("consumer.discovery.bpn_discovery", default={}) or {}
+        self.identifier_type: str = bpn_discovery_config.get("type", "manufacturerPartId")
+        self.endpoint_cache_ttl = int(bpn_discovery_config.get("endpoint_cache_ttl_seconds", 60 * 60 * 12))
+        self.cache = BpnDiscoveryCache(
+            max_entries=int(bpn_discovery_config.get("cache_max_entries", 10000)),
+            ttl=float(bpn_discovery_config.get("cache_ttl_seconds", 3600)),
+            negative_ttl=float(bpn_discovery_config.get("negative_cache_ttl_seconds", 300))
+        )
+
+    def _get_service(self) -> BpnDiscoveryService:
+        """
+        Get the BPN Discovery service, created on first use.
+
+        Raises:
+            ValueError: If the discovery OAuth service is not available or the Discovery Finder URL is not configured
+        """
+        with self._lock:
+            if self._service is not None:
+                return self._service
+
+            if not discovery_oauth or not discovery_oauth.connected:
+                raise ValueError("Discovery OAuth service is not available")
+
+            discovery_finder_url = ConfigManager.get_config("consumer.discovery.discovery_finder.url")
+            if not discovery_finder_url:
+                raise ValueError("Discovery Finder URL not configured")
+
+            discovery_finder = DiscoveryFinderService(url=discovery_finder_url, oauth=discovery_oauth)
+            self._service = BpnDiscoveryService(
+                oauth=discovery_oauth,
+                discovery_finder_service=discovery_finder,
+                cache_timeout_seconds=self.endpoint_cache_ttl
+            )
+            return self._service
+
+    def find_bpns(self, identifier: str, identifier_type: Optional[str] = None) -> List[str]:
+        """
+        Find the BPNs owning an identifier, from the cache if possible.
+
+        Args:
+            identifier: The identifier, e.g. a manufacturer part ID
+            identifier_type: Type of the identifier, the configured type by default
+
+        Returns:
+            List of BPNLs, empty if the identifier is not registered
+        """
+        identifier_type = identifier_type or self.identifier_type
+        service = self._get_service()
+        return self.cache.get_or_load(
+            identifier_type,
+            identifier,
+            lambda: service.find_bpns(keys=[identifier], identifier_type=identifier_type)
+        )
+
+    def set_identifier(self, identifier: str, identifier_type: Optional[str] = None) -> None:
+        """
+        Register an identifier for the own BPN and drop its cached BPNs.
+
+        Args:
+            identifier: The identifier, e.g. a manufacturer part ID
+            identifier_type: Type of the identifier, the configured type by default
+        """
+        identifier_type = identifier_type or self.identifier_type
+        try:
+            self._get_service().set_identifier(identifier_key=identifier, identifier_type=identifier_type)
+        finally:
+            self.cache.invalidate(identifier_type, identifier)
+
+    def invalidate(self, identifier: Optional[str] = None, identifier_type: Optional[str] = None) -> None:
+        """
+        Drop the cached BPNs of an identifier, or of every identifier and the cached discovery endpoints.
+
+        Args:
+            identifier: The identifier, None to clear the whole cache
+            identifier_type: Type of the identifier, the configured type by default
+        """
+        if identifier is not None:
+            self.cache.invalidate(identifier_type or self.identifier_type, identifier)
+            return
+        self.cache.clear()
+        with self._lock:
+            if self._service is not None:
+                self._service.flush_cache()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get the counters of the BPN cache."""
+        return self.cache.get_metrics()
+
+
+# Module-level singleton shared by the discovery and provision managers
+bpn_discovery_client = BpnDiscoveryClient()
@@ -0,0 +1,136 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from managers.enablement_services.consumer.single_flight import SingleFlight
+from utils.bounded_ttl_cache import BoundedTtlCache
+
+BpnDiscoveryKey = Tuple[str, str]
+
+
+class BpnDiscoveryCache:
+    """
+    Size and time bounded cache of the BPNs found by the BPN Discovery for an identifier.
+
+    Entries are keyed by (identifier type, identifier), e.g. ("manufacturerPartId", "MPI-1").
+    Identifiers without BPNs are cached as well, for ``negative_ttl`` seconds, so repeated scans
+    of an unknown part do not hit the service either. Concurrent lookups of the same identifier
+    are collapsed into one call of the service.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl: float = 3600, negative_ttl: float = 300):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries (int, optional): Maximum number of cached identifiers. Defaults to 10000.
+            ttl (float, optional): Seconds the BPNs of an identifier are served from the cache. Defaults to 3600.
+            negative_ttl (float, optional): Seconds an identifier without BPNs is served from the cache. Defaults to 300.
+        """
+        self.negative_ttl = negative_ttl
+        self._cache: BoundedTtlCache[BpnDiscoveryKey, List[str]] = BoundedTtlCache(max_entries=max_entries, ttl=ttl)
+        self._flights = SingleFlight()
+        self._lock = threading.Lock()
+        self.negative_hits = 0
+
+    def get(self, identifier_type: str, identifier: str) -> Optional[List[str]]:
+        """
+        Get the cached BPNs of an identifier.
+
+        Returns:
+            Optional[List[str]]: The BPNs (empty if the identifier is known to have none), or None if not cached or expired
+        """
+        bpns = self._cache.get((identifier_type, identifier))
+        if bpns is None:
+            return None
+        if not bpns:
+            with self._lock:
+                self.negative_hits += 1
+        return list(bpns)
+
+    def get_or_load(self, identifier_type: str, identifier: str, load: Callable[[], Optional[List[str]]]) -> List[str]:
+        """
+        Get the BPNs of an identifier from the cache, or look them up once for all the concurrent callers.
+
+        Args:
+            identifier_type (str): Type of the identifier
+            identifier (str): The identifier
+            load (Callable): Looks up the BPNs in the BPN Discovery, errors are raised and not cached
+
+        Returns:
+            List[str]: The BPNs of the identifier, empty if it has none
+        """
+        bpns = self.get(identifier_type, identifier)
+        if bpns is not None:
+            return bpns
+        return list(self._flights.do((identifier_type, identifier), self._load, identifier_type, identifier, load))
+
+    def _load(self, identifier_type: str, identifier: str, load: Callable[[], Optional[List[str]]]) -> List[str]:
+        generation = self._cache.generation
+        bpns = list(load() or [])
+        self.put(identifier_type, identifier, bpns, generation)
+        return bpns
+
+    def put(self, identifier_type: str, identifier: str, bpns: List[str], generation: Optional[int] = None) -> None:
+        """
+        Store the BPNs of an identifier, evicting the least recently used entries if the cache is full.
+
+        Args:
+            identifier_type (str): Type of the identifier
+            identifier (str): The identifier
+            bpns (List[str]): The BPNs found, empty if there are none
+            generation (Optional[int]): Generation read before the lookup started, the BPNs are dropped
+                if the cache was invalidated meanwhile
+        """
+        self._cache.put((identifier_type, identifier), list(bpns), ttl=None if bpns else self.negative_ttl, generation=generation)
+
+    def invalidate(self, identifier_type: str, identifier: str) -> None:
+        """Remove the cached BPNs of an identifier, e.g. after it was registered for a BPN."""
+        self._cache.invalidate((identifier_type, identifier))
+
+    def clear(self) -> None:
+        """Remove every cached identifier."""
+        self._cache.clear()
+        with self._lock:
+            self.negative_hits = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get the cache counters.
+
+        Returns:
+            Dict[str, Any]: Size, limits, hit/miss/eviction/expiration counters and the lookups coalesced
+        """
+        with self._lock:
+            negative_hits = self.negative_hits
+        return {
+            **self._cache.get_metrics(),
+            "negativeTtlSeconds": self.negative_ttl,
+            "negativeHits": negative_hits,
+            "coalesced": self._flights.get_metrics()["coalesced"]
+        }
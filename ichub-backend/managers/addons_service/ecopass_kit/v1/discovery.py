@@ -25,10 +25,8 @@ import uuid
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timezone
 
-from connector import discovery_oauth
-from tractusx_sdk.industry.services.discovery.bpn_discovery_service import BpnDiscoveryService
-from tractusx_sdk.dataspace.services.discovery import DiscoveryFinderService
-
+from managers.addons_service.ecopass_kit.v1.bpn_discovery import bpn_discovery_client
+from managers.addons_service.ecopass_kit.v1.task_store import DiscoveryTaskStore, create_discovery_task_store
 from managers.config.config_manager import ConfigManager
 from managers.config.log_manager import LoggingManager
 from dtr import dtr_manager
@@ -40,14 +38,19 @@ class DiscoveryTaskManager:
     """
     Manages discovery task status and state.
     
-    This class handles the in-memory storage and updates for discovery tasks.
-    In production environments, consider replacing with Redis or similar
-    distributed cache for scalability.
+    The tasks are kept in a DiscoveryTaskStore, which evicts them after their TTL and bounds
+    their number. The in-memory store is local to the worker, configure the Postgres store
+    (``consumer.discovery.dpp_discovery.task_store.type``) to poll tasks across workers.
     """
     
-    def __init__(self) -> None:
-        """Initialize the task manager with empty storage."""
-        self._tasks: Dict[str, Dict[str, Any]] = {}
+    def __init__(self, store: Optional[DiscoveryTaskStore] = None) -> None:
+        """
+        Initialize the task manager.
+        
+        Args:
+            store: Optional task store. If not provided, the configured one is created.
+        """
+        self.store = store if store is not None else create_discovery_task_store()
     
     def create_task(self, task_id: str) -> Dict[str, Any]:
         """
@@ -59,7 +62,7 @@ class DiscoveryTaskManager:
         Returns:
             The initial task state dictionary
         """
-        self._tasks[task_id] = {
+        task = {
             "status": "in_progress",
             "step": "parsing",
             "message": "Parsing identifier...",
@@ -69,11 +72,12 @@ class DiscoveryTaskManager:
             "created_at": datetime.now(timezone.utc).isoformat(),
             "error": None
         }
-        return self._tasks[task_id]
+        self.store.create(task_id, task)
+        return task
     
     def get_task(self, task_id: str) -> Optional[Dict[str, Any]]:
         """
-        Retrieve a task by its ID.
+        Retrieve a task by its ID, with the payloads it found.
         
         Args:
             task_id: The unique task identifier
@@ -81,7 +85,7 @@ class DiscoveryTaskManager:
         Returns:
             The task state dictionary or None if not found
         """
-        return self._tasks.get(task_id)
+        return self.store.get(task_id)
     
     def task_exists(self, task_id: str) -> bool:
         """
@@ -93,7 +97,7 @@ class DiscoveryTaskManager:
         Returns:
             True if the task exists, False otherwise
         """
-        return task_id in self._tasks
+        return self.store.exists(task_id)
     
     def update_task(
         self,
@@ -117,17 +121,17 @@ class DiscoveryTaskManager:
             digital_twin: Optional digital twin data
             data: Optional submodel data
         """
-        if task_id in self._tasks:
-            self._tasks[task_id].update({
-                "status": status,
-                "step": step,
-                "message": message,
-                "progress": progress
-            })
-            if digital_twin is not None:
-                self._tasks[task_id]["digital_twin"] = digital_twin
-            if data is not None:
-                self._tasks[task_id]["data"] = data
+        changes = {
+            "status": status,
+            "step": step,
+            "message": message,
+            "progress": progress
+        }
+        if digital_twin is not None:
+            changes["digital_twin"] = digital_twin
+        if data is not None:
+            changes["data"] = data
+        self.store.update(task_id, changes)
     
     def mark_failed(self, task_id: str, error: str) -> None:
         """
@@ -137,13 +141,13 @@ class DiscoveryTaskManager:
             task_id: The unique task identifier
             error: The error message
         """
-        if task_id in self._tasks:
-            current_step = self._tasks[task_id].get("step", "error")
-            self._tasks[task_id].update({
+        task = self.store.get(task_id, include_payloads=False)
+        if task is not None:
+            self.store.update(task_id, {
                 "status": "failed",
-                "step": current_step,
+                "step": task.get("step", "error"),
                 "message": f"Discovery failed: {error}",
-                "progress": self._tasks[task_id].get("progress", 0),
+                "progress": task.get("progress", 0),
                 "error": error
             })
 
@@ -246,7 +250,7 @@ class DiscoveryManager:
         try:
             # Step 1: Parse the ID
             logger.info(f"[Task {task_id}] Step 1: Parsing identifier: {id_str}")
-            self.task_manager.update_task(task_id, "parsing", "Parsing identifier...", 10)
+            await asyncio.to_thread(self.task_manager.update_task, task_id, "parsing", "Parsing identifier...", 10)
             
             manufacturer_part_id, part_instance_id = self.parse_id(id_str)
             
@@ -254,7 +258,7 @@ class DiscoveryManager:
             
             # Step 2: Discover BPN using BPN Discovery
             logger.info(f"[Task {task_id}] Step 2: Discovering BPN for manufacturerPartId: {manufacturer_part_id}")
-            self.task_manager.update_task(task_id, "discovering_bpn", f"Looking up BPN owner for {manufacturer_part_id}...", 25)
+            await asyncio.to_thread(self.task_manager.update_task, task_id, "discovering_bpn", f"Looking up BPN owner for {manufacturer_part_id}...", 25)
             
             bpn_list = await self.discover_bpn(manufacturer_part_id)
             
@@ -265,7 +269,7 @@ class DiscoveryManager:
             
             # Step 3: Retrieve digital twin shells using DTR (in parallel for multiple BPNs)
             logger.info(f"[Task {task_id}] Step 3: Retrieving digital twin for manufacturerPartId: {manufacturer_part_id}, partInstanceId: {part_instance_id}")
-            self.task_manager.update_task(task_id, "retrieving_twin", f"Retrieving digital twin from DTR across {len(bpn_list)} BPN(s)...", 50)
+            await asyncio.to_thread(self.task_manager.update_task, task_id, "retrieving_twin", f"Retrieving digital twin from DTR across {len(bpn_list)} BPN(s)...", 50)
             
             # Build query spec for DTR lookup using specific asset IDs
             query_spec = self._build_query_spec(manufacturer_part_id, part_instance_id)
@@ -286,9 +290,9 @@ class DiscoveryManager:
             
             # Step 4: Look up submodel by semantic ID
             logger.info(f"[Task {task_id}] Step 4: Looking up submodel with semanticId: {semantic_id}")
-            self.task_manager.update_task(task_id, "looking_up_submodel", "Searching for submodel with matching semantic ID...", 70)
+            await asyncio.to_thread(self.task_manager.update_task, task_id, "looking_up_submodel", "Searching for submodel with matching semantic ID...", 70)
             
-            matching_submodel = self._find_matching_submodel(shell_descriptor, semantic_id)
+            matching_submodel = self.find_matching_submodel(shell_descriptor, semantic_id)
             
             if not matching_submodel:
                 raise ValueError(f"No submodel found with semanticId: {semantic_id}")
@@ -298,7 +302,7 @@ class DiscoveryManager:
             
             # Step 5: Consume submodel data
             logger.info(f"[Task {task_id}] Step 5: Consuming submodel data for submodel: {submodel_id}")
-            self.task_manager.update_task(task_id, "consuming_data", "Retrieving submodel data...", 85)
+            await asyncio.to_thread(self.task_manager.update_task, task_id, "consuming_data", "Retrieving submodel data...", 85)
             
             submodel_data = await self._consume_submodel_data(
                 task_id, matching_bpn, shell_descriptor, submodel_id, dtr_policies, governance
@@ -307,7 +311,8 @@ class DiscoveryManager:
             logger.info(f"[Task {task_id}] Successfully consumed submodel data")
             
             # Step 6: Complete
-            self.task_manager.update_task(
+            await asyncio.to_thread(
+                self.task_manager.update_task,
                 task_id,
                 "complete",
                 "Discovery completed successfully",
@@ -321,7 +326,7 @@ class DiscoveryManager:
             
         except Exception as e:
             logger.error(f"[Task {task_id}] Discovery task failed: {str(e)}", exc_info=True)
-            self.task_manager.mark_failed(task_id, str(e))
+            await asyncio.to_thread(self.task_manager.mark_failed, task_id, str(e))
     
     async def discover_bpn(self, manufacturer_part_id: str) -> List[str]:
         """
@@ -337,40 +342,15 @@ class DiscoveryManager:
             ValueError: If BPN Discovery service is not available or lookup fails
         """
         try:
-            if not discovery_oauth or not discovery_oauth.connected:
-                raise ValueError("Discovery OAuth service is not available")
-            
-            # Get Discovery Finder URL from configuration
-            discovery_finder_url = ConfigManager.get_config("consumer.discovery.discovery_finder.url")
-            
-            if not discovery_finder_url:
-                raise ValueError("Discovery Finder URL not configured")
-            
-            # Create Discovery Finder service
-            discovery_finder = DiscoveryFinderService(
-                url=discovery_finder_url,
-                oauth=discovery_oauth
-            )
-            
-            # Create BPN Discovery service
-            bpn_discovery_service = BpnDiscoveryService(
-                oauth=discovery_oauth,
-                discovery_finder_service=discovery_finder
-            )
-            
-            # Get the type identifier from configuration (default: "manufacturerPartId")
-            bpn_type = ConfigManager.get_config("consumer.discovery.bpn_discovery.type", default="manufacturerPartId")
-            
-            # Look up the BPN using the manufacturer part ID
+            # Look up the BPN using the manufacturer part ID, answered from the cache for known part IDs
             bpn_list = await asyncio.to_thread(
-                bpn_discovery_service.find_bpns,
-                keys=[manufacturer_part_id],
-                identifier_type=bpn_type
+                bpn_discovery_client.find_bpns,
+                manufacturer_part_id
             )
             
             logger.info(f"BPN Discovery lookup for {manufacturer_part_id}: {bpn_list}")
             
-            return bpn_list if bpn_list else []
+            return bpn_list
             
         except Exception as e:
             logger.error(f"Failed to discover BPN: {str(e)}", exc_info=True)
@@ -412,8 +392,13 @@ class DiscoveryManager:
         dtr_policies: Optional[List[Dict[str, Any]]] = None
     ) -> tuple[Optional[Dict[str, Any]], Optional[str]]:
         """
-        Query all BPNs in parallel to find shells with matching DPP submodels.
-        
+        Query all BPNs in parallel and return the first shell with a matching DPP submodel.
+
+        The lookups are processed as they complete: as soon as one BPN returns a shell carrying the
+        semantic ID the remaining lookups are cancelled, so a slow or unreachable registry of another
+        partner does not delay the result. All the lookups share one deadline
+        (``consumer.discovery.dpp_discovery.shell_lookup_timeout_seconds``).
+
         Args:
             task_id: The unique task identifier
             bpn_list: List of BPNs to query
@@ -424,39 +409,48 @@ class DiscoveryManager:
         Returns:
             Tuple of (shell_descriptor, matching_bpn) or (None, None) if not found
         """
-        shell_tasks = [
-            asyncio.to_thread(
-                dtr_manager.consumer.discover_shells,
-                counter_party_id=bpn,
-                query_spec=query_spec,
-                dtr_policies=dtr_policies
-            )
-            for bpn in bpn_list
-        ]
+        timeout = ConfigManager.get_config("consumer.discovery.dpp_discovery.shell_lookup_timeout_seconds", default=None)
         
-        shell_results = await asyncio.gather(*shell_tasks, return_exceptions=True)
+        async def lookup(bpn: str) -> tuple[str, Any]:
+            try:
+                return bpn, await asyncio.to_thread(
+                    dtr_manager.consumer.discover_shells,
+                    counter_party_id=bpn,
+                    query_spec=query_spec,
+                    dtr_policies=dtr_policies
+                )
+            except Exception as e:
+                return bpn, e
         
-        # Process results and find shells with matching semantic ID
-        for bpn, result in zip(bpn_list, shell_results):
-            if isinstance(result, Exception):
-                logger.warning(f"[Task {task_id}] Error querying BPN {bpn}: {str(result)}")
-                continue
-            
-            logger.info(f"[Task {task_id}] DTR discover_shells result for BPN {bpn}: found {result.get('shellsFound', 0)} shell(s)")
-            
-            shell_descriptors = result.get("shellDescriptors", [])
-            
-            # Check each shell for matching semantic ID in submodels
-            for shell in shell_descriptors:
-                for submodel in shell.get("submodelDescriptors", []):
-                    submodel_semantic_id = extract_semantic_id(submodel)
-                    if submodel_semantic_id == semantic_id:
-                        logger.info(f"[Task {task_id}] Found matching shell with DPP submodel in BPN {bpn}, shell ID: {shell.get('id')}")
-                        return shell, bpn
+        shell_tasks = [asyncio.create_task(lookup(bpn)) for bpn in bpn_list]
+        
+        try:
+            for next_result in asyncio.as_completed(shell_tasks, timeout=timeout):
+                bpn, result = await next_result
+                if isinstance(result, Exception):
+                    logger.warning(f"[Task {task_id}] Error querying BPN {bpn}: {str(result)}")
+                    continue
+                
+                logger.info(f"[Task {task_id}] DTR discover_shells result for BPN {bpn}: found {result.get('shellsFound', 0)} shell(s)")
+                
+                # Check each shell for matching semantic ID in submodels
+                for shell in result.get("shellDescriptors", []):
+                    for submodel in shell.get("submodelDescriptors", []):
+                        submodel_semantic_id = extract_semantic_id(submodel)
+                        if submodel_semantic_id == semantic_id:
+                            logger.info(f"[Task {task_id}] Found matching shell with DPP submodel in BPN {bpn}, shell ID: {shell.get('id')}")
+                            return shell, bpn
+        except asyncio.TimeoutError:
+            pending = [bpn for bpn, shell_task in zip(bpn_list, shell_tasks) if not shell_task.done()]
+            logger.warning(f"[Task {task_id}] Shell lookup deadline of {timeout}s exceeded, no answer from BPN(s): {pending}")
+        finally:
+            # The worker threads cannot be interrupted, their results are abandoned
+            for shell_task in shell_tasks:
+                shell_task.cancel()
         
         return None, None
     
-    def _find_matching_submodel(
+    def find_matching_submodel(
         self,
         shell_descriptor: Dict[str, Any],
         semantic_id: str
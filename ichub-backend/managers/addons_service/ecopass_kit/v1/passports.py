@@ -20,26 +20,27 @@
 # SPDX-License-Identifier: Apache-2.0
 #################################################################################
 
-from typing import List, Optional, Dict, Any
-
-from sqlmodel import select
-from sqlalchemy.orm import selectinload
+from datetime import date
+from typing import List, Optional, Any
 
 from managers.config.log_manager import LoggingManager
 from managers.metadata_database.manager import RepositoryManagerFactory
-from managers.enablement_services.submodel_service_manager import SubmodelServiceManager
+from managers.enablement_services.submodel_service_manager import SubmodelServiceManagerRegistry
 from models.metadata_database.provider.models import (
+    CatalogPart,
+    Passport,
     TwinAspect,
     Twin,
-    SerializedPart,
-    PartnerCatalogPart,
 )
 from models.services.addons.ecopass_kit.v1 import DigitalProductPassport, TwinAssociation
+from utils.pagination import Page, cut_page, decode_cursor
 
 logger = LoggingManager.get_logger(__name__)
 
-# DPP semantic ID pattern for querying
-DPP_SEMANTIC_PATTERN = "%digital_product_passport%"
+# Number of passports whose metadata is stored per transaction when indexing the existing passports
+INDEX_BATCH_SIZE = 100
+# Number of index runs that may fail on a passport before it is no longer retried
+MAX_INDEX_ATTEMPTS = 3
 
 
 class PassportsManager:
@@ -47,105 +48,164 @@ class PassportsManager:
     Manages Digital Product Passports (DPP) operations.
 
     This manager handles the retrieval and transformation of DPP data
-    from the database into the standardized DPP format.
+    from the database into the standardized DPP format. The passports are
+    listed from their metadata in the passport table, which is filled when
+    the passport documents are written, so the documents are never read.
     """
 
     def __init__(self) -> None:
         """Initialize the Passports Manager."""
-        self.submodel_service_manager = SubmodelServiceManager()
+        self.submodel_service_manager = SubmodelServiceManagerRegistry.get()
 
     def get_all_passports(self) -> List[DigitalProductPassport]:
         """
         Retrieve all Digital Product Passports (DPPs) from the system.
 
-        This method fetches all twins that have DPP aspects (digital_product_passport
-        semantic ID) and returns them in the standardized DPP format.
-
         Returns:
             List[DigitalProductPassport]: A list of all Digital Product Passports
 
         Raises:
-            Exception: If there's an error accessing the database or processing DPPs
+            Exception: If there's an error accessing the database
+        """
+        return self.get_passports_page().items
+
+    def get_passports_page(self,
+            status: Optional[str] = None,
+            manufacturer_part_id: Optional[str] = None,
+            part_type: Optional[str] = None,
+            part_instance_id: Optional[str] = None,
+            min_incl_issue_date: Optional[date] = None,
+            max_excl_issue_date: Optional[date] = None,
+            min_incl_expiration_date: Optional[date] = None,
+            max_excl_expiration_date: Optional[date] = None,
+            limit: Optional[int] = None,
+            cursor: Optional[str] = None,
+            include_total: bool = False) -> Page[DigitalProductPassport]:
+        """
+        Retrieve a page of the Digital Product Passports matching the filters, with a single query.
+
+        Args:
+            status: Only the "shared" or only the "active" (not shared) passports
+            manufacturer_part_id: Only the passports of this manufacturer part ID
+            part_type: Only the passports of "catalog", "serialized" or "batch" parts
+            part_instance_id: Only the passports of this part instance ID
+            min_incl_issue_date: Only the passports issued on or after this date
+            max_excl_issue_date: Only the passports issued before this date
+            min_incl_expiration_date: Only the passports expiring on or after this date
+            max_excl_expiration_date: Only the passports expiring before this date
+            limit: Page size, None for all the passports
+            cursor: Cursor of the page, taken from the previous page
+            include_total: Whether to count all the matching passports
+
+        Returns:
+            Page[DigitalProductPassport]: The passports of the page, ordered by their twin aspect
         """
-        dpps: List[DigitalProductPassport] = []
+        filters = dict(
+            status=status,
+            manufacturer_part_id=manufacturer_part_id,
+            part_type=part_type,
+            part_instance_id=part_instance_id,
+            min_incl_issue_date=min_incl_issue_date,
+            max_excl_issue_date=max_excl_issue_date,
+            min_incl_expiration_date=min_incl_expiration_date,
+            max_excl_expiration_date=max_excl_expiration_date,
+        )
+        after_id = decode_cursor(cursor, int)[0] if cursor else None
 
         with RepositoryManagerFactory.create() as repo:
-            # Query twin aspects with DPP semantic ID and eagerly load related data
-            stmt = (
-                select(TwinAspect)
-                .where(TwinAspect.semantic_id.like(DPP_SEMANTIC_PATTERN))  # type: ignore
-                .options(
-                    selectinload(TwinAspect.twin).selectinload(Twin.catalog_part),  # type: ignore
-                    selectinload(TwinAspect.twin)  # type: ignore
-                    .selectinload(Twin.serialized_part)
-                    .selectinload(SerializedPart.partner_catalog_part)
-                    .selectinload(PartnerCatalogPart.catalog_part),
-                    selectinload(TwinAspect.twin).selectinload(Twin.batch),  # type: ignore
-                    selectinload(TwinAspect.twin).selectinload(Twin.twin_exchanges),  # type: ignore
-                )
+            rows = repo.passport_repository.find_page(
+                **filters,
+                limit=limit + 1 if limit is not None else None,
+                after_id=after_id
             )
+            rows, next_cursor = cut_page(rows, limit, lambda row: (row[0].twin_aspect_id,))
+            total = repo.passport_repository.count_page(**filters) if include_total else None
 
-            dpp_aspects = repo.twin_aspect_repository._session.scalars(stmt).all()
+            return Page(
+                items=[self._build_dpp(*row) for row in rows],
+                next_cursor=next_cursor,
+                total=total
+            )
 
-            if not dpp_aspects:
-                return []
+    def index_missing_passports(self) -> int:
+        """
+        Store the metadata of the existing passports that have none yet, e.g. the ones written before
+        the passport table existed. Reads the documents of those passports from the submodel service.
+        A passport whose document cannot be indexed is recorded as failed, and skipped once
+        MAX_INDEX_ATTEMPTS runs failed on it. Run by the passport index job, see jobs/run_passport_index.py.
 
-            for dpp_aspect in dpp_aspects:
-                try:
-                    dpp = self._process_dpp_aspect(dpp_aspect)
-                    if dpp:
-                        dpps.append(dpp)
-                except Exception as e:
-                    logger.error(
-                        f"Error processing DPP aspect {dpp_aspect.submodel_id}: {str(e)}"
+        Returns:
+            int: The number of passports indexed
+        """
+        indexed = 0
+        after_id = None
+        try:
+            while True:
+                with RepositoryManagerFactory.create() as repo:
+                    dpp_aspects = repo.passport_repository.find_unindexed_twin_aspects(
+                        limit=INDEX_BATCH_SIZE,
+                        after_id=after_id,
+                        max_attempts=MAX_INDEX_ATTEMPTS
                     )
-                    continue
-
-        return dpps
-
-    def _process_dpp_aspect(
-        self, dpp_aspect: TwinAspect
-    ) -> Optional[DigitalProductPassport]:
+                    if not dpp_aspects:
+                        break
+
+                    for dpp_aspect in dpp_aspects:
+                        try:
+                            aspect_data = self.submodel_service_manager.get_twin_aspect_document(
+                                submodel_id=dpp_aspect.submodel_id,
+                                semantic_id=dpp_aspect.semantic_id
+                            )
+                            repo.passport_repository.index_twin_aspect(dpp_aspect, aspect_data)
+                            indexed += 1
+                        except Exception as e:
+                            logger.error(
+                                f"Error indexing DPP aspect {dpp_aspect.submodel_id}: {str(e)}"
+                            )
+                            repo.passport_repository.record_index_failure(dpp_aspect, str(e))
+                    after_id = dpp_aspects[-1].id
+                    repo.commit()
+        except Exception as e:
+            logger.error(f"Error indexing the existing passports: {str(e)}")
+
+        if indexed:
+            logger.info(f"Indexed the metadata of {indexed} existing passports")
+        return indexed
+
+    def _build_dpp(
+        self,
+        passport: Passport,
+        dpp_aspect: TwinAspect,
+        db_twin: Twin,
+        catalog_part: Optional[CatalogPart],
+        shared: bool,
+    ) -> DigitalProductPassport:
         """
-        Process a single DPP aspect and convert it to a DigitalProductPassport.
+        Build a DigitalProductPassport from its metadata row.
 
         Args:
-            dpp_aspect: The TwinAspect containing DPP data
+            passport: The passport metadata
+            dpp_aspect: The TwinAspect holding the passport
+            db_twin: The twin of the passport
+            catalog_part: The catalog part of the twin, if any
+            shared: Whether the twin is shared with a business partner
 
         Returns:
-            DigitalProductPassport object or None if the twin is not found
+            DigitalProductPassport object
         """
-        db_twin = dpp_aspect.twin
-
-        if not db_twin:
-            return None
-
-        # Get the passport data from the submodel service
-        aspect_data = self.submodel_service_manager.get_twin_aspect_document(
-            submodel_id=dpp_aspect.submodel_id,
-            semantic_id=dpp_aspect.semantic_id
-        )
-
-        # Extract passport metadata
-        passport_id = self._extract_passport_id(aspect_data)
-        issue_date = self._extract_issue_date(aspect_data)
-        expiration_date = self._extract_expiration_date(aspect_data)
-
-        # Extract part information from the twin
-        part_info = self._extract_part_info(db_twin)
+        name = (catalog_part.name if catalog_part else None) or "Digital Product Passport"
+        manufacturer_part_id = catalog_part.manufacturer_part_id if catalog_part else ""
+        part_instance_id = passport.part_instance_id or ""
+        passport_id = passport.passport_id or ""
 
         # Extract version from semantic ID
         version = self._extract_version_from_semantic_id(dpp_aspect.semantic_id)
 
-        # Determine status based on shares
-        share_count = len(db_twin.twin_exchanges) if db_twin.twin_exchanges else 0
-        status = "shared" if share_count > 0 else "active"
-
         # Build the DPP ID
         dpp_id = self._build_dpp_id(
             passport_id,
-            part_info["manufacturer_part_id"],
-            part_info["part_instance_id"],
+            manufacturer_part_id,
+            part_instance_id,
             db_twin.global_id,
         )
 
@@ -153,24 +213,24 @@ class PassportsManager:
         twin_association = TwinAssociation(
             twinId=str(db_twin.global_id),
             aasId=str(db_twin.aas_id),
-            manufacturerPartId=part_info["manufacturer_part_id"],
-            partInstanceId=part_info["part_instance_id"],
-            twinName=part_info["name"],
+            manufacturerPartId=manufacturer_part_id,
+            partInstanceId=part_instance_id,
+            twinName=name,
         )
 
         # Create DPP object
         return DigitalProductPassport(
             id=dpp_id,
             passportId=passport_id if passport_id else dpp_id,
-            manufacturerPartId=part_info["manufacturer_part_id"],
-            partInstanceId=part_info["part_instance_id"],
-            partType=part_info["part_type"],
-            name=part_info["name"],
+            manufacturerPartId=manufacturer_part_id,
+            partInstanceId=part_instance_id,
+            partType=passport.part_type,
+            name=name,
             version=version,
             semanticId=dpp_aspect.semantic_id,
-            status=status,
-            issueDate=issue_date,
-            expirationDate=expiration_date,
+            status="shared" if shared else "active",
+            issueDate=passport.issue_date.isoformat() if passport.issue_date else None,
+            expirationDate=passport.expiration_date.isoformat() if passport.expiration_date else None,
             twinAssociation=twin_association,
             submodelId=str(dpp_aspect.submodel_id),
             createdAt=db_twin.created_date.isoformat() if db_twin.created_date else "",
@@ -179,98 +239,6 @@ class PassportsManager:
             else "",
         )
 
-    def _extract_passport_id(self, aspect_data: Dict[str, Any]) -> str:
-        """
-        Extract passport ID from the aspect data.
-
-        Args:
-            aspect_data: The submodel aspect data
-
-        Returns:
-            The passport ID (UUID) or empty string if not found
-        """
-        return aspect_data.get("metadata", {}).get("passportId", "")
-
-    def _extract_issue_date(self, aspect_data: Dict[str, Any]) -> Optional[str]:
-        """
-        Extract issue date from the DPP aspect data.
-
-        Tries multiple common paths where issue date might be stored.
-
-        Args:
-            aspect_data: The submodel aspect data
-
-        Returns:
-            The issue date string or None if not found
-        """
-        return (
-            aspect_data.get("metadata", {}).get("issueDate")
-            or aspect_data.get("metadata", {}).get("issuedDate")
-            or aspect_data.get("issueDate")
-            or aspect_data.get("issuedDate")
-            or aspect_data.get("validity", {}).get("issueDate")
-            or None
-        )
-
-    def _extract_expiration_date(self, aspect_data: Dict[str, Any]) -> Optional[str]:
-        """
-        Extract expiration date from the DPP aspect data.
-
-        Tries multiple common paths where expiration date might be stored.
-
-        Args:
-            aspect_data: The submodel aspect data
-
-        Returns:
-            The expiration date string or None if not found
-        """
-        return (
-            aspect_data.get("metadata", {}).get("expirationDate")
-            or aspect_data.get("metadata", {}).get("validUntil")
-            or aspect_data.get("expirationDate")
-            or aspect_data.get("validUntil")
-            or aspect_data.get("validity", {}).get("expirationDate")
-            or None
-        )
-
-    def _extract_part_info(self, db_twin: Twin) -> Dict[str, Any]:
-        """
-        Extract part information from the twin's related entities.
-
-        Args:
-            db_twin: The Twin database object
-
-        Returns:
-            Dictionary with name, manufacturer_part_id, part_instance_id, and part_type
-        """
-        name = "Digital Product Passport"
-        manufacturer_part_id = ""
-        part_instance_id = ""
-        part_type = None
-
-        if db_twin.catalog_part:
-            name = db_twin.catalog_part.name or name
-            manufacturer_part_id = db_twin.catalog_part.manufacturer_part_id
-            part_type = "catalog"
-        elif db_twin.serialized_part:
-            if db_twin.serialized_part.partner_catalog_part:
-                name = db_twin.serialized_part.partner_catalog_part.catalog_part.name or name
-                manufacturer_part_id = db_twin.serialized_part.partner_catalog_part.catalog_part.manufacturer_part_id
-            part_instance_id = db_twin.serialized_part.part_instance_id
-            part_type = "serialized"
-        elif db_twin.batch:
-            if db_twin.batch.catalog_part:
-                name = db_twin.batch.catalog_part.name or name
-                manufacturer_part_id = db_twin.batch.catalog_part.manufacturer_part_id
-            part_type = "batch"
-
-        return {
-            "name": name,
-            "manufacturer_part_id": manufacturer_part_id,
-            "part_instance_id": part_instance_id,
-            "part_type": part_type,
-        }
-
     def _extract_version_from_semantic_id(self, semantic_id: str) -> str:
         """
         Extract version from a semantic ID.
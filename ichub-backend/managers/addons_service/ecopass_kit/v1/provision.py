@@ -26,15 +26,10 @@ import html
 from sqlmodel import select
 from sqlalchemy.orm import selectinload
 
-from connector import discovery_oauth
-
-from tractusx_sdk.industry.services.discovery.bpn_discovery_service import BpnDiscoveryService
-from tractusx_sdk.dataspace.services.discovery import DiscoveryFinderService
-
-from managers.config.config_manager import ConfigManager
+from managers.addons_service.ecopass_kit.v1.bpn_discovery import bpn_discovery_client
 from managers.config.log_manager import LoggingManager
 from managers.metadata_database.manager import RepositoryManagerFactory
-from managers.enablement_services.submodel_service_manager import SubmodelServiceManager
+from managers.enablement_services.submodel_service_manager import SubmodelServiceManagerRegistry
 from services.provider.twin_management_service import TwinManagementService
 from models.services.provider.twin_management import (
     CatalogPartTwinShareCreate,
@@ -68,7 +63,7 @@ class ProvisionManager:
     def __init__(self) -> None:
         """Initialize the Provision Manager."""
         self.twin_management_service = TwinManagementService()
-        self.submodel_service_manager = SubmodelServiceManager()
+        self.submodel_service_manager = SubmodelServiceManagerRegistry.get()
 
     def share_dpp(
         self, dpp_id: str, business_partner_number: str
@@ -423,44 +418,17 @@ class ProvisionManager:
             True if registration was successful, False otherwise
         """
         try:
-            if not discovery_oauth or not discovery_oauth.connected:
-                logger.warning("Discovery OAuth service is not available")
-                return False
-
-            # Get Discovery Finder URL from configuration
-            discovery_finder_url = ConfigManager.get_config(
-                "consumer.discovery.discovery_finder.url"
-            )
-
-            if not discovery_finder_url:
-                logger.warning("Discovery Finder URL not configured")
-                return False
-
-            # Create Discovery Finder service
-            discovery_finder = DiscoveryFinderService(
-                url=discovery_finder_url, oauth=discovery_oauth
-            )
-
-            # Create BPN Discovery service
-            bpn_discovery_service = BpnDiscoveryService(
-                oauth=discovery_oauth, discovery_finder_service=discovery_finder
-            )
-
-            # Get the type identifier from configuration (default: "manufacturerPartId")
-            bpn_type = ConfigManager.get_config(
-                "consumer.discovery.bpn_discovery.type", default="manufacturerPartId"
-            )
-
-            # Register the manufacturer part ID
-            bpn_discovery_service.set_identifier(
-                identifier_key=manufacturer_part_id, identifier_type=bpn_type
-            )
+            # Registering through the shared client also drops the BPNs cached for the part ID
+            bpn_discovery_client.set_identifier(manufacturer_part_id)
 
             logger.info(
                 f"Successfully registered manufacturer part ID in BPN Discovery: {html.escape(manufacturer_part_id)}"
             )
             return True
 
+        except ValueError as e:
+            logger.warning(str(e))
+            return False
         except Exception as e:
             logger.error(f"Failed to register in BPN Discovery: {str(e)}", exc_info=True)
             return False
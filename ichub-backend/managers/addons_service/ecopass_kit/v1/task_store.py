@@ -0,0 +1,372 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import json
+import os
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Tuple, Type
+
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, SQLModel, delete, func, select
+
+from managers.config.config_manager import ConfigManager
+from managers.config.log_manager import LoggingManager
+from models.metadata_database.consumer.models import DiscoveryTaskPayloads, DiscoveryTasks
+from utils.bounded_ttl_cache import BoundedTtlCache
+
+logger = LoggingManager.get_logger(__name__)
+
+
+class DiscoveryTaskStore(ABC):
+    """
+    Storage of the discovery tasks status and the payloads they found.
+    
+    Tasks are removed ``ttl`` seconds after they were created, and the oldest ones once more than
+    ``max_entries`` tasks are stored. The payloads (digital twin and passport data) are kept apart
+    from the task status and only read when a task is requested with its payloads.
+    """
+    
+    PAYLOAD_FIELDS = ("digital_twin", "data")
+    
+    def __init__(self, ttl: float = 3600, max_entries: int = 1000) -> None:
+        """
+        Initialize the store.
+        
+        Args:
+            ttl: Seconds a task is kept after it was created
+            max_entries: Maximum number of stored tasks
+        """
+        self.ttl = ttl
+        self.max_entries = max(1, max_entries)
+    
+    @abstractmethod
+    def create(self, task_id: str, task: Dict[str, Any]) -> None:
+        """
+        Store a new task.
+        
+        Args:
+            task_id: The unique task identifier
+            task: The initial task state, without payloads
+        """
+    
+    @abstractmethod
+    def get(self, task_id: str, include_payloads: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve a task.
+        
+        Args:
+            task_id: The unique task identifier
+            include_payloads: Whether to read the payloads of the task, set to None otherwise
+            
+        Returns:
+            A copy of the task state or None if not found or expired
+        """
+    
+    @abstractmethod
+    def update(self, task_id: str, changes: Dict[str, Any]) -> None:
+        """
+        Update the fields of a task, unknown or expired tasks are ignored.
+        
+        Args:
+            task_id: The unique task identifier
+            changes: The fields to change, payload fields included
+        """
+    
+    def exists(self, task_id: str) -> bool:
+        """
+        Check if a task exists.
+        
+        Args:
+            task_id: The unique task identifier
+            
+        Returns:
+            True if the task exists and has not expired
+        """
+        return self.get(task_id, include_payloads=False) is not None
+
+
+@dataclass(frozen=True)
+class _SpilledPayload:
+    """Payload written to a file instead of being kept in memory."""
+    path: str
+
+
+class MemoryDiscoveryTaskStore(DiscoveryTaskStore):
+    """
+    In-process discovery task store.
+    
+    Payloads larger than ``spill_threshold`` bytes once serialized are written to files in
+    ``spill_dir`` and read back when the task is requested, so finished tasks waiting to be
+    polled do not hold their passports in memory. Expired tasks and their files are removed
+    whenever a task is created. The tasks are only visible to the worker running them, use the
+    Postgres store when the API runs with several workers.
+    """
+    
+    def __init__(self, ttl: float = 3600, max_entries: int = 1000, spill_threshold: Optional[int] = 256 * 1024, spill_dir: Optional[str] = None) -> None:
+        """
+        Initialize the store.
+        
+        Args:
+            ttl: Seconds a task is kept after it was created
+            max_entries: Maximum number of tasks kept in memory
+            spill_threshold: Size in bytes from which payloads are written to files, None to keep them all in memory
+            spill_dir: Directory of the payload files, a temporary directory by default
+        """
+        super().__init__(ttl=ttl, max_entries=max_entries)
+        self.spill_threshold = spill_threshold
+        self.spill_dir = spill_dir
+        self._lock = threading.Lock()
+        self._tasks: BoundedTtlCache[str, Dict[str, Any]] = BoundedTtlCache(
+            max_entries=self.max_entries, ttl=ttl, on_remove=self._remove_spilled_payloads)
+    
+    def create(self, task_id: str, task: Dict[str, Any]) -> None:
+        with self._lock:
+            # Expired tasks are otherwise only dropped when accessed, their spilled files would pile up
+            self._tasks.purge_expired()
+            self._tasks.put(task_id, dict(task))
+    
+    def get(self, task_id: str, include_payloads: bool = True) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            task = self._tasks.get(task_id)
+            if task is None:
+                return None
+            task = dict(task)
+        for field in self.PAYLOAD_FIELDS:
+            payload = task.get(field)
+            if not include_payloads:
+                task[field] = None
+            elif isinstance(payload, _SpilledPayload):
+                task[field] = self._read_spilled_payload(payload)
+        return task
+    
+    def update(self, task_id: str, changes: Dict[str, Any]) -> None:
+        changes = dict(changes)
+        for field in self.PAYLOAD_FIELDS:
+            if changes.get(field) is not None:
+                changes[field] = self._spill(task_id, field, changes[field])
+        with self._lock:
+            task = self._tasks.get(task_id)
+            if task is None:
+                self._remove_spilled_payloads(task_id, changes)
+                return
+            replaced = {field: task.get(field) for field in self.PAYLOAD_FIELDS if field in changes}
+            task.update(changes)
+        self._remove_spilled_payloads(task_id, replaced)
+    
+    def _spill(self, task_id: str, field: str, payload: Any) -> Any:
+        """Write a payload to a file if it is larger than the spill threshold."""
+        if self.spill_threshold is None:
+            return payload
+        serialized = json.dumps(payload).encode("utf-8")
+        if len(serialized) < self.spill_threshold:
+            return payload
+        if self.spill_dir is None:
+            self.spill_dir = tempfile.mkdtemp(prefix="ecopass-discovery-")
+        file_descriptor, path = tempfile.mkstemp(prefix=f"{task_id}-{field}-", suffix=".json", dir=self.spill_dir)
+        with os.fdopen(file_descriptor, "wb") as file:
+            file.write(serialized)
+        return _SpilledPayload(path)
+    
+    @staticmethod
+    def _read_spilled_payload(payload: _SpilledPayload) -> Optional[Any]:
+        try:
+            with open(payload.path, "rb") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            # Removed by a concurrent update or eviction of the task
+            return None
+    
+    @classmethod
+    def _remove_spilled_payloads(cls, task_id: str, task: Dict[str, Any]) -> None:
+        for field in cls.PAYLOAD_FIELDS:
+            payload = task.get(field)
+            if isinstance(payload, _SpilledPayload):
+                try:
+                    os.remove(payload.path)
+                except FileNotFoundError:
+                    pass
+    
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+
+class PostgresDiscoveryTaskStore(DiscoveryTaskStore):
+    """
+    Database-backed discovery task store, shared by all the workers and replicas of the API.
+    
+    The task status is stored in ``table_name`` and every payload as one row of
+    ``<table_name>_payloads``, which is only read when a task is requested with its payloads.
+    Expired tasks, and the oldest ones beyond ``max_entries``, are pruned when tasks are created,
+    read or updated, at most once every ``prune_interval`` seconds.
+    """
+    
+    # Table models by table name, defined once per process so every store on a table shares them
+    _models: Dict[str, Tuple[Type[DiscoveryTasks], Type[DiscoveryTaskPayloads]]] = {}
+    _models_lock = threading.Lock()
+    
+    def __init__(self, engine: Engine, ttl: float = 3600, max_entries: int = 100000, table_name: str = "discovery_tasks", prune_interval: float = 60) -> None:
+        """
+        Initialize the store and create its tables if they do not exist.
+        
+        Args:
+            engine: SQLAlchemy engine of the database
+            ttl: Seconds a task is kept after it was created
+            max_entries: Maximum number of stored tasks
+            table_name: Name of the tasks table, the payloads are stored in ``<table_name>_payloads``
+            prune_interval: Minimum seconds between two prunings of the expired tasks
+        """
+        super().__init__(ttl=ttl, max_entries=max_entries)
+        self.engine = engine
+        self.prune_interval = prune_interval
+        self._last_prune: Optional[datetime] = None
+        
+        self.TaskModel, self.PayloadModel = self._get_models(table_name)
+        SQLModel.metadata.create_all(engine, tables=[self.TaskModel.__table__, self.PayloadModel.__table__])
+    
+    @classmethod
+    def _get_models(cls, table_name: str) -> Tuple[Type[DiscoveryTasks], Type[DiscoveryTaskPayloads]]:
+        with cls._models_lock:
+            if table_name not in cls._models:
+                class DynamicDiscoveryTasks(DiscoveryTasks, table=True):
+                    __tablename__ = table_name
+                    __table_args__ = {"extend_existing": True}
+                
+                class DynamicDiscoveryTaskPayloads(DiscoveryTaskPayloads, table=True):
+                    __tablename__ = f"{table_name}_payloads"
+                    __table_args__ = {"extend_existing": True}
+                
+                cls._models[table_name] = (DynamicDiscoveryTasks, DynamicDiscoveryTaskPayloads)
+            return cls._models[table_name]
+    
+    def create(self, task_id: str, task: Dict[str, Any]) -> None:
+        now = datetime.now()
+        with Session(self.engine) as session:
+            self._prune(session, now, room=1)
+            session.add(self.TaskModel(
+                task_id=task_id,
+                status=task["status"],
+                step=task["step"],
+                message=task["message"],
+                progress=task.get("progress", 0),
+                error=task.get("error"),
+                created_at=now,
+                expires_at=now + timedelta(seconds=self.ttl)
+            ))
+            session.commit()
+    
+    def get(self, task_id: str, include_payloads: bool = True) -> Optional[Dict[str, Any]]:
+        now = datetime.now()
+        with Session(self.engine) as session:
+            if self._prune(session, now):
+                session.commit()
+            row = session.exec(
+                select(self.TaskModel).where(self.TaskModel.task_id == task_id, self.TaskModel.expires_at > now)
+            ).first()
+            if row is None:
+                return None
+            task = {
+                "status": row.status,
+                "step": row.step,
+                "message": row.message,
+                "progress": row.progress,
+                "created_at": row.created_at.isoformat(),
+                "error": row.error,
+                **{field: None for field in self.PAYLOAD_FIELDS}
+            }
+            if include_payloads:
+                payloads = session.exec(select(self.PayloadModel).where(self.PayloadModel.task_id == task_id)).all()
+                task.update({payload.name: payload.payload for payload in payloads})
+            return task
+    
+    def update(self, task_id: str, changes: Dict[str, Any]) -> None:
+        now = datetime.now()
+        with Session(self.engine) as session:
+            self._prune(session, now)
+            row = session.get(self.TaskModel, task_id)
+            if row is None or row.expires_at <= now:
+                session.commit()
+                return
+            for field, value in changes.items():
+                if field in self.PAYLOAD_FIELDS:
+                    if value is not None:
+                        session.merge(self.PayloadModel(task_id=task_id, name=field, payload=value))
+                elif field != "created_at":
+                    setattr(row, field, value)
+            session.add(row)
+            session.commit()
+    
+    def _prune(self, session: Session, now: datetime, room: int = 0) -> bool:
+        """
+        Delete the expired tasks and the oldest ones beyond the maximum number of tasks.
+        
+        Args:
+            session: The session the deletions are run in, committed by the caller
+            now: The current time
+            room: Number of tasks about to be created that have to fit within the maximum
+        
+        Returns:
+            False if the store was pruned less than ``prune_interval`` seconds ago and nothing was done
+        """
+        if self._last_prune is not None and (now - self._last_prune).total_seconds() < self.prune_interval:
+            return False
+        self._last_prune = now
+        session.exec(delete(self.TaskModel).where(self.TaskModel.expires_at <= now))
+        count = session.exec(select(func.count()).select_from(self.TaskModel)).one()
+        if count + room > self.max_entries:
+            oldest = select(self.TaskModel.task_id).order_by(self.TaskModel.created_at).limit(count + room - self.max_entries)
+            session.exec(delete(self.TaskModel).where(self.TaskModel.task_id.in_(oldest)))
+        session.exec(delete(self.PayloadModel).where(self.PayloadModel.task_id.not_in(select(self.TaskModel.task_id))))
+        return True
+
+
+def create_discovery_task_store() -> DiscoveryTaskStore:
+    """
+    Create the discovery task store configured in ``consumer.discovery.dpp_discovery.task_store``.
+    
+    Returns:
+        The Postgres store if ``type`` is "postgres", the in-memory store otherwise
+    """
+    store_config = ConfigManager.get_config("consumer.discovery.dpp_discovery.task_store", default={}) or {}
+    ttl = float(store_config.get("ttl_seconds", 3600))
+    max_entries = int(store_config.get("max_entries", 1000))
+    
+    if store_config.get("type", "memory") == "postgres":
+        from database import engine
+        logger.info("[Discovery Task Store] Storing the discovery tasks in the database")
+        return PostgresDiscoveryTaskStore(
+            engine,
+            ttl=ttl,
+            max_entries=max_entries,
+            table_name=store_config.get("table_name", "discovery_tasks")
+        )
+    
+    return MemoryDiscoveryTaskStore(
+        ttl=ttl,
+        max_entries=max_entries,
+        spill_threshold=store_config.get("spill_threshold_bytes", 256 * 1024),
+        spill_dir=store_config.get("spill_dir")
+    )
@@ -34,4 +34,6 @@ from .connector.database.connector_consumer_sync_postgres_memory_manager import
 
 from .dtr.memory.dtr_consumer_memory_manager import DtrConsumerMemoryManager
 from .dtr.database.dtr_consumer_postgres_memory_manager import DtrConsumerPostgresMemoryManager
-from .dtr.database.dtr_consumer_sync_postgres_memory_manager import DtrConsumerSyncPostgresMemoryManager
\ No newline at end of file
+from .dtr.database.dtr_consumer_sync_postgres_memory_manager import DtrConsumerSyncPostgresMemoryManager
+from .dtr.shell_fetch_executor import ShellFetchExecutor
+from .dtr.shell_descriptor_cache import ShellDescriptorCache
\ No newline at end of file
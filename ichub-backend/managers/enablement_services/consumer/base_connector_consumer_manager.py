@@ -22,7 +22,7 @@
 #################################################################################
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, List, Dict, Optional
+from typing import TYPE_CHECKING, Any, List, Dict, Optional, Sequence
 from tractusx_sdk.dataspace.services.discovery import ConnectorDiscoveryService
 if TYPE_CHECKING:
     from managers.enablement_services.connector_manager import BaseConnectorConsumerManager
@@ -156,7 +156,7 @@ class BaseConnectorConsumerManager(ABC):
         pass
 
     @abstractmethod
-    def get_connectors(self, bpn: str) -> List[str]:
+    def get_connectors(self, bpn: str) -> Sequence[str]:
         """
         Retrieve connectors for a specific BPN, with automatic discovery if not cached.
         
@@ -168,10 +168,21 @@ class BaseConnectorConsumerManager(ABC):
             bpn (str): The Business Partner Number to get connectors for
             
         Returns:
-            List[str]: List of connector URLs/endpoints for the BPN
+            Sequence[str]: Read-only sequence of connector URLs/endpoints for the BPN
         """
         pass
 
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get runtime metrics of the connector consumer manager.
+        
+        Implementations can override it to expose their counters.
+        
+        Returns:
+            Dict[str, Any]: Metrics grouped by component
+        """
+        return {}
+
     def _is_cache_expired(self, bpn: str) -> bool:
         """
         Helper method to check if cache for a specific BPN has expired.
@@ -0,0 +1,122 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Optional, Set, Type
+from sqlalchemy import or_
+from sqlmodel import Session, select, delete, func
+from models.metadata_database.consumer.models import KnownCacheChanges
+
+
+class CacheChangeLog:
+    """
+    Append-only log of the BPNs changed in a database-backed consumer cache.
+
+    Writers append the changed BPNs in the same transaction as the cache rows. Readers poll the
+    log for entries newer than the last one they applied, which is a single primary key range
+    query when nothing changed, and reload only the rows of those BPNs instead of the whole table.
+    A purge of the whole cache is logged with an empty BPN.
+    """
+
+    # Marker returned in the changed BPNs when the whole cache has to be reloaded
+    FULL_RELOAD = None
+    # Larger jumps of the change numbers are not tracked as gaps (e.g. sequence caching after a restart)
+    MAX_TRACKED_GAP = 1000
+
+    def __init__(self, model: Type[KnownCacheChanges], retention: float = 3600, gap_timeout: float = 60):
+        """
+        Initialize the change log.
+
+        Args:
+            model (Type[KnownCacheChanges]): Table model where the changes are stored
+            retention (float, optional): Seconds a change is kept before it is pruned. Defaults to 3600.
+            gap_timeout (float, optional): Seconds a missing change number is waited for. Defaults to 60.
+        """
+        self.model = model
+        self.retention = retention
+        self.gap_timeout = gap_timeout
+        self.last_id = 0
+        self._gaps: Dict[int, float] = {}
+        self._last_poll_at: Optional[float] = None
+
+    def record(self, session: Session, bpns: Iterable[Optional[str]]) -> None:
+        """
+        Add the changed BPNs to the session, they are stored when the session is committed.
+
+        Args:
+            session (Session): Session writing the cache rows
+            bpns (Iterable[Optional[str]]): Changed BPNs, FULL_RELOAD for a purge of the whole cache
+        """
+        changed_at = datetime.now()
+        for bpn in bpns:
+            session.add(self.model(bpnl=bpn, changed_at=changed_at))
+
+    def prune(self, session: Session) -> None:
+        """Delete the changes older than the retention."""
+        session.exec(delete(self.model).where(self.model.changed_at < datetime.now() - timedelta(seconds=self.retention)))
+
+    def reset(self, session: Session) -> None:
+        """Mark every logged change as applied, called after the whole cache was loaded."""
+        self.last_id = session.exec(select(func.max(self.model.id))).one() or 0
+        self._gaps = {}
+        self._last_poll_at = time.monotonic()
+
+    def poll(self, session: Session) -> Set[Optional[str]]:
+        """
+        Get the BPNs changed since the last poll.
+
+        Change numbers are assigned when a row is inserted, not when it is committed, so a
+        slower transaction can commit a lower number after a higher one was read. Missing
+        numbers are therefore checked again on the next polls until ``gap_timeout`` passes
+        (rolled back transactions leave permanent gaps).
+
+        Args:
+            session (Session): Session used to read the log
+
+        Returns:
+            Set[Optional[str]]: The changed BPNs, containing FULL_RELOAD when the whole cache has to be reloaded
+        """
+        now = time.monotonic()
+        if self._last_poll_at is None or now - self._last_poll_at >= self.retention:
+            # Changes may have been pruned since the last poll, only a full reload is safe
+            return {self.FULL_RELOAD}
+
+        self._gaps = {change_id: seen_at for change_id, seen_at in self._gaps.items() if now - seen_at < self.gap_timeout}
+
+        condition = self.model.id > self.last_id
+        if self._gaps:
+            condition = or_(condition, self.model.id.in_(list(self._gaps)))
+        rows = session.exec(select(self.model.id, self.model.bpnl).where(condition).order_by(self.model.id)).all()
+
+        changed = set()
+        for change_id, bpn in rows:
+            self._gaps.pop(change_id, None)
+            if change_id > self.last_id:
+                if change_id - self.last_id <= self.MAX_TRACKED_GAP:
+                    for missing_id in range(self.last_id + 1, change_id):
+                        self._gaps[missing_id] = now
+                self.last_id = change_id
+            changed.add(bpn)
+        self._last_poll_at = now
+        return changed
@@ -0,0 +1,87 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+
+import random
+import threading
+from typing import Any, Dict
+from tractusx_sdk.dataspace.tools import op
+
+
+class CacheRefreshPolicy:
+    """
+    Stale-while-revalidate policy of the consumer connector and DTR caches.
+
+    Entries expire after the expiration time shortened by a random jitter, so entries loaded
+    together (e.g. at startup) are not all refreshed at once. Within ``stale_grace`` seconds
+    after expiring, an entry is still served while it is refreshed in the background; older
+    entries are only returned once they were discovered again.
+    """
+
+    def __init__(self, stale_grace: float = 300, jitter: float = 0.1):
+        """
+        Initialize the refresh policy.
+
+        Args:
+            stale_grace (float, optional): Seconds an expired entry is still served. 0 disables serving stale entries. Defaults to 300.
+            jitter (float, optional): Maximum fraction of the expiration time an entry expires earlier. Defaults to 0.1.
+        """
+        self.stale_grace = max(0, stale_grace)
+        self.jitter = min(max(0, jitter), 1)
+        self._lock = threading.Lock()
+        self.stale_hits = 0
+
+    def next_refresh_timestamp(self, expiration_time: float) -> float:
+        """
+        Get the timestamp when an entry stored now has to be refreshed.
+
+        Args:
+            expiration_time (float): Expiration time of the cache in minutes
+
+        Returns:
+            float: UTC timestamp of the refresh
+        """
+        return op.get_future_timestamp(minutes=expiration_time * (1 - random.uniform(0, self.jitter)))
+
+    def is_within_grace(self, refresh_timestamp: float) -> bool:
+        """Check if an entry that expired at the given timestamp can still be served."""
+        return self.stale_grace > 0 and not op.is_interval_reached(end_timestamp=refresh_timestamp + self.stale_grace)
+
+    def record_stale_hit(self) -> None:
+        """Count a stale entry served while it is refreshed."""
+        with self._lock:
+            self.stale_hits += 1
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get the policy settings and counters.
+
+        Returns:
+            Dict[str, Any]: Grace window, jitter and the number of stale entries served
+        """
+        with self._lock:
+            return {
+                "staleGraceSeconds": self.stale_grace,
+                "jitter": self.jitter,
+                "staleHits": self.stale_hits
+            }
@@ -23,8 +23,7 @@
 
 import threading
 import hashlib
-import copy
-from typing import List, Dict
+from typing import List, Dict, Optional
 import json
 from datetime import datetime
 from sqlmodel import select, delete, Session, SQLModel
@@ -35,7 +34,8 @@ from tractusx_sdk.dataspace.services.discovery import ConnectorDiscoveryService
 from tractusx_sdk.dataspace.services.connector import BaseConnectorConsumerService
 from sqlalchemy.engine import Engine as E
 from sqlalchemy.orm import Session as S
-from models.metadata_database.consumer.models import KnownConnectors
+from models.metadata_database.consumer.models import KnownConnectors, KnownCacheChanges
+from ...cache_change_log import CacheChangeLog
 
 class ConsumerConnectorPostgresMemoryManager(ConnectorConsumerMemoryManager):
     """
@@ -51,7 +51,10 @@ class ConsumerConnectorPostgresMemoryManager(ConnectorConsumerMemoryManager):
                  table_name: str = "known_connectors", 
                  connectors_key: str = "connectors", 
                  logger: logging.Logger = None, 
-                 verbose: bool = False):
+                 verbose: bool = False,
+                 change_retention: float = 3600,
+                 stale_grace: float = 300,
+                 refresh_jitter: float = 0.1):
         """
         Initialize the Postgres memory-backed connection manager.
 
@@ -64,6 +67,9 @@ class ConsumerConnectorPostgresMemoryManager(ConnectorConsumerMemoryManager):
             connectors_key: Key used to store EDR counts within open_connections.
             logger: Optional logger instance for debug output.
             verbose: Flag for enabling verbose logging.
+            change_retention: Seconds the saved changes are kept in the change log for other replicas.
+            stale_grace: Seconds expired connectors are still served while they are refreshed in the background.
+            refresh_jitter: Maximum fraction of the expiration time the connectors of a BPN expire earlier.
         """
         # Initialize base memory connection manager and configure database.
         # Dynamically define the SQLModel table for EDR connections.
@@ -73,7 +79,9 @@ class ConsumerConnectorPostgresMemoryManager(ConnectorConsumerMemoryManager):
             connector_discovery=connector_discovery, 
             expiration_time=expiration_time, 
             logger=logger, 
-            verbose=verbose
+            verbose=verbose,
+            stale_grace=stale_grace,
+            refresh_jitter=refresh_jitter
         )
         self.engine = engine
         self.table_name = table_name
@@ -82,12 +90,21 @@ class ConsumerConnectorPostgresMemoryManager(ConnectorConsumerMemoryManager):
         self.connectors_key = connectors_key
         self._save_thread = None
         self._last_saved_hash = None
+        # BPNs changed in memory since the last save, only these are written to the database
+        self._dirty_bpns = set()
+        self._purge_all_pending = False
+        self._persist_lock = threading.Lock()  # Serializes database writes, never held by readers
         SQLModel.metadata.create_all(engine)
         class DynamicKnownConnectors(KnownConnectors, table=True):
             __tablename__ = table_name
             __table_args__ = {"extend_existing": True}
 
+        class DynamicKnownConnectorsChanges(KnownCacheChanges, table=True):
+            __tablename__ = f"{table_name}_changes"
+            __table_args__ = {"extend_existing": True}
+
         self.KnownConnectorsModel = DynamicKnownConnectors
+        self._change_log = CacheChangeLog(model=DynamicKnownConnectorsChanges, retention=change_retention)
         DynamicKnownConnectors.metadata.create_all(engine)
         self._load_from_db()
 
@@ -106,6 +123,7 @@ class ConsumerConnectorPostgresMemoryManager(ConnectorConsumerMemoryManager):
             None
         """
         super().add_connectors(bpn, connectors)  # Call the base class method to handle in-memory caching
+        self._mark_dirty(bpn)
         self._trigger_save()
 
     def delete_connector(self, bpn: str, connector_id: str) -> Dict:
@@ -120,6 +138,7 @@ class ConsumerConnectorPostgresMemoryManager(ConnectorConsumerMemoryManager):
             Dict: Updated cache state after deletion
         """
         super().delete_connector(bpn, connector_id)
+        self._mark_dirty(bpn)
         self._trigger_save()
         return self.known_connectors
 
@@ -135,6 +154,7 @@ class ConsumerConnectorPostgresMemoryManager(ConnectorConsumerMemoryManager):
             None
         """
         super().purge_bpn(bpn)
+        self._mark_dirty(bpn)
         self._trigger_save()
 
     
@@ -148,9 +168,19 @@ class ConsumerConnectorPostgresMemoryManager(ConnectorConsumerMemoryManager):
         Returns:
             None
         """
-        super().purge_cache()
+        with self._lock:
+            super().purge_cache()
+            self._dirty_bpns.clear()
+            self._purge_all_pending = True
         self._trigger_save()
 
+    def _mark_dirty(self, bpn: str) -> None:
+        """
+        Remember that the connectors of a BPN changed in memory and need to be written to the database.
+        """
+        with self._lock:
+            self._dirty_bpns.add(bpn)
+
 
     def _trigger_save(self):
         """
@@ -165,94 +195,153 @@ class ConsumerConnectorPostgresMemoryManager(ConnectorConsumerMemoryManager):
     def _load_from_db(self):
         """
         Reload known_connectors from the DB and restore them to memory.
+        
+        BPNs with changes that were not saved yet keep their in-memory state.
         """
-        self.logger.debug(f"[ConsumerConnectorPostgresMemoryManager] [{threading.get_ident()}] Trying to acquire lock (_load_from_db)")
-        with self._lock:
-            self.logger.debug(f"[ConsumerConnectorPostgresMemoryManager] [{threading.get_ident()}] Acquired lock (_load_from_db)")
+        # Hold the write lock so rows being written by a concurrent save are never read half way
+        with self._persist_lock:
             try:
-                loaded_bpns = 0
                 with Session(self.engine) as session:
+                    # Read the change position first, changes committed while loading are applied again later
+                    self._change_log.reset(session)
                     result = session.exec(select(self.KnownConnectorsModel)).all()
-                    
-                    # Store current state to compare for changes
-                    old_connectors = self.known_connectors.copy()
-                    
-                    # Clear current known_connectors
-                    self.known_connectors = {}
-                    
-                    for row in result:
-                        bpn = row.bpnl
-                        connectors_list = row.connectors
-                        expires_at = row.expires_at
-                        
-                        # Convert datetime back to timestamp for the SDK
-                        timestamp = expires_at.timestamp()
+            except SQLAlchemyError as e:
+                if self.logger and self.verbose:
+                    self.logger.error(f"[ConsumerConnectorPostgresMemoryManager] Error loading from db: {e}")
+                return
 
-                        self.known_connectors[bpn] = {
-                            self.REFRESH_INTERVAL_KEY: timestamp,
-                            self.CONNECTOR_LIST_KEY: connectors_list
-                        }
-                        loaded_bpns += 1
+            loaded = self._rows_to_known_connectors(result)
+
+            self.logger.debug(f"[ConsumerConnectorPostgresMemoryManager] [{threading.get_ident()}] Trying to acquire lock (_load_from_db)")
+            with self._lock:
+                self.logger.debug(f"[ConsumerConnectorPostgresMemoryManager] [{threading.get_ident()}] Acquired lock (_load_from_db)")
+                if self._purge_all_pending:
+                    # The table is about to be cleared, do not bring the purged entries back
+                    loaded = {}
+                for bpn in self._dirty_bpns:
+                    loaded.pop(bpn, None)
+                    if bpn in self.known_connectors:
+                        loaded[bpn] = self.known_connectors[bpn]
+                self.known_connectors = loaded
 
                 # Only log if there's a change in the data
                 new_hash = hashlib.sha256(json.dumps(self.known_connectors, sort_keys=True, default=str).encode()).hexdigest()
                 if self.logger and self.verbose and (self._last_saved_hash is None or new_hash != self._last_saved_hash):
-                    self.logger.info(f"[ConsumerConnectorPostgresMemoryManager] Loaded {loaded_bpns} BPN connector entries from the database.")
-                    
+                    self.logger.info(f"[ConsumerConnectorPostgresMemoryManager] Loaded {len(result)} BPN connector entries from the database.")
                 self._last_saved_hash = new_hash
+            self.logger.debug(f"[ConsumerConnectorPostgresMemoryManager] [{threading.get_ident()}] Released lock (_load_from_db)")
+
+    def _load_changes_from_db(self):
+        """
+        Reload only the BPNs changed in the database since the last load.
+        
+        Falls back to a full reload when the whole cache was purged or the change log can not
+        tell what changed anymore.
+        """
+        full_reload = False
+        with self._persist_lock:
+            try:
+                with Session(self.engine) as session:
+                    changed_bpns = self._change_log.poll(session)
+                    full_reload = CacheChangeLog.FULL_RELOAD in changed_bpns
+                    if not changed_bpns or full_reload:
+                        result = []
+                    else:
+                        result = session.exec(select(self.KnownConnectorsModel).where(self.KnownConnectorsModel.bpnl.in_(changed_bpns))).all()
             except SQLAlchemyError as e:
                 if self.logger and self.verbose:
-                    self.logger.error(f"[ConsumerConnectorPostgresMemoryManager] Error loading from db: {e}")
-        self.logger.debug(f"[ConsumerConnectorPostgresMemoryManager] [{threading.get_ident()}] Released lock (_load_from_db)")
+                    self.logger.error(f"[ConsumerConnectorPostgresMemoryManager] Error loading changes from db: {e}")
+                return
+
+            if changed_bpns and not full_reload:
+                loaded = self._rows_to_known_connectors(result)
+                with self._lock:
+                    if not self._purge_all_pending:
+                        for bpn in changed_bpns - self._dirty_bpns:
+                            if bpn in loaded:
+                                self.known_connectors[bpn] = loaded[bpn]
+                            else:
+                                self.known_connectors.pop(bpn, None)
+                if self.logger and self.verbose:
+                    self.logger.info(f"[ConsumerConnectorPostgresMemoryManager] Reloaded {len(result)} of {len(changed_bpns)} changed BPN connector entries from the database.")
+
+        if full_reload:
+            self._load_from_db()
+
+    def _rows_to_known_connectors(self, rows: List[KnownConnectors]) -> Dict:
+        """
+        Build the in-memory cache structure from database rows.
+        """
+        loaded = {}
+        for row in rows:
+            # Convert datetime back to timestamp for the SDK
+            loaded[row.bpnl] = self._create_connector_cache_entry(refresh_interval=row.expires_at.timestamp(), connectors=row.connectors)
+        return loaded
 
     def _save_to_db(self):
         """
-        Persist current in-memory known_connectors to the DB only if changes are detected.
+        Persist the BPNs changed since the last save.
+        
+        The rows of every changed BPN are replaced in a single transaction, together with an
+        entry per BPN in the change log. Unchanged BPNs are not touched. The in-memory lock is
+        only held to take a snapshot of the changes, the database is written without blocking
+        readers.
         """
-        connectors_to_save = {}
-        current_hash = ""
-        self.logger.debug(f"[ConsumerConnectorPostgresMemoryManager] [{threading.get_ident()}] Trying to acquire lock (_save_to_db)")
-        with self._lock:
-            self.logger.debug(f"[ConsumerConnectorPostgresMemoryManager] [{threading.get_ident()}] Acquired lock (_save_to_db)")
-            current_hash = hashlib.sha256(json.dumps(self.known_connectors, sort_keys=True, default=str).encode()).hexdigest()
+        with self._persist_lock:
+            while True:
+                self.logger.debug(f"[ConsumerConnectorPostgresMemoryManager] [{threading.get_ident()}] Trying to acquire lock (_save_to_db)")
+                with self._lock:
+                    self.logger.debug(f"[ConsumerConnectorPostgresMemoryManager] [{threading.get_ident()}] Acquired lock (_save_to_db)")
+                    purge_all = self._purge_all_pending
+                    dirty_bpns = self._dirty_bpns
+                    self._purge_all_pending = False
+                    self._dirty_bpns = set()
+                    rows = {bpn: self._snapshot_row(bpn) for bpn in dirty_bpns}
+                self.logger.debug(f"[ConsumerConnectorPostgresMemoryManager] [{threading.get_ident()}] Released lock (_save_to_db)")
 
-            if current_hash == self._last_saved_hash:
-                return
-            
-            connectors_to_save = copy.deepcopy(self.known_connectors)
+                if not purge_all and not dirty_bpns:
+                    return
 
-        self.logger.debug(f"[ConsumerConnectorPostgresMemoryManager] [{threading.get_ident()}] Released lock (_save_to_db)")
-        try:
-            saved_connectors = 0
-            with Session(self.engine) as session:
-                # Clear existing data
-                session.exec(delete(self.KnownConnectorsModel))
-                
-                # Save each BPN's connector data
-                for bpn, bpn_data in connectors_to_save.items():
-                    if self.CONNECTOR_LIST_KEY in bpn_data and self.REFRESH_INTERVAL_KEY in bpn_data:
-                        # Convert timestamp to datetime object instead of using the formatted string
-                        timestamp = bpn_data[self.REFRESH_INTERVAL_KEY]
-                        expires_at = datetime.fromtimestamp(timestamp)
-                        connectors_list = bpn_data[self.CONNECTOR_LIST_KEY]
-                        
-                        session.add(self.KnownConnectorsModel(
-                            bpnl=bpn,
-                            connectors=connectors_list,
-                            expires_at=expires_at
-                        ))
-                        saved_connectors += 1
-                                
-                session.commit()
+                try:
+                    saved_connectors = 0
+                    with Session(self.engine) as session:
+                        if purge_all:
+                            session.exec(delete(self.KnownConnectorsModel))
+                        for bpn, row in rows.items():
+                            if not purge_all:
+                                session.exec(delete(self.KnownConnectorsModel).where(self.KnownConnectorsModel.bpnl == bpn))
+                            if row is not None:
+                                session.add(self.KnownConnectorsModel(**row))
+                                saved_connectors += 1
+                        # Let the other replicas know what to reload
+                        self._change_log.record(session, ([CacheChangeLog.FULL_RELOAD] if purge_all else []) + list(rows))
+                        self._change_log.prune(session)
+                        session.commit()
+                    if self.logger and self.verbose:
+                        self.logger.info(f"[ConsumerConnectorPostgresMemoryManager] Saved {saved_connectors} of {len(rows)} changed BPN connector entries to the database.")
+                except SQLAlchemyError as e:
+                    # Keep the changes pending so the next save retries them
+                    with self._lock:
+                        self._purge_all_pending = self._purge_all_pending or purge_all
+                        self._dirty_bpns.update(dirty_bpns)
+                    if self.logger and self.verbose:
+                        self.logger.error(f"[ConsumerConnectorPostgresMemoryManager] Error saving to db: {e}")
+                    return
 
-                with self._lock:
-                    self._last_saved_hash = current_hash
+    def _snapshot_row(self, bpn: str) -> Optional[Dict]:
+        """
+        Build the database row of a BPN from the in-memory cache. Must be called holding the lock.
+        """
+        bpn_data = self.known_connectors.get(bpn)
+        if not bpn_data or self.CONNECTOR_LIST_KEY not in bpn_data or self.REFRESH_INTERVAL_KEY not in bpn_data:
+            return None
 
-                if self.logger and self.verbose:
-                    self.logger.info(f"[ConsumerConnectorPostgresMemoryManager] Saved {saved_connectors} BPN connector entries to the database.")
-        except SQLAlchemyError as e:
-            if self.logger and self.verbose:
-                self.logger.error(f"[ConsumerConnectorPostgresMemoryManager] Error saving to db: {e}")
+        # Convert timestamp to datetime object instead of using the formatted string
+        return {
+            "bpnl": bpn,
+            "connectors": list(bpn_data[self.CONNECTOR_LIST_KEY]),
+            "expires_at": datetime.fromtimestamp(bpn_data[self.REFRESH_INTERVAL_KEY])
+        }
 
     def stop(self):
         """
@@ -34,7 +34,13 @@ class ConsumerConnectorSyncPostgresMemoryManager(ConsumerConnectorPostgresMemory
     """
     Manages EDR connections using an in-memory cache synchronized with a Postgres database.
     Periodically persists changes and reloads updates from the database to ensure consistency.
+    
+    In the "incremental" sync mode only the BPNs listed in the change log since the last sync are
+    reloaded, the "full" mode reloads the whole table on every cycle.
     """
+    SYNC_MODE_INCREMENTAL = "incremental"
+    SYNC_MODE_FULL = "full"
+
     def __init__(self, 
                  connector_consumer_service: BaseConnectorConsumerService,
                  engine: E | S, 
@@ -44,7 +50,11 @@ class ConsumerConnectorSyncPostgresMemoryManager(ConsumerConnectorPostgresMemory
                  table_name: str = "known_connectors", 
                  connectors_key: str = "connectors", 
                  logger: logging.Logger = None, 
-                 verbose: bool = False):
+                 verbose: bool = False,
+                 sync_mode: str = "incremental",
+                 change_retention: float = 3600,
+                 stale_grace: float = 300,
+                 refresh_jitter: float = 0.1):
 
         super().__init__(
             connector_consumer_service=connector_consumer_service,
@@ -54,8 +64,14 @@ class ConsumerConnectorSyncPostgresMemoryManager(ConsumerConnectorPostgresMemory
             verbose=verbose, 
             table_name=table_name, 
             connectors_key=connectors_key, 
-            engine=engine
+            engine=engine,
+            change_retention=change_retention,
+            stale_grace=stale_grace,
+            refresh_jitter=refresh_jitter
         )
+        if sync_mode not in (self.SYNC_MODE_INCREMENTAL, self.SYNC_MODE_FULL):
+            raise ValueError(f"Unsupported sync mode [{sync_mode}], expected [{self.SYNC_MODE_INCREMENTAL}] or [{self.SYNC_MODE_FULL}]")
+        self.sync_mode = sync_mode
         self.persist_interval = persist_interval
         self._stop_event = threading.Event()
         self._start_background_tasks()
@@ -72,7 +88,16 @@ class ConsumerConnectorSyncPostgresMemoryManager(ConsumerConnectorPostgresMemory
         """
         while not self._stop_event.is_set():
             time.sleep(self.persist_interval)
-            self._save_to_db()
+            self._sync_with_db()
+
+    def _sync_with_db(self):
+        """
+        Save the local changes and load the ones made by other replicas.
+        """
+        self._save_to_db()
+        if self.sync_mode == self.SYNC_MODE_INCREMENTAL:
+            self._load_changes_from_db()
+        else:
             self._load_from_db()
 
     def stop(self):
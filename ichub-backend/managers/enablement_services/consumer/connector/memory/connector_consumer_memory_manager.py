@@ -31,8 +31,10 @@ from tractusx_sdk.dataspace.services.discovery import ConnectorDiscoveryService
 from tractusx_sdk.dataspace.services.connector import BaseConnectorConsumerService
 from tractusx_sdk.dataspace.tools import op
 from managers.enablement_services.consumer.base_connector_consumer_manager import BaseConnectorConsumerManager
-from typing import List, Dict, Optional
-import copy
+from managers.enablement_services.consumer.single_flight import SingleFlight
+from managers.enablement_services.consumer.cache_refresh_policy import CacheRefreshPolicy
+from types import MappingProxyType
+from typing import Any, List, Dict, Mapping, Optional, Sequence
 import logging
 
 class ConnectorConsumerMemoryManager(BaseConnectorConsumerManager):
@@ -55,7 +57,9 @@ class ConnectorConsumerMemoryManager(BaseConnectorConsumerManager):
                  connector_discovery: ConnectorDiscoveryService, 
                  expiration_time: int = 60, 
                  logger: logging.Logger = None, 
-                 verbose: bool = False):
+                 verbose: bool = False,
+                 stale_grace: float = 300,
+                 refresh_jitter: float = 0.1):
         """
         Initialize the memory-based connector consumer manager.
         
@@ -65,12 +69,16 @@ class ConnectorConsumerMemoryManager(BaseConnectorConsumerManager):
             expiration_time (int, optional): Cache expiration time in minutes. Defaults to 60.
             logger (logging.Logger, optional): Logger instance
             verbose (bool, optional): Verbose flag
+            stale_grace (float, optional): Seconds expired connectors are still served while they are refreshed in the background, 0 to wait for the refresh. Defaults to 300.
+            refresh_jitter (float, optional): Maximum fraction of the expiration time the connectors of a BPN expire earlier. Defaults to 0.1.
         """
         super().__init__(connector_consumer_service, connector_discovery, expiration_time)
         self.known_connectors = {}
         self.logger = logger if logger else None
         self.verbose = verbose
         self._lock = threading.RLock()
+        self._connector_discovery_flights = SingleFlight()
+        self.refresh_policy = CacheRefreshPolicy(stale_grace=stale_grace, jitter=refresh_jitter)
         
     def add_connectors(self, bpn: str, connectors: List[str]) -> None:
         """
@@ -86,26 +94,41 @@ class ConnectorConsumerMemoryManager(BaseConnectorConsumerManager):
         self.logger.debug(f"[CONNECTOR Manager] [{threading.get_ident()}] Trying to acquire lock (add_connectors)")
         with self._lock:
             self.logger.debug(f"[CONNECTOR Manager] [{threading.get_ident()}] Acquired lock (add_connectors)")
-            if bpn not in self.known_connectors:
-                self.known_connectors[bpn] = {}
-
             # Always update the refresh interval timestamp
-            self.known_connectors[bpn][self.REFRESH_INTERVAL_KEY] = op.get_future_timestamp(minutes=self.expiration_time)
+            refresh_interval = self.refresh_policy.next_refresh_timestamp(self.expiration_time)
             
             # Check if we already have valid connectors and the cache hasn't expired
-            if(self.CONNECTOR_LIST_KEY in self.known_connectors[bpn]) and (len(self.known_connectors[bpn][self.CONNECTOR_LIST_KEY]) > 0):
+            cached_connectors = self.known_connectors.get(bpn, {}).get(self.CONNECTOR_LIST_KEY)
+            if cached_connectors and not self._is_cache_expired(bpn):
+                self.known_connectors[bpn] = self._create_connector_cache_entry(refresh_interval=refresh_interval, connectors=cached_connectors)
                 if(self.logger and self.verbose):
                     self.logger.debug(f"[CONNECTOR Manager] [{bpn}] CONNECTORs already cached, skipping update")
                 return
             
             # Store the connectors under the specific key
-            self.known_connectors[bpn][self.CONNECTOR_LIST_KEY] = connectors
+            self.known_connectors[bpn] = self._create_connector_cache_entry(refresh_interval=refresh_interval, connectors=connectors)
             
             if(self.logger and self.verbose):
                 self.logger.info(f"[CONNECTOR Manager] [{bpn}] Added [{len(self.known_connectors[bpn][self.CONNECTOR_LIST_KEY])}] CONNECTORs to the cache! Next refresh at [{op.timestamp_to_datetime(self.known_connectors[bpn][self.REFRESH_INTERVAL_KEY])}] UTC")
         self.logger.debug(f"[CONNECTOR Manager] [{threading.get_ident()}] Released lock (add_connectors)")    
         return 
         
+    def _create_connector_cache_entry(self, refresh_interval: float, connectors: Sequence[str]) -> Mapping[str, Any]:
+        """
+        Create a read-only cache entry for a BPN.
+        
+        Entries are replaced instead of modified, so readers can use the cached entry and its
+        connector tuple without holding the lock or copying them.
+        
+        Args:
+            refresh_interval (float): Timestamp when the entry has to be refreshed
+            connectors (Sequence[str]): The connector URLs/endpoints of the BPN
+        """
+        return MappingProxyType({
+            self.REFRESH_INTERVAL_KEY: refresh_interval,
+            self.CONNECTOR_LIST_KEY: tuple(connectors)
+        })
+
     def is_connector_known(self, bpn: str, connector: str) -> bool:
         """
         Check if a specific connector is known/cached for the given BPN.
@@ -186,8 +209,12 @@ class ConnectorConsumerMemoryManager(BaseConnectorConsumerManager):
         with self._lock:
             self.logger.debug(f"[CONNECTOR Manager] [{threading.get_ident()}] Acquired lock (delete_connector)")
             if bpn in self.known_connectors and self.CONNECTOR_LIST_KEY in self.known_connectors[bpn]:
-                if connector_id in self.known_connectors[bpn][self.CONNECTOR_LIST_KEY]:
-                    self.known_connectors[bpn][self.CONNECTOR_LIST_KEY].remove(connector_id)
+                entry = self.known_connectors[bpn]
+                if connector_id in entry[self.CONNECTOR_LIST_KEY]:
+                    self.known_connectors[bpn] = self._create_connector_cache_entry(
+                        refresh_interval=entry[self.REFRESH_INTERVAL_KEY],
+                        connectors=[connector for connector in entry[self.CONNECTOR_LIST_KEY] if connector != connector_id]
+                    )
                     if(self.logger and self.verbose):
                         self.logger.debug(f"[CONNECTOR Manager] [{bpn}] Removed connector [{connector_id}] from cache")
         self.logger.debug(f"[CONNECTOR Manager] [{threading.get_ident()}] Released lock (delete_connector)")
@@ -219,7 +246,7 @@ class ConnectorConsumerMemoryManager(BaseConnectorConsumerManager):
             self.known_connectors = {}
         self.logger.debug(f"[CONNECTOR Manager] [{threading.get_ident()}] Released lock (purge_cache)")
 
-    def get_connectors(self, bpn: str) -> List[str]:
+    def get_connectors(self, bpn: str) -> Sequence[str]:
         """
         Retrieve connectors for a specific BPN, with automatic discovery if not cached.
         
@@ -230,24 +257,78 @@ class ConnectorConsumerMemoryManager(BaseConnectorConsumerManager):
         Args:
             bpn (str): The Business Partner Number to get connectors for
             
+        Concurrent calls for the same BPN share a single discovery. Connectors that expired
+        less than the stale grace window ago are returned right away while they are refreshed
+        in the background.
+        
         Returns:
-            List[str]: List of connector URLs/endpoints for the BPN
+            Sequence[str]: Read-only sequence of connector URLs/endpoints for the BPN
         """
-        self.logger.debug(f"[CONNECTOR Manager] [{threading.get_ident()}] Trying to acquire lock (get_connectors check)")
-        with self._lock:
-            self.logger.debug(f"[CONNECTOR Manager] [{threading.get_ident()}] Acquired lock (get_connectors check)")
-            known_connectors: Dict = {}
+        cached_connectors: Optional[Sequence[str]] = self._get_cached_connectors(bpn=bpn)
+        if(cached_connectors is not None):
+            return cached_connectors
+
+        stale_connectors: Optional[Sequence[str]] = self._get_stale_connectors(bpn=bpn)
+        if(stale_connectors is not None):
+            ## Serve the previous connectors, a single refresh per BPN runs in the background
+            if(self._connector_discovery_flights.start(bpn, self._discover_connectors, bpn) and self.logger and self.verbose):
+                self.logger.info(f"[CONNECTOR Manager] [{bpn}] Returning [{len(stale_connectors)}] expired CONNECTORs from cache, refreshing them in the background")
+            self.refresh_policy.record_stale_hit()
+            return stale_connectors
+
+        return self._connector_discovery_flights.do(bpn, self._discover_connectors, bpn)
+
+    def _get_cached_connectors(self, bpn: str) -> Optional[Sequence[str]]:
+        """
+        Get the cached connectors of a BPN.
+        
+        Args:
+            bpn (str): The Business Partner Number to get connectors for
             
-            ## If the connectors are known then the cache is loaded
-            if(bpn in self.known_connectors):
-                known_connectors = copy.deepcopy(self.known_connectors[bpn])
-        self.logger.debug(f"[CONNECTOR Manager] [{threading.get_ident()}] Released lock (get_connectors check)")
+        Returns:
+            Optional[Sequence[str]]: The cached connectors, or None if they are not cached or expired
+        """
+        ## Entries are replaced and never modified, so the cached one can be read without the lock
+        known_connectors: Mapping = self.known_connectors.get(bpn, {})
             
         ## In case there is connectors, and the interval has not yet been reached
-        if(known_connectors != {}) and (self.REFRESH_INTERVAL_KEY in known_connectors) and (self.CONNECTOR_LIST_KEY in known_connectors) and (not op.is_interval_reached(end_timestamp=known_connectors[self.REFRESH_INTERVAL_KEY])):
+        if(known_connectors) and (self.REFRESH_INTERVAL_KEY in known_connectors) and (self.CONNECTOR_LIST_KEY in known_connectors) and (not op.is_interval_reached(end_timestamp=known_connectors[self.REFRESH_INTERVAL_KEY])):
             if(self.logger and self.verbose):
-                self.logger.debug(f"[CONNECTOR Manager] [{bpn}] Returning [{len(self.known_connectors[bpn][self.CONNECTOR_LIST_KEY])}] CONNECTORs from cache. Next refresh at [{op.timestamp_to_datetime(self.known_connectors[bpn][self.REFRESH_INTERVAL_KEY])}] UTC")
-            return self.known_connectors[bpn][self.CONNECTOR_LIST_KEY] ## Return the urls from the connectors
+                self.logger.debug(f"[CONNECTOR Manager] [{bpn}] Returning [{len(known_connectors[self.CONNECTOR_LIST_KEY])}] CONNECTORs from cache. Next refresh at [{op.timestamp_to_datetime(known_connectors[self.REFRESH_INTERVAL_KEY])}] UTC")
+            return known_connectors[self.CONNECTOR_LIST_KEY] ## Return the urls from the connectors
+        return None
+
+    def _get_stale_connectors(self, bpn: str) -> Optional[Sequence[str]]:
+        """
+        Get the expired connectors of a BPN that can still be served while they are refreshed.
+        
+        Args:
+            bpn (str): The Business Partner Number to get connectors for
+            
+        Returns:
+            Optional[Sequence[str]]: The expired connectors, or None if there are none or they expired longer than the stale grace window ago
+        """
+        known_connectors: Mapping = self.known_connectors.get(bpn, {})
+        if(not known_connectors) or (self.REFRESH_INTERVAL_KEY not in known_connectors) or (not known_connectors.get(self.CONNECTOR_LIST_KEY)):
+            return None
+        if(not self.refresh_policy.is_within_grace(known_connectors[self.REFRESH_INTERVAL_KEY])):
+            return None
+        return known_connectors[self.CONNECTOR_LIST_KEY]
+
+    def _discover_connectors(self, bpn: str) -> Sequence[str]:
+        """
+        Discover and cache the connectors of a BPN.
+        
+        Args:
+            bpn (str): The Business Partner Number to discover connectors for
+            
+        Returns:
+            Sequence[str]: Read-only sequence of the discovered connector URLs/endpoints
+        """
+        ## Another discovery may have finished while this one was waiting to start
+        cached_connectors: Optional[Sequence[str]] = self._get_cached_connectors(bpn=bpn)
+        if(cached_connectors is not None):
+            return cached_connectors
             
         if(self.logger and self.verbose):
             self.logger.info(f"[CONNECTOR Manager] No cached CONNECTOR were found, discoverying CONNECTORs for bpn [{bpn}]...")
@@ -258,7 +339,19 @@ class ConnectorConsumerMemoryManager(BaseConnectorConsumerManager):
         
         self.add_connectors(bpn=bpn, connectors=connectors)
 
-        return connectors
+        return tuple(connectors)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get runtime metrics of the connector consumer manager.
+        
+        Returns:
+            Dict[str, Any]: Counters of the connector discoveries and of the expired connectors served while refreshed
+        """
+        return {
+            "connectorDiscovery": self._connector_discovery_flights.get_metrics(),
+            "connectorCacheRefresh": self.refresh_policy.get_metrics()
+        }
 
     def _is_cache_expired(self, bpn: str) -> bool:
         """
@@ -28,3 +28,5 @@ __license__ = "Apache License, Version 2.0"
 from .memory.dtr_consumer_memory_manager import DtrConsumerMemoryManager
 from .database.dtr_consumer_postgres_memory_manager import DtrConsumerPostgresMemoryManager
 from .database.dtr_consumer_sync_postgres_memory_manager import DtrConsumerSyncPostgresMemoryManager
+from .shell_fetch_executor import ShellFetchExecutor
+from .shell_descriptor_cache import ShellDescriptorCache
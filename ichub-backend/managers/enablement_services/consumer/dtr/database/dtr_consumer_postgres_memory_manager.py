@@ -23,19 +23,24 @@
 
 import threading
 import hashlib
-from typing import List, Dict, TYPE_CHECKING
+from typing import List, Dict, Optional, TYPE_CHECKING
 import json
 from datetime import datetime
 from sqlmodel import select, delete, Session, SQLModel
+from sqlalchemy import MetaData, Table, inspect
+from sqlalchemy.schema import CreateTable
 from sqlalchemy.exc import SQLAlchemyError
 import logging
 from ..memory import DtrConsumerMemoryManager
 from sqlalchemy.engine import Engine as E
 from sqlalchemy.orm import Session as S
-from models.metadata_database.consumer.models import KnownDtrs
+from models.metadata_database.consumer.models import KnownDtrs, KnownCacheChanges
+from tools.immutable_tools import thaw
+from ...cache_change_log import CacheChangeLog
 
 if TYPE_CHECKING:
     from managers.enablement_services.connector_manager import BaseConnectorConsumerManager
+    from managers.enablement_services.consumer.dtr.shell_fetch_executor import ShellFetchExecutor
 
 class DtrConsumerPostgresMemoryManager(DtrConsumerMemoryManager):
     """
@@ -43,7 +48,7 @@ class DtrConsumerPostgresMemoryManager(DtrConsumerMemoryManager):
     Inherits from DtrConsumerMemoryManager to maintain an in-memory cache and extends it with persistent storage functionality.
     """
 
-    def __init__(self, engine: E | S, connector_consumer_manager: 'BaseConnectorConsumerManager', expiration_time:int=3600, table_name="known_dtrs", dtrs_key="dtrs", logger:logging.Logger=None, verbose:bool=False, dct_type_id="dct:type", dct_type_key:str="'http://purl.org/dc/terms/type'.'@id'", operator:str="=", dct_type:str="https://w3id.org/catenax/taxonomy#DigitalTwinRegistry"):
+    def __init__(self, engine: E | S, connector_consumer_manager: 'BaseConnectorConsumerManager', expiration_time:int=3600, table_name="known_dtrs", dtrs_key="dtrs", logger:logging.Logger=None, verbose:bool=False, dct_type_id="dct:type", dct_type_key:str="'http://purl.org/dc/terms/type'.'@id'", operator:str="=", dct_type:str="https://w3id.org/catenax/taxonomy#DigitalTwinRegistry", parallel_dtr_discovery:bool=True, max_dtr_workers:int=5, dtr_timeout:Optional[float]=60, shell_fetch_executor:Optional['ShellFetchExecutor']=None, batch_fetch_threshold:Optional[int]=50, batch_page_size:int=100, shell_cache_max_entries:int=10000, shell_cache_ttl:float=300, change_retention:float=3600, stale_grace:float=300, refresh_jitter:float=0.1, edr_refresh_margin:float=30, negotiation_backoff_base:float=1, negotiation_backoff_max:float=60):
         """
         Initialize the Postgres memory-backed DTR manager.
 
@@ -54,25 +59,74 @@ class DtrConsumerPostgresMemoryManager(DtrConsumerMemoryManager):
             dtrs_key: Key used to store DTR data within known_dtrs.
             logger: Optional logger instance for debug output.
             verbose: Flag for enabling verbose logging.
+            parallel_dtr_discovery: Query the DTRs of a BPN concurrently when discovering shells.
+            max_dtr_workers: Maximum number of DTRs queried at the same time.
+            dtr_timeout: Deadline in seconds for a single DTR to answer, None to wait forever.
+            shell_fetch_executor: Executor used to fetch shell descriptors, defaults to the process-wide one.
+            batch_fetch_threshold: Minimum number of shells found by a lookup to read the descriptors page by page, None to disable.
+            batch_page_size: Page size used when reading shell descriptors page by page.
+            shell_cache_max_entries: Maximum number of cached shell descriptors.
+            shell_cache_ttl: Seconds a shell descriptor is served from the cache.
+            change_retention: Seconds the saved changes are kept in the change log for other replicas.
+            stale_grace: Seconds expired DTRs are still served while they are refreshed in the background.
+            refresh_jitter: Maximum fraction of the expiration time the DTRs of a BPN expire earlier.
+            edr_refresh_margin: Seconds before their expiry the cached EDR tokens of submodel assets are renegotiated.
+            negotiation_backoff_base: Seconds new negotiations of an asset are refused after it failed twice in a row.
+            negotiation_backoff_max: Maximum seconds new negotiations of a failing asset are refused.
         """
         # Initialize base memory DTR manager and configure database.
         # Dynamically define the SQLModel table for DTR data.
         # Load existing data from the database into memory.
-        super().__init__(connector_consumer_manager=connector_consumer_manager, expiration_time=expiration_time, logger=logger, verbose=verbose, dct_type_id=dct_type_id, dct_type_key=dct_type_key, operator=operator, dct_type=dct_type)
+        super().__init__(connector_consumer_manager=connector_consumer_manager, expiration_time=expiration_time, logger=logger, verbose=verbose, dct_type_id=dct_type_id, dct_type_key=dct_type_key, operator=operator, dct_type=dct_type, parallel_dtr_discovery=parallel_dtr_discovery, max_dtr_workers=max_dtr_workers, dtr_timeout=dtr_timeout, shell_fetch_executor=shell_fetch_executor, batch_fetch_threshold=batch_fetch_threshold, batch_page_size=batch_page_size, shell_cache_max_entries=shell_cache_max_entries, shell_cache_ttl=shell_cache_ttl, stale_grace=stale_grace, refresh_jitter=refresh_jitter, edr_refresh_margin=edr_refresh_margin, negotiation_backoff_base=negotiation_backoff_base, negotiation_backoff_max=negotiation_backoff_max)
         self.engine = engine
         self.table_name = table_name
         self.dtrs_key = dtrs_key
         self._save_thread = None
         self._last_saved_hash = None
+        # BPNs changed in memory since the last save, only these are written to the database
+        self._dirty_bpns = set()
+        self._purge_all_pending = False
+        self._persist_lock = threading.Lock()  # Serializes database writes, never held by readers
         SQLModel.metadata.create_all(engine)
         class DynamicKnownDtrs(KnownDtrs, table=True):
             __tablename__ = table_name
             __table_args__ = {"extend_existing": True}
 
+        class DynamicKnownDtrsChanges(KnownCacheChanges, table=True):
+            __tablename__ = f"{table_name}_changes"
+            __table_args__ = {"extend_existing": True}
+
         self.KnownDtrsModel = DynamicKnownDtrs
+        self._change_log = CacheChangeLog(model=DynamicKnownDtrsChanges, retention=change_retention)
         DynamicKnownDtrs.metadata.create_all(engine)
+        self._migrate_primary_key()
         self._load_from_db()
 
+    def _migrate_primary_key(self) -> None:
+        """
+        Rebuild a known DTRs table created when bpnl alone was its primary key.
+        
+        With that key a partner could only have one DTR stored. The rows are copied into a table
+        with the current (bpnl, asset_id) primary key in one transaction. Tables that already have
+        the current key are left untouched.
+        """
+        primary_key = inspect(self.engine).get_pk_constraint(self.table_name).get("constrained_columns") or []
+        if primary_key != ["bpnl"]:
+            return
+        table = self.KnownDtrsModel.__table__
+        with self.engine.begin() as connection:
+            old_table = Table(self.table_name, MetaData(), autoload_with=connection)
+            rows = [dict(row._mapping) for row in connection.execute(old_table.select())]
+            old_table.drop(connection)
+            connection.execute(CreateTable(table))
+            # Each index once, the model of a table defined again by another manager lists its indexes twice
+            for index in {index.name: index for index in table.indexes}.values():
+                index.create(connection)
+            if rows:
+                connection.execute(table.insert(), [{column.name: row.get(column.name) for column in table.columns} for row in rows])
+        if self.logger:
+            self.logger.info(f"[DtrConsumerPostgresMemoryManager] Migrated table {self.table_name} to the (bpnl, asset_id) primary key, {len(rows)} rows kept")
+
     def add_dtr(self, bpn: str, connector_url: str, asset_id: str, policies: List[str]) -> None:
         """
         Add DTR to the cache for a specific Business Partner Number (BPN).
@@ -90,6 +144,7 @@ class DtrConsumerPostgresMemoryManager(DtrConsumerMemoryManager):
             None
         """
         super().add_dtr(bpn, connector_url, asset_id, policies)  # Call the base class method to handle in-memory caching
+        self._mark_dirty(bpn)
         self._trigger_save()
 
     def delete_dtr(self, bpn: str, asset_id: str) -> Dict:
@@ -104,6 +159,7 @@ class DtrConsumerPostgresMemoryManager(DtrConsumerMemoryManager):
             Dict: Updated cache state after deletion
         """
         super().delete_dtr(bpn, asset_id)
+        self._mark_dirty(bpn)
         self._trigger_save()
         return self.known_dtrs
 
@@ -119,6 +175,7 @@ class DtrConsumerPostgresMemoryManager(DtrConsumerMemoryManager):
             None
         """
         super().purge_bpn(bpn)
+        self._mark_dirty(bpn)
         self._trigger_save()
 
     
@@ -132,9 +189,26 @@ class DtrConsumerPostgresMemoryManager(DtrConsumerMemoryManager):
         Returns:
             None
         """
-        super().purge_cache()
+        with self._dtrs_lock:
+            super().purge_cache()
+            self._dirty_bpns.clear()
+            self._purge_all_pending = True
         self._trigger_save()
 
+    def _delete_connection(self, connector_service, counter_party_id: str, connector_url: str, policies: List, filter_expression: Dict, bpn: str, asset_id: str):
+        """
+        Delete a failed connection and persist the removal of the DTR from the cache.
+        """
+        super()._delete_connection(connector_service, counter_party_id, connector_url, policies, filter_expression, bpn, asset_id)
+        self._mark_dirty(bpn)
+        self._trigger_save()
+
+    def _mark_dirty(self, bpn: str) -> None:
+        """
+        Remember that the DTRs of a BPN changed in memory and need to be written to the database.
+        """
+        with self._dtrs_lock:
+            self._dirty_bpns.add(bpn)
 
     def _trigger_save(self):
         """
@@ -149,106 +223,178 @@ class DtrConsumerPostgresMemoryManager(DtrConsumerMemoryManager):
     def _load_from_db(self):
         """
         Reload known_dtrs from the DB and restore them to memory.
+        
+        BPNs with changes that were not saved yet keep their in-memory state.
         """
-        self.logger.debug(f"[DtrConsumerPostgresMemoryManager] [{threading.get_ident()}] Trying to acquire lock (load_from_db)")
-        with self._dtrs_lock:
-            self.logger.debug(f"[DtrConsumerPostgresMemoryManager] [{threading.get_ident()}] Acquired lock (load_from_db)")
+        # Hold the write lock so rows being written by a concurrent save are never read half way
+        with self._persist_lock:
             try:
-                loaded_dtrs = 0
                 with Session(self.engine) as session:
+                    # Read the change position first, changes committed while loading are applied again later
+                    self._change_log.reset(session)
                     result = session.exec(select(self.KnownDtrsModel)).all()
-                    
-                    # Store current state to compare for changes
-                    old_dtrs = self.known_dtrs.copy()
-                    
-                    # Clear current known_dtrs
-                    self.known_dtrs = {}
-                    
-                    for row in result:
-                        bpn = row.bpnl
-                        edc_url = row.edc_url
-                        asset_id = row.asset_id
-                        policies = row.policies
-                        expires_at = row.expires_at
-                        
-                        # Convert datetime back to timestamp for the SDK
-                        timestamp = expires_at.timestamp()
+            except SQLAlchemyError as e:
+                if self.logger and self.verbose:
+                    self.logger.error(f"[DtrConsumerPostgresMemoryManager] Error loading from db: {e}")
+                return
+        
+            loaded = self._rows_to_known_dtrs(result)
 
-                        # Initialize BPN structure if it doesn't exist
-                        if bpn not in self.known_dtrs:
-                            self.known_dtrs[bpn] = {
-                                self.REFRESH_INTERVAL_KEY: timestamp,
-                                self.DTR_DATA_KEY: {}
-                            }
-                        
-                        # Update refresh interval to the latest timestamp
-                        if timestamp > self.known_dtrs[bpn][self.REFRESH_INTERVAL_KEY]:
-                            self.known_dtrs[bpn][self.REFRESH_INTERVAL_KEY] = timestamp
-                        
-                        # Add DTR using asset_id as key
-                        self.known_dtrs[bpn][self.DTR_DATA_KEY][asset_id] = {
-                            self.DTR_CONNECTOR_URL_KEY: edc_url,
-                            self.DTR_ASSET_ID_KEY: asset_id,
-                            self.DTR_POLICIES_KEY: policies
-                        }
-                        loaded_dtrs += 1
+            self.logger.debug(f"[DtrConsumerPostgresMemoryManager] [{threading.get_ident()}] Trying to acquire lock (load_from_db)")
+            with self._dtrs_lock:
+                self.logger.debug(f"[DtrConsumerPostgresMemoryManager] [{threading.get_ident()}] Acquired lock (load_from_db)")
+                if self._purge_all_pending:
+                    # The table is about to be cleared, do not bring the purged entries back
+                    loaded = {}
+                for bpn in self._dirty_bpns:
+                    loaded.pop(bpn, None)
+                    if bpn in self.known_dtrs:
+                        loaded[bpn] = self.known_dtrs[bpn]
+                self.known_dtrs = loaded
 
                 # Only log if there's a change in the data
                 new_hash = hashlib.sha256(json.dumps(self.known_dtrs, sort_keys=True, default=str).encode()).hexdigest()
                 if self.logger and self.verbose and (self._last_saved_hash is None or new_hash != self._last_saved_hash):
-                    self.logger.info(f"[DtrConsumerPostgresMemoryManager] Loaded {loaded_dtrs} DTR entries from the database.")
-                    
+                    self.logger.info(f"[DtrConsumerPostgresMemoryManager] Loaded {len(result)} DTR entries from the database.")
                 self._last_saved_hash = new_hash
+            self.logger.debug(f"[DtrConsumerPostgresMemoryManager] [{threading.get_ident()}] Released lock (load_from_db)")
+
+    def _load_changes_from_db(self):
+        """
+        Reload only the BPNs changed in the database since the last load.
+        
+        Falls back to a full reload when the whole cache was purged or the change log can not
+        tell what changed anymore.
+        """
+        full_reload = False
+        with self._persist_lock:
+            try:
+                with Session(self.engine) as session:
+                    changed_bpns = self._change_log.poll(session)
+                    full_reload = CacheChangeLog.FULL_RELOAD in changed_bpns
+                    if not changed_bpns or full_reload:
+                        result = []
+                    else:
+                        result = session.exec(select(self.KnownDtrsModel).where(self.KnownDtrsModel.bpnl.in_(changed_bpns))).all()
             except SQLAlchemyError as e:
                 if self.logger and self.verbose:
-                    self.logger.error(f"[DtrConsumerPostgresMemoryManager] Error loading from db: {e}")
-        self.logger.debug(f"[DtrConsumerPostgresMemoryManager] [{threading.get_ident()}] Released lock (load_from_db)")
+                    self.logger.error(f"[DtrConsumerPostgresMemoryManager] Error loading changes from db: {e}")
+                return
+
+            if changed_bpns and not full_reload:
+                loaded = self._rows_to_known_dtrs(result)
+                with self._dtrs_lock:
+                    if not self._purge_all_pending:
+                        for bpn in changed_bpns - self._dirty_bpns:
+                            if bpn in loaded:
+                                self.known_dtrs[bpn] = loaded[bpn]
+                            else:
+                                self.known_dtrs.pop(bpn, None)
+                if self.logger and self.verbose:
+                    self.logger.info(f"[DtrConsumerPostgresMemoryManager] Reloaded {len(result)} DTR entries of {len(changed_bpns)} changed BPN(s) from the database.")
+
+        if full_reload:
+            self._load_from_db()
+
+    def _rows_to_known_dtrs(self, rows: List[KnownDtrs]) -> Dict:
+        """
+        Build the in-memory cache structure from database rows.
+        """
+        loaded = {}
+        for row in rows:
+            bpn = row.bpnl
+            # Convert datetime back to timestamp for the SDK
+            timestamp = row.expires_at.timestamp()
+
+            # Initialize BPN structure if it doesn't exist
+            if bpn not in loaded:
+                loaded[bpn] = {
+                    self.REFRESH_INTERVAL_KEY: timestamp,
+                    self.DTR_DATA_KEY: {}
+                }
+            
+            # Update refresh interval to the latest timestamp
+            if timestamp > loaded[bpn][self.REFRESH_INTERVAL_KEY]:
+                loaded[bpn][self.REFRESH_INTERVAL_KEY] = timestamp
+            
+            # Add DTR using asset_id as key
+            loaded[bpn][self.DTR_DATA_KEY][row.asset_id] = self._create_dtr_cache_entry(connector_url=row.edc_url, asset_id=row.asset_id, policies=row.policies)
+        return loaded
           
     def _save_to_db(self):
         """
-        Persist current in-memory known_dtrs to the DB only if changes are detected.
+        Persist the BPNs changed since the last save.
+        
+        The rows of every changed BPN are replaced in a single transaction, together with an
+        entry per BPN in the change log. Unchanged BPNs are not touched. The in-memory lock is
+        only held to take a snapshot of the changes, the database is written without blocking
+        readers.
         """
-        self.logger.debug(f"[DtrConsumerPostgresMemoryManager] [{threading.get_ident()}] Trying to acquire lock (save_to_db)")
-        with self._dtrs_lock:
-            self.logger.debug(f"[DtrConsumerPostgresMemoryManager] [{threading.get_ident()}] Acquired lock (save_to_db)")
-            current_hash = hashlib.sha256(json.dumps(self.known_dtrs, sort_keys=True, default=str).encode()).hexdigest()
-            if current_hash == self._last_saved_hash:
-                return
-            try:
-                saved_dtrs = 0
-                with Session(self.engine) as session:
-                    # Clear existing data
-                    session.exec(delete(self.KnownDtrsModel))
-                    
-                    # Save each BPN's DTR data
-                    for bpn, bpn_data in self.known_dtrs.items():
-                        if self.DTR_DATA_KEY in bpn_data and self.REFRESH_INTERVAL_KEY in bpn_data:
-                            # Convert timestamp to datetime object instead of using the formatted string
-                            timestamp = bpn_data[self.REFRESH_INTERVAL_KEY]
-                            expires_at = datetime.fromtimestamp(timestamp)
-                            dtr_dict = bpn_data[self.DTR_DATA_KEY]
-                            
-                            # Iterate through all DTRs for this BPN (now a dictionary keyed by asset_id)
-                            if isinstance(dtr_dict, dict):
-                                for asset_id, dtr_data in dtr_dict.items():
-                                    if dtr_data is not None:
-                                        session.add(self.KnownDtrsModel(
-                                            bpnl=bpn,
-                                            edc_url=dtr_data[self.DTR_CONNECTOR_URL_KEY],
-                                            asset_id=dtr_data[self.DTR_ASSET_ID_KEY],
-                                            policies=dtr_data[self.DTR_POLICIES_KEY],
-                                            expires_at=expires_at
-                                        ))
-                                        saved_dtrs += 1
-                                    
-                    session.commit()
-                    self._last_saved_hash = current_hash
+        with self._persist_lock:
+            while True:
+                self.logger.debug(f"[DtrConsumerPostgresMemoryManager] [{threading.get_ident()}] Trying to acquire lock (save_to_db)")
+                with self._dtrs_lock:
+                    self.logger.debug(f"[DtrConsumerPostgresMemoryManager] [{threading.get_ident()}] Acquired lock (save_to_db)")
+                    purge_all = self._purge_all_pending
+                    dirty_bpns = self._dirty_bpns
+                    self._purge_all_pending = False
+                    self._dirty_bpns = set()
+                    rows = {bpn: self._snapshot_rows(bpn) for bpn in dirty_bpns}
+                self.logger.debug(f"[DtrConsumerPostgresMemoryManager] [{threading.get_ident()}] Released lock (save_to_db)")
+
+                if not purge_all and not dirty_bpns:
+                    return
+                
+                try:
+                    saved_dtrs = 0
+                    with Session(self.engine) as session:
+                        if purge_all:
+                            session.exec(delete(self.KnownDtrsModel))
+                        for bpn, bpn_rows in rows.items():
+                            if not purge_all:
+                                session.exec(delete(self.KnownDtrsModel).where(self.KnownDtrsModel.bpnl == bpn))
+                            for row in bpn_rows:
+                                session.add(self.KnownDtrsModel(**row))
+                                saved_dtrs += 1
+                        # Let the other replicas know what to reload
+                        self._change_log.record(session, ([CacheChangeLog.FULL_RELOAD] if purge_all else []) + list(rows))
+                        self._change_log.prune(session)
+                        session.commit()
                     if self.logger and self.verbose:
-                        self.logger.info(f"[DtrConsumerPostgresMemoryManager] Saved {saved_dtrs} DTR entries to the database.")
-            except SQLAlchemyError as e:
-                if self.logger and self.verbose:
-                    self.logger.error(f"[DtrConsumerPostgresMemoryManager] Error saving to db: {e}")
-        self.logger.debug(f"[DtrConsumerPostgresMemoryManager] [{threading.get_ident()}] Released lock (save_to_db)")
+                        self.logger.info(f"[DtrConsumerPostgresMemoryManager] Saved {saved_dtrs} DTR entries of {len(rows)} changed BPN(s) to the database.")
+                except SQLAlchemyError as e:
+                    # Keep the changes pending so the next save retries them
+                    with self._dtrs_lock:
+                        self._purge_all_pending = self._purge_all_pending or purge_all
+                        self._dirty_bpns.update(dirty_bpns)
+                    if self.logger and self.verbose:
+                        self.logger.error(f"[DtrConsumerPostgresMemoryManager] Error saving to db: {e}")
+                    return
+
+    def _snapshot_rows(self, bpn: str) -> List[Dict]:
+        """
+        Build the database rows of a BPN from the in-memory cache. Must be called holding the DTR lock.
+        """
+        bpn_data = self.known_dtrs.get(bpn)
+        if not bpn_data or self.DTR_DATA_KEY not in bpn_data or self.REFRESH_INTERVAL_KEY not in bpn_data:
+            return []
+        
+        # Convert timestamp to datetime object instead of using the formatted string
+        expires_at = datetime.fromtimestamp(bpn_data[self.REFRESH_INTERVAL_KEY])
+        dtr_dict = bpn_data[self.DTR_DATA_KEY]
+        if not isinstance(dtr_dict, dict):
+            return []
+        
+        return [
+            {
+                "bpnl": bpn,
+                "edc_url": dtr_data[self.DTR_CONNECTOR_URL_KEY],
+                "asset_id": dtr_data[self.DTR_ASSET_ID_KEY],
+                "policies": thaw(dtr_data[self.DTR_POLICIES_KEY]),
+                "expires_at": expires_at
+            }
+            for dtr_data in dtr_dict.values() if dtr_data is not None
+        ]
 
     def stop(self):
         """
@@ -27,17 +27,24 @@ from sqlalchemy.orm import Session as S
 import threading
 import time
 import logging
-from typing import TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from managers.enablement_services.connector_manager import BaseConnectorConsumerManager
+    from managers.enablement_services.consumer.dtr.shell_fetch_executor import ShellFetchExecutor
 
 class DtrConsumerSyncPostgresMemoryManager(DtrConsumerPostgresMemoryManager):
     """
     Manages DTR data using an in-memory cache synchronized with a Postgres database.
     Periodically persists changes and reloads updates from the database to ensure consistency.
+    
+    In the "incremental" sync mode only the BPNs listed in the change log since the last sync are
+    reloaded, the "full" mode reloads the whole table on every cycle.
     """
-    def __init__(self, engine: E | S, connector_consumer_manager: 'BaseConnectorConsumerManager', persist_interval:int = 5, expiration_time:int=3600, table_name="known_dtrs", dtrs_key="dtrs", logger:logging.Logger=None, verbose:bool=False, dct_type_id="dct:type",dct_type_key:str="'http://purl.org/dc/terms/type'.'@id'", operator:str="=", dct_type:str="https://w3id.org/catenax/taxonomy#DigitalTwinRegistry"):
+    SYNC_MODE_INCREMENTAL = "incremental"
+    SYNC_MODE_FULL = "full"
+
+    def __init__(self, engine: E | S, connector_consumer_manager: 'BaseConnectorConsumerManager', persist_interval:int = 5, expiration_time:int=3600, table_name="known_dtrs", dtrs_key="dtrs", logger:logging.Logger=None, verbose:bool=False, dct_type_id="dct:type",dct_type_key:str="'http://purl.org/dc/terms/type'.'@id'", operator:str="=", dct_type:str="https://w3id.org/catenax/taxonomy#DigitalTwinRegistry", parallel_dtr_discovery:bool=True, max_dtr_workers:int=5, dtr_timeout:Optional[float]=60, shell_fetch_executor:Optional['ShellFetchExecutor']=None, batch_fetch_threshold:Optional[int]=50, batch_page_size:int=100, shell_cache_max_entries:int=10000, shell_cache_ttl:float=300, sync_mode:str="incremental", change_retention:float=3600, stale_grace:float=300, refresh_jitter:float=0.1, edr_refresh_margin:float=30, negotiation_backoff_base:float=1, negotiation_backoff_max:float=60):
         """Initialize the DTR consumer synchronization manager.
 
         Args:
@@ -49,8 +56,26 @@ class DtrConsumerSyncPostgresMemoryManager(DtrConsumerPostgresMemoryManager):
             dtrs_key (str, optional): Key used to store DTR data within known_dtrs. Defaults to "dtrs".
             logger (logging.Logger, optional): Logger instance for debug output. Defaults to None.
             verbose (bool, optional): Flag for enabling verbose logging. Defaults to False.
+            parallel_dtr_discovery (bool, optional): Query the DTRs of a BPN concurrently when discovering shells. Defaults to True.
+            max_dtr_workers (int, optional): Maximum number of DTRs queried at the same time. Defaults to 5.
+            dtr_timeout (Optional[float], optional): Deadline in seconds for a single DTR to answer, None to wait forever. Defaults to 60.
+            shell_fetch_executor (Optional[ShellFetchExecutor], optional): Executor used to fetch shell descriptors. Defaults to the process-wide one.
+            batch_fetch_threshold (Optional[int], optional): Minimum number of shells found by a lookup to read the descriptors page by page, None to disable. Defaults to 50.
+            batch_page_size (int, optional): Page size used when reading shell descriptors page by page. Defaults to 100.
+            shell_cache_max_entries (int, optional): Maximum number of cached shell descriptors. Defaults to 10000.
+            shell_cache_ttl (float, optional): Seconds a shell descriptor is served from the cache. Defaults to 300.
+            sync_mode (str, optional): "incremental" to reload only the changed BPNs, "full" to reload the whole table. Defaults to "incremental".
+            change_retention (float, optional): Seconds the saved changes are kept in the change log for other replicas. Defaults to 3600.
+            stale_grace (float, optional): Seconds expired DTRs are still served while they are refreshed in the background. Defaults to 300.
+            refresh_jitter (float, optional): Maximum fraction of the expiration time the DTRs of a BPN expire earlier. Defaults to 0.1.
+            edr_refresh_margin (float, optional): Seconds before their expiry the cached EDR tokens of submodel assets are renegotiated. Defaults to 30.
+            negotiation_backoff_base (float, optional): Seconds new negotiations of an asset are refused after it failed twice in a row. Defaults to 1.
+            negotiation_backoff_max (float, optional): Maximum seconds new negotiations of a failing asset are refused. Defaults to 60.
         """
-        super().__init__(connector_consumer_manager=connector_consumer_manager, expiration_time=expiration_time, logger=logger, verbose=verbose, table_name=table_name, dtrs_key=dtrs_key, engine=engine, dct_type_id=dct_type_id, dct_type_key=dct_type_key, operator=operator, dct_type=dct_type)
+        super().__init__(connector_consumer_manager=connector_consumer_manager, expiration_time=expiration_time, logger=logger, verbose=verbose, table_name=table_name, dtrs_key=dtrs_key, engine=engine, dct_type_id=dct_type_id, dct_type_key=dct_type_key, operator=operator, dct_type=dct_type, parallel_dtr_discovery=parallel_dtr_discovery, max_dtr_workers=max_dtr_workers, dtr_timeout=dtr_timeout, shell_fetch_executor=shell_fetch_executor, batch_fetch_threshold=batch_fetch_threshold, batch_page_size=batch_page_size, shell_cache_max_entries=shell_cache_max_entries, shell_cache_ttl=shell_cache_ttl, change_retention=change_retention, stale_grace=stale_grace, refresh_jitter=refresh_jitter, edr_refresh_margin=edr_refresh_margin, negotiation_backoff_base=negotiation_backoff_base, negotiation_backoff_max=negotiation_backoff_max)
+        if sync_mode not in (self.SYNC_MODE_INCREMENTAL, self.SYNC_MODE_FULL):
+            raise ValueError(f"Unsupported sync mode [{sync_mode}], expected [{self.SYNC_MODE_INCREMENTAL}] or [{self.SYNC_MODE_FULL}]")
+        self.sync_mode = sync_mode
         self.persist_interval = persist_interval
         self._stop_event = threading.Event()
         self._start_background_tasks()
@@ -67,7 +92,16 @@ class DtrConsumerSyncPostgresMemoryManager(DtrConsumerPostgresMemoryManager):
         """
         while not self._stop_event.is_set():
             time.sleep(self.persist_interval)
-            self._save_to_db()
+            self._sync_with_db()
+
+    def _sync_with_db(self):
+        """
+        Save the local changes and load the ones made by other replicas.
+        """
+        self._save_to_db()
+        if self.sync_mode == self.SYNC_MODE_INCREMENTAL:
+            self._load_changes_from_db()
+        else:
             self._load_from_db()
 
     def stop(self):
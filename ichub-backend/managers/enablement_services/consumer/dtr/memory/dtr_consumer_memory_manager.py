@@ -23,25 +23,33 @@
 
 ## This file was created using an LLM (Claude Sonnet 4) and reviewed by a human committer
 
-import copy
 import hashlib
 import logging
 import threading
 import time
 import json
 import base64
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import TYPE_CHECKING, Dict, List, Optional, Union, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
+from functools import partial
+from typing import TYPE_CHECKING, Callable, Dict, List, Mapping, Optional, Tuple, Union, Any
 from tractusx_sdk.dataspace.tools import op
 from sqlmodel import Session
 from tractusx_sdk.dataspace.services.connector import BaseConnectorConsumerService
 from managers.enablement_services.consumer.base_dtr_consumer_manager import BaseDtrConsumerManager
 from managers.enablement_services.consumer.dtr.pagination_manager import PaginationManager, DtrPaginationState, PageState
+from managers.enablement_services.consumer.dtr.shell_fetch_executor import ShellFetchExecutor
+from managers.enablement_services.consumer.dtr.shell_descriptor_cache import ShellDescriptorCache
+from managers.enablement_services.consumer.single_flight import SingleFlight
+from managers.enablement_services.consumer.cache_refresh_policy import CacheRefreshPolicy
+from managers.enablement_services.consumer.edr_token_cache import EdrToken, EdrTokenCache, EdrTokenKey
+from managers.enablement_services.consumer.negotiation_backoff import NegotiationBackoff
 if TYPE_CHECKING:
     from managers.enablement_services.connector_manager import BaseConnectorConsumerManager
 from requests import Response
 from tractusx_sdk.dataspace.models.connector.base_catalog_model import BaseCatalogModel
 from tractusx_sdk.dataspace.tools import HttpTools
+from tools.immutable_tools import freeze, thaw
+from tools.exceptions import NotAvailableError
 
 class DtrConsumerMemoryManager(BaseDtrConsumerManager):
     """
@@ -52,28 +60,61 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
     the base DTR consumer manager interface.
     """ 
     
+    ## AAS service specification profile advertised by registries in GET /description
+    REGISTRY_SERVICE_PROFILE = "AssetAdministrationShellRegistryServiceSpecification"
+    ## Dataplane status codes of a rejected (expired or revoked) EDR token
+    REJECTED_TOKEN_STATUS_CODES = (401, 403)
+    
     ## Declare variables
     known_dtrs: Dict
     logger: logging.Logger
     verbose: bool
 
-    def __init__(self, connector_consumer_manager: 'BaseConnectorConsumerManager', expiration_time: int = 60, logger:logging.Logger=None, verbose:bool=False, dct_type_id="dct:type", dct_type_key:str="'http://purl.org/dc/terms/type'.'@id'", operator:str="=", dct_type:str="https://w3id.org/catenax/taxonomy#DigitalTwinRegistry"):
+    def __init__(self, connector_consumer_manager: 'BaseConnectorConsumerManager', expiration_time: int = 60, logger:logging.Logger=None, verbose:bool=False, dct_type_id="dct:type", dct_type_key:str="'http://purl.org/dc/terms/type'.'@id'", operator:str="=", dct_type:str="https://w3id.org/catenax/taxonomy#DigitalTwinRegistry", parallel_dtr_discovery:bool=True, max_dtr_workers:int=5, dtr_timeout:Optional[float]=60, shell_fetch_executor:Optional[ShellFetchExecutor]=None, batch_fetch_threshold:Optional[int]=50, batch_page_size:int=100, shell_cache_max_entries:int=10000, shell_cache_ttl:float=300, stale_grace:float=300, refresh_jitter:float=0.1, edr_refresh_margin:float=30, negotiation_backoff_base:float=1, negotiation_backoff_max:float=60):
         """
         Initialize the memory-based DTR consumer manager.
         
         Args:
             connector_consumer_manager (BaseConnectorConsumerManager): Connector manager with consumer capabilities
             expiration_time (int, optional): Cache expiration time in minutes. Defaults to 60.
+            parallel_dtr_discovery (bool, optional): Query the DTRs of a BPN concurrently in discover_shells. Defaults to True.
+            max_dtr_workers (int, optional): Maximum number of DTRs queried at the same time. Defaults to 5.
+            dtr_timeout (Optional[float], optional): Deadline in seconds for a single DTR to answer, None to wait forever. Defaults to 60.
+            shell_fetch_executor (Optional[ShellFetchExecutor], optional): Executor used to fetch shell descriptors. Defaults to the process-wide one.
+            batch_fetch_threshold (Optional[int], optional): Minimum number of shells found by a lookup to read the descriptors page by page
+                from registries supporting it, None to always fetch them one by one. Defaults to 50.
+            batch_page_size (int, optional): Page size used when reading shell descriptors page by page. Defaults to 100.
+            shell_cache_max_entries (int, optional): Maximum number of cached shell descriptors. Defaults to 10000.
+            shell_cache_ttl (float, optional): Seconds a shell descriptor is served from the cache. Defaults to 300.
+            stale_grace (float, optional): Seconds expired DTRs are still served while they are refreshed in the background, 0 to wait for the refresh. Defaults to 300.
+            refresh_jitter (float, optional): Maximum fraction of the expiration time the DTRs of a BPN expire earlier. Defaults to 0.1.
+            edr_refresh_margin (float, optional): Seconds before their expiry the cached EDR tokens of submodel assets are renegotiated. Defaults to 30.
+            negotiation_backoff_base (float, optional): Seconds new negotiations of an asset are refused after it failed twice in a row,
+                doubled on every further failure. Defaults to 1.
+            negotiation_backoff_max (float, optional): Maximum seconds new negotiations of a failing asset are refused. Defaults to 60.
         """
         super().__init__(connector_consumer_manager, expiration_time, dct_type_id=dct_type_id, dct_type_key=dct_type_key, operator=operator, dct_type=dct_type)
         self.known_dtrs = {}
-        self.shell_descriptors = {}  # Central storage for shell descriptors by shell ID
+        self.shell_descriptors = ShellDescriptorCache(max_entries=shell_cache_max_entries, ttl=shell_cache_ttl)  # Shell descriptors by (BPN, DTR asset ID, shell ID)
         self.logger = logger if logger else None
         self.verbose = verbose
+        self.parallel_dtr_discovery = parallel_dtr_discovery
+        self.max_dtr_workers = max(1, max_dtr_workers)
+        # Long-lived pool shared by every discovery, bounding the DTR lookups running at once including timed out ones
+        self._dtr_discovery_executor = ThreadPoolExecutor(max_workers=self.max_dtr_workers, thread_name_prefix="dtr-discovery")
+        self.dtr_timeout = dtr_timeout
+        self.shell_fetch_executor = shell_fetch_executor if shell_fetch_executor else ShellFetchExecutor.get_shared()
+        self.batch_fetch_threshold = batch_fetch_threshold
+        self.batch_page_size = max(1, batch_page_size)
+        self.dtr_capabilities = {}  # Probed registry capabilities by (BPN, DTR asset ID)
+        self._dtr_discovery_flights = SingleFlight()  # One DTR discovery at a time per BPN
+        self.refresh_policy = CacheRefreshPolicy(stale_grace=stale_grace, jitter=refresh_jitter)
+        self.edr_tokens = EdrTokenCache(refresh_margin=edr_refresh_margin)  # Negotiated submodel asset tokens
+        self.negotiation_backoff = NegotiationBackoff(base_delay=negotiation_backoff_base, max_delay=negotiation_backoff_max)
+        self._edr_negotiation_flights = SingleFlight()  # One negotiation at a time per asset and policy
         # Use separate locks for different data structures to reduce contention
         self._dtrs_lock = threading.RLock()  # Only for known_dtrs modifications
         self._shells_lock = threading.RLock()  # Only for shell_descriptors modifications
-        self._list_lock = threading.RLock()  # Only for thread-safe list operations
         
     def add_dtr(self, bpn: str, connector_url: str, asset_id: str, policies: List[str]) -> None:
         """
@@ -94,7 +135,7 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
                 self.known_dtrs[bpn] = {}
 
             # Always update the refresh interval timestamp
-            self.known_dtrs[bpn][self.REFRESH_INTERVAL_KEY] = op.get_future_timestamp(minutes=self.expiration_time)
+            self.known_dtrs[bpn][self.REFRESH_INTERVAL_KEY] = self.refresh_policy.next_refresh_timestamp(self.expiration_time)
             
             # Initialize DTR dictionary if it doesn't exist
             if self.DTR_DATA_KEY not in self.known_dtrs[bpn]:
@@ -116,10 +157,13 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
         
         return
 
-    def _create_dtr_cache_entry(self, connector_url: str, asset_id: str, policies: List[Union[str, Dict[str, Any]]]) -> dict:
+    def _create_dtr_cache_entry(self, connector_url: str, asset_id: str, policies: List[Union[str, Dict[str, Any]]]) -> Mapping[str, Any]:
         """
         Create a new DTR cache entry for a specific BPN.
         
+        Entries are read-only (policies are stored as tuples of read-only mappings), so cache
+        hits can hand out the cached entry itself instead of a copy.
+        
         Args:
             bpn (str): The Business Partner Number to associate DTR with
             connector_url (str): URL of the EDC where the DTR is stored
@@ -127,11 +171,11 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
             policies (List[Union[str, Dict[str, Any]]]): List of policies for this DTR (cleaned of @id and @type)
         """
 
-        return {
+        return freeze({
                     self.DTR_CONNECTOR_URL_KEY: connector_url,
                     self.DTR_ASSET_ID_KEY: asset_id,
                     self.DTR_POLICIES_KEY: policies
-                }
+                })
 
     def is_dtr_known(self, bpn: str, asset_id: str) -> bool:
         """
@@ -166,7 +210,7 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
             asset_id (str): The asset ID of the DTR
             
         Returns:
-            Optional[Dict]: The DTR data if found, None otherwise
+            Optional[Mapping]: The read-only DTR data if found, None otherwise
         """
         # Read operation - no lock needed for simple lookups
         if bpn not in self.known_dtrs:
@@ -179,10 +223,7 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
         if not isinstance(dtr_dict, dict):
             return None
             
-        if asset_id in dtr_dict:
-            return copy.deepcopy(dtr_dict[asset_id])
-        
-        return None
+        return dtr_dict.get(asset_id)
 
     def get_known_dtrs(self) -> Dict:
         """
@@ -191,8 +232,15 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
         Returns:
             Dict: Complete cache dictionary containing all BPNs and their associated DTRs
         """
-        # Read operation - return a deep copy of the current state
-        return copy.deepcopy(self.known_dtrs)
+        # Read operation - copy the structure, the DTR entries are read-only and shared
+        with self._dtrs_lock:
+            return {
+                bpn: {
+                    key: dict(value) if key == self.DTR_DATA_KEY and isinstance(value, dict) else value
+                    for key, value in bpn_data.items()
+                }
+                for bpn, bpn_data in self.known_dtrs.items()
+            }
 
     def delete_dtr(self, bpn: str, asset_id: str) -> Dict:
         """
@@ -233,6 +281,9 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
                 del self.known_dtrs[bpn]
                 if(self.logger and self.verbose):
                     self.logger.info(f"[DTR Manager] [{bpn}] Purged all DTRs from cache")
+            for capability_key in [key for key in self.dtr_capabilities if key[0] == bpn]:
+                self.dtr_capabilities.pop(capability_key, None)
+            self.shell_descriptors.invalidate_bpn(bpn)
         self.logger.debug(f"[DTR Manager] [{threading.get_ident()}] Released lock (purge_bpn)")
 
     def purge_cache(self) -> None:
@@ -251,6 +302,7 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
                 self.logger.debug(f"[DTR Manager] [{threading.get_ident()}] Acquired lock (purge_cache - shells)")
                 self.known_dtrs.clear()
                 self.shell_descriptors.clear()
+                self.dtr_capabilities.clear()
                 if(self.logger and self.verbose):
                     self.logger.info("[DTR Manager] Purged entire DTR cache and shell descriptors")
             self.logger.debug(f"[DTR Manager] [{threading.get_ident()}] Released lock (purge_cache - shells)")        
@@ -265,7 +317,7 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
             connector_url (str): The connector URL to filter by
             
         Returns:
-            List[Dict]: List of DTR data from the specified connector
+            List[Mapping]: List of read-only DTR data from the specified connector
         """
         # Read operation - no lock needed for lookups
         if bpn not in self.known_dtrs or self.DTR_DATA_KEY not in self.known_dtrs[bpn]:
@@ -277,7 +329,7 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
             
         # Filter DTRs by connector URL
         filtered_dtrs = [
-            copy.deepcopy(dtr) for dtr in dtr_dict.values()
+            dtr for dtr in list(dtr_dict.values())
             if dtr.get(self.DTR_CONNECTOR_URL_KEY) == connector_url
         ]
         
@@ -350,6 +402,23 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
         
         return []
 
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get runtime metrics of the DTR consumer manager.
+        
+        Returns:
+            Dict[str, Any]: Metrics grouped by component
+        """
+        return {
+            "dtrDiscovery": self._dtr_discovery_flights.get_metrics(),
+            "dtrCacheRefresh": self.refresh_policy.get_metrics(),
+            **self.connector_consumer_manager.get_metrics(),
+            "edrNegotiation": self._edr_negotiation_flights.get_metrics(),
+            "edrTokenCache": self.edr_tokens.get_metrics(),
+            "negotiationBackoff": self.negotiation_backoff.get_metrics(),
+            "shellFetchExecutor": self.shell_fetch_executor.get_metrics(),
+            "shellDescriptorCache": self.shell_descriptors.get_metrics()
+        }
     
     def get_catalog(self,  connector_service:BaseConnectorConsumerService, counter_party_id: str = None, counter_party_address: str = None,
                     request: BaseCatalogModel = None, timeout=60) -> dict | None:
@@ -437,14 +506,39 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
         
         This method first checks the cache for existing DTRs. If cache is empty
         or expired, it uses the connector manager to get connectors for the BPN,
-        then queries each connector's catalog to find DTR assets.
+        then queries each connector's catalog to find DTR assets. Concurrent calls
+        for the same BPN share a single discovery. DTRs that expired less than the
+        stale grace window ago are returned right away while they are refreshed in
+        the background.
         
         Args:
             bpn (str): The Business Partner Number to get DTRs for
             timeout (int): Timeout for catalog requests
             
         Returns:
-            List[Dict]: List of DTR data for the BPN, each containing connector_url, asset_id, and policies
+            List[Mapping]: List of read-only DTR data for the BPN, each containing connector_url, asset_id, and policies
+        """
+        cached_dtrs = self._get_cached_dtrs(bpn)
+        if cached_dtrs is not None:
+            return cached_dtrs
+        
+        stale_dtrs = self._get_stale_dtrs(bpn)
+        if stale_dtrs is not None:
+            # Serve the previous DTRs, a single refresh per BPN runs in the background
+            if self._dtr_discovery_flights.start(bpn, self._discover_dtrs, bpn, timeout) and self.logger and self.verbose:
+                self.logger.info(f"[DTR Manager] [{bpn}] Returning {len(stale_dtrs)} expired DTRs from cache, refreshing them in the background")
+            self.refresh_policy.record_stale_hit()
+            return stale_dtrs
+        
+        # Callers waiting for the same discovery share its result, each one gets its own list
+        return list(self._dtr_discovery_flights.do(bpn, self._discover_dtrs, bpn, timeout))
+
+    def _get_cached_dtrs(self, bpn: str) -> Optional[List[Mapping]]:
+        """
+        Get the DTRs of a BPN from the cache.
+        
+        Returns:
+            Optional[List[Mapping]]: The cached DTRs, None if they are not cached or expired
         """
         # Check if we have cached data that hasn't expired (read operation - no lock needed)
         if bpn in self.known_dtrs and not self._is_cache_expired(bpn):
@@ -453,83 +547,115 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
                 if len(cached_dtrs_dict) > 0:
                     if(self.logger and self.verbose):
                         self.logger.debug(f"[DTR Manager] [{bpn}] Returning {len(cached_dtrs_dict)} DTRs from cache. Next refresh at [{op.timestamp_to_datetime(self.known_dtrs[bpn][self.REFRESH_INTERVAL_KEY])}] UTC")
-                    # Return list of DTR values
-                    return [copy.deepcopy(dtr) for dtr in cached_dtrs_dict.values()]
+                    # Return list of DTR values, the entries are read-only and shared with the cache
+                    return list(cached_dtrs_dict.values())
+        return None
+
+    def _get_stale_dtrs(self, bpn: str) -> Optional[List[Mapping]]:
+        """
+        Get the expired DTRs of a BPN that can still be served while they are refreshed.
+        
+        Returns:
+            Optional[List[Mapping]]: The expired DTRs, None if there are none or they expired longer than the stale grace window ago
+        """
+        entry = self.known_dtrs.get(bpn)
+        if not entry or self.REFRESH_INTERVAL_KEY not in entry or not self.refresh_policy.is_within_grace(entry[self.REFRESH_INTERVAL_KEY]):
+            return None
+        cached_dtrs_dict = entry.get(self.DTR_DATA_KEY)
+        if not isinstance(cached_dtrs_dict, dict) or len(cached_dtrs_dict) == 0:
+            return None
+        return list(cached_dtrs_dict.values())
+
+    def _discover_dtrs(self, bpn: str, timeout: int) -> List[Mapping]:
+        """
+        Discover the DTRs of a BPN in the catalogs of its connectors and add them to the cache.
+        
+        Args:
+            bpn (str): The Business Partner Number to discover DTRs for
+            timeout (int): Timeout for catalog requests
+            
+        Returns:
+            List[Mapping]: List of read-only DTR data for the BPN
+        """
+        # A discovery that just finished may already have filled the cache
+        cached_dtrs = self._get_cached_dtrs(bpn)
+        if cached_dtrs is not None:
+            return cached_dtrs
         
         # Cache is expired or doesn't exist, discover DTRs
         if(self.logger and self.verbose):
             self.logger.info(f"[DTR Manager] No cached DTRs were found, discovering DTRs for bpn [{bpn}]...")
+        
+        # Get connectors from the connector manager
+        try:
+            connectors = self.connector_consumer_manager.get_connectors(bpn)
+            if not connectors or len(connectors) == 0:
+                if(self.logger and self.verbose):
+                    self.logger.warning(f"[DTR Manager] [{bpn}] No connectors found for DTR discovery")
+                return []
             
-            # Get connectors from the connector manager
-            try:
-                connectors = self.connector_consumer_manager.get_connectors(bpn)
-                if not connectors or len(connectors) == 0:
+            if(self.logger and self.verbose):
+                self.logger.debug(f"[DTR Manager] [{bpn}] Found {len(connectors)} connectors, searching for DTR assets")
+            
+            # Search for DTR assets in each connector's catalog
+            connector_service:BaseConnectorConsumerService = self.connector_consumer_manager.connector_service
+            
+            # Get catalogs in parallel from all the connectors 
+            catalogs:dict = self.get_catalogs_by_filter_expression(
+                                    connector_service=connector_service,
+                                    edcs=connectors,
+                                    counter_party_id=bpn,
+                                    filter_expression=connector_service.get_filter_expression(
+                                        key=self.dct_type_key,
+                                        operator=self.operator,
+                                        value=self.dct_type
+                                    ),
+                                    timeout=timeout
+                                    ) 
+        
+            # Iterate over catalogs and extract DTR information
+            for connector_url, catalog in catalogs.items():
+                if catalog and not catalog.get("error"):
+                    # Get datasets from the catalog - using DCAT dataset key
+                    datasets = catalog.get(self.DCAT_DATASET_KEY, [])
+                    if not isinstance(datasets, list):
+                        datasets = [datasets] if datasets else []
+                    
+                    for dataset in datasets:
+                        if self._is_dtr_asset(dataset):
+                            # Extract asset ID
+                            asset_id = dataset.get(self.ID_KEY, "")
+                            if not asset_id:
+                                continue
+                            
+                            # Extract policies
+                            policies = self._extract_policies(dataset)
+                            
+                            # Create DTR data structure
+                            self.add_dtr(bpn=bpn, connector_url=connector_url, asset_id=asset_id, policies=policies)
+
+                            if(self.logger and self.verbose):
+                                self.logger.info(f"[DTR Manager] [{bpn}] Found DTR asset [{asset_id}] in connector [{connector_url}] added to cache")
+            
+            # Return the cached DTRs for this BPN
+            if bpn in self.known_dtrs and self.DTR_DATA_KEY in self.known_dtrs[bpn]:
+                cached_dtrs_dict = self.known_dtrs[bpn][self.DTR_DATA_KEY]
+                if isinstance(cached_dtrs_dict, dict):
+                    cached_dtrs_list = list(cached_dtrs_dict.values())
                     if(self.logger and self.verbose):
-                        self.logger.warning(f"[DTR Manager] [{bpn}] No connectors found for DTR discovery")
-                    return []
-                
-                if(self.logger and self.verbose):
-                    self.logger.debug(f"[DTR Manager] [{bpn}] Found {len(connectors)} connectors, searching for DTR assets")
-                
-                # Search for DTR assets in each connector's catalog
-                connector_service:BaseConnectorConsumerService = self.connector_consumer_manager.connector_service
-                
-                # Get catalogs in parallel from all the connectors 
-                catalogs:dict = self.get_catalogs_by_filter_expression(
-                                        connector_service=connector_service,
-                                        edcs=connectors,
-                                        counter_party_id=bpn,
-                                        filter_expression=connector_service.get_filter_expression(
-                                            key=self.dct_type_key,
-                                            operator=self.operator,
-                                            value=self.dct_type
-                                        ),
-                                        timeout=timeout
-                                        ) 
-            
-                # Iterate over catalogs and extract DTR information
-                for connector_url, catalog in catalogs.items():
-                    if catalog and not catalog.get("error"):
-                        # Get datasets from the catalog - using DCAT dataset key
-                        datasets = catalog.get(self.DCAT_DATASET_KEY, [])
-                        if not isinstance(datasets, list):
-                            datasets = [datasets] if datasets else []
-                        
-                        for dataset in datasets:
-                            if self._is_dtr_asset(dataset):
-                                # Extract asset ID
-                                asset_id = dataset.get(self.ID_KEY, "")
-                                if not asset_id:
-                                    continue
-                                
-                                # Extract policies
-                                policies = self._extract_policies(dataset)
-                                
-                                # Create DTR data structure
-                                self.add_dtr(bpn=bpn, connector_url=connector_url, asset_id=asset_id, policies=policies)
-
-                                if(self.logger and self.verbose):
-                                    self.logger.info(f"[DTR Manager] [{bpn}] Found DTR asset [{asset_id}] in connector [{connector_url}] added to cache")
-                
-                # Return the cached DTRs for this BPN
-                if bpn in self.known_dtrs and self.DTR_DATA_KEY in self.known_dtrs[bpn]:
-                    cached_dtrs_dict = self.known_dtrs[bpn][self.DTR_DATA_KEY]
-                    if isinstance(cached_dtrs_dict, dict):
-                        cached_dtrs_list = list(cached_dtrs_dict.values())
-                        if(self.logger and self.verbose):
-                            self.logger.info(f"[DTR Manager] [{bpn}] Discovery complete. Found {len(cached_dtrs_list)} DTR(s) total")
-                        return [copy.deepcopy(dtr) for dtr in cached_dtrs_list]
-                    else:
-                        return []
+                        self.logger.info(f"[DTR Manager] [{bpn}] Discovery complete. Found {len(cached_dtrs_list)} DTR(s) total")
+                    return cached_dtrs_list
                 else:
-                    if(self.logger and self.verbose):
-                        self.logger.info(f"[DTR Manager] [{bpn}] No DTR assets found in any connector catalogs")
                     return []
-        
-            except Exception as e:
+            else:
                 if(self.logger and self.verbose):
-                    self.logger.error(f"[DTR Manager] [{bpn}] Error discovering DTRs: {e}")
+                    self.logger.info(f"[DTR Manager] [{bpn}] No DTR assets found in any connector catalogs")
                 return []
+    
+        except Exception as e:
+            if(self.logger and self.verbose):
+                self.logger.error(f"[DTR Manager] [{bpn}] Error discovering DTRs: {e}")
+            return []
 
     def discover_shells(self, counter_party_id: str, query_spec: List[Dict[str, str]], dtr_policies: Optional[List[Dict]] = None, limit: Optional[int] = None, cursor: Optional[str] = None) -> Dict:
         """
@@ -569,6 +695,7 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
             current_page = PageState(dtr_states={}, page_number=0, limit=limit)
         
         all_shells = []
+        fetched_descriptors: Dict[Tuple[str, str], Dict] = {}
         dtr_results = []
         connector_service = self.connector_consumer_manager.connector_service
         
@@ -578,6 +705,7 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
         
         # Process DTRs
         new_dtr_states = {}
+        dtrs_to_process: List[Tuple[Dict, DtrPaginationState]] = []
         for dtr in dtrs:
             asset_id = dtr.get(self.DTR_ASSET_ID_KEY)
             dtr_state = current_page.dtr_states.get(asset_id, DtrPaginationState(asset_id))
@@ -585,29 +713,52 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
             if dtr_state.exhausted:
                 new_dtr_states[asset_id] = dtr_state
                 continue
-            
-            dtr = self._process_dtr_with_retry(
-                connector_service, counter_party_id, dtr, query_spec, dtr_policies,
-                limit=per_dtr_limit, cursor=dtr_state.cursor
+            dtrs_to_process.append((dtr, dtr_state))
+        
+        if self.parallel_dtr_discovery and len(dtrs_to_process) > 1:
+            processed = self._discover_shells_parallel(
+                connector_service, counter_party_id, dtrs_to_process, query_spec, dtr_policies, per_dtr_limit
             )
+        else:
+            processed = self._discover_shells_sequential(
+                connector_service, counter_party_id, dtrs_to_process, query_spec, dtr_policies, per_dtr_limit, limit
+            )
+        
+        # Merge the results in the original DTR order so pages stay stable
+        for dtr, dtr_state in dtrs_to_process:
+            asset_id = dtr.get(self.DTR_ASSET_ID_KEY)
+            if asset_id not in processed:
+                continue
             
-            dtr_results.append(dtr)
-            shells = dtr.get("shells", [])
-            all_shells.extend(shells)
+            dtr_result = processed[asset_id]
+            # The fetched descriptors only build this page, they are not part of the DTR info
+            for shell_id, shell_descriptor in dtr_result.pop("shellDescriptors", {}).items():
+                fetched_descriptors[(asset_id, shell_id)] = shell_descriptor
+            dtr_results.append(dtr_result)
+            
+            if dtr_result.get("status") == "timeout":
+                # Keep the previous cursor so the DTR is retried on the next page
+                new_dtr_states[asset_id] = DtrPaginationState(
+                    asset_id=asset_id,
+                    cursor=dtr_state.cursor,
+                    exhausted=False
+                )
+                continue
+            
+            all_shells.extend((asset_id, shell_id) for shell_id in dtr_result.get("shells", []))
             
             # Update DTR state
-            paging_metadata = dtr.get("paging_metadata", {})
+            paging_metadata = dtr_result.get("paging_metadata", {})
             new_cursor = paging_metadata.get("cursor")
             new_dtr_states[asset_id] = DtrPaginationState(
                 asset_id=asset_id,
                 cursor=new_cursor,
                 exhausted=not new_cursor
             )
-            
-            # Stop if we've reached the total limit
-            if limit and len(all_shells) >= limit:
-                all_shells = all_shells[:limit]
-                break
+        
+        # Stop if we've reached the total limit
+        if limit and len(all_shells) >= limit:
+            all_shells = all_shells[:limit]
         
         # Create new page state with reference to current page as previous
         new_page = PageState(
@@ -617,8 +768,12 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
             previous_state=current_page  # Store current page as previous state
         )
         
-        # Get shell descriptors
-        shell_descriptors = [self.shell_descriptors.get(shell_id) for shell_id in all_shells if shell_id in self.shell_descriptors]
+        # Get the shell descriptors fetched for this page, the bounded cache may already have evicted some of them
+        shell_descriptors = []
+        for key in all_shells:
+            shell_descriptor = fetched_descriptors.get(key)
+            if shell_descriptor is not None:
+                shell_descriptors.append(shell_descriptor)
         
         # Generate pagination tokens - only include pagination if limit or cursor was provided
         pagination_enabled = limit is not None or cursor is not None
@@ -661,14 +816,87 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
         
         return response
 
-    def _process_dtr_parallel(self, connector_service, counter_party_id: str, dtr: Dict, query_spec: List[Dict], dtr_policies: Optional[List[Dict]] = None, dtr_results: List = None, limit: Optional[int] = None, cursor: Optional[str] = None) -> None:
-        """Process a single DTR in parallel and append result to shared list."""
-        dtr = self._process_dtr_with_retry(connector_service, counter_party_id, dtr, query_spec, dtr_policies, limit=limit, cursor=cursor)
-        self.logger.debug(f"[DTR Manager] [{threading.get_ident()}] Trying to acquire lock (_process_dtr_parallel)")
-        with self._list_lock:  # Thread-safe append to shared list
-            self.logger.debug(f"[DTR Manager] [{threading.get_ident()}] Acquired lock (_process_dtr_parallel)")
-            dtr_results.append(dtr)
-        self.logger.debug(f"[DTR Manager] [{threading.get_ident()}] Released lock (_process_dtr_parallel)")
+    def _discover_shells_sequential(self, connector_service, counter_party_id: str, dtrs_to_process: List[Tuple[Dict, DtrPaginationState]], query_spec: List[Dict], dtr_policies: Optional[List[Dict]] = None, per_dtr_limit: Optional[int] = None, limit: Optional[int] = None) -> Dict[str, Dict]:
+        """Process the DTRs one after another, stopping once the total limit is reached."""
+        results = {}
+        shells_found = 0
+        for dtr, dtr_state in dtrs_to_process:
+            result = self._process_dtr_with_retry(
+                connector_service, counter_party_id, dtr, query_spec, dtr_policies,
+                limit=per_dtr_limit, cursor=dtr_state.cursor
+            )
+            results[dtr.get(self.DTR_ASSET_ID_KEY)] = result
+            shells_found += len(result.get("shells", []))
+            if limit and shells_found >= limit:
+                break
+        return results
+
+    def _discover_shells_parallel(self, connector_service, counter_party_id: str, dtrs_to_process: List[Tuple[Dict, DtrPaginationState]], query_spec: List[Dict], dtr_policies: Optional[List[Dict]] = None, per_dtr_limit: Optional[int] = None) -> Dict[str, Dict]:
+        """
+        Fan out the shell lookups over the bounded worker pool of the manager.
+        
+        The DTRs have to answer within ``dtr_timeout`` seconds of being submitted, whether a worker
+        picked them up or they are still queued behind slow lookups. DTRs that miss the deadline are
+        reported with status ``timeout``, the page is built from the DTRs that answered. Lookups still
+        running are left to finish in the background, queued ones are cancelled.
+        
+        Returns:
+            Dict[str, Dict]: DTR results keyed by DTR asset ID
+        """
+        results: Dict[str, Dict] = {}
+        deadline = time.monotonic() + self.dtr_timeout if self.dtr_timeout is not None else None
+        future_to_dtr = {}
+        try:
+            for dtr, dtr_state in dtrs_to_process:
+                future = self._dtr_discovery_executor.submit(
+                    self._process_dtr_with_retry, connector_service, counter_party_id, dtr, query_spec, dtr_policies,
+                    limit=per_dtr_limit, cursor=dtr_state.cursor
+                )
+                future_to_dtr[future] = dtr
+            
+            pending = set(future_to_dtr)
+            while pending:
+                wait_timeout = max(0, deadline - time.monotonic()) if deadline is not None else None
+                done, pending = wait(pending, timeout=wait_timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    dtr = future_to_dtr[future]
+                    asset_id = dtr.get(self.DTR_ASSET_ID_KEY)
+                    try:
+                        results[asset_id] = future.result()
+                    except Exception as e:
+                        results[asset_id] = {
+                            "connectorUrl": dtr.get(self.DTR_CONNECTOR_URL_KEY),
+                            "assetId": asset_id,
+                            "status": "failed",
+                            "shellsFound": 0,
+                            "shells": [],
+                            "error": str(e)
+                        }
+                
+                if pending and deadline is not None and time.monotonic() >= deadline:
+                    for future in pending:
+                        dtr = future_to_dtr[future]
+                        results[dtr.get(self.DTR_ASSET_ID_KEY)] = self._create_dtr_timeout_result(dtr)
+                        if self.logger and self.verbose:
+                            self.logger.warning(f"[DTR Manager] [{counter_party_id}] DTR [{dtr.get(self.DTR_ASSET_ID_KEY)}] did not answer within {self.dtr_timeout}s, skipping it for this page")
+                    break
+        finally:
+            # Do not wait for DTRs that exceeded their deadline, only drop the ones not started yet
+            for future in future_to_dtr:
+                future.cancel()
+        
+        return results
+
+    def _create_dtr_timeout_result(self, dtr: Dict) -> Dict:
+        """Create the DTR result reported when a DTR misses its deadline."""
+        return {
+            "connectorUrl": dtr.get(self.DTR_CONNECTOR_URL_KEY),
+            "assetId": dtr.get(self.DTR_ASSET_ID_KEY),
+            "status": "timeout",
+            "shellsFound": 0,
+            "shells": [],
+            "error": f"DTR did not respond within {self.dtr_timeout} seconds"
+        }
 
     def _process_dtr_with_retry(self, connector_service, counter_party_id: str, dtr: Dict, query_spec: List[Dict], dtr_policies: Optional[List[Dict]] = None, max_retries: int = 2, limit: Optional[int] = None, cursor: Optional[str] = None) -> Dict:
         """Process a single DTR with retry mechanism."""
@@ -676,7 +904,7 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
         asset_id = dtr.get(self.DTR_ASSET_ID_KEY)
         
         # Use provided policies or fall back to cached policies for automatic negotiation
-        policies_to_use = dtr_policies if dtr_policies else dtr.get(self.DTR_POLICIES_KEY, [])
+        policies_to_use = dtr_policies if dtr_policies else thaw(dtr.get(self.DTR_POLICIES_KEY, []))
         
         dtr = {
             "connectorUrl": connector_url,
@@ -723,20 +951,25 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
                 if response.status_code == 200:
                     response_data = response.json()
                     shell_ids = self._extract_shell_ids(response_data)
-                    shells = self._fetch_shell_descriptors(response_data, dataplane_url, access_token)
+                    shells, shell_errors = self._fetch_shell_descriptors(response_data, dataplane_url, access_token, counter_party_id=counter_party_id, dtr_asset_id=asset_id)
                     
-                    # Store shell descriptors in central memory
+                    # Store shell descriptors in the shared cache for later discover_shell calls
+                    shell_descriptors = {}
                     for shell in shells:
                         shell_id = shell.get("id")
                         if shell_id:
-                            self.shell_descriptors[shell_id] = shell
+                            self.shell_descriptors.put(counter_party_id, asset_id, shell_id, shell)
+                            shell_descriptors[shell_id] = shell
                     
                     dtr.update({
                         "status": "connected",
                         "shellsFound": len(shell_ids),
                         "shells": shell_ids,  # Store just IDs in DTR info
+                        "shellDescriptors": shell_descriptors,  # Removed by discover_shells once the page is built
                         "paging_metadata": response_data.get("paging_metadata", {})
                     })
+                    if shell_errors:
+                        dtr["shellErrors"] = shell_errors
                     return dtr
                 else:
                     # Delete failed connection for retry
@@ -846,40 +1079,139 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
         
         return response
     
-    def _fetch_shell_descriptors(self, shells_response: Dict, dataplane_url: str, access_token: str) -> List[Dict]:
-        """Fetch shell descriptors from shell UUIDs in parallel."""
+    def _fetch_shell_descriptors(self, shells_response: Dict, dataplane_url: str, access_token: str, counter_party_id: Optional[str] = None, dtr_asset_id: Optional[str] = None) -> Tuple[List[Dict], List[Dict]]:
+        """
+        Fetch the shell descriptors of the shell UUIDs returned by a lookup.
+        
+        Large result sets are read page by page from the registry when it supports listing
+        shell descriptors, the remaining ones (or all of them otherwise) are fetched one by one.
+        
+        Returns:
+            Tuple[List[Dict], List[Dict]]: The fetched shell descriptors and one error entry
+                ({"shellId": ..., "error": ...}) for every shell that could not be fetched
+        """
         shell_uuids = shells_response.get('result', []) if isinstance(shells_response, dict) else shells_response
         if not shell_uuids:
-            return []
+            return [], []
         
         shells = []
-        threads = []
+        if (self.batch_fetch_threshold is not None and len(shell_uuids) >= self.batch_fetch_threshold
+                and counter_party_id and dtr_asset_id
+                and self._supports_shell_descriptor_listing(counter_party_id, dtr_asset_id, dataplane_url, access_token)):
+            shells, shell_uuids = self._fetch_shell_descriptors_batched(shell_uuids, dataplane_url, access_token)
+            if not shell_uuids:
+                return shells, []
+            if self.logger and self.verbose:
+                self.logger.debug(f"[DTR Manager] [{counter_party_id}] {len(shell_uuids)} shell(s) not found while paging DTR [{dtr_asset_id}], fetching them one by one")
         
-        # Use a thread-safe list to collect results
-        def fetch_single_shell(shell_uuid: str, results_list: List[Dict]):
-            try:
-                shell = self._fetch_shell_descriptor(shell_uuid, dataplane_url, access_token)
-                if shell:
-                    self.logger.debug(f"[DTR Manager] [{threading.get_ident()}] Trying to acquire lock (fetch_single_shell)")
-                    with self._list_lock:  # Thread-safe append
-                        self.logger.debug(f"[DTR Manager] [{threading.get_ident()}] Acquired lock (fetch_single_shell)")
-                        results_list.append(shell)
-                    self.logger.debug(f"[DTR Manager] [{threading.get_ident()}] Released lock (fetch_single_shell)")
-            except Exception:
-                # Silently continue on error
-                pass
-        
-        # Start threads for parallel fetching
-        for shell_uuid in shell_uuids:
-            thread = threading.Thread(target=fetch_single_shell, args=(shell_uuid, shells))
-            thread.start()
-            threads.append(thread)
+        fetched_shells, errors = self._fetch_shell_descriptors_by_id(shell_uuids, dataplane_url, access_token)
+        return shells + fetched_shells, errors
+    
+    def _fetch_shell_descriptors_by_id(self, shell_uuids: List[str], dataplane_url: str, access_token: str) -> Tuple[List[Dict], List[Dict]]:
+        """Fetch shell descriptors one by one in parallel using the shared shell fetch executor."""
+        def fetch_single_shell(shell_uuid: str) -> Dict:
+            shell = self._fetch_shell_descriptor(shell_uuid, dataplane_url, access_token)
+            if not shell:
+                raise LookupError("Shell descriptor not found or not accessible")
+            return shell
         
-        # Wait for all threads to complete
-        for thread in threads:
-            thread.join()
+        shells = []
+        errors = []
+        for shell_uuid, shell, error in self.shell_fetch_executor.run(dataplane_url, fetch_single_shell, shell_uuids):
+            if error:
+                errors.append({"shellId": shell_uuid, "error": error})
+                if self.logger and self.verbose:
+                    self.logger.debug(f"[DTR Manager] Failed to fetch shell descriptor [{shell_uuid}]: {error}")
+                continue
+            shells.append(shell)
+        
+        return shells, errors
+    
+    def _fetch_shell_descriptors_batched(self, shell_uuids: List[str], dataplane_url: str, access_token: str) -> Tuple[List[Dict], List[str]]:
+        """
+        Read the wanted shell descriptors page by page from GET /shell-descriptors.
+        
+        The registry only lists the shells visible to us, so paging stops as soon as every wanted
+        shell was seen. To avoid walking a huge registry for a handful of shells, at most ten
+        descriptors per wanted shell are scanned.
+        
+        Returns:
+            Tuple[List[Dict], List[str]]: The descriptors found and the shell UUIDs that were not found
+        """
+        wanted = set(shell_uuids)
+        found: Dict[str, Dict] = {}
+        max_scanned = max(len(wanted) * 10, self.batch_page_size)
+        scanned = 0
+        cursor = None
+        
+        try:
+            while len(found) < len(wanted) and scanned < max_scanned:
+                params = {"limit": self.batch_page_size}
+                if cursor:
+                    params["cursor"] = cursor
+                response = HttpTools.do_get(
+                    url=f"{dataplane_url}/shell-descriptors",
+                    headers={"Authorization": f"{access_token}"},
+                    params=params
+                )
+                if response.status_code != 200:
+                    break
+                
+                page = response.json()
+                descriptors = page.get("result", []) if isinstance(page, dict) else []
+                scanned += len(descriptors)
+                for descriptor in descriptors:
+                    shell_id = descriptor.get("id") if isinstance(descriptor, dict) else None
+                    if shell_id in wanted:
+                        found[shell_id] = descriptor
+                
+                cursor = page.get("paging_metadata", {}).get("cursor") if isinstance(page, dict) else None
+                if not cursor or not descriptors:
+                    break
+        except Exception as e:
+            if self.logger and self.verbose:
+                self.logger.warning(f"[DTR Manager] Paging shell descriptors from [{dataplane_url}] failed, falling back to single fetches: {e}")
+        
+        missing = [shell_uuid for shell_uuid in shell_uuids if shell_uuid not in found]
+        return list(found.values()), missing
+    
+    def _supports_shell_descriptor_listing(self, counter_party_id: str, dtr_asset_id: str, dataplane_url: str, access_token: str) -> bool:
+        """
+        Check once per DTR whether the registry can list shell descriptors page by page.
+        
+        The capabilities are read from the service description (GET /description) of the
+        registry and cached, registries without a description are treated as not supporting it.
+        """
+        capability_key = (counter_party_id, dtr_asset_id)
+        capabilities = self.dtr_capabilities.get(capability_key)
+        if capabilities is None:
+            capabilities = self._probe_dtr_capabilities(dataplane_url, access_token)
+            self.dtr_capabilities[capability_key] = capabilities
+            if self.logger and self.verbose:
+                self.logger.debug(f"[DTR Manager] [{counter_party_id}] Capabilities of DTR [{dtr_asset_id}]: {capabilities}")
+        return capabilities.get("shellDescriptorListing", False)
+    
+    def _probe_dtr_capabilities(self, dataplane_url: str, access_token: str) -> Dict[str, Any]:
+        """Read the service description of a remote registry and derive the supported features."""
+        capabilities = {"profiles": [], "shellDescriptorListing": False}
+        try:
+            response = HttpTools.do_get(
+                url=f"{dataplane_url}/description",
+                headers={"Authorization": f"{access_token}"}
+            )
+            if response.status_code != 200:
+                return capabilities
+            profiles = response.json().get("profiles", [])
+        except Exception:
+            return capabilities
         
-        return shells
+        capabilities["profiles"] = profiles
+        # Both the full (SSP-001) and the read (SSP-002) registry profiles include GetAllAssetAdministrationShellDescriptors
+        capabilities["shellDescriptorListing"] = any(
+            self.REGISTRY_SERVICE_PROFILE in profile and (profile.endswith("SSP-001") or profile.endswith("SSP-002"))
+            for profile in profiles if isinstance(profile, str)
+        )
+        return capabilities
         
     def _extract_shell_ids(self, shells_response: Dict) -> List[str]:
         """Extract shell IDs from the lookup response."""
@@ -931,13 +1263,26 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
         
         connector_service = self.connector_consumer_manager.connector_service
         
+        # Serve repeated lookups from the cache without a new DSP round trip
+        for dtr in dtrs:
+            asset_id = dtr.get(self.DTR_ASSET_ID_KEY)
+            shell = self.shell_descriptors.get(counter_party_id, asset_id, id)
+            if shell is not None:
+                return {
+                    "shell_descriptor": shell,
+                    "dtr": {
+                        "connectorUrl": dtr.get(self.DTR_CONNECTOR_URL_KEY),
+                        "assetId": asset_id,
+                    }
+                }
+        
         # Try each DTR to find the shell
         for dtr in dtrs:
             connector_url = dtr.get(self.DTR_CONNECTOR_URL_KEY)
             asset_id = dtr.get(self.DTR_ASSET_ID_KEY)
             
             # Use provided policies or fall back to cached policies for automatic negotiation
-            policies_to_use = dtr_policies if dtr_policies else dtr.get(self.DTR_POLICIES_KEY, [])
+            policies_to_use = dtr_policies if dtr_policies else thaw(dtr.get(self.DTR_POLICIES_KEY, []))
             
             filter_expression = connector_service.get_filter_expression(
                 key=self.dct_type_key, operator=self.operator, value=self.dct_type
@@ -955,6 +1300,7 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
                 # Fetch specific shell descriptor
                 shell = self._fetch_shell_descriptor(id, dataplane_url, access_token)
                 if shell:
+                    self.shell_descriptors.put(counter_party_id, asset_id, id, shell)
                     return {
                         "shell_descriptor": shell,
                         "dtr": {
@@ -1103,7 +1449,7 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
             asset_id = dtr.get(self.DTR_ASSET_ID_KEY)
             
             # Use provided policies or fall back to cached policies for automatic negotiation
-            policies_to_use = dtr_policies if dtr_policies else dtr.get(self.DTR_POLICIES_KEY, [])
+            policies_to_use = dtr_policies if dtr_policies else thaw(dtr.get(self.DTR_POLICIES_KEY, []))
             
             filter_expression = connector_service.get_filter_expression(
                 key=self.dct_type_key, operator=self.operator, value=self.dct_type
@@ -1296,7 +1642,7 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
         self._mark_failed_negotiations(assets_to_negotiate, asset_tokens, asset_errors, response)
         
         # Fetch data in parallel
-        self._fetch_data_parallel(submodels_to_fetch, asset_tokens, response)
+        self._fetch_data_parallel(counter_party_id, submodels_to_fetch, asset_tokens, response)
         
         # Mark any remaining pending items as failed
         self._mark_remaining_pending_as_failed(submodels_to_fetch, response)
@@ -1342,11 +1688,9 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
              
             if self.logger:
                 self.logger.info(
-                    f"[DTR Manager] [{counter_party_id}] Purged cached asset token for asset ID [{asset_id}] due to data fetch failure. Waiting 5s before retry..."
+                    f"[DTR Manager] [{counter_party_id}] Purged cached asset token for asset ID [{asset_id}] due to data fetch failure. Retrying..."
                 )
 
-            time.sleep(5)
-
             access_token = self._negotiate_asset(counter_party_id, asset_id, connector_url, policies)
             if not access_token:
                 response["submodelDescriptor"]["status"] = "error"
@@ -1370,11 +1714,6 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
                         f"[DTR Manager] [{counter_party_id}] Exception during submodel fetch, purging asset cache for [{asset_id}]"
                     )
                 self._purge_asset_cache(counter_party_id, asset_id, connector_url, policies)
-                if self.logger:
-                    self.logger.info(
-                        f"[DTR Manager] [{counter_party_id}] Waiting 5s before retry after exception for asset [{asset_id}]"
-                    )
-                time.sleep(5)
 
                 access_token = self._negotiate_asset(counter_party_id, asset_id, connector_url, policies)
                 if access_token:
@@ -1387,10 +1726,10 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
                         response["submodel"] = data
                         response["submodelDescriptor"]["status"] = "success"
                         return response
-            except Exception as purge_exc:
+            except Exception as retry_exc:
                 if self.logger:
                     self.logger.warning(
-                        f"[DTR Manager] [{counter_party_id}] Failed to purge asset cache after exception for [{asset_id}]: {purge_exc}"
+                        f"[DTR Manager] [{counter_party_id}] Retry after exception failed for asset [{asset_id}]: {retry_exc}"
                     )
             response["submodelDescriptor"]["status"] = "error"
             response["submodelDescriptor"]["error"] = f"Asset negotiation failed. You may not have enough access permissions to this submodel. {str(e)}"
@@ -1462,8 +1801,8 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
                 response["submodelDescriptors"][submodel_id]["status"] = "error"
                 response["submodelDescriptors"][submodel_id]["error"] = error_message
     
-    def _fetch_data_parallel(self, submodels_to_fetch: List[Dict], asset_tokens: Dict[str, str], response: Dict) -> None:
-        """Fetch submodel data in parallel."""
+    def _fetch_data_parallel(self, counter_party_id: str, submodels_to_fetch: List[Dict], asset_tokens: Dict[str, str], response: Dict) -> None:
+        """Fetch submodel data in parallel, renegotiating the asset once if the dataplane rejects its token."""
         fetch_tasks = [
             item for item in submodels_to_fetch 
             if item["assetId"] in asset_tokens
@@ -1478,7 +1817,8 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
                     self._fetch_submodel_data_with_token,
                     item["submodel_id"],
                     item["href"],
-                    asset_tokens[item["assetId"]]
+                    asset_tokens[item["assetId"]],
+                    partial(self._renegotiate_rejected_asset, counter_party_id, item["assetId"], item["connectorUrl"], item["policies"])
                 ): item["submodel_id"]
                 for item in fetch_tasks
             }
@@ -1620,21 +1960,73 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
             return None
 
     def _negotiate_asset(self, counter_party_id: str, asset_id: str, dsp_endpoint_url: str, policies: List[Dict]) -> Optional[str]:
-        """Negotiate access to a single asset and return the access token."""
+        """
+        Get the access token of a single asset, negotiating it only if no valid token is cached.
+        
+        Cached tokens about to expire are still returned while a new one is negotiated in the background,
+        at most once per refresh margin. Concurrent negotiations of the same asset and policies share a single one.
+        """
+        key = EdrTokenCache.key(counter_party_id, dsp_endpoint_url, asset_id, policies)
+        token = self.edr_tokens.get(key)
+        if token is not None:
+            if self.edr_tokens.claim_refresh(key, token):
+                self._edr_negotiation_flights.start(key, self._negotiate_edr_token, key, counter_party_id, asset_id, dsp_endpoint_url, policies)
+            return token.access_token
+        
+        token = self._edr_negotiation_flights.do(key, self._negotiate_edr_token, key, counter_party_id, asset_id, dsp_endpoint_url, policies)
+        return token.access_token if token else None
+
+    def _renegotiate_rejected_asset(self, counter_party_id: str, asset_id: str, dsp_endpoint_url: str, policies: List[Dict], rejected_token: str) -> Optional[str]:
+        """
+        Get a new access token for an asset after the dataplane rejected the given one.
+        
+        If the cached token already differs from the rejected one, another fetch renegotiated it and it is reused.
+        """
+        key = EdrTokenCache.key(counter_party_id, dsp_endpoint_url, asset_id, policies)
+        token = self.edr_tokens.get(key)
+        if token is not None and token.access_token != rejected_token:
+            return token.access_token
+        if self.logger:
+            self.logger.info(f"[DTR Manager] [{counter_party_id}] Access token for asset [{asset_id}] was rejected, renegotiating")
+        self.edr_tokens.invalidate(key)
+        return self._negotiate_asset(counter_party_id, asset_id, dsp_endpoint_url, policies)
+
+    def _negotiate_edr_token(self, key: EdrTokenKey, counter_party_id: str, asset_id: str, dsp_endpoint_url: str, policies: List[Dict]) -> Optional[EdrToken]:
+        """
+        Negotiate access to a single asset and cache the token.
+        
+        Raises:
+            NotAvailableError: If the negotiation of the asset failed repeatedly and is backed off
+        """
+        remaining = self.negotiation_backoff.remaining(key)
+        if remaining > 0:
+            raise NotAvailableError(f"The negotiation of asset [{asset_id}] failed repeatedly, it will be retried in {remaining:.1f}s")
+        
         connector_service: BaseConnectorConsumerService = self.connector_consumer_manager.connector_service
-        dataplane_url, access_token = connector_service.do_dsp_by_asset_id(
-            counter_party_id=counter_party_id,
-            counter_party_address=dsp_endpoint_url,
-            asset_id=asset_id,
-            policies=policies
-        )
-        return access_token
+        try:
+            dataplane_url, access_token = connector_service.do_dsp_by_asset_id(
+                counter_party_id=counter_party_id,
+                counter_party_address=dsp_endpoint_url,
+                asset_id=asset_id,
+                policies=policies
+            )
+        except Exception:
+            self.negotiation_backoff.record_failure(key)
+            raise
+        
+        if not access_token:
+            self.negotiation_backoff.record_failure(key)
+            return None
+        self.negotiation_backoff.record_success(key)
+        return self.edr_tokens.put(key, dataplane_url, access_token)
 
     def _purge_asset_cache(self, counter_party_id: str, asset_id: str, dsp_endpoint_url: str, policies: List[Dict]) -> bool:
         """Purge asset from memory cache and delete from database."""
         if self.logger:
             self.logger.info(f"[DTR Manager] [{counter_party_id}] PURGE: Starting purge for asset [{asset_id}]")
         
+        self.edr_tokens.invalidate(EdrTokenCache.key(counter_party_id, dsp_endpoint_url, asset_id, policies))
+        
         connector_service: BaseConnectorConsumerService = self.connector_consumer_manager.connector_service
         policies_checksum = hashlib.sha3_256(str(policies).encode('utf-8')).hexdigest()
         filter_checksum = hashlib.sha3_256(str(connector_service.get_filter_expression(key="https://w3id.org/edc/v0.0.1/ns/id", value=asset_id)).encode('utf-8')).hexdigest()
@@ -1749,12 +2141,23 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
         # Return True if deleted from either location
         return deleted_from_memory or deleted_from_db
             
-    def _fetch_submodel_data_with_token(self, submodel_id: str, href: str, access_token: str) -> Optional[Dict]:
-        """Fetch submodel data using a pre-negotiated access token."""
+    def _fetch_submodel_data_with_token(self, submodel_id: str, href: str, access_token: str, renegotiate: Optional[Callable[[str], Optional[str]]] = None) -> Optional[Dict]:
+        """
+        Fetch submodel data using a pre-negotiated access token.
+        
+        If the dataplane rejects the token and ``renegotiate`` is given, it is called with the rejected
+        token to get a new one and the fetch is retried once.
+        """
         try:
             headers = {"Authorization": f"{access_token}"}
             response = HttpTools.do_get(href, headers=headers)
             
+            if response.status_code in self.REJECTED_TOKEN_STATUS_CODES and renegotiate is not None:
+                access_token = renegotiate(access_token)
+                if not access_token:
+                    return None
+                response = HttpTools.do_get(href, headers={"Authorization": f"{access_token}"})
+            
             if response.status_code == 200:
                 return response.json()
             else:
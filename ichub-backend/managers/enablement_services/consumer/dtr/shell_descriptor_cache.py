@@ -0,0 +1,81 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+from typing import Any, Dict, Optional, Tuple
+
+from utils.bounded_ttl_cache import BoundedTtlCache
+
+ShellCacheKey = Tuple[str, str, str]
+
+
+class ShellDescriptorCache:
+    """
+    Size and time bounded cache of shell descriptors discovered in partner DTRs.
+
+    Entries are keyed by (BPN, DTR asset ID, shell ID). Once ``max_entries`` is reached the
+    least recently used entry is evicted, and entries older than ``ttl`` seconds are never
+    served again.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl: float = 300):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries (int, optional): Maximum number of cached descriptors. Defaults to 10000.
+            ttl (float, optional): Seconds a descriptor is served from the cache. Defaults to 300.
+        """
+        self._cache: BoundedTtlCache[ShellCacheKey, Dict] = BoundedTtlCache(max_entries=max_entries, ttl=ttl)
+
+    def get(self, bpn: str, dtr_asset_id: str, shell_id: str) -> Optional[Dict]:
+        """
+        Get a cached shell descriptor.
+
+        Returns:
+            Optional[Dict]: The descriptor, or None if it is not cached or expired
+        """
+        return self._cache.get((bpn, dtr_asset_id, shell_id))
+
+    def put(self, bpn: str, dtr_asset_id: str, shell_id: str, descriptor: Dict) -> None:
+        """Store a shell descriptor, evicting the least recently used entries if the cache is full."""
+        self._cache.put((bpn, dtr_asset_id, shell_id), descriptor)
+
+    def invalidate_bpn(self, bpn: str) -> None:
+        """Remove every descriptor discovered for a BPN."""
+        self._cache.invalidate_where(lambda key: key[0] == bpn)
+
+    def clear(self) -> None:
+        """Remove every cached descriptor."""
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get the cache counters.
+
+        Returns:
+            Dict[str, Any]: Size, limits and hit/miss/eviction/expiration counters
+        """
+        return self._cache.get_metrics()
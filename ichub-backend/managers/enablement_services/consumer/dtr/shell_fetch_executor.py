@@ -0,0 +1,166 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class ShellFetchExecutor:
+    """
+    Process-wide bounded executor for fetching shell descriptors from partner DTRs.
+
+    All DTR consumer managers share one worker pool, so a lookup returning thousands of
+    AAS IDs can not spawn thousands of threads. On top of the pool size, the number of
+    requests in flight against a single dataplane URL is capped, which protects the
+    partner's DTR from being flooded by a single discovery.
+    """
+
+    _shared_instance: Optional['ShellFetchExecutor'] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, max_workers: int = 32, max_per_dataplane: int = 8):
+        """
+        Initialize the executor.
+
+        Args:
+            max_workers (int, optional): Size of the worker pool. Defaults to 32.
+            max_per_dataplane (int, optional): Maximum requests in flight per dataplane URL. Defaults to 8.
+        """
+        self.max_workers = max(1, max_workers)
+        self.max_per_dataplane = max(1, max_per_dataplane)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="dtr-shell-fetch")
+        self._condition = threading.Condition()
+        self._in_flight = 0
+        self._active = 0
+        self._in_flight_by_dataplane: Dict[str, int] = {}
+        self._submitted = 0
+        self._succeeded = 0
+        self._failed = 0
+
+    @classmethod
+    def get_shared(cls) -> 'ShellFetchExecutor':
+        """Return the process-wide executor, creating it with the default limits if needed."""
+        with cls._shared_lock:
+            if cls._shared_instance is None:
+                cls._shared_instance = cls()
+            return cls._shared_instance
+
+    @classmethod
+    def set_shared(cls, executor: 'ShellFetchExecutor') -> None:
+        """Replace the process-wide executor, e.g. with one built from the configuration."""
+        with cls._shared_lock:
+            cls._shared_instance = executor
+
+    def run(self, dataplane_url: str, task: Callable[[Any], Any], items: List[Any]) -> List[Tuple[Any, Any, Optional[str]]]:
+        """
+        Run a task for every item against one dataplane and wait for all of them.
+
+        The calling thread blocks while the dataplane is at its concurrency cap, the worker
+        threads never wait for a slot.
+
+        Args:
+            dataplane_url (str): The dataplane the requests are sent to
+            task (Callable): Function called with a single item
+            items (List[Any]): The items to process
+
+        Returns:
+            List[Tuple[Any, Any, Optional[str]]]: (item, result, error) in the order of the items,
+                error is None when the task returned without raising
+        """
+        futures: List[Tuple[Any, Future]] = []
+        for item in items:
+            self._acquire_slot(dataplane_url)
+            try:
+                future = self._executor.submit(self._run_task, task, item)
+            except Exception:
+                self._release_slot(dataplane_url, succeeded=False)
+                raise
+            future.add_done_callback(
+                lambda done, url=dataplane_url: self._release_slot(url, succeeded=not done.cancelled() and done.exception() is None)
+            )
+            futures.append((item, future))
+
+        results = []
+        for item, future in futures:
+            try:
+                results.append((item, future.result(), None))
+            except Exception as e:
+                results.append((item, None, str(e) or type(e).__name__))
+        return results
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get a snapshot of the pool usage.
+
+        Returns:
+            Dict[str, Any]: Pool size, per-dataplane cap, in-flight and active task counts and totals
+        """
+        with self._condition:
+            return {
+                "poolSize": self.max_workers,
+                "maxPerDataplane": self.max_per_dataplane,
+                "inFlight": self._in_flight,
+                "active": self._active,
+                "queued": self._in_flight - self._active,
+                "inFlightByDataplane": dict(self._in_flight_by_dataplane),
+                "submitted": self._submitted,
+                "succeeded": self._succeeded,
+                "failed": self._failed
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker pool."""
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
+
+    def _run_task(self, task: Callable[[Any], Any], item: Any) -> Any:
+        with self._condition:
+            self._active += 1
+        try:
+            return task(item)
+        finally:
+            with self._condition:
+                self._active -= 1
+
+    def _acquire_slot(self, dataplane_url: str) -> None:
+        with self._condition:
+            while self._in_flight_by_dataplane.get(dataplane_url, 0) >= self.max_per_dataplane:
+                self._condition.wait()
+            self._in_flight_by_dataplane[dataplane_url] = self._in_flight_by_dataplane.get(dataplane_url, 0) + 1
+            self._in_flight += 1
+            self._submitted += 1
+
+    def _release_slot(self, dataplane_url: str, succeeded: bool) -> None:
+        with self._condition:
+            remaining = self._in_flight_by_dataplane.get(dataplane_url, 1) - 1
+            if remaining > 0:
+                self._in_flight_by_dataplane[dataplane_url] = remaining
+            else:
+                # Drop idle dataplanes so the map does not grow with every partner ever contacted
+                self._in_flight_by_dataplane.pop(dataplane_url, None)
+            self._in_flight -= 1
+            if succeeded:
+                self._succeeded += 1
+            else:
+                self._failed += 1
+            self._condition.notify_all()
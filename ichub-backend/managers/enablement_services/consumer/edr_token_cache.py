@@ -0,0 +1,144 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+
+import base64
+import hashlib
+import json
+import threading
+import time
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from utils.bounded_ttl_cache import BoundedTtlCache
+
+EdrTokenKey = Tuple[str, str, str, str]
+
+
+class EdrToken(NamedTuple):
+    """A negotiated EDR token and the time it lapses."""
+    dataplane_url: str
+    access_token: str
+    expires_at: float  # time.monotonic() based
+
+
+class EdrTokenCache:
+    """
+    Cache of the EDR tokens negotiated for the assets of partner connectors.
+
+    Tokens are keyed by (counter party, connector address, asset ID, policy checksum), the same
+    selection the connector SDK uses to reuse transfer processes. The expiry is read from the
+    ``exp`` claim of the token, tokens without one are kept for ``default_ttl`` seconds.
+    Tokens lapsing within ``refresh_margin`` seconds are flagged for a proactive refresh, at most
+    once per ``refresh_margin`` seconds and key so a failing or slow refresh is not retried on every use.
+    """
+
+    def __init__(self, refresh_margin: float = 30, default_ttl: float = 300, max_entries: int = 1000):
+        """
+        Initialize the cache.
+
+        Args:
+            refresh_margin (float, optional): Seconds before the expiry a token is refreshed. Defaults to 30.
+            default_ttl (float, optional): Seconds a token without expiry claim is used. Defaults to 300.
+            max_entries (int, optional): Maximum number of cached tokens. Defaults to 1000.
+        """
+        self.refresh_margin = max(0, refresh_margin)
+        self.default_ttl = default_ttl
+        # Every token is stored with the TTL read from its expiry claim
+        self._cache: BoundedTtlCache[EdrTokenKey, EdrToken] = BoundedTtlCache(max_entries=max_entries, ttl=default_ttl)
+        self._refresh_attempts: Dict[EdrTokenKey, float] = {}  # Last proactive refresh by key, time.monotonic() based
+        self._refresh_lock = threading.Lock()
+
+    @staticmethod
+    def key(counter_party_id: str, counter_party_address: str, asset_id: str, policies: List[Dict]) -> EdrTokenKey:
+        """Build the cache key of the token negotiated for an asset with the given policies."""
+        policies_checksum = hashlib.sha3_256(str(policies).encode('utf-8')).hexdigest()
+        return (counter_party_id, counter_party_address, asset_id, policies_checksum)
+
+    def get(self, key: EdrTokenKey) -> Optional[EdrToken]:
+        """
+        Get a cached token.
+
+        Returns:
+            Optional[EdrToken]: The token, or None if it is not cached or already expired
+        """
+        return self._cache.get(key)
+
+    def put(self, key: EdrTokenKey, dataplane_url: str, access_token: str) -> EdrToken:
+        """Store a negotiated token, evicting the least recently used tokens if the cache is full."""
+        ttl = self._seconds_to_expiry(access_token)
+        token = EdrToken(dataplane_url=dataplane_url, access_token=access_token, expires_at=time.monotonic() + ttl)
+        self._cache.put(key, token, ttl=ttl)
+        return token
+
+    def needs_refresh(self, token: EdrToken) -> bool:
+        """Check if a token lapses within the refresh margin."""
+        return time.monotonic() >= token.expires_at - self.refresh_margin
+
+    def claim_refresh(self, key: EdrTokenKey, token: EdrToken) -> bool:
+        """
+        Check if a token lapses within the refresh margin and record the refresh attempt.
+
+        Returns:
+            bool: True if the token should be refreshed now, False if it is still fresh or a
+                refresh was already attempted within the last ``refresh_margin`` seconds
+        """
+        if not self.needs_refresh(token):
+            return False
+        now = time.monotonic()
+        with self._refresh_lock:
+            last_attempt = self._refresh_attempts.get(key)
+            if last_attempt is not None and now - last_attempt < self.refresh_margin:
+                return False
+            self._refresh_attempts = {k: at for k, at in self._refresh_attempts.items() if now - at < self.refresh_margin}
+            self._refresh_attempts[key] = now
+            return True
+
+    def invalidate(self, key: EdrTokenKey) -> None:
+        """Remove a token, e.g. after the dataplane rejected it."""
+        self._cache.invalidate(key)
+        with self._refresh_lock:
+            self._refresh_attempts.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove every cached token."""
+        self._cache.clear()
+        with self._refresh_lock:
+            self._refresh_attempts.clear()
+
+    def _seconds_to_expiry(self, access_token: str) -> float:
+        """Read the seconds left until the ``exp`` claim of a JWT, the default TTL if it has none."""
+        try:
+            payload = access_token.split(".")[1]
+            claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+            return float(claims["exp"]) - time.time()
+        except Exception:
+            return self.default_ttl
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get the cache counters.
+
+        Returns:
+            Dict[str, Any]: Size, limits and hit/miss/eviction/expiration counters
+        """
+        return {**self._cache.get_metrics(), "refreshMarginSeconds": self.refresh_margin}
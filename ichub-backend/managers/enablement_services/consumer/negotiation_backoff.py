@@ -0,0 +1,111 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+
+import threading
+import time
+from typing import Any, Dict, Hashable, Tuple
+
+
+class NegotiationBackoff:
+    """
+    Exponential backoff of failing negotiations, without blocking the calling thread.
+
+    The first retry after a failure is allowed right away, every further consecutive failure
+    doubles the time (from ``base_delay`` up to ``max_delay`` seconds) during which new attempts
+    for the same key are refused. Callers fail fast instead of sleeping while holding a worker.
+    """
+
+    # Idle keys are dropped once this many keys are tracked
+    MAX_TRACKED_KEYS = 1000
+
+    def __init__(self, base_delay: float = 1, max_delay: float = 60):
+        """
+        Initialize the backoff.
+
+        Args:
+            base_delay (float, optional): Seconds refused after the second consecutive failure. Defaults to 1.
+            max_delay (float, optional): Maximum seconds refused after a failure. Defaults to 60.
+        """
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._failures: Dict[Hashable, Tuple[int, float]] = {}  # Consecutive failures and the time of the next allowed attempt
+        self._lock = threading.Lock()
+        self.refused = 0
+
+    def remaining(self, key: Hashable) -> float:
+        """
+        Get the seconds until a new attempt for the key is allowed.
+
+        Returns:
+            float: 0 if an attempt is allowed now
+        """
+        with self._lock:
+            failures = self._failures.get(key)
+            if failures is None:
+                return 0
+            remaining = failures[1] - time.monotonic()
+            if remaining <= 0:
+                return 0
+            self.refused += 1
+            return remaining
+
+    def record_failure(self, key: Hashable) -> float:
+        """
+        Record a failed attempt.
+
+        Returns:
+            float: Seconds until the next attempt is allowed
+        """
+        with self._lock:
+            now = time.monotonic()
+            if len(self._failures) >= self.MAX_TRACKED_KEYS:
+                self._forget_idle(now)
+            count, allowed_at = self._failures.get(key, (0, now))
+            # Failures separated by more than the maximum delay start a new backoff
+            count = 1 if now - allowed_at > self.max_delay else count + 1
+            delay = 0 if count == 1 else min(self.max_delay, self.base_delay * 2 ** (count - 2))
+            self._failures[key] = (count, now + delay)
+            return delay
+
+    def _forget_idle(self, now: float) -> None:
+        """Drop the keys whose backoff ended longer than the maximum delay ago."""
+        self._failures = {key: failures for key, failures in self._failures.items() if now - failures[1] <= self.max_delay}
+
+    def record_success(self, key: Hashable) -> None:
+        """Reset the backoff of a key after a successful attempt."""
+        with self._lock:
+            self._failures.pop(key, None)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get the backoff counters.
+
+        Returns:
+            Dict[str, Any]: Keys currently failing and attempts refused during a backoff
+        """
+        with self._lock:
+            return {
+                "failingKeys": len(self._failures),
+                "refused": self.refused
+            }
@@ -0,0 +1,156 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class _Flight:
+    """A call in progress and the outcome shared with the callers waiting for it."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Collapses concurrent calls for the same key into a single execution.
+
+    The first caller for a key runs the function, callers arriving while it is in flight
+    wait for it and get the same result (or exception) instead of repeating the work.
+    Once the call finished, the next caller for the key runs the function again. Calls can also
+    be started in the background, e.g. to refresh a cache entry while the stale one is served.
+    """
+
+    def __init__(self):
+        """Initialize the single-flight group."""
+        self._lock = threading.Lock()
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._calls = 0
+        self._executions = 0
+        self._coalesced = 0
+        self._failed = 0
+        self._background = 0
+
+    def do(self, key: Hashable, function: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a function once for all the concurrent callers of a key.
+
+        Args:
+            key (Hashable): Identifies the work, e.g. the BPN being discovered
+            function (Callable): The work to run
+            *args, **kwargs: Arguments passed to the function
+
+        Returns:
+            Any: The result of the function, shared by all the callers of the flight
+
+        Raises:
+            BaseException: The exception raised by the function, re-raised in every caller
+        """
+        with self._lock:
+            self._calls += 1
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                self._flights[key] = flight
+                self._executions += 1
+            else:
+                self._coalesced += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        return self._run(key, flight, function, *args, **kwargs)
+
+    def start(self, key: Hashable, function: Callable[..., Any], *args, **kwargs) -> bool:
+        """
+        Run a function in a background thread, unless a call for the key is already in flight.
+
+        Callers of ``do`` arriving while the background call runs wait for it like for any other flight.
+
+        Args:
+            key (Hashable): Identifies the work, e.g. the BPN being refreshed
+            function (Callable): The work to run
+            *args, **kwargs: Arguments passed to the function
+
+        Returns:
+            bool: True if the function was started, False if a call for the key was already in flight
+        """
+        with self._lock:
+            self._calls += 1
+            if key in self._flights:
+                self._coalesced += 1
+                return False
+            flight = _Flight()
+            self._flights[key] = flight
+            self._executions += 1
+            self._background += 1
+
+        threading.Thread(target=self._run_in_background, args=(key, flight, function, args, kwargs), daemon=True).start()
+        return True
+
+    def _run(self, key: Hashable, flight: _Flight, function: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run the function of a flight and hand its outcome to the callers waiting for it."""
+        try:
+            flight.result = function(*args, **kwargs)
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            with self._lock:
+                self._failed += 1
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+    def _run_in_background(self, key: Hashable, flight: _Flight, function: Callable[..., Any], args: tuple, kwargs: dict) -> None:
+        """Run a flight started by ``start``, the error is only raised to the callers waiting for it."""
+        try:
+            self._run(key, flight, function, *args, **kwargs)
+        except Exception:
+            pass
+
+    def get_metrics(self) -> Dict[str, int]:
+        """
+        Get the call counters.
+
+        Returns:
+            Dict[str, int]: Calls, executions (and how many of them ran in the background), calls coalesced
+            into another one, failed executions and flights in progress
+        """
+        with self._lock:
+            return {
+                "calls": self._calls,
+                "executions": self._executions,
+                "background": self._background,
+                "coalesced": self._coalesced,
+                "failed": self._failed,
+                "inFlight": len(self._flights)
+            }
@@ -28,6 +28,7 @@ from tools.constants import ODRL_CONTEXT, CX_POLICY_CONTEXT, TYPE
 import json
 
 from .dtr_provider_manager import DtrProviderManager
+from .edc_registration_cache import EdcRegistrationCache
 
 logger = LoggingManager.get_logger(__name__)
 from tools.crypt_tools import blake2b_128bit
@@ -43,7 +44,8 @@ class ConnectorProviderManager:
                  path_submodel_dispatcher: str = "/submodel-dispatcher",
                  authorization: bool = False,
                  backend_api_key: str = "X-Api-Key",
-                 backend_api_key_value: str = ""):
+                 backend_api_key_value: str = "",
+                 registration_cache_ttl: float | None = 300):
 
         self.ichub_url = ichub_url  # for the circular submodel bundles.
         self.path_submodel_dispatcher = path_submodel_dispatcher
@@ -57,6 +59,8 @@ class ConnectorProviderManager:
 
         self.empty_policy = self.get_empty_policy_config()
         self.connector_service = connector_provider_service
+        # Assets, policies and contracts known to exist in the connector, so they are not checked on every offer registration
+        self.registration_cache = EdcRegistrationCache(ttl=registration_cache_ttl)
 
     def get_empty_policy_config(self) -> dict:
         """Returns an empty policy template."""
@@ -158,6 +162,7 @@ class ConnectorProviderManager:
                            version="3.0",
                            headers:dict=None) -> tuple[str, str, str, str]:
         
+        self.registration_cache.ensure_fingerprint(self.get_registration_fingerprint())
         dtr_url = DtrProviderManager.get_dtr_url(base_dtr_url=base_dtr_url, uri=uri, api_path=api_path)
         ## step 1: Create the submodel bundle asset
         asset_id = self.get_or_create_dtr_asset(dtr_url=dtr_url, dct_type=dct_type, existing_asset_id=existing_asset_id, version=version, headers=headers)
@@ -205,6 +210,7 @@ class ConnectorProviderManager:
         return usage_policy_id, access_policy_id
         
     def register_submodel_bundle_circular_offer(self, semantic_id: str) -> tuple[str, str, str, str]:
+        self.registration_cache.ensure_fingerprint(self.get_registration_fingerprint())
         ## step 1: Create the submodel bundle asset
         asset_id = self.get_or_create_circular_submodel_asset(semantic_id)
 
@@ -221,6 +227,51 @@ class ConnectorProviderManager:
         
         return asset_id, usage_policy_id, access_policy_id, contract_id
 
+    def get_registration_fingerprint(self) -> str:
+        """Fingerprint of the configuration the registered offers are built from, the registration cache is dropped when it changes."""
+        return blake2b_128bit(json.dumps([
+            self.ichub_url,
+            self.path_submodel_dispatcher,
+            self.authorization,
+            self.backend_api_key,
+            self.backend_api_key_value,
+            self.agreements
+        ], sort_keys=True, default=str))
+
+    def get_metrics(self) -> dict:
+        """Returns the counters of the registration cache."""
+        return {
+            "registrationCache": self.registration_cache.get_metrics()
+        }
+
+    def _is_registered(self, kind: str, oid: str, controller) -> bool:
+        """
+        Checks if an asset, policy or contract definition exists, asking the connector only if it is not cached.
+        
+        A cached ID reported missing by the connector drops the whole registration cache.
+        """
+        if self.registration_cache.is_registered(kind, oid):
+            return True
+        
+        response = controller.get_by_id(oid=oid)
+        if response.status_code == 200:
+            self.registration_cache.mark_registered(kind, oid)
+            return True
+        if response.status_code == 404:
+            self.registration_cache.mark_missing(kind, oid)
+        return False
+
+    def _create_registered(self, kind: str, oid: str, create):
+        """Creates an asset, policy or contract definition and caches it, the cache is dropped if the creation fails."""
+        try:
+            response = create()
+        except Exception:
+            # Creations fail e.g. when a cached policy or asset they reference was deleted in the connector
+            self.registration_cache.clear()
+            raise
+        self.registration_cache.mark_registered(kind, response.get("@id", oid))
+        return response
+
     def generate_contract_id(self, asset_id:str, usage_policy_id:str, access_policy_id:str) -> str:
         return "ichub:contract:"+blake2b_128bit(
             asset_id + usage_policy_id + access_policy_id
@@ -228,17 +279,16 @@ class ConnectorProviderManager:
 
     def get_or_create_contract(self, asset_id:str, usage_policy_id:str, access_policy_id:str) -> str:
         contract_id:str = self.generate_contract_id(asset_id=asset_id, usage_policy_id=usage_policy_id, access_policy_id=access_policy_id)
-        existing_contract = self.connector_service.contract_definitions.get_by_id(oid=contract_id)
-        if existing_contract.status_code == 200:
+        if self._is_registered(EdcRegistrationCache.CONTRACT, contract_id, self.connector_service.contract_definitions):
             logger.debug(f"Contract with ID {contract_id} already exists.")
             return contract_id
 
-        contract_response = self.connector_service.create_contract(
+        contract_response = self._create_registered(EdcRegistrationCache.CONTRACT, contract_id, lambda: self.connector_service.create_contract(
             contract_id=contract_id,
             usage_policy_id=usage_policy_id,
             access_policy_id=access_policy_id,
             asset_id=asset_id
-        )
+        ))
         return contract_response.get("@id", contract_id)
 
 
@@ -266,18 +316,17 @@ class ConnectorProviderManager:
         
         """Get or create a policy in the EDC, returning the policy ID."""
         # Check if the policy already exists
-        existing_policy = self.connector_service.policies.get_by_id(oid=policy_id)
-        if existing_policy.status_code == 200:
+        if self._is_registered(EdcRegistrationCache.POLICY, policy_id, self.connector_service.policies):
             logger.debug(f"Policy with ID {policy_id} already exists.")
             return policy_id
 
-        policy_response = self.connector_service.create_policy(
+        policy_response = self._create_registered(EdcRegistrationCache.POLICY, policy_id, lambda: self.connector_service.create_policy(
             policy_id=policy_id,
             context=context,
             permissions=permissions,
             prohibitions=prohibitions,
             obligations=obligations
-        )
+        ))
         return policy_response.get("@id", policy_id)
     
     
@@ -287,15 +336,13 @@ class ConnectorProviderManager:
             existing_asset_id = self.generate_dtr_asset_id(dtr_url=dtr_url)
         """Get or create a circular submodel asset."""
         # Check if the asset already exists
-        existing_asset = self.connector_service.assets.get_by_id(oid=existing_asset_id)
-        
-        if existing_asset.status_code == 200:
+        if self._is_registered(EdcRegistrationCache.ASSET, existing_asset_id, self.connector_service.assets):
             logger.debug(f"[DTR] Asset with ID {existing_asset_id} already exists.")
             return existing_asset_id
         
         # If it doesn't exist, create it
         logger.info(f"[DTR] Creating new asset with ID {existing_asset_id}.")
-        asset = self.create_dtr_asset(asset_id=existing_asset_id, dtr_url=dtr_url, dct_type=dct_type, version=version, headers=headers)
+        asset = self._create_registered(EdcRegistrationCache.ASSET, existing_asset_id, lambda: self.create_dtr_asset(asset_id=existing_asset_id, dtr_url=dtr_url, dct_type=dct_type, version=version, headers=headers))
         return asset.get("@id", existing_asset_id)
     
     def get_or_create_circular_submodel_asset(self, semantic_id:str) -> str:
@@ -303,15 +350,13 @@ class ConnectorProviderManager:
         standard_asset_id = self.generate_asset_id(semantic_id=semantic_id)
         """Get or create a circular submodel asset."""
         # Check if the asset already exists
-        existing_asset = self.connector_service.assets.get_by_id(oid=standard_asset_id)
-        
-        if existing_asset.status_code == 200:
+        if self._is_registered(EdcRegistrationCache.ASSET, standard_asset_id, self.connector_service.assets):
             logger.debug(f"Asset with ID {standard_asset_id} already exists.")
             return standard_asset_id
         
         # If it doesn't exist, create it
         logger.info(f"Creating new asset with ID {standard_asset_id}.")
-        asset = self.create_circular_submodel_asset(semantic_id)
+        asset = self._create_registered(EdcRegistrationCache.ASSET, standard_asset_id, lambda: self.create_circular_submodel_asset(semantic_id))
         return asset.get("@id", standard_asset_id)
     
     def build_dispatcher_url(self, semantic_id: str):
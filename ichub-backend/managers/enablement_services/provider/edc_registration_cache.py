@@ -0,0 +1,118 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+RegistrationKey = Tuple[str, str]
+
+
+class EdcRegistrationCache:
+    """
+    Remembers the assets, policies and contract definitions known to exist in the provider connector.
+
+    Their IDs are derived from their content, so an ID found once does not need to be checked again
+    on every offer registration. Entries are checked again after ``ttl`` seconds, so an entry deleted
+    directly in the connector is only noticed once its TTL lapsed or a creation referencing it fails.
+    The whole cache is dropped when the registration configuration changes or when a cached ID is
+    reported missing by the connector (something was deleted there, other cached entries may be gone too).
+    """
+
+    ASSET = "asset"
+    POLICY = "policy"
+    CONTRACT = "contract"
+
+    def __init__(self, ttl: Optional[float] = 300):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl (Optional[float], optional): Seconds an entry is trusted before it is checked again, None to trust it forever. Defaults to 300.
+        """
+        self.ttl = ttl
+        self._entries: Dict[RegistrationKey, float] = {}
+        self._fingerprint: Optional[str] = None
+        self._lock = threading.Lock()
+        self.hits: Dict[str, int] = {self.ASSET: 0, self.POLICY: 0, self.CONTRACT: 0}
+        self.misses: Dict[str, int] = {self.ASSET: 0, self.POLICY: 0, self.CONTRACT: 0}
+        self.invalidations = 0
+
+    def is_registered(self, kind: str, oid: str) -> bool:
+        """Check if an asset, policy or contract definition is known to exist and does not need to be checked."""
+        with self._lock:
+            registered_at = self._entries.get((kind, oid))
+            if registered_at is None or (self.ttl is not None and time.monotonic() - registered_at >= self.ttl):
+                self.misses[kind] = self.misses.get(kind, 0) + 1
+                return False
+            self.hits[kind] = self.hits.get(kind, 0) + 1
+            return True
+
+    def mark_registered(self, kind: str, oid: str) -> None:
+        """Remember that an asset, policy or contract definition exists in the connector."""
+        with self._lock:
+            self._entries[(kind, oid)] = time.monotonic()
+
+    def mark_missing(self, kind: str, oid: str) -> None:
+        """
+        Handle an ID reported missing by the connector.
+
+        If it was cached it has been deleted in the connector, then the whole cache is dropped.
+        """
+        with self._lock:
+            if (kind, oid) in self._entries:
+                self._clear()
+
+    def ensure_fingerprint(self, fingerprint: str) -> None:
+        """Drop the cache if the registration configuration changed since the last call."""
+        with self._lock:
+            if self._fingerprint is not None and self._fingerprint != fingerprint:
+                self._clear()
+            self._fingerprint = fingerprint
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._clear()
+
+    def _clear(self) -> None:
+        if self._entries:
+            self.invalidations += 1
+        self._entries = {}
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get the cache counters.
+
+        Returns:
+            Dict[str, Any]: Size, TTL, hits and misses by kind and the number of invalidations
+        """
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "ttlSeconds": self.ttl,
+                "hits": dict(self.hits),
+                "misses": dict(self.misses),
+                "invalidations": self.invalidations
+            }
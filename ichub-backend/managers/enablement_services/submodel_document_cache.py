@@ -0,0 +1,201 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import json
+import os
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from hashlib import blake2b
+from typing import Any, BinaryIO, ClassVar, Dict, Iterator, Optional, Tuple
+from uuid import UUID
+
+from utils.bounded_ttl_cache import BoundedTtlCache
+
+SubmodelDocumentKey = Tuple[str, UUID]
+
+
+def etag_matches(etag: str, if_none_match: Optional[str]) -> bool:
+    """Check an If-None-Match header against an entity tag, weak tags included."""
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or any(tag.removeprefix("W/") == etag for tag in tags)
+
+
+@dataclass(frozen=True)
+class SubmodelDocument:
+    """A submodel document serialized once, with the validators of its HTTP responses."""
+    body: bytes
+    etag: str
+    last_modified: datetime
+
+    @classmethod
+    def from_payload(cls, payload: Any, last_modified: datetime) -> "SubmodelDocument":
+        """Serialize a submodel payload and compute its entity tag."""
+        body = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode()
+        return cls(body=body, etag=f'"{blake2b(body, digest_size=16).hexdigest()}"', last_modified=last_modified)
+
+    def matches(self, if_none_match: Optional[str]) -> bool:
+        """Check an If-None-Match header against the entity tag."""
+        return etag_matches(self.etag, if_none_match)
+
+
+@dataclass(frozen=True)
+class SubmodelFile:
+    """
+    A submodel file in the local storage, served as stored instead of being parsed and serialized again.
+
+    Files up to ``INLINE_FILE_SIZE`` are read with their metadata. Larger ones keep the descriptor their
+    metadata was read from open and are streamed from it with ``iter_content``, so the bytes sent are the
+    ones the entity tag describes even if the file is replaced meanwhile.
+    """
+    path: str
+    size: int
+    etag: str
+    last_modified: datetime
+    body: Optional[bytes] = None
+    file: Optional[BinaryIO] = field(default=None, compare=False, repr=False)
+
+    # Below this size reading the file at once is cheaper than streaming it in chunks
+    INLINE_FILE_SIZE: ClassVar[int] = 64 * 1024
+    # Size of the chunks large files are streamed in
+    CHUNK_SIZE: ClassVar[int] = 64 * 1024
+
+    @classmethod
+    def from_path(cls, path: str) -> "SubmodelFile":
+        """
+        Describe a stored submodel file, with its content if it is small.
+
+        Files are replaced atomically on every write, so the inode, modification time and size identify the content.
+        The descriptor of a large file is left open, it must be consumed with ``iter_content`` or closed.
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        file = open(path, "rb")
+        try:
+            stat_result = os.fstat(file.fileno())
+            body = None
+            if stat_result.st_size <= cls.INLINE_FILE_SIZE:
+                body = file.read()
+                file.close()
+                file = None
+        except BaseException:
+            file.close()
+            raise
+        version = f"{stat_result.st_ino}-{stat_result.st_mtime_ns}-{stat_result.st_size}".encode()
+        return cls(
+            path=path,
+            size=stat_result.st_size,
+            etag=f'"{blake2b(version, digest_size=16).hexdigest()}"',
+            last_modified=datetime.fromtimestamp(stat_result.st_mtime, tz=timezone.utc),
+            body=body,
+            file=file
+        )
+
+    def iter_content(self) -> Iterator[bytes]:
+        """Read the content of a large file in chunks from its open descriptor, closing it at the end."""
+        try:
+            while chunk := self.file.read(self.CHUNK_SIZE):
+                yield chunk
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Close the descriptor of a large file that is not streamed, e.g. when answering 304."""
+        if self.file is not None:
+            self.file.close()
+
+    def matches(self, if_none_match: Optional[str]) -> bool:
+        """Check an If-None-Match header against the entity tag."""
+        return etag_matches(self.etag, if_none_match)
+
+
+class SubmodelDocumentCache:
+    """
+    Size and time bounded read-through cache of serialized submodel documents.
+
+    Entries are keyed by (semantic ID, submodel ID). Once ``max_entries`` documents or ``max_bytes``
+    of serialized documents are cached, the least recently used entries are evicted. Writes and deletes
+    through the submodel service manager invalidate their entry, the ``ttl`` bounds how long a document
+    changed by another replica can still be served.
+    """
+
+    def __init__(self, max_entries: int = 10000, max_bytes: int = 64 * 1024 * 1024, ttl: float = 300):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries (int, optional): Maximum number of cached documents. Defaults to 10000.
+            max_bytes (int, optional): Maximum size of the cached documents. Defaults to 64 MiB.
+            ttl (float, optional): Seconds a document is served from the cache. Defaults to 300.
+        """
+        self._cache: BoundedTtlCache[SubmodelDocumentKey, SubmodelDocument] = BoundedTtlCache(
+            max_entries=max_entries, ttl=ttl, max_size=max_bytes, sizeof=lambda document: len(document.body))
+
+    @property
+    def generation(self) -> int:
+        """Bumped by every invalidation, a document read before it may be outdated and is not stored."""
+        return self._cache.generation
+
+    def get(self, semantic_id: str, submodel_id: UUID) -> Optional[SubmodelDocument]:
+        """
+        Get a cached submodel document.
+
+        Returns:
+            Optional[SubmodelDocument]: The document, or None if it is not cached or expired
+        """
+        return self._cache.get((semantic_id, submodel_id))
+
+    def put(self, semantic_id: str, submodel_id: UUID, document: SubmodelDocument, generation: int) -> None:
+        """
+        Store a submodel document, evicting the least recently used entries if the cache is full.
+
+        Args:
+            semantic_id (str): Semantic ID of the submodel
+            submodel_id (UUID): ID of the submodel
+            document (SubmodelDocument): The document
+            generation (int): Value of ``generation`` before the document was read from the submodel service,
+                the document is dropped if an entry was invalidated meanwhile
+        """
+        self._cache.put((semantic_id, submodel_id), document, generation=generation)
+
+    def invalidate(self, semantic_id: str, submodel_id: UUID) -> None:
+        """Remove a submodel document, called when it is written or deleted."""
+        self._cache.invalidate((semantic_id, submodel_id))
+
+    def clear(self) -> None:
+        """Remove every cached document."""
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get the cache counters.
+
+        Returns:
+            Dict[str, Any]: Size, limits and hit/miss/eviction/expiration counters
+        """
+        return self._cache.get_metrics()
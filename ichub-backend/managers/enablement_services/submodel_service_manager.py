@@ -22,9 +22,11 @@
 #################################################################################
 
 import os
+import threading
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Any
-from uuid import UUID
+from typing import Dict, Any, Optional
+from uuid import UUID, uuid4
 from hashlib import sha256
 from enum import Enum
 
@@ -36,6 +38,7 @@ from tractusx_sdk.industry.adapters import SubmodelAdapter
 from tractusx_sdk.industry.adapters.submodel_adapter_factory import SubmodelAdapterFactory
 from tractusx_sdk.industry.adapters.submodel_adapters.file_system_adapter import FileSystemAdapter
 from managers.enablement_services.adapters.http_submodel_adapter import HttpSubmodelAdapter
+from managers.enablement_services.submodel_document_cache import SubmodelDocument, SubmodelDocumentCache, SubmodelFile
 
 
 class OperationType(Enum):
@@ -48,8 +51,14 @@ class SubmodelServiceManager:
     """Manager for handling submodel service."""
     adapter: SubmodelAdapter
     adapter_mode: str
+    storage_location: str
+    document_cache: Optional[SubmodelDocumentCache]
     logger = LoggingManager.get_logger(__name__)
 
+    # Document caches shared by all the managers of the same storage, so a write through any of them invalidates it
+    _document_caches: Dict[str, SubmodelDocumentCache] = {}
+    _document_caches_lock = threading.Lock()
+
     def __init__(self):
         # Get adapter mode from configuration (default: filesystem)
         self.adapter_mode = ConfigManager.get_config(
@@ -78,8 +87,32 @@ class SubmodelServiceManager:
             self.adapter = self._initialize_http_adapter()
         else:
             raise ValueError(f"Unsupported adapter mode: {self.adapter_mode}")
+
+        self.document_cache = self._get_document_cache()
         
         self.logger.info(f"SubmodelServiceManager initialized with mode: {self.adapter_mode}")
+
+    def _get_document_cache(self) -> Optional[SubmodelDocumentCache]:
+        """Get the document cache of the storage of this manager, created by the first manager using it."""
+        cache_config = ConfigManager.get_config("provider.submodel_dispatcher.cache", default={})
+        if not isinstance(cache_config, dict):
+            raise ValueError(
+                f"Expected 'provider.submodel_dispatcher.cache' to be a dict, "
+                f"got: {type(cache_config).__name__}"
+            )
+        if not cache_config.get("enabled", True):
+            return None
+
+        with SubmodelServiceManager._document_caches_lock:
+            cache = SubmodelServiceManager._document_caches.get(self.storage_location)
+            if cache is None:
+                cache = SubmodelDocumentCache(
+                    max_entries=int(cache_config.get("max_entries", 10000)),
+                    max_bytes=int(cache_config.get("max_size_mb", 64)) * 1024 * 1024,
+                    ttl=float(cache_config.get("ttl_seconds", 300))
+                )
+                SubmodelServiceManager._document_caches[self.storage_location] = cache
+            return cache
     
     def _initialize_filesystem_adapter(self) -> FileSystemAdapter:
         """Initialize filesystem adapter for local storage."""
@@ -97,6 +130,7 @@ class SubmodelServiceManager:
         # Convert relative path to absolute path if needed
         if not os.path.isabs(submodel_service_path):
             submodel_service_path = os.path.abspath(submodel_service_path)
+        self.storage_location = f"filesystem:{submodel_service_path}"
         
         # Ensure the directory exists and check permissions
         try:
@@ -146,6 +180,12 @@ class SubmodelServiceManager:
         api_path = http_config.get("api_path", "")
         timeout = http_config.get("timeout", 30)
         verify_ssl = http_config.get("verify_ssl", True)
+        pool_config = http_config.get("pool", {})
+        if not isinstance(pool_config, dict):
+            raise ValueError(
+                f"Expected 'provider.submodel_dispatcher.http.pool' to be a dict, "
+                f"got: {type(pool_config).__name__}"
+            )
         
         # Extract authentication configuration
         auth_config = http_config.get("auth", {})
@@ -189,6 +229,7 @@ class SubmodelServiceManager:
                 self.logger.info("Using Bearer token authentication")
         
         self.logger.info(f"Initializing HTTP adapter for: {base_url}")
+        self.storage_location = f"http:{base_url}{api_path}"
         
         return HttpSubmodelAdapter(
             base_url=base_url,
@@ -197,7 +238,10 @@ class SubmodelServiceManager:
             auth_token=auth_token if auth_enabled else None,
             auth_key_name=auth_key_name,
             timeout=timeout,
-            verify_ssl=verify_ssl
+            verify_ssl=verify_ssl,
+            max_connections=int(pool_config.get("max_connections", 100)),
+            max_keepalive_connections=int(pool_config.get("max_keepalive_connections", 20)),
+            keepalive_expiry=float(pool_config.get("keepalive_expiry", 30))
         )
 
     def _validate_uuid(self, value: Any) -> UUID:
@@ -292,7 +336,7 @@ class SubmodelServiceManager:
         elif operation == OperationType.WRITE:
             if not self.adapter.exists(sha256_id):
                 self.adapter.create_directory(sha256_id)
-            self.adapter.write(file_path, payload)
+            self._write_file(file_path, payload)
             self.logger.info("Submodel uploaded successfully.")
             return None
         
@@ -304,6 +348,66 @@ class SubmodelServiceManager:
             self.logger.info("Submodel deleted successfully.")
             return None
 
+    def _write_file(self, file_path: str, payload: Dict[str, Any]) -> None:
+        """Write a submodel file, replacing it atomically on a local filesystem so readers never see a partial file."""
+        root_path = self._get_root_path()
+        if root_path is None:
+            self.adapter.write(file_path, payload)
+            return
+
+        temporary_path = f"{file_path}.{uuid4().hex}.tmp"
+        try:
+            self.adapter.write(temporary_path, payload)
+            os.replace(os.path.join(root_path, temporary_path), os.path.join(root_path, file_path))
+        except BaseException:
+            try:
+                os.remove(os.path.join(root_path, temporary_path))
+            except OSError:
+                pass
+            raise
+
+    def _get_root_path(self) -> Optional[str]:
+        """Get the directory of the stored submodels, None if they are not stored on a local filesystem."""
+        root_path = getattr(self.adapter, "root_path", None)
+        if self.adapter_mode == "filesystem" and isinstance(root_path, str):
+            return root_path
+        return None
+
+    @property
+    def stores_files(self) -> bool:
+        """Whether the submodels are files on a local filesystem, which can be served without parsing them."""
+        return self._get_root_path() is not None
+
+    def get_twin_aspect_document_file(
+        self,
+        submodel_id: UUID,
+        semantic_id: str
+    ) -> SubmodelFile:
+        """Get the stored file of a submodel, to serve its bytes as they are.
+
+        Args:
+            submodel_id: UUID of the submodel.
+            semantic_id: Semantic ID of the submodel.
+
+        Returns:
+            The path of the file with its size, entity tag and last modification date.
+
+        Raises:
+            InvalidError: If submodel_id is invalid or the submodels are not stored on a local filesystem.
+            NotFoundError: If the submodel is not found.
+        """
+        root_path = self._get_root_path()
+        if root_path is None:
+            raise InvalidError(f"Submodel files can only be served in filesystem mode, not in {self.adapter_mode} mode")
+
+        submodel_id = self._validate_uuid(submodel_id)
+        _, file_path = self._get_filesystem_path(semantic_id, submodel_id)
+        try:
+            return SubmodelFile.from_path(os.path.join(root_path, file_path))
+        except FileNotFoundError as e:
+            self.logger.error(f"Submodel file not found: {file_path}")
+            raise NotFoundError(f"Submodel file not found: {file_path}") from e
+
     def upload_twin_aspect_document(
         self,
         submodel_id: UUID,
@@ -311,12 +415,15 @@ class SubmodelServiceManager:
         payload: Dict[str, Any]
     ) -> None:
         """Upload a submodel to the service."""
-        self._execute_submodel_operation(
-            OperationType.WRITE,
-            submodel_id,
-            semantic_id,
-            payload
-        )
+        try:
+            self._execute_submodel_operation(
+                OperationType.WRITE,
+                submodel_id,
+                semantic_id,
+                payload
+            )
+        finally:
+            self._invalidate_cached_document(submodel_id, semantic_id)
 
     def get_twin_aspect_document(
         self,
@@ -336,8 +443,110 @@ class SubmodelServiceManager:
         semantic_id: str
     ) -> None:
         """Delete a submodel from the service."""
-        self._execute_submodel_operation(
-            OperationType.DELETE,
-            submodel_id,
-            semantic_id
-        )
+        try:
+            self._execute_submodel_operation(
+                OperationType.DELETE,
+                submodel_id,
+                semantic_id
+            )
+        finally:
+            self._invalidate_cached_document(submodel_id, semantic_id)
+
+    def get_cached_twin_aspect_document(
+        self,
+        submodel_id: UUID,
+        semantic_id: str
+    ) -> SubmodelDocument:
+        """Get a serialized submodel, from the document cache if possible, otherwise from the service.
+
+        Args:
+            submodel_id: UUID of the submodel.
+            semantic_id: Semantic ID of the submodel.
+
+        Returns:
+            The serialized submodel with its entity tag and last modification date.
+
+        Raises:
+            InvalidError: If submodel_id is invalid.
+            NotFoundError: If the submodel is not found.
+        """
+        submodel_id = self._validate_uuid(submodel_id)
+        document = self.peek_twin_aspect_document(submodel_id, semantic_id)
+        if document is not None:
+            return document
+
+        generation = self.document_cache.generation if self.document_cache is not None else 0
+        payload = self.get_twin_aspect_document(submodel_id, semantic_id)
+        document = SubmodelDocument.from_payload(payload, self._get_last_modified(submodel_id, semantic_id))
+        if self.document_cache is not None:
+            self.document_cache.put(semantic_id, submodel_id, document, generation)
+        return document
+
+    def peek_twin_aspect_document(
+        self,
+        submodel_id: UUID,
+        semantic_id: str
+    ) -> Optional[SubmodelDocument]:
+        """Get a serialized submodel only if it is in the document cache, without calling the service."""
+        if self.document_cache is None:
+            return None
+        return self.document_cache.get(semantic_id, self._validate_uuid(submodel_id))
+
+    def _invalidate_cached_document(self, submodel_id: UUID, semantic_id: str) -> None:
+        if self.document_cache is not None:
+            self.document_cache.invalidate(semantic_id, self._validate_uuid(submodel_id))
+
+    def _get_last_modified(self, submodel_id: UUID, semantic_id: str) -> datetime:
+        """Get the modification time of a stored submodel file, the current time if the storage does not tell."""
+        root_path = self._get_root_path()
+        if root_path is not None:
+            _, file_path = self._get_filesystem_path(semantic_id, submodel_id)
+            try:
+                return datetime.fromtimestamp(os.path.getmtime(os.path.join(root_path, file_path)), tz=timezone.utc)
+            except OSError:
+                pass
+        return datetime.now(timezone.utc)
+
+    def close(self) -> None:
+        """Release the resources of the adapter, e.g. the pooled connections to an external submodel service."""
+        close = getattr(self.adapter, "close", None)
+        if callable(close):
+            close()
+
+
+class SubmodelServiceManagerRegistry:
+    """
+    Long-lived SubmodelServiceManager shared by the services.
+
+    Every manager is built from the same configuration, so a single manager is shared: the storage
+    checks and the HTTP connection pool of the submodel service are set up once instead of for
+    every operation. ``close_all`` releases it at shutdown.
+    """
+
+    _manager: Optional[SubmodelServiceManager] = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def get(cls) -> SubmodelServiceManager:
+        """
+        Get the shared manager, created on first use.
+
+        Returns:
+            The shared manager.
+        """
+        with cls._lock:
+            if cls._manager is None:
+                cls._manager = SubmodelServiceManager()
+            return cls._manager
+
+    @classmethod
+    def close_all(cls) -> None:
+        """Close the shared manager, the next call to ``get`` creates a new one."""
+        with cls._lock:
+            manager, cls._manager = cls._manager, None
+        if manager is None:
+            return
+        try:
+            manager.close()
+        except Exception as e:
+            manager.logger.warning(f"Error closing submodel service manager: {e}")
@@ -36,7 +36,9 @@ class RepositoryManager:
         self._enablement_service_stack_repository = None
         self._legal_entity_repository = None
         self._partner_catalog_part_repository = None
+        self._passport_repository = None
         self._serialized_part_repository = None
+        self._serialized_part_twin_bulk_job_repository = None
         self._twin_repository = None
         self._twin_aspect_repository = None
         self._twin_aspect_registration_repository = None
@@ -63,6 +65,10 @@ class RepositoryManager:
         """Manually commit the session."""
         self._session.commit()
 
+    def flush(self):
+        """Write the pending changes to the database without committing them."""
+        self._session.flush()
+
     def rollback(self):
         """Manually roll back the session."""
         self._session.rollback()
@@ -124,6 +130,14 @@ class RepositoryManager:
             self._partner_catalog_part_repository = PartnerCatalogPartRepository(self._session)
         return self._partner_catalog_part_repository
     
+    @property
+    def passport_repository(self):
+        """Lazy initialization of the passport repository."""
+        if self._passport_repository is None:
+            from managers.metadata_database.repositories import PassportRepository
+            self._passport_repository = PassportRepository(self._session)
+        return self._passport_repository
+
     @property
     def serialized_part_repository(self):
         """Lazy initialization of the serialized part repository."""
@@ -132,6 +146,14 @@ class RepositoryManager:
             self._serialized_part_repository = SerializedPartRepository(self._session)
         return self._serialized_part_repository
 
+    @property
+    def serialized_part_twin_bulk_job_repository(self):
+        """Lazy initialization of the serialized part twin bulk job repository."""
+        if self._serialized_part_twin_bulk_job_repository is None:
+            from managers.metadata_database.repositories import SerializedPartTwinBulkJobRepository
+            self._serialized_part_twin_bulk_job_repository = SerializedPartTwinBulkJobRepository(self._session)
+        return self._serialized_part_twin_bulk_job_repository
+
     @property
     def twin_repository(self):
         """Lazy initialization of the twin repository."""
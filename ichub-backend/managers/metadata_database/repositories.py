@@ -23,12 +23,12 @@
 # SPDX-License-Identifier: Apache-2.0
 #################################################################################
 
-from sqlalchemy import case
-from sqlmodel import SQLModel, Session, select, desc
+from sqlalchemy import case, delete, distinct, exists, func, tuple_
+from sqlmodel import SQLModel, Session, select, desc, update
 from sqlalchemy.orm import selectinload
-from typing import TypeVar, Type, List, Optional, Generic
+from typing import Any, Dict, TypeVar, Type, Iterable, List, Optional, Generic, Tuple
 from uuid import UUID, uuid4
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 
 from models.metadata_database.provider.models import (
     BusinessPartner,
@@ -42,7 +42,18 @@ from models.metadata_database.provider.models import (
     CatalogPart,
     SerializedPart,
     PartnerCatalogPart,
-    DataExchangeAgreement
+    DataExchangeAgreement,
+    Passport,
+    PassportIndexFailure,
+    SerializedPartTwinBulkJob,
+    SerializedPartTwinBulkJobItem
+)
+from tools.passport_tools import (
+    DPP_SEMANTIC_ID_MARKER,
+    extract_expiration_date,
+    extract_issue_date,
+    extract_passport_id,
+    is_passport_semantic_id,
 )
 
 
@@ -71,8 +82,18 @@ class BaseRepository(Generic[ModelType]):
             self.get_type().id == obj_id)  # type: ignore
         return self._session.scalars(stmt).first()
 
-    def find_all(self, offset: Optional[int] = None, limit: Optional[int] = 100) -> List[ModelType]:
+    def find_all(self, offset: Optional[int] = None, limit: Optional[int] = 100, after_id: Optional[int] = None) -> List[ModelType]:
+        """
+        Find all the entities, ordered by ID when paged.
+        Pass the ID of the last entity of the previous page as after_id to page by key instead of by offset.
+        """
         stmt = select(self.get_type())  # select(Author)
+        if after_id is not None:
+            stmt = stmt.where(self.get_type().id > after_id)  # type: ignore
+
+        if offset is not None or limit is not None or after_id is not None:
+            stmt = stmt.order_by(self.get_type().id)  # type: ignore
+
         if offset is not None:
             stmt = stmt.offset(offset)
 
@@ -82,6 +103,27 @@ class BaseRepository(Generic[ModelType]):
         result = self._session.scalars(stmt).unique()
         return list(result)
 
+    def _exec(self, stmt, yield_per: Optional[int] = None) -> Iterable:
+        """Run a statement, streaming the rows in batches of yield_per from a server-side cursor if given."""
+        if yield_per:
+            return self._session.exec(stmt.execution_options(yield_per=yield_per))
+        return self._session.exec(stmt).all()
+
+    def _scalars(self, stmt, yield_per: Optional[int] = None) -> Iterable:
+        """Like _exec, for statements selecting a single entity."""
+        if yield_per:
+            return self._session.scalars(stmt.execution_options(yield_per=yield_per))
+        return self._session.scalars(stmt).all()
+
+    def count(self) -> int:
+        """Count all the entities."""
+        return self._session.exec(select(func.count()).select_from(self.get_type())).one()
+
+    def _count_distinct_ids(self, stmt) -> int:
+        """Count the distinct entity IDs selected by a (possibly joined) statement."""
+        subquery = stmt.order_by(None).subquery()
+        return self._session.exec(select(func.count(distinct(subquery.c.id)))).one()
+
     def update(self, id: int, obj_in: dict) -> Optional[ModelType]:
         db_obj = self._session.get(self.get_type(), id)
         if not db_obj:
@@ -142,14 +184,46 @@ class CatalogPartRepository(BaseRepository[CatalogPart]):
             CatalogPart.manufacturer_part_id == manufacturer_part_id)
         return self._session.scalars(stmt).first()
 
-    def find_by_manufacturer_id_manufacturer_part_id(self, manufacturer_id: Optional[str], manufacturer_part_id: Optional[str], join_partner_catalog_parts : bool = False) -> List[tuple[CatalogPart, int]]:
+    def find_by_manufacturer_id_manufacturer_part_id(self, manufacturer_id: Optional[str], manufacturer_part_id: Optional[str], join_partner_catalog_parts : bool = False, eager_load: bool = False,
+            limit: Optional[int] = None, after_id: Optional[int] = None, yield_per: Optional[int] = None) -> List[tuple[CatalogPart, int]]:
         """
         Find catalog parts by manufacturer ID and manufacturer part ID.
         If manufacturer ID is not provided, all catalog parts are returned.
         If manufacturer part ID is not provided, all catalog parts with the given manufacturer ID are returned.
         
         The result is a list of tuples, where each tuple contains the CatalogPart object and its status.
+        With eager_load the legal entity and the partner catalog parts with their business partners are
+        loaded together with the catalog parts, instead of one query per catalog part when accessed.
+        With limit the catalog parts are ordered by ID, after_id is the ID of the last catalog part of the previous page.
+        With yield_per the rows are streamed from a server-side cursor in batches of that size, the result is then
+        an iterator instead of a list.
         """
+        stmt = self._with_status_statement(manufacturer_id, manufacturer_part_id, join_partner_catalog_parts)
+
+        if after_id is not None:
+            stmt = stmt.where(CatalogPart.id > after_id)
+
+        if limit is not None or after_id is not None:
+            # DISTINCT ON (id) requires the ordering to start with the ID anyway
+            stmt = stmt.order_by(CatalogPart.id)
+
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        if eager_load:
+            stmt = stmt.options(
+                selectinload(CatalogPart.legal_entity),
+                selectinload(CatalogPart.partner_catalog_parts).selectinload(PartnerCatalogPart.business_partner)
+            )
+
+        return self._exec(stmt, yield_per)
+
+    def count_by_manufacturer_id_manufacturer_part_id(self, manufacturer_id: Optional[str], manufacturer_part_id: Optional[str]) -> int:
+        """Count the catalog parts found by find_by_manufacturer_id_manufacturer_part_id."""
+        return self._count_distinct_ids(self._with_status_statement(manufacturer_id, manufacturer_part_id))
+
+    @staticmethod
+    def _with_status_statement(manufacturer_id: Optional[str], manufacturer_part_id: Optional[str], join_partner_catalog_parts: bool = False):
 
         # Case to determine the status of the catalog part
         status_expr = case(
@@ -179,7 +253,7 @@ class CatalogPartRepository(BaseRepository[CatalogPart]):
             subquery = select(PartnerCatalogPart).join(BusinessPartner, BusinessPartner.id == PartnerCatalogPart.business_partner_id).where(PartnerCatalogPart.catalog_part_id == CatalogPart.id).subquery()
             stmt = stmt.join(subquery, subquery.c.catalog_part_id == CatalogPart.id, isouter=True)
 
-        return self._session.exec(stmt).all()
+        return stmt
 
 class DataExchangeAgreementRepository(BaseRepository[DataExchangeAgreement]):
     def get_by_business_partner_id(self, business_partner_id: int) -> List[DataExchangeAgreement]:
@@ -330,18 +404,87 @@ class SerializedPartRepository(BaseRepository[SerializedPart]):
 
         return self._session.scalars(stmt).all()
 
+    def find_by_keys(self, keys: List[Tuple[str, str, str]]) -> List[Tuple[SerializedPart, str, str]]:
+        """
+        Retrieve the SerializedParts matching one of the (manufacturer_id, manufacturer_part_id, part_instance_id) keys,
+        each together with its manufacturer_id and manufacturer_part_id.
+
+        The partner catalog part with its catalog part and business partner, and the twin with its
+        registrations are loaded together with the serialized parts.
+        """
+        if not keys:
+            return []
+        stmt = select(SerializedPart, LegalEntity.bpnl, CatalogPart.manufacturer_part_id).join(
+            PartnerCatalogPart, PartnerCatalogPart.id == SerializedPart.partner_catalog_part_id).join(
+            CatalogPart, CatalogPart.id == PartnerCatalogPart.catalog_part_id).join(
+            LegalEntity, LegalEntity.id == CatalogPart.legal_entity_id).where(
+            tuple_(LegalEntity.bpnl, CatalogPart.manufacturer_part_id, SerializedPart.part_instance_id).in_(keys)
+        ).options(
+            selectinload(SerializedPart.partner_catalog_part).selectinload(PartnerCatalogPart.catalog_part),
+            selectinload(SerializedPart.partner_catalog_part).selectinload(PartnerCatalogPart.business_partner),
+            selectinload(SerializedPart.twin).selectinload(Twin.twin_registrations)
+        ).order_by(SerializedPart.id)
+        return list(self._session.exec(stmt).all())
+
     def find_with_status(self,
         manufacturer_id: Optional[str] = None,
         manufacturer_part_id: Optional[str] = None,
         business_partner_number: Optional[str] = None,
         customer_part_id: Optional[str] = None,
         part_instance_id: Optional[str] = None,
-        van: Optional[str] = None) -> List[tuple[SerializedPart, int]]:
+        van: Optional[str] = None,
+        eager_load: bool = False,
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+        yield_per: Optional[int] = None) -> List[tuple[SerializedPart, int]]:
         """
         Find serialized parts with status information.
         The result is a list of tuples, where each tuple contains the SerializedPart object and its status.
+        With eager_load the partner catalog part with its catalog part, legal entity and business partner
+        are loaded together with the serialized parts, instead of several queries per part when accessed.
+        With limit the serialized parts are ordered by ID, after_id is the ID of the last serialized part of the previous page.
+        With yield_per the rows are streamed from a server-side cursor in batches of that size, the result is then
+        an iterator instead of a list.
         """
-        
+        stmt = self._with_status_statement(manufacturer_id, manufacturer_part_id, business_partner_number, customer_part_id, part_instance_id, van)
+
+        if after_id is not None:
+            stmt = stmt.where(SerializedPart.id > after_id)
+
+        if limit is not None or after_id is not None:
+            # DISTINCT ON (id) requires the ordering to start with the ID anyway
+            stmt = stmt.order_by(SerializedPart.id)
+
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        if eager_load:
+            stmt = stmt.options(
+                selectinload(SerializedPart.partner_catalog_part).selectinload(PartnerCatalogPart.catalog_part).selectinload(CatalogPart.legal_entity),
+                selectinload(SerializedPart.partner_catalog_part).selectinload(PartnerCatalogPart.business_partner)
+            )
+
+        return self._exec(stmt, yield_per)
+
+    def count_with_status(self,
+        manufacturer_id: Optional[str] = None,
+        manufacturer_part_id: Optional[str] = None,
+        business_partner_number: Optional[str] = None,
+        customer_part_id: Optional[str] = None,
+        part_instance_id: Optional[str] = None,
+        van: Optional[str] = None) -> int:
+        """Count the serialized parts found by find_with_status."""
+        return self._count_distinct_ids(self._with_status_statement(
+            manufacturer_id, manufacturer_part_id, business_partner_number, customer_part_id, part_instance_id, van))
+
+    @staticmethod
+    def _with_status_statement(
+        manufacturer_id: Optional[str],
+        manufacturer_part_id: Optional[str],
+        business_partner_number: Optional[str],
+        customer_part_id: Optional[str],
+        part_instance_id: Optional[str],
+        van: Optional[str]):
         # Case to determine the status of the serialized part
         status_expr = case(
             # 0: no twin at all (draft)
@@ -383,7 +526,7 @@ class SerializedPartRepository(BaseRepository[SerializedPart]):
         if customer_part_id:
             stmt = stmt.where(PartnerCatalogPart.customer_part_id == customer_part_id)
 
-        return self._session.exec(stmt).all()
+        return stmt
 
     def create_new(self, partner_catalog_part_id: int, part_instance_id: str, van: Optional[str]) -> SerializedPart:
         """Create a new SerializedPart instance."""
@@ -420,6 +563,23 @@ class TwinRepository(BaseRepository[Twin]):
             Twin.global_id == global_id)
         return self._session.scalars(stmt).first()
     
+    def find_by_global_ids(self, global_ids: List[UUID], batch_size: int = 500, include_parts: bool = False) -> List[Twin]:
+        """
+        Retrieve all the Twins with one of the given global_ids, with one query per batch_size IDs.
+        With include_parts the catalog part or the serialized part of the twins, with their partner catalog part,
+        catalog part and legal entity, are loaded together with the twins.
+        """
+        twins: List[Twin] = []
+        for start in range(0, len(global_ids), batch_size):
+            stmt = select(Twin).where(Twin.global_id.in_(global_ids[start:start + batch_size]))
+            if include_parts:
+                stmt = stmt.options(
+                    selectinload(Twin.catalog_part).selectinload(CatalogPart.legal_entity),
+                    selectinload(Twin.serialized_part).selectinload(SerializedPart.partner_catalog_part).selectinload(PartnerCatalogPart.catalog_part).selectinload(CatalogPart.legal_entity)
+                )
+            twins.extend(self._session.scalars(stmt).all())
+        return twins
+
     def find_by_aas_id(self, aas_id: UUID) -> Optional[Twin]:
         stmt = select(Twin).where(
             Twin.aas_id == aas_id)
@@ -431,15 +591,46 @@ class TwinRepository(BaseRepository[Twin]):
             global_id: Optional[UUID] = None,
             include_data_exchange_agreements: bool = False,
             include_aspects: bool = False,
-            include_registrations: bool = False) -> List[Twin]:
-        
+            include_registrations: bool = False,
+            limit: Optional[int] = None,
+            after: Optional[Tuple[datetime, int]] = None,
+            yield_per: Optional[int] = None,
+            include_parts: bool = False) -> List[Twin]:
+        """
+        Find the twins of catalog parts.
+        With limit the twins are ordered by creation date and ID, newest first. after is the
+        (created_date, id) of the last twin of the previous page.
+        With yield_per the twins are streamed from a server-side cursor in batches of that size.
+        With include_parts the catalog part, its legal entity and partner catalog parts are loaded together with the twins.
+        """
+        stmt = self._catalog_part_twins_statement(manufacturer_id, manufacturer_part_id, global_id)
+
+        stmt = self._apply_subquery_filters(stmt, include_data_exchange_agreements, include_aspects, include_registrations)
+
+        if include_parts:
+            stmt = stmt.options(
+                selectinload(Twin.catalog_part).selectinload(CatalogPart.legal_entity),
+                selectinload(Twin.catalog_part).selectinload(CatalogPart.partner_catalog_parts).selectinload(PartnerCatalogPart.business_partner)
+            )
+
+        stmt = self._apply_keyset(stmt, limit, after)
+
+        return self._scalars(stmt, yield_per)
+
+    def count_catalog_part_twins(self,
+            manufacturer_id: Optional[str] = None,
+            manufacturer_part_id: Optional[str] = None,
+            global_id: Optional[UUID] = None) -> int:
+        """Count the twins found by find_catalog_part_twins."""
+        return self._count_distinct_ids(self._catalog_part_twins_statement(manufacturer_id, manufacturer_part_id, global_id))
+
+    @staticmethod
+    def _catalog_part_twins_statement(manufacturer_id: Optional[str], manufacturer_part_id: Optional[str], global_id: Optional[UUID]):
         stmt = select(Twin).join(
             CatalogPart, CatalogPart.twin_id == Twin.id).join(
             LegalEntity, LegalEntity.id == CatalogPart.legal_entity_id
         ).distinct()
 
-        stmt = self._apply_subquery_filters(stmt, include_data_exchange_agreements, include_aspects, include_registrations)
-
         if manufacturer_id:
             stmt = stmt.where(LegalEntity.bpnl == manufacturer_id)
 
@@ -449,7 +640,7 @@ class TwinRepository(BaseRepository[Twin]):
         if global_id:
             stmt = stmt.where(Twin.global_id == global_id)
 
-        return self._session.scalars(stmt).all()
+        return stmt
     
     def find_serialized_part_twins(self,
             manufacturer_id: Optional[str] = None,
@@ -462,13 +653,73 @@ class TwinRepository(BaseRepository[Twin]):
             enablement_service_stack_id: Optional[int] = None,
             min_incl_created_date: Optional[datetime] = None,
             max_excl_created_date: Optional[datetime] = None,
-            limit: int = 50,
-            offset: int = 0,
+            limit: Optional[int] = 50,
+            after: Optional[Tuple[datetime, int]] = None,
             include_data_exchange_agreements: bool = False,
             include_aspects: bool = False,
             include_registrations: bool = False,
-            include_all_partner_catalog_parts: bool = False) -> List[Twin]:
-        
+            include_all_partner_catalog_parts: bool = False,
+            yield_per: Optional[int] = None,
+            include_parts: bool = False) -> List[Twin]:
+        """
+        Find the twins of serialized parts.
+        With limit the twins are ordered by creation date and ID, newest first. after is the
+        (created_date, id) of the last twin of the previous page; unlike an offset, skipping
+        to a later page does not get slower the further it is.
+        With yield_per the twins are streamed from a server-side cursor in batches of that size.
+        With include_parts the serialized part with its partner catalog part, catalog part, legal entity
+        and business partner are loaded together with the twins.
+        """
+        stmt = self._serialized_part_twins_statement(
+            manufacturer_id, manufacturer_part_id, customer_part_id, part_instance_id, van, business_partner_number,
+            global_id, enablement_service_stack_id, min_incl_created_date, max_excl_created_date)
+
+        stmt = self._apply_subquery_filters(stmt, include_data_exchange_agreements, include_aspects, include_registrations)
+
+        if include_all_partner_catalog_parts:
+            subquery = select(PartnerCatalogPart).join(
+                BusinessPartner, PartnerCatalogPart.business_partner_id == BusinessPartner.id
+            ).subquery()
+            stmt = stmt.join(subquery, subquery.c.catalog_part_id == CatalogPart.id, isouter=True)            
+
+        if include_parts:
+            stmt = stmt.options(
+                selectinload(Twin.serialized_part).selectinload(SerializedPart.partner_catalog_part).selectinload(PartnerCatalogPart.catalog_part).selectinload(CatalogPart.legal_entity),
+                selectinload(Twin.serialized_part).selectinload(SerializedPart.partner_catalog_part).selectinload(PartnerCatalogPart.business_partner)
+            )
+
+        stmt = self._apply_keyset(stmt, limit, after)
+
+        return self._scalars(stmt, yield_per)
+
+    def count_serialized_part_twins(self,
+            manufacturer_id: Optional[str] = None,
+            manufacturer_part_id: Optional[str] = None,
+            customer_part_id: Optional[str] = None,
+            part_instance_id: Optional[str] = None,
+            van: Optional[str] = None,
+            business_partner_number: Optional[str] = None,
+            global_id: Optional[UUID] = None,
+            enablement_service_stack_id: Optional[int] = None,
+            min_incl_created_date: Optional[datetime] = None,
+            max_excl_created_date: Optional[datetime] = None) -> int:
+        """Count the twins found by find_serialized_part_twins."""
+        return self._count_distinct_ids(self._serialized_part_twins_statement(
+            manufacturer_id, manufacturer_part_id, customer_part_id, part_instance_id, van, business_partner_number,
+            global_id, enablement_service_stack_id, min_incl_created_date, max_excl_created_date))
+
+    @staticmethod
+    def _serialized_part_twins_statement(
+            manufacturer_id: Optional[str],
+            manufacturer_part_id: Optional[str],
+            customer_part_id: Optional[str],
+            part_instance_id: Optional[str],
+            van: Optional[str],
+            business_partner_number: Optional[str],
+            global_id: Optional[UUID],
+            enablement_service_stack_id: Optional[int],
+            min_incl_created_date: Optional[datetime],
+            max_excl_created_date: Optional[datetime]):
         stmt = select(Twin).join(
             SerializedPart, SerializedPart.twin_id == Twin.id).join(
             PartnerCatalogPart, PartnerCatalogPart.id == SerializedPart.partner_catalog_part_id).join(
@@ -476,8 +727,6 @@ class TwinRepository(BaseRepository[Twin]):
             LegalEntity, LegalEntity.id == CatalogPart.legal_entity_id
         ).distinct()
 
-        stmt = self._apply_subquery_filters(stmt, include_data_exchange_agreements, include_aspects, include_registrations)
-
         if manufacturer_id:
             stmt = stmt.where(LegalEntity.bpnl == manufacturer_id)
 
@@ -507,26 +756,27 @@ class TwinRepository(BaseRepository[Twin]):
             stmt = stmt.join(BusinessPartner, BusinessPartner.id == PartnerCatalogPart.business_partner_id
                 ).where(BusinessPartner.bpnl == business_partner_number)
 
-        if include_all_partner_catalog_parts:
-            subquery = select(PartnerCatalogPart).join(
-                BusinessPartner, PartnerCatalogPart.business_partner_id == BusinessPartner.id
-            ).subquery()
-            stmt = stmt.join(subquery, subquery.c.catalog_part_id == CatalogPart.id, isouter=True)            
-
         if min_incl_created_date:
             stmt = stmt.where(Twin.created_date >= min_incl_created_date)
 
         if max_excl_created_date:
             stmt = stmt.where(Twin.created_date < max_excl_created_date)
 
-        if limit or offset:
-            stmt = stmt.order_by(desc(Twin.created_date))
-            if offset:
-                stmt = stmt.offset(offset)
-            if limit:
-                stmt = stmt.limit(limit)
+        return stmt
 
-        return self._session.scalars(stmt).all()
+    @staticmethod
+    def _apply_keyset(stmt, limit: Optional[int], after: Optional[Tuple[datetime, int]]):
+        """Order the twins newest first and return the page after the (created_date, id) of the last twin of the previous page."""
+        if after is not None:
+            stmt = stmt.where(tuple_(Twin.created_date, Twin.id) < tuple_(*after))
+
+        if limit is not None or after is not None:
+            stmt = stmt.order_by(desc(Twin.created_date), desc(Twin.id))
+
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        return stmt
 
     @staticmethod
     def _apply_subquery_filters(stmt, include_data_exchange_agreements: bool, include_aspects: bool, include_registrations: bool):
@@ -571,6 +821,20 @@ class TwinAspectRepository(BaseRepository[TwinAspect]):
             TwinAspect.submodel_id == submodel_id)
         return self._session.scalars(stmt).first()
 
+    def get_by_submodel_id(self, submodel_id: UUID) -> Optional[TwinAspect]:
+        """Retrieve a TwinAspect by its submodel_id."""
+        stmt = select(TwinAspect).where(TwinAspect.submodel_id == submodel_id)
+        return self._session.scalars(stmt).first()
+
+    def find_by_twin_ids(self, twin_ids: List[int], batch_size: int = 500) -> List[TwinAspect]:
+        """Retrieve all the TwinAspects of the given twins, together with their registrations, with one query per batch_size twins."""
+        twin_aspects: List[TwinAspect] = []
+        for start in range(0, len(twin_ids), batch_size):
+            stmt = select(TwinAspect).where(TwinAspect.twin_id.in_(twin_ids[start:start + batch_size])).options(
+                selectinload(TwinAspect.twin_aspect_registrations))
+            twin_aspects.extend(self._session.scalars(stmt).all())
+        return twin_aspects
+
     def create_new(self, twin_id: int, semantic_id: str, submodel_id: UUID = None) -> TwinAspect:
         """Create a new TwinAspect instance."""
         if not submodel_id:
@@ -618,6 +882,17 @@ class TwinAspectRegistrationRepository(BaseRepository[TwinAspectRegistration]):
         self.create(twin_aspect_registration)
         return twin_aspect_registration
 
+    def update_status(self, enablement_service_stack_id: int, twin_aspect_ids: List[int], status: int) -> None:
+        """Set the status of the TwinAspectRegistrations of the given twin aspects in a stack with a single statement."""
+        if not twin_aspect_ids:
+            return
+        stmt = update(TwinAspectRegistration).where(
+            TwinAspectRegistration.enablement_service_stack_id == enablement_service_stack_id
+        ).where(
+            TwinAspectRegistration.twin_aspect_id.in_(twin_aspect_ids)
+        ).values(status=status, modified_date=datetime.now(timezone.utc))
+        self._session.exec(stmt)
+
 class TwinExchangeRepository(BaseRepository[TwinExchange]):
     def get_by_twin_id_data_exchange_agreement_id(self, twin_id: int, data_exchange_agreement_id: int) -> Optional[Twin]:
         stmt = select(TwinExchange).where(
@@ -662,3 +937,263 @@ class TwinRegistrationRepository(BaseRepository[TwinRegistration]):
         )
         self.create(twin_registration)
         return twin_registration
+
+    def mark_dtr_registered(self, enablement_service_stack_id: int, twin_ids: List[int]) -> None:
+        """Set the dtr_registered flag of the TwinRegistrations of the given twins in a stack with a single statement."""
+        if not twin_ids:
+            return
+        stmt = update(TwinRegistration).where(
+            TwinRegistration.enablement_service_stack_id == enablement_service_stack_id
+        ).where(
+            TwinRegistration.twin_id.in_(twin_ids)
+        ).values(dtr_registered=True)
+        self._session.exec(stmt)
+
+class PassportRepository(BaseRepository[Passport]):
+    def index_twin_aspect(self, twin_aspect: TwinAspect, aspect_data: Dict[str, Any]) -> Optional[Passport]:
+        """
+        Create or update the passport metadata of a twin aspect from its document.
+        Does nothing if the twin aspect is not a Digital Product Passport. The part of the passport
+        is taken from the twin of the aspect.
+        """
+        if not is_passport_semantic_id(twin_aspect.semantic_id):
+            return None
+
+        passport = self._session.get(Passport, twin_aspect.id)
+        if passport is None:
+            passport = Passport(twin_aspect_id=twin_aspect.id, twin_id=twin_aspect.twin_id)
+
+        twin = twin_aspect.twin
+        passport.catalog_part_id = None
+        passport.part_type = None
+        passport.part_instance_id = None
+        if twin.catalog_part:
+            passport.catalog_part_id = twin.catalog_part.id
+            passport.part_type = "catalog"
+        elif twin.serialized_part:
+            passport.catalog_part_id = twin.serialized_part.partner_catalog_part.catalog_part_id
+            passport.part_type = "serialized"
+            passport.part_instance_id = twin.serialized_part.part_instance_id
+        elif twin.batch:
+            passport.catalog_part_id = twin.batch.catalog_part_id
+            passport.part_type = "batch"
+
+        passport.passport_id = extract_passport_id(aspect_data) or None
+        passport.issue_date = extract_issue_date(aspect_data)
+        passport.expiration_date = extract_expiration_date(aspect_data)
+        passport.modified_date = datetime.now(timezone.utc)
+        self._session.add(passport)
+
+        failure = self._session.get(PassportIndexFailure, twin_aspect.id)
+        if failure is not None:
+            self._session.delete(failure)
+        return passport
+
+    def record_index_failure(self, twin_aspect: TwinAspect, error: str) -> PassportIndexFailure:
+        """Record that indexing the passport of a twin aspect failed, counting the failed attempts."""
+        failure = self._session.get(PassportIndexFailure, twin_aspect.id)
+        if failure is None:
+            failure = PassportIndexFailure(twin_aspect_id=twin_aspect.id)
+        failure.attempts += 1
+        failure.error = error
+        failure.modified_date = datetime.now(timezone.utc)
+        self._session.add(failure)
+        return failure
+
+    def find_twin_aspects(self, twin_aspect_ids: List[int]) -> List[TwinAspect]:
+        """Retrieve the twin aspects with the given IDs, together with the twins and parts needed by index_twin_aspect."""
+        if not twin_aspect_ids:
+            return []
+        stmt = self._with_twin_parts(select(TwinAspect).where(TwinAspect.id.in_(twin_aspect_ids)))
+        return list(self._session.scalars(stmt).all())
+
+    def find_page(self,
+            status: Optional[str] = None,
+            manufacturer_part_id: Optional[str] = None,
+            part_type: Optional[str] = None,
+            part_instance_id: Optional[str] = None,
+            min_incl_issue_date: Optional[date] = None,
+            max_excl_issue_date: Optional[date] = None,
+            min_incl_expiration_date: Optional[date] = None,
+            max_excl_expiration_date: Optional[date] = None,
+            limit: Optional[int] = None,
+            after_id: Optional[int] = None) -> List[Tuple[Passport, TwinAspect, Twin, Optional[CatalogPart], bool]]:
+        """
+        Find the passports with their twin aspect, twin, catalog part and whether the twin is shared, with a single query.
+        The passports are ordered by twin aspect ID; after_id is the twin aspect ID of the last passport of the previous page.
+        """
+        stmt = self._page_statement(status, manufacturer_part_id, part_type, part_instance_id,
+            min_incl_issue_date, max_excl_issue_date, min_incl_expiration_date, max_excl_expiration_date)
+
+        if after_id is not None:
+            stmt = stmt.where(Passport.twin_aspect_id > after_id)
+
+        stmt = stmt.order_by(Passport.twin_aspect_id)
+
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        return list(self._session.exec(stmt).all())
+
+    def count_page(self,
+            status: Optional[str] = None,
+            manufacturer_part_id: Optional[str] = None,
+            part_type: Optional[str] = None,
+            part_instance_id: Optional[str] = None,
+            min_incl_issue_date: Optional[date] = None,
+            max_excl_issue_date: Optional[date] = None,
+            min_incl_expiration_date: Optional[date] = None,
+            max_excl_expiration_date: Optional[str] = None) -> int:
+        """Count the passports found by find_page."""
+        subquery = self._page_statement(status, manufacturer_part_id, part_type, part_instance_id,
+            min_incl_issue_date, max_excl_issue_date, min_incl_expiration_date, max_excl_expiration_date).subquery()
+        return self._session.exec(select(func.count()).select_from(subquery)).one()
+
+    @staticmethod
+    def _page_statement(
+            status: Optional[str],
+            manufacturer_part_id: Optional[str],
+            part_type: Optional[str],
+            part_instance_id: Optional[str],
+            min_incl_issue_date: Optional[date],
+            max_excl_issue_date: Optional[date],
+            min_incl_expiration_date: Optional[date],
+            max_excl_expiration_date: Optional[date]):
+        shared = exists().where(TwinExchange.twin_id == Twin.id)
+
+        stmt = select(Passport, TwinAspect, Twin, CatalogPart, shared.label("shared")).join(
+            TwinAspect, TwinAspect.id == Passport.twin_aspect_id).join(
+            Twin, Twin.id == Passport.twin_id).join(
+            CatalogPart, CatalogPart.id == Passport.catalog_part_id, isouter=True)
+
+        if status == "shared":
+            stmt = stmt.where(shared)
+        elif status == "active":
+            stmt = stmt.where(~shared)
+
+        if manufacturer_part_id:
+            stmt = stmt.where(CatalogPart.manufacturer_part_id == manufacturer_part_id)
+
+        if part_type:
+            stmt = stmt.where(Passport.part_type == part_type)
+
+        if part_instance_id:
+            stmt = stmt.where(Passport.part_instance_id == part_instance_id)
+
+        if min_incl_issue_date:
+            stmt = stmt.where(Passport.issue_date >= min_incl_issue_date)
+
+        if max_excl_issue_date:
+            stmt = stmt.where(Passport.issue_date < max_excl_issue_date)
+
+        if min_incl_expiration_date:
+            stmt = stmt.where(Passport.expiration_date >= min_incl_expiration_date)
+
+        if max_excl_expiration_date:
+            stmt = stmt.where(Passport.expiration_date < max_excl_expiration_date)
+
+        return stmt
+
+    def find_unindexed_twin_aspects(self,
+            limit: int = 100,
+            after_id: Optional[int] = None,
+            max_attempts: Optional[int] = None) -> List[TwinAspect]:
+        """
+        Find Digital Product Passport twin aspects that have no passport metadata yet, together with their twins and parts.
+        The twin aspects are ordered by ID; after_id is the ID of the last twin aspect of the previous batch.
+        With max_attempts, the twin aspects that already failed to be indexed that many times are skipped.
+        """
+        stmt = select(TwinAspect).where(
+            TwinAspect.semantic_id.like(f"%{DPP_SEMANTIC_ID_MARKER}%")  # type: ignore
+        ).where(
+            ~exists().where(Passport.twin_aspect_id == TwinAspect.id)
+        )
+        if max_attempts is not None:
+            stmt = stmt.where(~exists().where(
+                PassportIndexFailure.twin_aspect_id == TwinAspect.id,
+                PassportIndexFailure.attempts >= max_attempts
+            ))
+        if after_id is not None:
+            stmt = stmt.where(TwinAspect.id > after_id)
+        stmt = stmt.order_by(TwinAspect.id).limit(limit)
+        return list(self._session.scalars(self._with_twin_parts(stmt)).all())
+
+    @staticmethod
+    def _with_twin_parts(stmt):
+        return stmt.options(
+            selectinload(TwinAspect.twin).selectinload(Twin.catalog_part),
+            selectinload(TwinAspect.twin).selectinload(Twin.serialized_part).selectinload(SerializedPart.partner_catalog_part),
+            selectinload(TwinAspect.twin).selectinload(Twin.batch)
+        )
+
+
+class SerializedPartTwinBulkJobRepository(BaseRepository[SerializedPartTwinBulkJob]):
+    def find_by_job_id(self, job_id: str) -> Optional[SerializedPartTwinBulkJob]:
+        """Retrieve a bulk job by its ID."""
+        return self._session.get(SerializedPartTwinBulkJob, job_id)
+
+    def create_job(self, job: SerializedPartTwinBulkJob, items: List[SerializedPartTwinBulkJobItem]) -> SerializedPartTwinBulkJob:
+        """Add a bulk job together with its parts."""
+        self._session.add(job)
+        self._session.add_all(items)
+        return job
+
+    def find_items(self, job_id: str) -> List[SerializedPartTwinBulkJobItem]:
+        """Retrieve the parts of a bulk job, in the order of the request."""
+        stmt = select(SerializedPartTwinBulkJobItem).where(
+            SerializedPartTwinBulkJobItem.job_id == job_id
+        ).order_by(SerializedPartTwinBulkJobItem.part_index)
+        return list(self._session.scalars(stmt).all())
+
+    def start(self, job_id: str, stale_before: datetime) -> bool:
+        """
+        Mark a bulk job as in progress with a single conditional statement, so only one worker can start it.
+        A job still in progress can only be started again once it was not advanced since stale_before,
+        i.e. its run was lost. The failed parts that are not duplicates are set back to pending.
+        Returns False if the job is in progress.
+        """
+        stmt = update(SerializedPartTwinBulkJob).where(
+            SerializedPartTwinBulkJob.job_id == job_id
+        ).where(
+            (SerializedPartTwinBulkJob.status != "in_progress") | (SerializedPartTwinBulkJob.modified_date < stale_before)
+        ).values(status="in_progress", modified_date=datetime.now(timezone.utc))
+        if self._session.exec(stmt).rowcount != 1:
+            return False
+
+        stmt = update(SerializedPartTwinBulkJobItem).where(
+            SerializedPartTwinBulkJobItem.job_id == job_id
+        ).where(
+            SerializedPartTwinBulkJobItem.status == "failed"
+        ).where(
+            SerializedPartTwinBulkJobItem.duplicate == False  # noqa: E712
+        ).values(status="pending", error=None)
+        self._session.exec(stmt)
+        return True
+
+    def update_items(self, job_id: str, values: List[Dict[str, Any]]) -> None:
+        """
+        Store the outcome of parts of a bulk job with a single batched statement, and record that the job advanced.
+        Every entry of values holds the part_index of a part and the columns to set.
+        """
+        if not values:
+            return
+        self._session.execute(update(SerializedPartTwinBulkJobItem), [{"job_id": job_id, **value} for value in values])
+        self.touch(job_id)
+
+    def touch(self, job_id: str, status: Optional[str] = None) -> None:
+        """Set the modified date of a bulk job, and its status if given."""
+        values: Dict[str, Any] = {"modified_date": datetime.now(timezone.utc)}
+        if status:
+            values["status"] = status
+        self._session.exec(update(SerializedPartTwinBulkJob).where(SerializedPartTwinBulkJob.job_id == job_id).values(**values))
+
+    def delete_oldest(self, keep: int) -> None:
+        """Delete the finished bulk jobs and their parts, keeping the keep most recent finished ones."""
+        stmt = select(SerializedPartTwinBulkJob.job_id).where(
+            SerializedPartTwinBulkJob.status != "in_progress"
+        ).order_by(desc(SerializedPartTwinBulkJob.created_date)).offset(keep)
+        job_ids = list(self._session.scalars(stmt).all())
+        if not job_ids:
+            return
+        self._session.exec(delete(SerializedPartTwinBulkJobItem).where(SerializedPartTwinBulkJobItem.job_id.in_(job_ids)))
+        self._session.exec(delete(SerializedPartTwinBulkJob).where(SerializedPartTwinBulkJob.job_id.in_(job_ids)))
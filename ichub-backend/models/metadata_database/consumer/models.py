@@ -24,7 +24,7 @@ from sqlmodel import SQLModel, Field
 from sqlalchemy import JSON
 from sqlmodel import Column
 from datetime import datetime
-from typing import List
+from typing import Any, List, Optional
 
 class KnownConnectors(SQLModel):
     """
@@ -49,7 +49,48 @@ class KnownDtrs(SQLModel):
 
     bpnl: str = Field(primary_key=True, index=True, description="Business Partner Number Legal Entity")
     edc_url: str = Field(description="URL of the EDC where the DTR is stored")
-    asset_id: str = Field(description="Asset ID of the DTR")
+    asset_id: str = Field(primary_key=True, description="Asset ID of the DTR")
     policies: List[str] = Field(sa_column=Column(JSON), description="List of policies for this DTR")
     expires_at: datetime = Field(index=True, description="When this cache entry expires")
 
+
+
+class KnownCacheChanges(SQLModel):
+    """
+    Represents a change to one of the consumer caches, used by the replicas to reload only what changed.
+    
+    Every save appends one row per changed BPNL, a purge of the whole cache is stored with an
+    empty BPNL. Rows are pruned once they are older than the configured retention.
+    """
+
+    id: Optional[int] = Field(default=None, primary_key=True, description="Increasing change number")
+    bpnl: Optional[str] = Field(default=None, description="Business Partner Number Legal Entity that changed, empty when the whole cache was purged")
+    changed_at: datetime = Field(index=True, description="When the change was saved")
+
+
+class DiscoveryTasks(SQLModel):
+    """
+    Represents the status of an asynchronous Digital Product Passport discovery task.
+    
+    The payloads found by the task (digital twin and passport data) are stored separately
+    in the task payloads table, so polling the status does not read them.
+    """
+
+    task_id: str = Field(primary_key=True, description="Unique identifier of the discovery task")
+    status: str = Field(description="Task status (in_progress, completed, failed)")
+    step: str = Field(description="Current step of the discovery")
+    message: str = Field(description="Status message")
+    progress: int = Field(default=0, description="Progress percentage (0-100)")
+    error: Optional[str] = Field(default=None, description="Error message of a failed task")
+    created_at: datetime = Field(index=True, description="When the task was created")
+    expires_at: datetime = Field(index=True, description="When the task is removed")
+
+
+class DiscoveryTaskPayloads(SQLModel):
+    """
+    Represents a payload found by a discovery task, e.g. the digital twin or the passport data.
+    """
+
+    task_id: str = Field(primary_key=True, description="Unique identifier of the discovery task")
+    name: str = Field(primary_key=True, description="Name of the payload (digital_twin, data)")
+    payload: Any = Field(sa_column=Column(JSON), description="The payload")
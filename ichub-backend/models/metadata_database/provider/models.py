@@ -31,10 +31,10 @@ SQLAlchemy and SQLModel.
 from enum import Enum
 from typing import Any, Dict, List, Optional
 from uuid import UUID, uuid4
-from datetime import datetime
+from datetime import date, datetime
 from pydantic import BaseModel, Field as PydField
 from sqlmodel import Field, SQLModel, Relationship
-from sqlalchemy import Column, JSON, UniqueConstraint, SmallInteger
+from sqlalchemy import Column, JSON, Index, UniqueConstraint, SmallInteger
 from tools.constants import TWIN_ID_DESCRIPTION, BUSINESS_PARTNER_ID_DESCRIPTION
 
 class Unit(str, Enum):
@@ -152,6 +152,11 @@ class Twin(SQLModel, table=True):
     twin_exchanges: List["TwinExchange"] = Relationship(back_populates="twin")
     twin_registrations: List["TwinRegistration"] = Relationship(back_populates="twin")
 
+    __table_args__ = (
+        # Keyset pagination of the twin listings (newest first)
+        Index("idx_twin_created_date_id", "created_date", "id"),
+    )
+
     __tablename__ = "twin"
 
 
@@ -552,6 +557,7 @@ class TwinAspect(SQLModel, table=True):
     Relationships:
         twin (Twin): The twin associated with this aspect.
         twin_aspect_registrations (List["TwinAspectRegistration"]): The registrations associated with this twin aspect.
+        passport (Optional["Passport"]): The passport metadata, if the aspect is a Digital Product Passport.
 
     Table Name:
         twin_aspect
@@ -565,6 +571,7 @@ class TwinAspect(SQLModel, table=True):
     # Relationships
     twin: Twin = Relationship(back_populates="twin_aspects")
     twin_aspect_registrations: List["TwinAspectRegistration"] = Relationship(back_populates="twin_aspect")
+    passport: Optional["Passport"] = Relationship(back_populates="twin_aspect", sa_relationship_kwargs={"uselist": False, "passive_deletes": True})
 
     __table_args__ = (
         UniqueConstraint("twin_id", "semantic_id", name="uk_twin_aspect_twin_id_semantic_id"),
@@ -679,4 +686,127 @@ class TwinRegistration(SQLModel, table=True):
     twin: Twin = Relationship(back_populates="twin_registrations")
     enablement_service_stack: EnablementServiceStack = Relationship(back_populates="twin_registrations")
 
-    __tablename__ = "twin_registration"
\ No newline at end of file
+    __tablename__ = "twin_registration"
+
+class Passport(SQLModel, table=True):
+    """
+    Holds the metadata of a Digital Product Passport (twin aspect with a digital_product_passport semantic ID).
+    It is filled from the passport document whenever the document is written, so the passports can be
+    listed and filtered without reading the documents from the submodel service.
+
+    Attributes:
+        twin_aspect_id (int): The ID of the twin aspect holding the passport (foreign key to twin_aspect).
+        twin_id (int): The ID of the twin of the passport (foreign key to twin).
+        catalog_part_id (Optional[int]): The ID of the catalog part of the twin, directly or through its serialized part or batch.
+        part_type (Optional[str]): The type of the part of the twin: catalog, serialized or batch.
+        part_instance_id (Optional[str]): The part instance ID of a serialized part.
+        passport_id (Optional[str]): The passport ID from the passport metadata.
+        issue_date (Optional[date]): The issue date from the passport, None if missing or not an ISO 8601 date.
+        expiration_date (Optional[date]): The expiration date from the passport, None if missing or not an ISO 8601 date.
+        modified_date (datetime): When the metadata was last extracted from the passport document.
+
+    Relationships:
+        twin_aspect (TwinAspect): The twin aspect holding the passport.
+
+    Table Name:
+        passport
+    """
+    twin_aspect_id: int = Field(foreign_key="twin_aspect.id", ondelete="CASCADE", primary_key=True, description="The ID of the twin aspect holding the passport.")
+    twin_id: int = Field(index=True, foreign_key="twin.id", description=TWIN_ID_DESCRIPTION)
+    catalog_part_id: Optional[int] = Field(default=None, index=True, foreign_key="catalog_part.id", ondelete="SET NULL", description="The ID of the catalog part of the twin.")
+    part_type: Optional[str] = Field(default=None, index=True, description="The type of the part of the twin: catalog, serialized or batch.")
+    part_instance_id: Optional[str] = Field(default=None, description="The part instance ID of a serialized part.")
+    passport_id: Optional[str] = Field(default=None, index=True, description="The passport ID from the passport metadata.")
+    issue_date: Optional[date] = Field(default=None, index=True, description="The issue date of the passport.")
+    expiration_date: Optional[date] = Field(default=None, index=True, description="The expiration date of the passport.")
+    modified_date: datetime = Field(default_factory=datetime.utcnow, description="When the metadata was last extracted from the passport document.")
+
+    # Relationships
+    twin_aspect: TwinAspect = Relationship(back_populates="passport")
+
+    __tablename__ = "passport"
+
+
+class PassportIndexFailure(SQLModel, table=True):
+    """
+    Records a Digital Product Passport whose metadata could not be extracted from its document
+    by the passport index job, so the job stops retrying it after a few runs.
+
+    Attributes:
+        twin_aspect_id (int): The ID of the twin aspect holding the passport (foreign key to twin_aspect).
+        attempts (int): The number of job runs that failed to index the passport.
+        error (Optional[str]): The error of the last failed attempt.
+        modified_date (datetime): When the last attempt failed.
+
+    Table Name:
+        passport_index_failure
+    """
+    twin_aspect_id: int = Field(foreign_key="twin_aspect.id", ondelete="CASCADE", primary_key=True, description="The ID of the twin aspect holding the passport.")
+    attempts: int = Field(default=0, description="The number of job runs that failed to index the passport.")
+    error: Optional[str] = Field(default=None, description="The error of the last failed attempt.")
+    modified_date: datetime = Field(default_factory=datetime.utcnow, description="When the last attempt failed.")
+
+    __tablename__ = "passport_index_failure"
+
+
+class SerializedPartTwinBulkJob(SQLModel, table=True):
+    """
+    A bulk registration job of serialized part twins. It is stored so any worker can report on
+    and resume the job, whichever worker created or ran it.
+
+    Attributes:
+        job_id (str): The ID of the job.
+        status (str): The status of the job: in_progress or completed.
+        total (int): The number of parts of the job.
+        auto_create_serial_part_aspect (bool): Whether the SerialPart aspect of every registered twin is created too.
+        created_date (datetime): When the job was created.
+        modified_date (datetime): When the job was last started, advanced or finished.
+
+    Table Name:
+        serialized_part_twin_bulk_job
+    """
+    job_id: str = Field(primary_key=True, description="The ID of the job.")
+    status: str = Field(index=True, description="The status of the job: in_progress or completed.")
+    total: int = Field(default=0, description="The number of parts of the job.")
+    auto_create_serial_part_aspect: bool = Field(default=False, description="Whether the SerialPart aspect of every registered twin is created too.")
+    created_date: datetime = Field(default_factory=datetime.utcnow, index=True, description="When the job was created.")
+    modified_date: datetime = Field(default_factory=datetime.utcnow, description="When the job was last started, advanced or finished.")
+
+    __tablename__ = "serialized_part_twin_bulk_job"
+
+
+class SerializedPartTwinBulkJobItem(SQLModel, table=True):
+    """
+    A part of a bulk registration job of serialized part twins, with the twin requested for it and its outcome.
+
+    Attributes:
+        job_id (str): The ID of the job (foreign key to serialized_part_twin_bulk_job).
+        part_index (int): The position of the part in the request.
+        manufacturer_id (str): The manufacturer ID of the part.
+        manufacturer_part_id (str): The manufacturer part ID of the part.
+        part_instance_id (str): The part instance ID of the part.
+        requested_global_id (Optional[UUID]): The global ID requested for the twin, if any.
+        requested_dtr_aas_id (Optional[UUID]): The AAS ID requested for the twin, if any.
+        global_id (Optional[UUID]): The global ID of the twin, once it is created.
+        dtr_aas_id (Optional[UUID]): The AAS ID of the twin, once it is created.
+        status (str): The registration status of the part: pending, registered or failed.
+        error (Optional[str]): The reason why the part could not be registered.
+        duplicate (bool): Whether the part was already requested earlier in the job, such parts are never retried.
+
+    Table Name:
+        serialized_part_twin_bulk_job_item
+    """
+    job_id: str = Field(foreign_key="serialized_part_twin_bulk_job.job_id", ondelete="CASCADE", primary_key=True, description="The ID of the job.")
+    part_index: int = Field(primary_key=True, description="The position of the part in the request.")
+    manufacturer_id: str = Field(description="The manufacturer ID of the part.")
+    manufacturer_part_id: str = Field(description="The manufacturer part ID of the part.")
+    part_instance_id: str = Field(description="The part instance ID of the part.")
+    requested_global_id: Optional[UUID] = Field(default=None, description="The global ID requested for the twin, if any.")
+    requested_dtr_aas_id: Optional[UUID] = Field(default=None, description="The AAS ID requested for the twin, if any.")
+    global_id: Optional[UUID] = Field(default=None, description="The global ID of the twin, once it is created.")
+    dtr_aas_id: Optional[UUID] = Field(default=None, description="The AAS ID of the twin, once it is created.")
+    status: str = Field(default="pending", description="The registration status of the part: pending, registered or failed.")
+    error: Optional[str] = Field(default=None, description="The reason why the part could not be registered.")
+    duplicate: bool = Field(default=False, description="Whether the part was already requested earlier in the job.")
+
+    __tablename__ = "serialized_part_twin_bulk_job_item"
@@ -21,6 +21,6 @@
 # SPDX-License-Identifier: Apache-2.0
 #################################################################################
 
-from .discovery import DiscoverDppRequest, DiscoveryStatus, DiscoverDppResponse
+from .discovery import DiscoverDppRequest, DiscoveryStatus, DiscoverDppResponse, BatchDiscoverDppRequest, BatchDiscoveryResult
 from .passports import DigitalProductPassport, TwinAssociation
 from .provision import ShareDppRequest, ShareDppResponse
@@ -87,3 +87,66 @@ class DiscoverDppResponse(BaseModel):
 
     class Config:
         populate_by_name = True
+
+
+class BatchDiscoverDppRequest(BaseModel):
+    """Request model for discovering the Digital Product Passports of many identifiers"""
+    ids: List[str] = Field(
+        min_length=1,
+        description="The identifiers in format 'CX:<manufacturerPartId>:<partInstanceId>'"
+    )
+    semantic_id: str = Field(
+        alias="semanticId",
+        description="The semantic ID of the submodel to retrieve (e.g., 'urn:samm:io.catenax.generic.digital_product_passport:6.1.0#DigitalProductPassport')"
+    )
+    dtr_policies: Optional[List[Dict[str, Any]]] = Field(
+        None,
+        alias="dtrPolicies",
+        description="Policies to apply for DTR (Digital Twin Registry) access"
+    )
+    governance: Optional[Dict[str, Any]] = Field(
+        None,
+        description="Governance policies for submodel consumption (passport data access)"
+    )
+
+    class Config:
+        populate_by_name = True
+
+
+class BatchDiscoveryResult(BaseModel):
+    """Result of one identifier of a batch discovery, with the progress of the whole batch"""
+    id: str = Field(
+        description="The identifier in format 'CX:<manufacturerPartId>:<partInstanceId>'"
+    )
+    status: str = Field(
+        description="Result of the identifier: 'completed' or 'failed'"
+    )
+    bpn: Optional[str] = Field(
+        None,
+        description="The BPN owning the digital twin"
+    )
+    digital_twin: Optional[Dict[str, Any]] = Field(
+        None,
+        alias="digitalTwin",
+        description="The discovered digital twin shell descriptor"
+    )
+    data: Optional[Dict[str, Any]] = Field(
+        None,
+        description="The consumed DPP data"
+    )
+    error: Optional[str] = Field(
+        None,
+        description="Why the passport of the identifier was not discovered"
+    )
+    processed: int = Field(
+        description="Number of identifiers of the batch processed so far"
+    )
+    failed: int = Field(
+        description="Number of identifiers of the batch that failed so far"
+    )
+    total: int = Field(
+        description="Number of identifiers of the batch"
+    )
+
+    class Config:
+        populate_by_name = True
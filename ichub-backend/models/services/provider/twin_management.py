@@ -88,6 +88,17 @@ class TwinAspectCreate(BaseModel):
     #enablement_service_stack_name: str = Field(alias="enablementServiceStackName", description="The name of the enablement service stack where the twin aspect should be registered.")
     payload: Dict[str, Any] = Field(description="The payload data of the new aspect. This is a JSON object that contains the actual data of the aspect. The structure of this object is determined by the semantic ID of the aspect.")
 
+class TwinAspectBulkCreateResult(BaseModel):
+    """Represents the outcome of one item of a bulk twin aspect creation."""
+
+    index: int = Field(description="The position of the item in the request.")
+    global_id: UUID = Field(alias="globalId", description="The Catena-X ID / global ID of the digital twin to which the aspect belongs.")
+    semantic_id: str = Field(alias="semanticId", description="The semantic ID of the aspect.")
+    submodel_id: Optional[UUID] = Field(alias="submodelId", description="The ID of the submodel descriptor of the aspect, if the aspect could be created.", default=None)
+    status: Optional[TwinAspectRegistrationStatus] = Field(description="The registration status the aspect reached. It is kept, so sending the item again continues from there.", default=None)
+    updated: bool = Field(description="Whether the payload of an aspect already stored in the submodel service was uploaded again (update mode).", default=False)
+    error: Optional[str] = Field(description="The reason why the item could not be fully registered, if it failed.", default=None)
+
 class TwinRead(BaseModel):
     """Represents a digital twin within the Digital Twin Registry."""
 
@@ -140,6 +151,39 @@ class SerializedPartTwinRead(SerializedPartRead, TwinRead):
 class SerializedPartTwinDetailsRead(SerializedPartDetailsRead, TwinRead, TwinDetailsReadBase):
     """Represents the details of a serialized part twin within the Digital Twin Registry."""
 
+class SerializedPartTwinBulkStatus(enum.Enum):
+    """An enumeration of the states of a serialized part within a bulk twin registration job"""
+
+    PENDING = "pending"
+    """The twin of the part is not registered in the Digital Twin Registry yet"""
+
+    REGISTERED = "registered"
+    """The twin of the part is registered in the Digital Twin Registry"""
+
+    FAILED = "failed"
+    """The twin of the part could not be registered, resuming the job tries it again"""
+
+class SerializedPartTwinBulkResult(SerializedPartBase):
+    """Represents the outcome for one serialized part of a bulk twin registration job."""
+
+    index: int = Field(description="The position of the part in the request.")
+    global_id: Optional[UUID] = Field(alias="globalId", description="The Catena-X ID / global ID of the digital twin, once it is created.", default=None)
+    dtr_aas_id: Optional[UUID] = Field(alias="dtrAasId", description="The shell descriptor ID ('AAS ID') of the digital twin, once it is created.", default=None)
+    status: SerializedPartTwinBulkStatus = Field(description="The registration status of the part.", default=SerializedPartTwinBulkStatus.PENDING)
+    error: Optional[str] = Field(description="The reason why the part could not be registered, if it failed.", default=None)
+
+class SerializedPartTwinBulkJobRead(BaseModel):
+    """Represents a bulk registration job of serialized part twins."""
+
+    job_id: str = Field(alias="jobId", description="The ID of the job, used to follow its progress and to resume it.")
+    status: str = Field(description="The status of the job: 'in_progress' or 'completed'.")
+    total: int = Field(description="The number of parts in the job.")
+    registered: int = Field(description="The number of parts whose twin is registered.", default=0)
+    failed: int = Field(description="The number of parts that could not be registered.", default=0)
+    created_date: datetime = Field(alias="createdDate", description="The date when the job was created.")
+    modified_date: datetime = Field(alias="modifiedDate", description="The date when the job was last started or finished.")
+    results: List[SerializedPartTwinBulkResult] = Field(description="The outcome for every part of the job, in the order of the request.", default=[])
+
 class SerializedPartTwinShareCreate(SerializedPartBase):
     # Hint: we don't need the TwinShareCreateBase here, because a serialized part has already a link to a single business partner
     pass
@@ -27,10 +27,6 @@ from managers.config.config_manager import ConfigManager
 from connector import connector_start_up_error
 from dtr import dtr_start_up_error
 
-# Set up asyncio default thread pool for blocking operations
-import asyncio
-import concurrent.futures
-
 app = api
 
 
@@ -71,13 +67,9 @@ def start():
         logger.info(f"[UVICORN] Thread pool size: {worker_threads}")
         logger.info(f"[UVICORN] Timeouts: keep_alive={timeout_keep_alive}s, graceful_shutdown={timeout_graceful_shutdown}s")
         
-        # Configure asyncio's default thread pool executor globally
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        executor = concurrent.futures.ThreadPoolExecutor(max_workers=worker_threads)
-        loop.set_default_executor(executor)
-        
-        logger.info(f"[ASYNCIO] Configured default thread pool with {worker_threads} threads - blocking calls handled automatically!")
+        # The blocking service calls of the endpoints run on a dedicated pool of worker_threads threads
+        # (see utils.async_utils.get_blocking_executor), uvicorn creates its own event loop
+        logger.info(f"[ASYNCIO] Blocking service calls run on a dedicated pool of {worker_threads} threads")
         
         # Uvicorn configuration with server settings
         uvicorn_config = {
@@ -22,7 +22,7 @@
 # SPDX-License-Identifier: Apache-2.0
 #################################################################################
 
-from typing import List, Optional, Tuple
+from typing import Iterator, List, Optional, Tuple
 from models.services.provider.part_management import (
     BatchCreate,
     BatchRead,
@@ -52,6 +52,8 @@ from managers.metadata_database.manager import RepositoryManagerFactory, Reposit
 from models.metadata_database.provider.models import CatalogPart, SerializedPart, PartnerCatalogPart, LegalEntity
 from managers.config.log_manager import LoggingManager
 from tools.exceptions import InvalidError, NotFoundError, AlreadyExistsError
+from utils.pagination import Page, cut_page, decode_cursor
+from utils.streaming import STREAM_BATCH_SIZE
 
 logger = LoggingManager.get_logger(__name__)
 
@@ -257,7 +259,7 @@ class PartManagementService():
 
             # Get the updated catalog part with status
             db_catalog_parts = repos.catalog_part_repository.find_by_manufacturer_id_manufacturer_part_id(
-                manufacturer_id, manufacturer_part_id, join_partner_catalog_parts=True
+                manufacturer_id, manufacturer_part_id, join_partner_catalog_parts=True, eager_load=True
             )
             
             if not db_catalog_parts:
@@ -288,27 +290,59 @@ class PartManagementService():
             return result
 
     def get_catalog_parts(self, manufacturer_id: Optional[str] = None, manufacturer_part_id: Optional[str] = None) -> List[CatalogPartReadWithStatus]:
+        return self.get_catalog_parts_page(manufacturer_id, manufacturer_part_id).items
+
+    def get_catalog_parts_page(self,
+        manufacturer_id: Optional[str] = None,
+        manufacturer_part_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = False) -> Page[CatalogPartReadWithStatus]:
+        """
+        Retrieves a page of catalog parts, ordered by their ID.
+        Without limit all the catalog parts are returned.
+        """
+        after_id = decode_cursor(cursor, int)[0] if cursor else None
         with RepositoryManagerFactory.create() as repos:
             result = []
             
             db_catalog_parts: List[tuple[CatalogPart, int]] = repos.catalog_part_repository.find_by_manufacturer_id_manufacturer_part_id(
-                manufacturer_id, manufacturer_part_id, join_partner_catalog_parts=True
+                manufacturer_id, manufacturer_part_id, join_partner_catalog_parts=True, eager_load=True,
+                limit=limit + 1 if limit is not None else None, after_id=after_id
             )
+            db_catalog_parts, next_cursor = cut_page(db_catalog_parts, limit, lambda row: (row[0].id,))
             
             if db_catalog_parts:
                 for db_catalog_part, status in db_catalog_parts:
-                    result.append(
-                        CatalogPartReadWithStatus(
-                            manufacturerId=db_catalog_part.legal_entity.bpnl,
-                            manufacturerPartId=db_catalog_part.manufacturer_part_id,
-                            name=db_catalog_part.name,
-                            category=db_catalog_part.category,
-                            bpns=db_catalog_part.bpns,
-                            status=status
-                        )
-                    )
-            
-            return result
+                    result.append(PartManagementService._build_catalog_part_with_status(db_catalog_part, status))
+
+            total = repos.catalog_part_repository.count_by_manufacturer_id_manufacturer_part_id(
+                manufacturer_id, manufacturer_part_id) if include_total else None
+
+            return Page(items=result, next_cursor=next_cursor, total=total)
+
+    def iter_catalog_parts(self, manufacturer_id: Optional[str] = None, manufacturer_part_id: Optional[str] = None) -> Iterator[CatalogPartReadWithStatus]:
+        """
+        Stream all the catalog parts, reading them from a server-side cursor in batches of STREAM_BATCH_SIZE.
+        The database session stays open until the iterator is exhausted or closed.
+        """
+        with RepositoryManagerFactory.create() as repos:
+            db_catalog_parts = repos.catalog_part_repository.find_by_manufacturer_id_manufacturer_part_id(
+                manufacturer_id, manufacturer_part_id, eager_load=True, yield_per=STREAM_BATCH_SIZE
+            )
+            for db_catalog_part, status in db_catalog_parts:
+                yield PartManagementService._build_catalog_part_with_status(db_catalog_part, status)
+
+    @staticmethod
+    def _build_catalog_part_with_status(db_catalog_part: CatalogPart, status: int) -> CatalogPartReadWithStatus:
+        return CatalogPartReadWithStatus(
+            manufacturerId=db_catalog_part.legal_entity.bpnl,
+            manufacturerPartId=db_catalog_part.manufacturer_part_id,
+            name=db_catalog_part.name,
+            category=db_catalog_part.category,
+            bpns=db_catalog_part.bpns,
+            status=status
+        )
 
     def get_catalog_part_details(self, manufacturer_id: str, manufacturer_part_id: str) -> Optional[CatalogPartDetailsReadWithStatus]:
         """
@@ -316,7 +350,7 @@ class PartManagementService():
         """
         with RepositoryManagerFactory.create() as repos:
             db_catalog_parts: List[tuple[CatalogPart, int]] = repos.catalog_part_repository.find_by_manufacturer_id_manufacturer_part_id(
-                manufacturer_id, manufacturer_part_id, join_partner_catalog_parts=True
+                manufacturer_id, manufacturer_part_id, join_partner_catalog_parts=True, eager_load=True
             )
             
             if not db_catalog_parts:
@@ -506,7 +540,8 @@ class PartManagementService():
             db_serialized_parts: List[tuple[SerializedPart, int]] = repos.serialized_part_repository.find_with_status(
                 manufacturer_id=manufacturer_id,
                 manufacturer_part_id=manufacturer_part_id,
-                part_instance_id=part_instance_id
+                part_instance_id=part_instance_id,
+                eager_load=True
             )
             
             if not db_serialized_parts:
@@ -540,36 +575,79 @@ class PartManagementService():
         """
         Retrieves serialized parts from the system according to given parameters.
         """
+        return self.get_serialized_parts_page(query).items
+
+    def get_serialized_parts_page(self,
+        query: SerializedPartQuery = SerializedPartQuery(),
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = False) -> Page[SerializedPartReadWithStatus]:
+        """
+        Retrieves a page of serialized parts according to given parameters, ordered by their ID.
+        Without limit all the matching serialized parts are returned.
+        """
+        after_id = decode_cursor(cursor, int)[0] if cursor else None
+        filters = dict(
+            manufacturer_id=query.manufacturer_id,
+            manufacturer_part_id=query.manufacturer_part_id,
+            part_instance_id=query.part_instance_id,
+            business_partner_number=query.business_partner_number,
+            customer_part_id=query.customer_part_id,
+            van=query.van
+        )
         with RepositoryManagerFactory.create() as repos:
             db_serialized_parts: List[tuple[SerializedPart, int]] = repos.serialized_part_repository.find_with_status(
+                **filters,
+                eager_load=True,
+                limit=limit + 1 if limit is not None else None,
+                after_id=after_id
+            )
+            db_serialized_parts, next_cursor = cut_page(db_serialized_parts, limit, lambda row: (row[0].id,))
+
+            result = []
+            for db_serialized_part, status in db_serialized_parts:
+                result.append(PartManagementService._build_serialized_part_with_status(db_serialized_part, status))
+
+            total = repos.serialized_part_repository.count_with_status(**filters) if include_total else None
+
+            return Page(items=result, next_cursor=next_cursor, total=total)
+
+    def iter_serialized_parts(self, query: SerializedPartQuery = SerializedPartQuery()) -> Iterator[SerializedPartReadWithStatus]:
+        """
+        Stream the serialized parts matching the given parameters, reading them from a server-side cursor
+        in batches of STREAM_BATCH_SIZE. The database session stays open until the iterator is exhausted or closed.
+        """
+        with RepositoryManagerFactory.create() as repos:
+            db_serialized_parts = repos.serialized_part_repository.find_with_status(
                 manufacturer_id=query.manufacturer_id,
                 manufacturer_part_id=query.manufacturer_part_id,
                 part_instance_id=query.part_instance_id,
                 business_partner_number=query.business_partner_number,
                 customer_part_id=query.customer_part_id,
-                van=query.van
+                van=query.van,
+                eager_load=True,
+                yield_per=STREAM_BATCH_SIZE
             )
-
-            result = []
             for db_serialized_part, status in db_serialized_parts:
-                result.append(
-                    SerializedPartReadWithStatus(
-                        manufacturerId=db_serialized_part.partner_catalog_part.catalog_part.legal_entity.bpnl,
-                        manufacturerPartId=db_serialized_part.partner_catalog_part.catalog_part.manufacturer_part_id,
-                        name=db_serialized_part.partner_catalog_part.catalog_part.name,
-                        category=db_serialized_part.partner_catalog_part.catalog_part.category,
-                        bpns=db_serialized_part.partner_catalog_part.catalog_part.bpns,
-                        partInstanceId=db_serialized_part.part_instance_id,
-                        customerPartId=db_serialized_part.partner_catalog_part.customer_part_id,
-                        businessPartner=BusinessPartnerRead(
-                            name=db_serialized_part.partner_catalog_part.business_partner.name,
-                            bpnl=db_serialized_part.partner_catalog_part.business_partner.bpnl
-                        ),
-                        van=db_serialized_part.van,
-                        status=SharingStatus(status)
-                    )
-                )
-            return result
+                yield PartManagementService._build_serialized_part_with_status(db_serialized_part, status)
+
+    @staticmethod
+    def _build_serialized_part_with_status(db_serialized_part: SerializedPart, status: int) -> SerializedPartReadWithStatus:
+        return SerializedPartReadWithStatus(
+            manufacturerId=db_serialized_part.partner_catalog_part.catalog_part.legal_entity.bpnl,
+            manufacturerPartId=db_serialized_part.partner_catalog_part.catalog_part.manufacturer_part_id,
+            name=db_serialized_part.partner_catalog_part.catalog_part.name,
+            category=db_serialized_part.partner_catalog_part.catalog_part.category,
+            bpns=db_serialized_part.partner_catalog_part.catalog_part.bpns,
+            partInstanceId=db_serialized_part.part_instance_id,
+            customerPartId=db_serialized_part.partner_catalog_part.customer_part_id,
+            businessPartner=BusinessPartnerRead(
+                name=db_serialized_part.partner_catalog_part.business_partner.name,
+                bpnl=db_serialized_part.partner_catalog_part.business_partner.bpnl
+            ),
+            van=db_serialized_part.van,
+            status=SharingStatus(status)
+        )
 
     def create_jis_part(self, jis_part_create: JISPartCreate) -> JISPartRead:
         """
@@ -27,6 +27,7 @@ from typing import List, Optional
 from models.services.provider.partner_management import BusinessPartnerCreate, BusinessPartnerRead, DataExchangeAgreementRead
 from models.metadata_database.provider.models import BusinessPartner, DataExchangeAgreement
 from managers.metadata_database.manager import RepositoryManagerFactory
+from utils.pagination import Page, cut_page, decode_cursor
 
 class PartnerManagementService():
     """
@@ -80,9 +81,23 @@ class PartnerManagementService():
         """
         List all partners in the system.
         """
+        return self.list_business_partners_page().items
+
+    def list_business_partners_page(self, limit: Optional[int] = None, cursor: Optional[str] = None, include_total: bool = False) -> Page[BusinessPartnerRead]:
+        """
+        List a page of the partners in the system, ordered by their ID.
+        Without limit all the partners are listed.
+        """
+        after_id = decode_cursor(cursor, int)[0] if cursor else None
         with RepositoryManagerFactory.create() as repo:
-            db_partners = repo.business_partner_repository.find_all()
-            return [BusinessPartnerRead(name=bp.name, bpnl=bp.bpnl) for bp in db_partners]
+            db_partners = repo.business_partner_repository.find_all(limit=limit + 1 if limit is not None else None, after_id=after_id)
+            db_partners, next_cursor = cut_page(db_partners, limit, lambda bp: (bp.id,))
+            total = repo.business_partner_repository.count() if include_total else None
+            return Page(
+                items=[BusinessPartnerRead(name=bp.name, bpnl=bp.bpnl) for bp in db_partners],
+                next_cursor=next_cursor,
+                total=total
+            )
         
     def get_data_exchange_agreements(self, partner_number: str) -> List[DataExchangeAgreementRead]:
         """
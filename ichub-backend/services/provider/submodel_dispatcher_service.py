@@ -25,7 +25,10 @@
 from uuid import UUID
 from typing import Dict, Any, Optional
 
-from managers.enablement_services.submodel_service_manager import SubmodelServiceManager
+from managers.enablement_services.submodel_service_manager import SubmodelServiceManagerRegistry
+from managers.enablement_services.submodel_document_cache import SubmodelDocument, SubmodelFile
+from managers.metadata_database.manager import RepositoryManagerFactory
+from tools.passport_tools import is_passport_semantic_id
 from tools.submodel_type_util import get_submodel_type
 
 class SubmodelDispatcherService:
@@ -35,7 +38,7 @@ class SubmodelDispatcherService:
 
     def __init__(self):
         # TODO: Deal with the proper config => Submodel Service is normally a singleton
-        self.submodel_service_manager = SubmodelServiceManager()
+        self.submodel_service_manager = SubmodelServiceManagerRegistry.get()
 
     def get_submodel_content(self, edc_bpn: Optional[str],
                              edc_contract_agreement_id: Optional[str], semantic_id: str,
@@ -67,6 +70,41 @@ class SubmodelDispatcherService:
         return self.submodel_service_manager.get_twin_aspect_document(
             submodel_id, semantic_id)
 
+    def get_submodel_document(self, edc_bpn: Optional[str],
+                              edc_contract_agreement_id: Optional[str], semantic_id: str,
+                              submodel_id: UUID) -> SubmodelDocument:
+        """
+        Dispatch a submodel as a serialized document with its entity tag, read through the document cache.
+
+        The access checks are the same as for get_submodel_content.
+        """
+        get_submodel_type(semantic_id)  # Validate the semantic ID
+        return self.submodel_service_manager.get_cached_twin_aspect_document(submodel_id, semantic_id)
+
+    @property
+    def serves_files(self) -> bool:
+        """Whether submodels are served as the stored files (filesystem mode) instead of as documents."""
+        return self.submodel_service_manager.stores_files
+
+    def get_submodel_file(self, edc_bpn: Optional[str],
+                          edc_contract_agreement_id: Optional[str], semantic_id: str,
+                          submodel_id: UUID) -> SubmodelFile:
+        """
+        Dispatch a submodel as the stored file, which is sent without parsing and serializing it again.
+
+        The access checks are the same as for get_submodel_content.
+        """
+        get_submodel_type(semantic_id)  # Validate the semantic ID
+        return self.submodel_service_manager.get_twin_aspect_document_file(submodel_id, semantic_id)
+
+    def peek_submodel_document(self, semantic_id: str, submodel_id: UUID) -> Optional[SubmodelDocument]:
+        """
+        Get a serialized submodel only if it is in the document cache. This never blocks, so it can be
+        called on the event loop before falling back to get_submodel_document on the thread pool.
+        """
+        get_submodel_type(semantic_id)  # Validate the semantic ID
+        return self.submodel_service_manager.peek_twin_aspect_document(submodel_id, semantic_id)
+
     def upload_submodel(self, submodel_id: UUID, semantic_id: str, submodel_payload: Dict[str, Any]) -> None:
         """
         Uploads a submodel to the appropriate submodel service.
@@ -82,6 +120,14 @@ class SubmodelDispatcherService:
         get_submodel_type(semantic_id)  # Validate the semantic ID
         self.submodel_service_manager.upload_twin_aspect_document(submodel_id, semantic_id, submodel_payload)
 
+        # Keep the metadata of the passports in sync with their documents
+        if is_passport_semantic_id(semantic_id):
+            with RepositoryManagerFactory.create() as repo:
+                db_twin_aspect = repo.twin_aspect_repository.get_by_submodel_id(submodel_id)
+                if db_twin_aspect:
+                    repo.passport_repository.index_twin_aspect(db_twin_aspect, submodel_payload)
+                    repo.commit()
+
     def delete_submodel(self, submodel_id: UUID, semantic_id: str) -> None:
         """
         Deletes a submodel from the submodel service.
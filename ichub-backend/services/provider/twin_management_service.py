@@ -23,9 +23,11 @@
 # SPDX-License-Identifier: Apache-2.0
 #################################################################################
 
-from typing import Optional, Dict, Any, List
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Optional, Dict, Any, Iterator, List, Set, Tuple
 from uuid import UUID, uuid4
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 from connector import connector_manager
 from dtr import dtr_provider_manager
@@ -33,7 +35,7 @@ from dtr import dtr_provider_manager
 from managers.submodels.submodel_document_generator import SubmodelDocumentGenerator, SEM_ID_PART_TYPE_INFORMATION_V1, SEM_ID_SERIAL_PART_V3
 from managers.config.config_manager import ConfigManager
 from managers.metadata_database.manager import RepositoryManagerFactory, RepositoryManager
-from managers.enablement_services.submodel_service_manager import SubmodelServiceManager
+from managers.enablement_services.submodel_service_manager import SubmodelServiceManager, SubmodelServiceManagerRegistry
 from models.services.provider.part_management import SerializedPartQuery
 from models.services.provider.partner_management import BusinessPartnerRead, DataExchangeAgreementRead
 from models.services.provider.twin_management import (
@@ -45,16 +47,32 @@ from models.services.provider.twin_management import (
     SerializedPartTwinRead,
     SerializedPartTwinShareCreate,
     SerializedPartTwinDetailsRead,
+    SerializedPartTwinBulkJobRead,
+    SerializedPartTwinBulkResult,
+    SerializedPartTwinBulkStatus,
     TwinRead,
     TwinAspectCreate,
     TwinAspectRead,
+    TwinAspectBulkCreateResult,
     TwinAspectRegistration,
     TwinAspectRegistrationStatus,
     TwinsAspectRegistrationMode,
     TwinDetailsReadBase,
 )
-from models.metadata_database.provider.models import CatalogPart, EnablementServiceStack, Twin, BusinessPartner, TwinAspect, TwinAspectRegistration
+from models.metadata_database.provider.models import (
+    CatalogPart,
+    EnablementServiceStack,
+    Twin,
+    BusinessPartner,
+    SerializedPartTwinBulkJob,
+    SerializedPartTwinBulkJobItem,
+    TwinAspect,
+    TwinAspectRegistration,
+)
 from tools.exceptions import NotFoundError, NotAvailableError
+from tools.passport_tools import is_passport_semantic_id
+from utils.pagination import Page, cut_page, decode_cursor
+from utils.streaming import STREAM_BATCH_SIZE
 
 from managers.config.log_manager import LoggingManager
 
@@ -64,6 +82,190 @@ logger = LoggingManager.get_logger(__name__)
 
 CATALOG_DIGITAL_TWIN_TYPE = "PartType"
 INSTANCE_DIGITAL_TWIN_TYPE = "PartInstance"
+# Serialized part twins returned by default, the listing was always limited to the newest ones
+SERIALIZED_PART_TWINS_PAGE_SIZE = 50
+
+
+@dataclass
+class _BulkTwinAspect:
+    """Aspect of a bulk creation, copied out of the database session so the workers never touch it."""
+    index: int
+    aas_id: UUID
+    submodel_id: UUID
+    semantic_id: str
+    payload: Dict[str, Any]
+    twin_aspect_id: int
+    initial_status: int
+    status: int
+    enablement_service_stack_id: int
+    connection_settings: Optional[Dict[str, Any]]
+    error: Optional[str] = None
+    updated: bool = False
+
+
+@dataclass
+class _BulkSerializedPartTwin:
+    """Twin of a bulk registration job, copied out of the database session so the workers never touch it."""
+    index: int
+    twin_id: int
+    enablement_service_stack_id: int
+    dtr_registered: bool
+    shell_descriptor: Dict[str, Any]
+    serial_part_aspect: Optional[TwinAspectCreate] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class _SerializedPartTwinBulkJob:
+    """A bulk registration job: the requested parts, their results and the parts that were requested twice."""
+    create_inputs: List[SerializedPartTwinCreate]
+    job: SerializedPartTwinBulkJobRead
+    duplicate_indexes: Set[int]
+    auto_create_serial_part_aspect: bool = False
+
+
+class SerializedPartTwinBulkJobManager:
+    """
+    Stores the bulk serialized part twin registration jobs in the metadata database.
+
+    A job is stored with the outcome of each of its parts, which is updated after every batch,
+    so any worker can report on a job and resume it, whichever worker created or ran it. Only
+    the ``max_jobs`` most recent finished jobs are kept.
+    """
+
+    def __init__(self, max_jobs: int = 100, repository_manager_factory: Optional[Callable[[], RepositoryManager]] = None):
+        """
+        Initialize the job manager.
+
+        Args:
+            max_jobs (int, optional): Maximum number of finished jobs kept, the oldest ones are deleted first. Defaults to 100.
+            repository_manager_factory (Callable, optional): Creates the repository managers. Defaults to RepositoryManagerFactory.create.
+        """
+        self.max_jobs = max(1, max_jobs)
+        self._create_repository_manager = repository_manager_factory or RepositoryManagerFactory.create
+
+    def create_job(self, parts: List[SerializedPartTwinCreate], auto_create_serial_part_aspect: bool = False) -> SerializedPartTwinBulkJobRead:
+        """Create a job for the given parts, parts appearing more than once only count the first time."""
+        now = datetime.now(timezone.utc)
+        job_id = str(uuid4())
+        items = []
+        seen_keys = set()
+        for index, part in enumerate(parts):
+            item = SerializedPartTwinBulkJobItem(
+                job_id=job_id,
+                part_index=index,
+                manufacturer_id=part.manufacturer_id,
+                manufacturer_part_id=part.manufacturer_part_id,
+                part_instance_id=part.part_instance_id,
+                requested_global_id=part.global_id,
+                requested_dtr_aas_id=part.dtr_aas_id,
+                status=SerializedPartTwinBulkStatus.PENDING.value
+            )
+            key = (part.manufacturer_id, part.manufacturer_part_id, part.part_instance_id)
+            if key in seen_keys:
+                item.duplicate = True
+                item.status = SerializedPartTwinBulkStatus.FAILED.value
+                item.error = "Duplicate serialized part, it is already part of the request."
+            seen_keys.add(key)
+            items.append(item)
+
+        db_job = SerializedPartTwinBulkJob(
+            job_id=job_id,
+            status="in_progress",
+            total=len(parts),
+            auto_create_serial_part_aspect=auto_create_serial_part_aspect,
+            created_date=now,
+            modified_date=now
+        )
+        with self._create_repository_manager() as repo:
+            repo.serialized_part_twin_bulk_job_repository.create_job(db_job, items)
+            repo.serialized_part_twin_bulk_job_repository.delete_oldest(self.max_jobs)
+            repo.commit()
+            return self._to_bulk_job(db_job, items).job
+
+    def get_job(self, job_id: str) -> Optional[_SerializedPartTwinBulkJob]:
+        """Get a job with the current outcome of its parts, or None if the job is not known."""
+        with self._create_repository_manager() as repo:
+            db_job = repo.serialized_part_twin_bulk_job_repository.find_by_job_id(job_id)
+            if db_job is None:
+                return None
+            return self._to_bulk_job(db_job, repo.serialized_part_twin_bulk_job_repository.find_items(job_id))
+
+    def start_job(self, job_id: str, stale_after: float) -> bool:
+        """
+        Mark a job as in progress again and set its failed parts back to pending, False if it is still in progress.
+        A job in progress that did not advance for stale_after seconds lost its run and can be started again.
+        """
+        stale_before = datetime.now(timezone.utc) - timedelta(seconds=stale_after)
+        with self._create_repository_manager() as repo:
+            started = repo.serialized_part_twin_bulk_job_repository.start(job_id, stale_before)
+            repo.commit()
+            return started
+
+    def save_results(self, job_id: str, results: List[SerializedPartTwinBulkResult]) -> None:
+        """Store the outcome of parts of a job."""
+        with self._create_repository_manager() as repo:
+            repo.serialized_part_twin_bulk_job_repository.update_items(job_id, [
+                {
+                    "part_index": result.index,
+                    "global_id": result.global_id,
+                    "dtr_aas_id": result.dtr_aas_id,
+                    "status": result.status.value,
+                    "error": result.error
+                }
+                for result in results
+            ])
+            repo.commit()
+
+    def finish_job(self, job_id: str) -> None:
+        """Mark a job as completed."""
+        with self._create_repository_manager() as repo:
+            repo.serialized_part_twin_bulk_job_repository.touch(job_id, status="completed")
+            repo.commit()
+
+    @staticmethod
+    def _to_bulk_job(db_job: SerializedPartTwinBulkJob, items: List[SerializedPartTwinBulkJobItem]) -> _SerializedPartTwinBulkJob:
+        """Build a job from its stored state."""
+        create_inputs = [
+            SerializedPartTwinCreate(
+                manufacturerId=item.manufacturer_id,
+                manufacturerPartId=item.manufacturer_part_id,
+                partInstanceId=item.part_instance_id,
+                globalId=item.requested_global_id,
+                dtrAasId=item.requested_dtr_aas_id
+            )
+            for item in items
+        ]
+        results = [
+            SerializedPartTwinBulkResult(
+                index=item.part_index,
+                manufacturerId=item.manufacturer_id,
+                manufacturerPartId=item.manufacturer_part_id,
+                partInstanceId=item.part_instance_id,
+                globalId=item.global_id,
+                dtrAasId=item.dtr_aas_id,
+                status=SerializedPartTwinBulkStatus(item.status),
+                error=item.error
+            )
+            for item in items
+        ]
+        job = SerializedPartTwinBulkJobRead(
+            jobId=db_job.job_id,
+            status=db_job.status,
+            total=db_job.total,
+            registered=sum(1 for result in results if result.status == SerializedPartTwinBulkStatus.REGISTERED),
+            failed=sum(1 for result in results if result.status == SerializedPartTwinBulkStatus.FAILED),
+            createdDate=db_job.created_date,
+            modifiedDate=db_job.modified_date,
+            results=results
+        )
+        return _SerializedPartTwinBulkJob(
+            create_inputs=create_inputs,
+            job=job,
+            duplicate_indexes={item.part_index for item in items if item.duplicate},
+            auto_create_serial_part_aspect=db_job.auto_create_serial_part_aspect
+        )
+
 
 class TwinManagementService:
     """
@@ -72,6 +274,7 @@ class TwinManagementService:
     
     def __init__(self):
         self.submodel_document_generator = SubmodelDocumentGenerator()
+        self.serialized_part_twin_bulk_jobs = SerializedPartTwinBulkJobManager()
 
     @staticmethod
     def _none_if_empty(value: Optional[str]) -> Optional[str]:
@@ -212,37 +415,81 @@ class TwinManagementService:
         manufacturer_part_id: Optional[str] = None,
         include_data_exchange_agreements: bool = False) -> List[CatalogPartTwinRead]:
         
+        return self.get_catalog_part_twins_page(manufacturer_id, manufacturer_part_id, include_data_exchange_agreements).items
+
+    def get_catalog_part_twins_page(self,
+        manufacturer_id: Optional[str] = None,
+        manufacturer_part_id: Optional[str] = None,
+        include_data_exchange_agreements: bool = False,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = False) -> Page[CatalogPartTwinRead]:
+        """
+        Get a page of catalog part twins, newest first.
+        Without limit all the catalog part twins are returned.
+        """
+        after = decode_cursor(cursor, datetime, int) if cursor else None
         with RepositoryManagerFactory.create() as repo:
             db_twins = repo.twin_repository.find_catalog_part_twins(
                 manufacturer_id=manufacturer_id,
                 manufacturer_part_id=manufacturer_part_id,
-                include_data_exchange_agreements=include_data_exchange_agreements
+                include_data_exchange_agreements=include_data_exchange_agreements,
+                limit=limit + 1 if limit is not None else None,
+                after=after,
+                include_parts=True
             )
+            db_twins, next_cursor = cut_page(db_twins, limit, lambda db_twin: (db_twin.created_date, db_twin.id))
             
             result = []
             for db_twin in db_twins:
-                db_catalog_part = db_twin.catalog_part
-                twin_result = CatalogPartTwinRead(
-                    globalId=db_twin.global_id,
-                    dtrAasId=db_twin.aas_id,
-                    createdDate=db_twin.created_date,
-                    modifiedDate=db_twin.modified_date,
-                    manufacturerId=db_catalog_part.legal_entity.bpnl,
-                    manufacturerPartId=db_catalog_part.manufacturer_part_id,
-                    name=db_catalog_part.name,
-                    category=TwinManagementService._none_if_empty(db_catalog_part.category),
-                    bpns=db_catalog_part.bpns,
-                    customerPartIds={partner_catalog_part.customer_part_id: BusinessPartnerRead(
-                        name=partner_catalog_part.business_partner.name,
-                        bpnl=partner_catalog_part.business_partner.bpnl
-                    ) for partner_catalog_part in db_catalog_part.partner_catalog_parts}
-                )
-                if include_data_exchange_agreements:
-                    self._fill_shares(db_twin, twin_result)
+                result.append(self._build_catalog_part_twin(db_twin, include_data_exchange_agreements))
 
-                result.append(twin_result)
+            total = repo.twin_repository.count_catalog_part_twins(
+                manufacturer_id=manufacturer_id,
+                manufacturer_part_id=manufacturer_part_id
+            ) if include_total else None
             
-            return result
+            return Page(items=result, next_cursor=next_cursor, total=total)
+
+    def iter_catalog_part_twins(self,
+        manufacturer_id: Optional[str] = None,
+        manufacturer_part_id: Optional[str] = None,
+        include_data_exchange_agreements: bool = False) -> Iterator[CatalogPartTwinRead]:
+        """
+        Stream all the catalog part twins, reading them from a server-side cursor in batches of STREAM_BATCH_SIZE.
+        The database session stays open until the iterator is exhausted or closed.
+        """
+        with RepositoryManagerFactory.create() as repo:
+            db_twins = repo.twin_repository.find_catalog_part_twins(
+                manufacturer_id=manufacturer_id,
+                manufacturer_part_id=manufacturer_part_id,
+                include_data_exchange_agreements=include_data_exchange_agreements,
+                yield_per=STREAM_BATCH_SIZE,
+                include_parts=True
+            )
+            for db_twin in db_twins:
+                yield self._build_catalog_part_twin(db_twin, include_data_exchange_agreements)
+
+    def _build_catalog_part_twin(self, db_twin: Twin, include_data_exchange_agreements: bool) -> CatalogPartTwinRead:
+        db_catalog_part = db_twin.catalog_part
+        twin_result = CatalogPartTwinRead(
+            globalId=db_twin.global_id,
+            dtrAasId=db_twin.aas_id,
+            createdDate=db_twin.created_date,
+            modifiedDate=db_twin.modified_date,
+            manufacturerId=db_catalog_part.legal_entity.bpnl,
+            manufacturerPartId=db_catalog_part.manufacturer_part_id,
+            name=db_catalog_part.name,
+            category=TwinManagementService._none_if_empty(db_catalog_part.category),
+            bpns=db_catalog_part.bpns,
+            customerPartIds={partner_catalog_part.customer_part_id: BusinessPartnerRead(
+                name=partner_catalog_part.business_partner.name,
+                bpnl=partner_catalog_part.business_partner.bpnl
+            ) for partner_catalog_part in db_catalog_part.partner_catalog_parts}
+        )
+        if include_data_exchange_agreements:
+            self._fill_shares(db_twin, twin_result)
+        return twin_result
 
     def create_catalog_part_twin_share(self, catalog_part_share_input: CatalogPartTwinShareCreate) -> bool:
         
@@ -371,24 +618,7 @@ class TwinManagementService:
             ## Create serial part submodel when registering, if configured
             # TODO: This makes our API unclean - aspect creation should not be part of twin creation - should be moved to the frontend in future
             if auto_create_serial_part_aspect:
-                serial_part_doc = self.submodel_document_generator.generate_serial_part_v3(
-                    global_id=db_twin.global_id,
-                    manufacturer_id=create_input.manufacturer_id,
-                    manufacturer_part_id=create_input.manufacturer_part_id,
-                    customer_part_id=db_serialized_part.partner_catalog_part.customer_part_id,
-                    name=db_serialized_part.partner_catalog_part.catalog_part.name,
-                    part_instance_id=create_input.part_instance_id,
-                    van=db_serialized_part.van,
-                    bpns=db_serialized_part.partner_catalog_part.catalog_part.bpns
-                )
-
-                self.create_twin_aspect(
-                    TwinAspectCreate(
-                        globalId=db_twin.global_id,
-                        semanticId=SEM_ID_SERIAL_PART_V3,
-                        payload=serial_part_doc
-                    )
-                )
+                self.create_twin_aspect(self._get_serial_part_aspect(create_input, db_serialized_part, db_twin))
 
             return TwinRead(
                 globalId=db_twin.global_id,
@@ -397,11 +627,341 @@ class TwinManagementService:
                 modifiedDate=db_twin.modified_date
             )
 
+    def create_serialized_part_twins_job(self, create_inputs: List[SerializedPartTwinCreate], auto_create_serial_part_aspect: bool = False) -> SerializedPartTwinBulkJobRead:
+        """
+        Create a job registering the twins of many serialized parts, run it with ``run_serialized_part_twins_job``.
+
+        If auto_create_serial_part_aspect is set, the SerialPart aspect of every registered twin is
+        created as well, like create_serialized_part_twin does for a single part.
+        """
+        return self.serialized_part_twin_bulk_jobs.create_job(create_inputs, auto_create_serial_part_aspect)
+
+    def get_offer_registration_metrics(self) -> Dict[str, Any]:
+        """
+        Get the counters of the cache of the offers registered in the provider connector.
+        """
+        return connector_manager.provider.get_metrics()
+
+    def get_serialized_part_twins_job(self, job_id: str) -> SerializedPartTwinBulkJobRead:
+        """
+        Get the progress and the per part results of a bulk serialized part twin registration job.
+        """
+        return self._get_serialized_part_twins_job(job_id).job
+
+    def resume_serialized_part_twins_job(self, job_id: str) -> SerializedPartTwinBulkJobRead:
+        """
+        Prepare a finished job to try its failed parts again, run it with ``run_serialized_part_twins_job``.
+
+        A job whose run was lost, e.g. because its worker was restarted, can be resumed once it did not
+        advance for the configured stale_job_seconds.
+        """
+        self._get_serialized_part_twins_job(job_id)
+        bulk_config = ConfigManager.get_config("provider.twinManagement.bulk", default={}) or {}
+        stale_after = float(bulk_config.get("stale_job_seconds", 900))
+        # Checked and set with a single statement, so two concurrent resumes cannot both start a run
+        if not self.serialized_part_twin_bulk_jobs.start_job(job_id, stale_after):
+            raise NotAvailableError(f"Bulk twin registration job '{job_id}' is still in progress.")
+        return self._get_serialized_part_twins_job(job_id).job
+
+    def run_serialized_part_twins_job(self, job_id: str) -> None:
+        """
+        Register the twins of the pending parts of a bulk job.
+
+        The parts are processed in batches: the serialized parts of a batch are read with one query,
+        the missing twins and twin registrations are inserted together, and the shell descriptors are
+        pushed to the DTR by a bounded pool of workers while the next batch is prepared. The
+        dtr_registered flags and the outcome of the parts are stored as soon as a batch is done, so a
+        resumed or repeated job skips the parts already registered. If the job creates the SerialPart
+        aspects, the aspects of a batch are created with create_twin_aspects once its twins are registered.
+        """
+        bulk_job = self._get_serialized_part_twins_job(job_id)
+        create_inputs, job = bulk_job.create_inputs, bulk_job.job
+        bulk_config = ConfigManager.get_config("provider.twinManagement.bulk", default={}) or {}
+        max_workers = max(1, int(bulk_config.get("max_workers", 16)))
+        batch_size = max(1, int(bulk_config.get("batch_size", 500)))
+
+        pending_indexes = [result.index for result in job.results if result.status == SerializedPartTwinBulkStatus.PENDING]
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                in_flight = None
+                for start in range(0, len(pending_indexes), batch_size):
+                    indexes = pending_indexes[start:start + batch_size]
+                    bulk_twins = self._create_bulk_serialized_part_twin_entities(
+                        create_inputs, job, indexes, bulk_job.auto_create_serial_part_aspect
+                    )
+                    futures = [
+                        (bulk_twin, executor.submit(self._register_bulk_serialized_part_twin, bulk_twin))
+                        for bulk_twin in bulk_twins if not bulk_twin.dtr_registered
+                    ]
+                    # Wait for the previous batch only now, so its registration overlaps the preparation of this one
+                    if in_flight:
+                        self._complete_bulk_serialized_part_twins(job, *in_flight)
+                    in_flight = (indexes, bulk_twins, futures)
+                if in_flight:
+                    self._complete_bulk_serialized_part_twins(job, *in_flight)
+        except Exception as e:
+            logger.error(f"Bulk twin registration job '{job_id}' failed: {e}")
+            for result in job.results:
+                if result.status == SerializedPartTwinBulkStatus.PENDING:
+                    result.status = SerializedPartTwinBulkStatus.FAILED
+                    result.error = str(e)
+            # Also the parts of the batch that was being prepared or registered, its outcome is not stored yet
+            self.serialized_part_twin_bulk_jobs.save_results(job_id, [job.results[index] for index in pending_indexes])
+        finally:
+            self.serialized_part_twin_bulk_jobs.finish_job(job_id)
+
+    def _get_serialized_part_twins_job(self, job_id: str) -> _SerializedPartTwinBulkJob:
+        """
+        Get a bulk job, raising NotFoundError if it is not known.
+        """
+        bulk_job = self.serialized_part_twin_bulk_jobs.get_job(job_id)
+        if bulk_job is None:
+            raise NotFoundError(f"Bulk twin registration job '{job_id}' not found.")
+        return bulk_job
+
+    def _create_bulk_serialized_part_twin_entities(self, create_inputs: List[SerializedPartTwinCreate], job: SerializedPartTwinBulkJobRead, indexes: List[int], auto_create_serial_part_aspect: bool = False) -> List[_BulkSerializedPartTwin]:
+        """
+        Get or create the twins and twin registrations of a batch of a bulk job.
+
+        The serialized parts are read with one query, the missing twins and registrations are
+        inserted with one flush each and the batch is committed once. Parts that cannot be
+        registered are marked as failed in the job. With auto_create_serial_part_aspect the
+        SerialPart aspect of every twin is prepared as well.
+        """
+        bulk_twins: List[_BulkSerializedPartTwin] = []
+
+        with RepositoryManagerFactory.create() as repo:
+            keys = {
+                (create_inputs[index].manufacturer_id, create_inputs[index].manufacturer_part_id, create_inputs[index].part_instance_id)
+                for index in indexes
+            }
+            db_serialized_parts: Dict[Tuple[str, str, str], Any] = {}
+            for db_serialized_part, manufacturer_id, manufacturer_part_id in repo.serialized_part_repository.find_by_keys(list(keys)):
+                # Like for a single part, the first serialized part is used if the key matches several business partners
+                db_serialized_parts.setdefault((manufacturer_id, manufacturer_part_id, db_serialized_part.part_instance_id), db_serialized_part)
+
+            db_enablement_service_stacks: Dict[str, EnablementServiceStack] = {}
+            batch = []
+            for index in indexes:
+                create_input = create_inputs[index]
+                result = job.results[index]
+                db_serialized_part = db_serialized_parts.get(
+                    (create_input.manufacturer_id, create_input.manufacturer_part_id, create_input.part_instance_id)
+                )
+                if not db_serialized_part:
+                    result.status = SerializedPartTwinBulkStatus.FAILED
+                    result.error = "Serialized Part not found."
+                    continue
+                if not db_serialized_part.partner_catalog_part:
+                    result.status = SerializedPartTwinBulkStatus.FAILED
+                    result.error = "Serialized Part is not linked to a Catalog Part of a Business Partner."
+                    continue
+
+                db_enablement_service_stack = db_enablement_service_stacks.get(create_input.manufacturer_id)
+                if db_enablement_service_stack is None:
+                    db_enablement_service_stack = self.get_or_create_enablement_stack(repo=repo, manufacturer_id=create_input.manufacturer_id)
+                    db_enablement_service_stacks[create_input.manufacturer_id] = db_enablement_service_stack
+
+                db_twin = db_serialized_part.twin
+                is_new = db_twin is None
+                if is_new:
+                    db_twin = repo.twin_repository.create_new(
+                        global_id=create_input.global_id,
+                        dtr_aas_id=create_input.dtr_aas_id)
+                batch.append((index, create_input, db_serialized_part, db_twin, is_new, db_enablement_service_stack))
+
+            # The new twins need their IDs before they can be linked and registered
+            repo.flush()
+            for index, create_input, db_serialized_part, db_twin, is_new, db_enablement_service_stack in batch:
+                db_twin_registration = None
+                if is_new:
+                    db_serialized_part.twin_id = db_twin.id
+                else:
+                    db_twin_registration = next((
+                        db_twin_registration for db_twin_registration in db_twin.twin_registrations
+                        if db_twin_registration.enablement_service_stack_id == db_enablement_service_stack.id
+                    ), None)
+                if not db_twin_registration:
+                    db_twin_registration = repo.twin_registration_repository.create_new(
+                        twin_id=db_twin.id,
+                        enablement_service_stack_id=db_enablement_service_stack.id
+                    )
+
+                result = job.results[index]
+                result.global_id = db_twin.global_id
+                result.dtr_aas_id = db_twin.aas_id
+                bulk_twins.append(_BulkSerializedPartTwin(
+                    index=index,
+                    twin_id=db_twin.id,
+                    enablement_service_stack_id=db_enablement_service_stack.id,
+                    dtr_registered=bool(db_twin_registration.dtr_registered),
+                    shell_descriptor=self._get_serialized_part_shell_descriptor(create_input, db_serialized_part, db_twin),
+                    serial_part_aspect=self._get_serial_part_aspect(create_input, db_serialized_part, db_twin) if auto_create_serial_part_aspect else None
+                ))
+
+            repo.commit()
+
+        return bulk_twins
+
+    @staticmethod
+    def _get_serialized_part_shell_descriptor(create_input: SerializedPartTwinCreate, db_serialized_part: Any, db_twin: Twin) -> Dict[str, Any]:
+        """
+        Build the arguments of the shell descriptor of a serialized part twin, the same as for a single part.
+        """
+        db_catalog_part = db_serialized_part.partner_catalog_part.catalog_part
+
+        # Normalize empty category to None for asset_type
+        asset_type_value = None
+        if db_catalog_part and getattr(db_catalog_part, 'category', None):
+            _cat = str(db_catalog_part.category).strip()
+            if _cat:
+                asset_type_value = _cat
+
+        return {
+            "global_id": db_twin.global_id,
+            "aas_id": db_twin.aas_id,
+            "asset_kind": "Instance",
+            "display_name": db_catalog_part.name if db_catalog_part else None,
+            "description": db_catalog_part.description if db_catalog_part else None,
+            "id_short": db_catalog_part.name if db_catalog_part else None,
+            "manufacturer_id": create_input.manufacturer_id,
+            "manufacturer_part_id": create_input.manufacturer_part_id,
+            "customer_part_ids": {
+                db_serialized_part.partner_catalog_part.customer_part_id: db_serialized_part.partner_catalog_part.business_partner.bpnl
+            },
+            "asset_type": asset_type_value,
+            "digital_twin_type": INSTANCE_DIGITAL_TWIN_TYPE,
+            "van": db_serialized_part.van,
+            "part_instance_id": create_input.part_instance_id
+        }
+
+    def _get_serial_part_aspect(self, create_input: SerializedPartTwinCreate, db_serialized_part: Any, db_twin: Twin) -> TwinAspectCreate:
+        """
+        Build the SerialPart aspect of a serialized part twin.
+        """
+        serial_part_doc = self.submodel_document_generator.generate_serial_part_v3(
+            global_id=db_twin.global_id,
+            manufacturer_id=create_input.manufacturer_id,
+            manufacturer_part_id=create_input.manufacturer_part_id,
+            customer_part_id=db_serialized_part.partner_catalog_part.customer_part_id,
+            name=db_serialized_part.partner_catalog_part.catalog_part.name,
+            part_instance_id=create_input.part_instance_id,
+            van=db_serialized_part.van,
+            bpns=db_serialized_part.partner_catalog_part.catalog_part.bpns
+        )
+        return TwinAspectCreate(
+            globalId=db_twin.global_id,
+            semanticId=SEM_ID_SERIAL_PART_V3,
+            payload=serial_part_doc
+        )
+
+    @staticmethod
+    def _register_bulk_serialized_part_twin(bulk_twin: _BulkSerializedPartTwin) -> None:
+        """
+        Push the shell descriptor of a bulk job twin to the DTR, runs in a worker thread.
+        """
+        try:
+            dtr_provider_manager.create_or_update_shell_descriptor(**bulk_twin.shell_descriptor)
+            bulk_twin.dtr_registered = True
+        except Exception as e:
+            logger.error(f"Failed to register the shell descriptor of twin '{bulk_twin.shell_descriptor['global_id']}': {e}")
+            bulk_twin.error = str(e)
+
+    def _complete_bulk_serialized_part_twins(self, job: SerializedPartTwinBulkJobRead, indexes: List[int], bulk_twins: List[_BulkSerializedPartTwin], futures: List[Tuple[_BulkSerializedPartTwin, Future]]) -> None:
+        """
+        Wait for the DTR registrations of a batch, then store the dtr_registered flags and the outcome of its parts.
+
+        The prepared SerialPart aspects of the registered twins are created afterwards, a part whose
+        aspect fails is reported as failed so resuming the job creates it again.
+        """
+        for _, future in futures:
+            future.result()
+
+        twin_ids_by_stack: Dict[int, List[int]] = {}
+        for bulk_twin, _ in futures:
+            if bulk_twin.dtr_registered:
+                twin_ids_by_stack.setdefault(bulk_twin.enablement_service_stack_id, []).append(bulk_twin.twin_id)
+        if twin_ids_by_stack:
+            with RepositoryManagerFactory.create() as repo:
+                for enablement_service_stack_id, twin_ids in twin_ids_by_stack.items():
+                    repo.twin_registration_repository.mark_dtr_registered(enablement_service_stack_id, twin_ids)
+                repo.commit()
+
+        aspect_twins = [bulk_twin for bulk_twin in bulk_twins if bulk_twin.dtr_registered and bulk_twin.serial_part_aspect]
+        if aspect_twins:
+            aspect_results = self.create_twin_aspects([bulk_twin.serial_part_aspect for bulk_twin in aspect_twins])
+            for bulk_twin, aspect_result in zip(aspect_twins, aspect_results):
+                if aspect_result.error:
+                    bulk_twin.dtr_registered = False
+                    bulk_twin.error = f"The twin is registered, but its SerialPart aspect could not be created: {aspect_result.error}"
+
+        for bulk_twin in bulk_twins:
+            result = job.results[bulk_twin.index]
+            if bulk_twin.dtr_registered:
+                result.status = SerializedPartTwinBulkStatus.REGISTERED
+            else:
+                result.status = SerializedPartTwinBulkStatus.FAILED
+                result.error = bulk_twin.error
+
+        self.serialized_part_twin_bulk_jobs.save_results(job.job_id, [job.results[index] for index in indexes])
+
     def get_serialized_part_twins(self,
         serialized_part_query: SerializedPartQuery = SerializedPartQuery(),
         global_id: Optional[UUID] = None,
         include_data_exchange_agreements: bool = False) -> List[SerializedPartTwinRead]:
         
+        return self.get_serialized_part_twins_page(serialized_part_query, global_id, include_data_exchange_agreements).items
+
+    def get_serialized_part_twins_page(self,
+        serialized_part_query: SerializedPartQuery = SerializedPartQuery(),
+        global_id: Optional[UUID] = None,
+        include_data_exchange_agreements: bool = False,
+        limit: Optional[int] = SERIALIZED_PART_TWINS_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        include_total: bool = False) -> Page[SerializedPartTwinRead]:
+        """
+        Get a page of serialized part twins, newest first.
+        By default the newest SERIALIZED_PART_TWINS_PAGE_SIZE twins are returned.
+        """
+        after = decode_cursor(cursor, datetime, int) if cursor else None
+        filters = dict(
+            manufacturer_id=serialized_part_query.manufacturer_id,
+            manufacturer_part_id=serialized_part_query.manufacturer_part_id,
+            part_instance_id=serialized_part_query.part_instance_id,
+            van=serialized_part_query.van,
+            customer_part_id=serialized_part_query.customer_part_id,
+            business_partner_number=serialized_part_query.business_partner_number,
+            global_id=global_id
+        )
+        with RepositoryManagerFactory.create() as repo:
+            db_twins = repo.twin_repository.find_serialized_part_twins(
+                **filters,
+                include_data_exchange_agreements=include_data_exchange_agreements,
+                limit=limit + 1 if limit is not None else None,
+                after=after,
+                include_parts=True
+            )
+            db_twins, next_cursor = cut_page(db_twins, limit, lambda db_twin: (db_twin.created_date, db_twin.id))
+            
+            result = []
+            for db_twin in db_twins:
+                twin_result = TwinManagementService._build_serialized_part_twin(db_twin)
+                if include_data_exchange_agreements:
+                    self._fill_shares(db_twin, twin_result)
+                result.append(twin_result)
+
+            total = repo.twin_repository.count_serialized_part_twins(**filters) if include_total else None
+            
+            return Page(items=result, next_cursor=next_cursor, total=total)
+
+    def iter_serialized_part_twins(self,
+        serialized_part_query: SerializedPartQuery = SerializedPartQuery(),
+        include_data_exchange_agreements: bool = False) -> Iterator[SerializedPartTwinRead]:
+        """
+        Stream all the serialized part twins matching the query, not only the newest ones, reading them
+        from a server-side cursor in batches of STREAM_BATCH_SIZE. The database session stays open until
+        the iterator is exhausted or closed.
+        """
         with RepositoryManagerFactory.create() as repo:
             db_twins = repo.twin_repository.find_serialized_part_twins(
                 manufacturer_id=serialized_part_query.manufacturer_id,
@@ -410,18 +970,16 @@ class TwinManagementService:
                 van=serialized_part_query.van,
                 customer_part_id=serialized_part_query.customer_part_id,
                 business_partner_number=serialized_part_query.business_partner_number,
-                global_id=global_id,
-                include_data_exchange_agreements=include_data_exchange_agreements
+                include_data_exchange_agreements=include_data_exchange_agreements,
+                limit=None,
+                yield_per=STREAM_BATCH_SIZE,
+                include_parts=True
             )
-            
-            result = []
             for db_twin in db_twins:
                 twin_result = TwinManagementService._build_serialized_part_twin(db_twin)
                 if include_data_exchange_agreements:
                     self._fill_shares(db_twin, twin_result)
-                result.append(twin_result)
-            
-            return result
+                yield twin_result
 
     def get_serialized_part_twin_details(self, global_id: UUID) -> Optional[SerializedPartTwinDetailsRead]:
         with RepositoryManagerFactory.create() as repo:
@@ -594,6 +1152,291 @@ class TwinManagementService:
 
             return self._create_twin_aspect_read_response(db_twin_aspect, db_enablement_service_stack, db_twin_aspect_registration)
 
+    def create_twin_aspects(self, twin_aspect_creates: List[TwinAspectCreate], update: bool = False) -> List[TwinAspectBulkCreateResult]:
+        """
+        Create many twin aspects at once, reporting the outcome of every item.
+
+        The rows are written in batches, the DTR asset and the EDC offer of each semantic ID are
+        registered once, and the payload upload and submodel descriptor registration of the items
+        run on a bounded pool of workers. A failing item does not stop the others, its registration
+        keeps the status it reached so sending it again continues from there.
+
+        Items already stored in the submodel service are left unchanged, unless update is set: then
+        their payload is uploaded again, as create_or_update_twin_aspect_not_default does for one aspect.
+        """
+        bulk_config = ConfigManager.get_config("provider.twinManagement.bulk", default={}) or {}
+        max_workers = max(1, int(bulk_config.get("max_workers", 16)))
+        batch_size = max(1, int(bulk_config.get("batch_size", 500)))
+
+        results = [
+            TwinAspectBulkCreateResult(
+                index=index,
+                globalId=twin_aspect_create.global_id,
+                semanticId=twin_aspect_create.semantic_id,
+                submodelId=twin_aspect_create.submodel_id
+            )
+            for index, twin_aspect_create in enumerate(twin_aspect_creates)
+        ]
+
+        # Step 1: Write the twin aspects and their registrations to the database
+        bulk_aspects = self._create_bulk_twin_aspect_entities(twin_aspect_creates, results, batch_size)
+
+        registering_aspects = [
+            bulk_aspect for bulk_aspect in bulk_aspects
+            if bulk_aspect.status < TwinAspectRegistrationStatus.DTR_REGISTERED.value
+        ]
+        pending_aspects = bulk_aspects if update else registering_aspects
+        if pending_aspects:
+            # Step 2: Register the DTR asset and the EDC offer of every semantic ID only once
+            asset_ids, edc_errors = {}, {}
+            if registering_aspects:
+                asset_ids, edc_errors = self._register_bulk_edc_offers(
+                    {bulk_aspect.semantic_id for bulk_aspect in registering_aspects}
+                )
+
+            # Step 3: Upload the payloads and register the submodel descriptors concurrently
+            submodel_service_managers = {
+                bulk_aspect.enablement_service_stack_id: _create_submodel_service_manager(bulk_aspect.connection_settings)
+                for bulk_aspect in pending_aspects
+            }
+            runnable_aspects = []
+            for bulk_aspect in pending_aspects:
+                if bulk_aspect.status < TwinAspectRegistrationStatus.DTR_REGISTERED.value and bulk_aspect.semantic_id in edc_errors:
+                    bulk_aspect.error = edc_errors[bulk_aspect.semantic_id]
+                else:
+                    runnable_aspects.append(bulk_aspect)
+
+            if runnable_aspects:
+                with ThreadPoolExecutor(max_workers=min(max_workers, len(runnable_aspects))) as executor:
+                    for bulk_aspect in runnable_aspects:
+                        executor.submit(
+                            self._register_bulk_twin_aspect,
+                            bulk_aspect,
+                            asset_ids.get(bulk_aspect.semantic_id),
+                            submodel_service_managers[bulk_aspect.enablement_service_stack_id],
+                            update
+                        )
+
+            # Step 4: Store the status reached by every aspect
+            self._update_bulk_twin_aspect_statuses(pending_aspects, batch_size)
+
+            # Step 5: Store the metadata of the uploaded passports
+            self._index_bulk_passports(pending_aspects, batch_size)
+
+        for bulk_aspect in bulk_aspects:
+            result = results[bulk_aspect.index]
+            result.submodel_id = bulk_aspect.submodel_id
+            result.status = TwinAspectRegistrationStatus(bulk_aspect.status)
+            result.updated = bulk_aspect.updated
+            result.error = bulk_aspect.error
+        return results
+
+    def _create_bulk_twin_aspect_entities(self, twin_aspect_creates: List[TwinAspectCreate], results: List[TwinAspectBulkCreateResult], batch_size: int) -> List[_BulkTwinAspect]:
+        """
+        Get or create the twin aspects and registrations of a bulk creation.
+
+        The twins and their existing aspects are read with one query each, new rows are flushed
+        in batches and everything is committed once. Items that cannot be created get their error
+        set in the results.
+        """
+        bulk_aspects: List[_BulkTwinAspect] = []
+
+        with RepositoryManagerFactory.create() as repo:
+            db_twins = {
+                db_twin.global_id: db_twin
+                for db_twin in repo.twin_repository.find_by_global_ids(
+                    list({twin_aspect_create.global_id for twin_aspect_create in twin_aspect_creates}),
+                    batch_size=batch_size,
+                    include_parts=True
+                )
+            }
+            db_twin_aspects = {
+                (db_twin_aspect.twin_id, db_twin_aspect.semantic_id): db_twin_aspect
+                for db_twin_aspect in repo.twin_aspect_repository.find_by_twin_ids(
+                    [db_twin.id for db_twin in db_twins.values()],
+                    batch_size=batch_size
+                )
+            }
+            db_enablement_service_stacks: Dict[str, EnablementServiceStack] = {}
+            seen_keys: Set[Tuple[int, str]] = set()
+
+            for start in range(0, len(twin_aspect_creates), batch_size):
+                batch: List[Tuple[int, TwinAspectCreate, Twin, TwinAspect, bool, EnablementServiceStack]] = []
+                for index in range(start, min(start + batch_size, len(twin_aspect_creates))):
+                    twin_aspect_create = twin_aspect_creates[index]
+                    db_twin = db_twins.get(twin_aspect_create.global_id)
+                    if not db_twin:
+                        results[index].error = f"Twin for global ID '{twin_aspect_create.global_id}' not found."
+                        continue
+
+                    # Twin aspects are unique per twin and semantic ID
+                    key = (db_twin.id, twin_aspect_create.semantic_id)
+                    if key in seen_keys:
+                        results[index].error = "Duplicate twin aspect, the twin and semantic ID are already part of the request."
+                        continue
+                    seen_keys.add(key)
+
+                    try:
+                        manufacturer_id = self._get_manufacturer_id_from_twin(db_twin)
+                    except NotFoundError as e:
+                        results[index].error = str(e)
+                        continue
+                    db_enablement_service_stack = db_enablement_service_stacks.get(manufacturer_id)
+                    if db_enablement_service_stack is None:
+                        db_enablement_service_stack = self.get_or_create_enablement_stack(repo=repo, manufacturer_id=manufacturer_id)
+                        db_enablement_service_stacks[manufacturer_id] = db_enablement_service_stack
+
+                    db_twin_aspect = db_twin_aspects.get(key)
+                    is_new = db_twin_aspect is None
+                    if is_new:
+                        db_twin_aspect = repo.twin_aspect_repository.create_new(
+                            twin_id=db_twin.id,
+                            semantic_id=twin_aspect_create.semantic_id,
+                            submodel_id=twin_aspect_create.submodel_id
+                        )
+                    batch.append((index, twin_aspect_create, db_twin, db_twin_aspect, is_new, db_enablement_service_stack))
+
+                # The new twin aspects need their IDs before their registrations can be created
+                repo.flush()
+                db_twin_aspect_registrations = []
+                for _, _, _, db_twin_aspect, is_new, db_enablement_service_stack in batch:
+                    db_twin_aspect_registration = None
+                    if not is_new:
+                        db_twin_aspect_registration = db_twin_aspect.find_registration_by_stack_id(db_enablement_service_stack.id)
+                    if not db_twin_aspect_registration:
+                        db_twin_aspect_registration = repo.twin_aspect_registration_repository.create_new(
+                            twin_aspect_id=db_twin_aspect.id,
+                            enablement_service_stack_id=db_enablement_service_stack.id,
+                            registration_mode=TwinsAspectRegistrationMode.DISPATCHED.value,
+                        )
+                    db_twin_aspect_registrations.append(db_twin_aspect_registration)
+
+                for (index, twin_aspect_create, db_twin, db_twin_aspect, _, db_enablement_service_stack), db_twin_aspect_registration in zip(batch, db_twin_aspect_registrations):
+                    bulk_aspects.append(_BulkTwinAspect(
+                        index=index,
+                        aas_id=db_twin.aas_id,
+                        submodel_id=db_twin_aspect.submodel_id,
+                        semantic_id=db_twin_aspect.semantic_id,
+                        payload=twin_aspect_create.payload,
+                        twin_aspect_id=db_twin_aspect.id,
+                        initial_status=db_twin_aspect_registration.status,
+                        status=db_twin_aspect_registration.status,
+                        enablement_service_stack_id=db_enablement_service_stack.id,
+                        connection_settings=db_enablement_service_stack.connection_settings
+                    ))
+
+            repo.commit()
+
+        return bulk_aspects
+
+    def _register_bulk_edc_offers(self, semantic_ids: Set[str]) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """
+        Ensure the DTR asset is registered and register the EDC offer of every semantic ID.
+
+        Returns:
+            Tuple[Dict[str, str], Dict[str, str]]: The asset ID and the registration error of the semantic IDs
+        """
+        asset_ids: Dict[str, str] = {}
+        errors: Dict[str, str] = {}
+        try:
+            self._ensure_dtr_asset_registration()
+        except Exception as e:
+            logger.error(f"Failed to register the DTR asset: {e}")
+            return asset_ids, {semantic_id: str(e) for semantic_id in semantic_ids}
+
+        for semantic_id in semantic_ids:
+            try:
+                asset_id, _, _, _ = connector_manager.provider.register_submodel_bundle_circular_offer(
+                    semantic_id=semantic_id
+                )
+                asset_ids[semantic_id] = asset_id
+            except Exception as e:
+                logger.error(f"Failed to register the EDC offer for semantic ID '{semantic_id}': {e}")
+                errors[semantic_id] = str(e)
+        return asset_ids, errors
+
+    @staticmethod
+    def _register_bulk_twin_aspect(bulk_aspect: _BulkTwinAspect, asset_id: Optional[str], submodel_service_manager: SubmodelServiceManager, update: bool = False) -> None:
+        """
+        Upload the payload of a bulk aspect and register its submodel descriptor, runs in a worker thread.
+        With update the payload of an aspect already stored is uploaded again.
+        """
+        try:
+            if bulk_aspect.status < TwinAspectRegistrationStatus.STORED.value:
+                submodel_service_manager.upload_twin_aspect_document(
+                    bulk_aspect.submodel_id,
+                    bulk_aspect.semantic_id,
+                    bulk_aspect.payload
+                )
+                bulk_aspect.status = TwinAspectRegistrationStatus.STORED.value
+            elif update:
+                submodel_service_manager.upload_twin_aspect_document(
+                    bulk_aspect.submodel_id,
+                    bulk_aspect.semantic_id,
+                    bulk_aspect.payload
+                )
+                bulk_aspect.updated = True
+
+            if asset_id and bulk_aspect.status < TwinAspectRegistrationStatus.EDC_REGISTERED.value:
+                bulk_aspect.status = TwinAspectRegistrationStatus.EDC_REGISTERED.value
+
+            if bulk_aspect.status < TwinAspectRegistrationStatus.DTR_REGISTERED.value:
+                dtr_provider_manager.create_submodel_descriptor(
+                    aas_id=bulk_aspect.aas_id,
+                    submodel_id=bulk_aspect.submodel_id,
+                    semantic_id=bulk_aspect.semantic_id,
+                    connector_asset_id=asset_id
+                )
+                bulk_aspect.status = TwinAspectRegistrationStatus.DTR_REGISTERED.value
+        except Exception as e:
+            logger.error(f"Failed to register twin aspect '{bulk_aspect.submodel_id}': {e}")
+            bulk_aspect.error = str(e)
+
+    @staticmethod
+    def _update_bulk_twin_aspect_statuses(bulk_aspects: List[_BulkTwinAspect], batch_size: int) -> None:
+        """
+        Store the status reached by the bulk aspects, with one update per status and batch.
+        The modified date of the aspects uploaded again is updated as well.
+        """
+        twin_aspect_ids_by_stack_status: Dict[Tuple[int, int], List[int]] = {}
+        for bulk_aspect in bulk_aspects:
+            if bulk_aspect.status != bulk_aspect.initial_status or bulk_aspect.updated:
+                twin_aspect_ids_by_stack_status.setdefault(
+                    (bulk_aspect.enablement_service_stack_id, bulk_aspect.status), []
+                ).append(bulk_aspect.twin_aspect_id)
+        if not twin_aspect_ids_by_stack_status:
+            return
+
+        with RepositoryManagerFactory.create() as repo:
+            for (enablement_service_stack_id, status), twin_aspect_ids in twin_aspect_ids_by_stack_status.items():
+                for start in range(0, len(twin_aspect_ids), batch_size):
+                    repo.twin_aspect_registration_repository.update_status(
+                        enablement_service_stack_id, twin_aspect_ids[start:start + batch_size], status
+                    )
+            repo.commit()
+
+    @staticmethod
+    def _index_bulk_passports(bulk_aspects: List[_BulkTwinAspect], batch_size: int) -> None:
+        """
+        Store the metadata of the Digital Product Passports uploaded by a bulk creation, in batches.
+        """
+        payloads = {
+            bulk_aspect.twin_aspect_id: bulk_aspect.payload
+            for bulk_aspect in bulk_aspects
+            if is_passport_semantic_id(bulk_aspect.semantic_id)
+            and (bulk_aspect.updated or bulk_aspect.initial_status < TwinAspectRegistrationStatus.STORED.value <= bulk_aspect.status)
+        }
+        if not payloads:
+            return
+
+        twin_aspect_ids = list(payloads)
+        with RepositoryManagerFactory.create() as repo:
+            for start in range(0, len(twin_aspect_ids), batch_size):
+                for db_twin_aspect in repo.passport_repository.find_twin_aspects(twin_aspect_ids[start:start + batch_size]):
+                    repo.passport_repository.index_twin_aspect(db_twin_aspect, payloads[db_twin_aspect.id])
+                repo.flush()
+            repo.commit()
+
     def _get_or_create_twin_aspect_registration(self, repo: RepositoryManager, db_twin_aspect: TwinAspect, db_enablement_service_stack: EnablementServiceStack) -> TwinAspectRegistration:
         """
         Get or create a twin aspect registration for the given enablement service stack.
@@ -642,6 +1485,7 @@ class TwinManagementService:
                 db_twin_aspect.semantic_id,
                 twin_aspect_create.payload
             )
+            repo.passport_repository.index_twin_aspect(db_twin_aspect, twin_aspect_create.payload)
 
             # Update the registration status to STORED
             db_twin_aspect_registration.status = TwinAspectRegistrationStatus.STORED.value
@@ -661,6 +1505,7 @@ class TwinManagementService:
                 db_twin_aspect.semantic_id,
                 twin_aspect_create.payload
             )
+            repo.passport_repository.index_twin_aspect(db_twin_aspect, twin_aspect_create.payload)
             # Update the registration modified date
             db_twin_aspect_registration.modified_date = datetime.now(timezone.utc)
             repo.commit()
@@ -923,7 +1768,7 @@ class TwinManagementService:
 
 def _create_submodel_service_manager(connection_settings: Optional[Dict[str, Any]]) -> SubmodelServiceManager:
     """
-    Create a new instance of the SubmodelServiceManager class.
+    Get the SubmodelServiceManager of an enablement service stack, the shared one for now.
     """
     # TODO: later we can configure the manager via the connection settings from the DB here
-    return SubmodelServiceManager()
+    return SubmodelServiceManagerRegistry.get()
@@ -0,0 +1,107 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+"""
+Micro-benchmark of the consumer cache hit path (get_dtrs and get_connectors).
+
+Compares the previous read path, which deep-copied the cached entries on every hit, with the
+read-only entries handed out by the managers now. Not collected by pytest, run it with:
+
+    python -m tests.benchmarks.benchmark_consumer_cache_reads
+"""
+
+import copy
+import logging
+import threading
+import timeit
+from unittest.mock import Mock
+
+from managers.enablement_services.consumer.connector.memory.connector_consumer_memory_manager import ConnectorConsumerMemoryManager
+from managers.enablement_services.consumer.dtr.memory.dtr_consumer_memory_manager import DtrConsumerMemoryManager
+
+BPN = "BPNL0000000000AA"
+DTR_COUNT = 3
+CONNECTOR_COUNT = 3
+ITERATIONS = 20000
+
+# Keep the lock debug messages of the managers out of the measurements
+logger = logging.getLogger("benchmark")
+logger.setLevel(logging.WARNING)
+
+# A usage policy shaped like the ones found in partner catalogs
+POLICIES = [{
+    "odrl:permission": {
+        "odrl:action": {"@id": "odrl:use"},
+        "odrl:constraint": {
+            "odrl:and": [
+                {"odrl:leftOperand": {"@id": "cx-policy:FrameworkAgreement"}, "odrl:operator": {"@id": "odrl:eq"}, "odrl:rightOperand": "DataExchangeGovernance:1.0"},
+                {"odrl:leftOperand": {"@id": "cx-policy:Membership"}, "odrl:operator": {"@id": "odrl:eq"}, "odrl:rightOperand": "active"},
+                {"odrl:leftOperand": {"@id": "cx-policy:UsagePurpose"}, "odrl:operator": {"@id": "odrl:eq"}, "odrl:rightOperand": "cx.core.digitalTwinRegistry:1"}
+            ]
+        }
+    },
+    "odrl:prohibition": [],
+    "odrl:obligation": []
+}]
+
+
+def _per_call_microseconds(function) -> float:
+    return timeit.timeit(function, number=ITERATIONS) / ITERATIONS * 1_000_000
+
+
+def benchmark_get_dtrs() -> None:
+    manager = DtrConsumerMemoryManager(connector_consumer_manager=Mock(), logger=logger)
+    for index in range(DTR_COUNT):
+        manager.add_dtr(BPN, f"https://edc-{index}", f"dtr-{index}", copy.deepcopy(POLICIES))
+
+    # Previous read path: plain dictionaries deep-copied on every hit
+    plain_dtrs = {
+        f"dtr-{index}": {"connector_url": f"https://edc-{index}", "asset_id": f"dtr-{index}", "policies": copy.deepcopy(POLICIES)}
+        for index in range(DTR_COUNT)
+    }
+    before = _per_call_microseconds(lambda: [copy.deepcopy(dtr) for dtr in plain_dtrs.values()])
+    after = _per_call_microseconds(lambda: manager.get_dtrs(BPN))
+    print(f"get_dtrs ({DTR_COUNT} DTRs):             before {before:8.2f} us/call   after {after:8.2f} us/call   ({before / after:.0f}x)")
+
+
+def benchmark_get_connectors() -> None:
+    manager = ConnectorConsumerMemoryManager(connector_consumer_service=Mock(), connector_discovery=Mock(), logger=logger)
+    connectors = [f"https://edc-{index}/api/v1/dsp" for index in range(CONNECTOR_COUNT)]
+    manager.add_connectors(BPN, connectors)
+
+    # Previous read path: the BPN entry deep-copied under the lock on every hit
+    lock = threading.RLock()
+    plain_entry = {"refresh_interval": manager.known_connectors[BPN]["refresh_interval"], "connectors": list(connectors)}
+
+    def previous_read():
+        with lock:
+            return copy.deepcopy(plain_entry)["connectors"]
+
+    before = _per_call_microseconds(previous_read)
+    after = _per_call_microseconds(lambda: manager.get_connectors(BPN))
+    print(f"get_connectors ({CONNECTOR_COUNT} connectors):     before {before:8.2f} us/call   after {after:8.2f} us/call   ({before / after:.0f}x)")
+
+
+if __name__ == "__main__":
+    benchmark_get_dtrs()
+    benchmark_get_connectors()
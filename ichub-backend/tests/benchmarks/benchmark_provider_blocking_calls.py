@@ -0,0 +1,96 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+"""
+Concurrency benchmark of the provider endpoints against a slow Digital Twin Registry.
+
+Compares an endpoint calling the synchronous service directly on the event loop, as the
+provider routers did before, with an endpoint running it through the AsyncManagerWrapper
+on the blocking call pool. The DTR is a stub answering after a fixed delay. Not collected
+by pytest, run it with:
+
+    python -m tests.benchmarks.benchmark_provider_blocking_calls
+"""
+
+import asyncio
+import time
+
+import httpx
+from fastapi import FastAPI
+
+from utils.async_utils import AsyncManagerWrapper
+
+DTR_LATENCY = 0.05
+CLIENTS = [1, 8, 32]
+REQUESTS_PER_CLIENT = 5
+
+
+class SlowDtrTwinService:
+    """Synchronous service stub whose DTR call takes DTR_LATENCY seconds."""
+
+    def create_serialized_part_twin(self) -> dict:
+        time.sleep(DTR_LATENCY)
+        return {"registered": True}
+
+
+twin_service = SlowDtrTwinService()
+async_twin_service = AsyncManagerWrapper(twin_service, "SlowDtrTwinService")
+
+app = FastAPI()
+
+
+@app.post("/blocking")
+async def create_twin_blocking() -> dict:
+    return twin_service.create_serialized_part_twin()
+
+
+@app.post("/offloaded")
+async def create_twin_offloaded() -> dict:
+    return await async_twin_service.create_serialized_part_twin()
+
+
+async def _run_clients(path: str, clients: int) -> float:
+    """Run the clients in parallel and return the requests per second."""
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://benchmark") as client:
+        async def run_client():
+            for _ in range(REQUESTS_PER_CLIENT):
+                response = await client.post(path)
+                response.raise_for_status()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(run_client() for _ in range(clients)))
+        return clients * REQUESTS_PER_CLIENT / (time.perf_counter() - start)
+
+
+async def benchmark() -> None:
+    print(f"Stubbed DTR latency {DTR_LATENCY * 1000:.0f} ms, {REQUESTS_PER_CLIENT} requests per client")
+    # Start the threads of the pool before measuring
+    await _run_clients("/offloaded", max(CLIENTS))
+    for clients in CLIENTS:
+        before = await _run_clients("/blocking", clients)
+        after = await _run_clients("/offloaded", clients)
+        print(f"{clients:3d} parallel clients:   before {before:8.1f} req/s   after {after:8.1f} req/s   ({after / before:.1f}x)")
+
+
+if __name__ == "__main__":
+    asyncio.run(benchmark())
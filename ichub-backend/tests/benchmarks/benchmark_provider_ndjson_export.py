@@ -0,0 +1,126 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+"""
+Memory benchmark of the serialized part export.
+
+Compares the JSON array listing, which materializes every row and read model before
+serializing one array, with the NDJSON streaming mode, which reads a server-side cursor
+and serializes chunk by chunk. Uses a SQLite file database. Not collected by pytest, run it with:
+
+    python -m tests.benchmarks.benchmark_provider_ndjson_export
+"""
+
+import os
+import tempfile
+import time
+import tracemalloc
+import warnings
+from typing import List
+
+from pydantic import TypeAdapter
+from sqlalchemy import insert
+from sqlmodel import Session, SQLModel, create_engine
+
+from managers.metadata_database.manager import RepositoryManager
+from models.metadata_database.provider import models as provider_models
+from models.metadata_database.provider.models import BusinessPartner, CatalogPart, LegalEntity, PartnerCatalogPart, SerializedPart
+from models.services.provider.part_management import SerializedPartRead
+from services.provider import part_management_service as part_management_module
+from utils.streaming import STREAM_CHUNK_SIZE, _next_chunk
+
+ROW_COUNTS = [5000, 20000, 50000]
+CATALOG_PARTS = 100
+
+
+def _seed(engine, rows: int) -> None:
+    """Insert the serialized parts in bulk, spread over CATALOG_PARTS catalog parts of one partner."""
+    with Session(engine) as session:
+        session.exec(insert(LegalEntity).values(id=1, bpnl="BPNL000000000001"))
+        session.exec(insert(BusinessPartner).values(id=1, name="Partner", bpnl="BPNL000000000002"))
+        session.exec(insert(CatalogPart), params=[
+            {"id": index, "manufacturer_part_id": f"MPI-{index}", "legal_entity_id": 1, "name": f"Part {index}", "materials": []}
+            for index in range(1, CATALOG_PARTS + 1)])
+        session.exec(insert(PartnerCatalogPart), params=[
+            {"id": index, "business_partner_id": 1, "catalog_part_id": index, "customer_part_id": f"CPI-{index}"}
+            for index in range(1, CATALOG_PARTS + 1)])
+        session.exec(insert(SerializedPart), params=[
+            {"partner_catalog_part_id": index % CATALOG_PARTS + 1, "part_instance_id": f"PI-{index}", "van": f"VAN-{index}"}
+            for index in range(rows)])
+        session.commit()
+
+
+def _json_array(service) -> tuple:
+    start = time.perf_counter()
+    body = TypeAdapter(List[SerializedPartRead]).dump_json(service.get_serialized_parts(), by_alias=True)
+    return time.perf_counter() - start, len(body)
+
+
+def _ndjson(service) -> tuple:
+    adapter = TypeAdapter(SerializedPartRead)
+    items = service.iter_serialized_parts()
+    start = time.perf_counter()
+    first_chunk = None
+    size = 0
+    while chunk := _next_chunk(items, adapter, STREAM_CHUNK_SIZE):
+        if first_chunk is None:
+            first_chunk = time.perf_counter() - start
+        size += len(chunk)
+    return first_chunk, size
+
+
+def _measure(function, service) -> tuple:
+    tracemalloc.start()
+    try:
+        result = function(service)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024 / 1024, result
+
+
+def benchmark() -> None:
+    # SQLite ignores the DISTINCT ON of the status query
+    warnings.filterwarnings("ignore", message="DISTINCT ON is currently supported only by the PostgreSQL dialect")
+    service = part_management_module.PartManagementService()
+    print(f"Chunks of {STREAM_CHUNK_SIZE} items, peak Python memory measured with tracemalloc")
+    for rows in ROW_COUNTS:
+        with tempfile.TemporaryDirectory() as directory:
+            engine = create_engine(f"sqlite:///{os.path.join(directory, 'export.db')}")
+            SQLModel.metadata.create_all(engine, tables=[
+                model.__table__ for model in vars(provider_models).values()
+                if isinstance(model, type) and issubclass(model, SQLModel) and hasattr(model, "__table__") and model.__module__ == provider_models.__name__
+            ])
+            _seed(engine, rows)
+            part_management_module.RepositoryManagerFactory.create = staticmethod(lambda: RepositoryManager(Session(engine)))
+
+            before_peak, (before_time, before_size) = _measure(_json_array, service)
+            after_peak, (first_chunk, after_size) = _measure(_ndjson, service)
+            engine.dispose()
+
+        print(f"{rows:6d} rows:   JSON array peak {before_peak:7.1f} MiB, first byte after {before_time * 1000:7.0f} ms ({before_size / 1024 / 1024:.1f} MiB)"
+              f"   NDJSON peak {after_peak:5.1f} MiB, first byte after {first_chunk * 1000:4.0f} ms ({after_size / 1024 / 1024:.1f} MiB)")
+
+
+if __name__ == "__main__":
+    benchmark()
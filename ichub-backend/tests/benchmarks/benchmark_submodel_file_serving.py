@@ -0,0 +1,115 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+"""
+Benchmark of serving filesystem-backed submodels.
+
+Compares the previous GET route, which parsed the stored file into a dict and let FastAPI
+validate and serialize it again, with sending the stored file as it is (read at once when it
+is small, streamed from its path otherwise). Both routes run in
+a FastAPI app called through httpx, using the submodel service manager on a temporary
+directory. Not collected by pytest, run it with:
+
+    python -m tests.benchmarks.benchmark_submodel_file_serving
+"""
+
+import asyncio
+import logging
+import tempfile
+import time
+from typing import Any, Dict
+from unittest.mock import patch
+from uuid import UUID, uuid4
+
+import httpx
+from fastapi import FastAPI, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+
+from managers.config.config_manager import ConfigManager
+from managers.enablement_services.submodel_service_manager import SubmodelServiceManager
+
+SEMANTIC_ID = "urn:samm:io.catenax.pcf:7.0.0#Pcf"
+DOCUMENT_SIZES = {"1 KB": 1024, "1 MB": 1024 * 1024, "20 MB": 20 * 1024 * 1024}
+REQUESTS = {"1 KB": 500, "1 MB": 50, "20 MB": 5}
+
+
+def _document(size: int) -> Dict[str, Any]:
+    """Build a PCF-like submodel of about the given serialized size."""
+    entry = {"productId": str(uuid4()), "declaredUnit": "kilogram", "pcfExcludingBiogenic": 2.5,
+             "crossSectoralStandardsUsed": [{"crossSectoralStandard": "ISO Standard 14067"}]}
+    # About 290 bytes per entry once stored with indentation
+    count = max(1, size // 290)
+    return {"id": str(uuid4()), "specVersion": "urn:io.catenax.pcf:datamodel:version:7.0.0",
+            "pcf": [dict(entry, position=index) for index in range(count)]}
+
+
+def _create_app(manager: SubmodelServiceManager) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/parsed/{submodel_id}", response_model=Dict[str, Any])
+    async def parsed(submodel_id: UUID) -> Dict[str, Any]:
+        return await run_in_threadpool(manager.get_twin_aspect_document, submodel_id, SEMANTIC_ID)
+
+    @app.get("/file/{submodel_id}")
+    async def file(submodel_id: UUID):
+        submodel_file = await run_in_threadpool(manager.get_twin_aspect_document_file, submodel_id, SEMANTIC_ID)
+        if submodel_file.body is not None:
+            return Response(content=submodel_file.body, media_type="application/json")
+        return StreamingResponse(submodel_file.iter_content(), media_type="application/json",
+                                 headers={"Content-Length": str(submodel_file.size)})
+
+    return app
+
+
+async def _measure(client: httpx.AsyncClient, url: str, requests: int) -> float:
+    start = time.perf_counter()
+    for _ in range(requests):
+        response = await client.get(url)
+        response.raise_for_status()
+    return (time.perf_counter() - start) / requests
+
+
+async def benchmark() -> None:
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    with tempfile.TemporaryDirectory() as directory:
+        config = {"provider.submodel_dispatcher.mode": "filesystem", "provider.submodel_dispatcher.path": directory}
+        with patch.object(ConfigManager, "get_config", side_effect=lambda key, default=None: config.get(key, default)):
+            manager = SubmodelServiceManager()
+        transport = httpx.ASGITransport(app=_create_app(manager))
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+            for label, size in DOCUMENT_SIZES.items():
+                submodel_id = uuid4()
+                manager.upload_twin_aspect_document(submodel_id, SEMANTIC_ID, _document(size))
+                stored_size = manager.get_twin_aspect_document_file(submodel_id, SEMANTIC_ID).size
+                requests = REQUESTS[label]
+
+                parsed = await _measure(client, f"/parsed/{submodel_id}", requests)
+                raw = await _measure(client, f"/file/{submodel_id}", requests)
+                print(f"{label:>5} ({stored_size / 1024:8.0f} KiB stored, {requests:3d} requests):   "
+                      f"parsed and serialized {parsed * 1000:8.2f} ms/request   file as stored {raw * 1000:7.2f} ms/request   "
+                      f"({parsed / raw:5.1f}x)")
+
+
+if __name__ == "__main__":
+    asyncio.run(benchmark())
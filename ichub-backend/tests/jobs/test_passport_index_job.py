@@ -0,0 +1,56 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import unittest
+from unittest.mock import Mock, patch
+
+from jobs.passport_index_job import PassportIndexJob
+
+
+class TestPassportIndexJob(unittest.TestCase):
+    """Test cases for the PassportIndexJob class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.mock_passports_manager = Mock()
+        self.mock_passports_manager.index_missing_passports.return_value = 2
+
+    def test_run_indexes_the_missing_passports(self):
+        """Test that the job indexes the passports without metadata."""
+        job = PassportIndexJob(passports_manager=self.mock_passports_manager, enabled=True)
+
+        self.assertEqual(job.run(), 2)
+        self.mock_passports_manager.index_missing_passports.assert_called_once_with()
+
+    @patch('jobs.passport_index_job.logger')
+    def test_run_disabled(self, mock_logger):
+        """Test that indexing doesn't run when disabled."""
+        job = PassportIndexJob(passports_manager=self.mock_passports_manager, enabled=False)
+
+        self.assertEqual(job.run(), 0)
+        self.mock_passports_manager.index_missing_passports.assert_not_called()
+        mock_logger.info.assert_called_with("[PassportIndexJob] Passport indexing is disabled.")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from managers.addons_service.ecopass_kit.v1 import batch_discovery
+from managers.addons_service.ecopass_kit.v1.batch_discovery import BatchDiscoveryManager
+from managers.addons_service.ecopass_kit.v1.discovery import DiscoveryManager
+
+DPP_SEMANTIC_ID = "urn:samm:io.catenax.generic.digital_product_passport:5.0.0#DigitalProductPassport"
+
+
+def make_shell(manufacturer_part_id, part_instance_id):
+    return {
+        "id": f"shell-{manufacturer_part_id}-{part_instance_id}",
+        "specificAssetIds": [
+            {"name": "manufacturerPartId", "value": manufacturer_part_id},
+            {"name": "partInstanceId", "value": part_instance_id}
+        ],
+        "submodelDescriptors": [{"id": f"dpp-{part_instance_id}", "semanticId": {"keys": [{"type": "GlobalReference", "value": DPP_SEMANTIC_ID}]}}]
+    }
+
+
+class TestBatchDiscoveryManager:
+    """Test cases for the batch discovery of Digital Product Passports."""
+
+    def setup_method(self):
+        """Setup method called before each test."""
+        self.discovery_manager = DiscoveryManager(task_manager=MagicMock())
+        self.manager = BatchDiscoveryManager(self.discovery_manager, max_concurrency=4, page_size=2)
+        self.lock = threading.Lock()
+        self.active_lookups = 0
+        self.concurrent_with_first_lookup = False
+        self.lookups = []
+        # Shells of the DTR, read two by two
+        self.shells = {"MPI-1": [make_shell("MPI-1", f"SN-{index}") for index in range(5)], "MPI-2": [make_shell("MPI-2", "SN-A")]}
+
+    def _discover_shells(self, counter_party_id, query_spec, dtr_policies, limit, cursor):
+        manufacturer_part_id = query_spec[0]["value"]
+        with self.lock:
+            first_lookup = not self.lookups
+            self.lookups.append((manufacturer_part_id, cursor))
+            self.active_lookups += 1
+        time.sleep(0.05)
+        with self.lock:
+            if first_lookup and self.active_lookups > 1:
+                self.concurrent_with_first_lookup = True
+            self.active_lookups -= 1
+        start = int(cursor or 0)
+        shells = self.shells[manufacturer_part_id]
+        result = {"shellDescriptors": shells[start:start + limit], "pagination": {}}
+        if start + limit < len(shells):
+            result["pagination"]["next"] = str(start + limit)
+        return result
+
+    @staticmethod
+    def _discover_submodel(counter_party_id, id, dtr_policies, governance, submodel_id):
+        return {"submodel": {"passportId": submodel_id}}
+
+    def _discover(self, ids):
+        async def collect():
+            return [result async for result in self.manager.discover(ids, DPP_SEMANTIC_ID)]
+
+        consumer = MagicMock()
+        consumer.discover_shells.side_effect = self._discover_shells
+        consumer.discover_submodel.side_effect = self._discover_submodel
+        with patch.object(batch_discovery.dtr_manager, "consumer", consumer), \
+                patch.object(self.discovery_manager, "discover_bpn", AsyncMock(return_value=["BPNL000000000001"])) as discover_bpn:
+            results = asyncio.run(collect())
+        return {result["id"]: result for result in results}, results, discover_bpn
+
+    def test_identifiers_are_grouped_by_part(self):
+        """The BPN and shells of a part are looked up once for all its instances, each passport is read."""
+        by_id, results, discover_bpn = self._discover(["CX:MPI-1:SN-0", "CX:MPI-1:SN-1", "CX:MPI-2:SN-A", "CX:MPI-1:SN-0"])
+
+        assert len(results) == 3
+        assert all(result["status"] == "completed" for result in results)
+        assert by_id["CX:MPI-2:SN-A"]["data"] == {"passportId": "dpp-SN-A"}
+        assert by_id["CX:MPI-1:SN-1"]["digital_twin"]["id"] == "shell-MPI-1-SN-1"
+        assert discover_bpn.await_count == 2
+        assert sorted(self.lookups) == [("MPI-1", None), ("MPI-2", None)]
+        assert [result["processed"] for result in results] == [1, 2, 3]
+        assert results[-1]["total"] == 3
+
+    def test_lookup_pages_until_every_instance_is_found(self):
+        """The shells of a part are read page by page, and no further than needed."""
+        by_id, _, _ = self._discover(["CX:MPI-1:SN-3"])
+
+        assert by_id["CX:MPI-1:SN-3"]["status"] == "completed"
+        assert self.lookups == [("MPI-1", None), ("MPI-1", "2")]
+
+    def test_first_lookup_of_a_bpn_runs_alone(self):
+        """The DTR of a BPN is negotiated by the first lookup before the others start."""
+        self._discover(["CX:MPI-1:SN-0", "CX:MPI-2:SN-A"])
+
+        assert len(self.lookups) == 2
+        assert not self.concurrent_with_first_lookup
+
+    def test_invalid_and_unknown_identifiers_fail(self):
+        """Malformed identifiers and instances without shell are reported as failed, the others complete."""
+        by_id, results, _ = self._discover(["invalid", "CX:MPI-2:SN-Z", "CX:MPI-2:SN-A"])
+
+        assert by_id["invalid"]["status"] == "failed"
+        assert "not found" in by_id["CX:MPI-2:SN-Z"]["error"]
+        assert by_id["CX:MPI-2:SN-A"]["status"] == "completed"
+        assert results[-1]["failed"] == 2
+
+    def test_unexpected_errors_fail_the_part_without_stalling_the_stream(self):
+        """An error escaping the BPN lookup fails the instances of the part, the stream still ends."""
+        async def discover_bpn(manufacturer_part_id):
+            if manufacturer_part_id == "MPI-1":
+                raise ConnectionError("BPN discovery unreachable")
+            return ["BPNL000000000001"]
+
+        async def collect():
+            return [result async for result in self.manager.discover(["CX:MPI-1:SN-0", "CX:MPI-1:SN-1", "CX:MPI-2:SN-A"], DPP_SEMANTIC_ID)]
+
+        consumer = MagicMock()
+        consumer.discover_shells.side_effect = self._discover_shells
+        consumer.discover_submodel.side_effect = self._discover_submodel
+        with patch.object(batch_discovery.dtr_manager, "consumer", consumer), \
+                patch.object(self.discovery_manager, "discover_bpn", side_effect=discover_bpn):
+            results = asyncio.run(asyncio.wait_for(collect(), timeout=5))
+
+        by_id = {result["id"]: result for result in results}
+        assert len(results) == 3
+        assert "BPN discovery unreachable" in by_id["CX:MPI-1:SN-0"]["error"]
+        assert by_id["CX:MPI-1:SN-1"]["status"] == "failed"
+        assert by_id["CX:MPI-2:SN-A"]["status"] == "completed"
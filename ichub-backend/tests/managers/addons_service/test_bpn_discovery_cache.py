@@ -0,0 +1,126 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+
+from managers.addons_service.ecopass_kit.v1.bpn_discovery_cache import BpnDiscoveryCache
+
+TYPE = "manufacturerPartId"
+
+
+class TestBpnDiscoveryCache:
+    """Test cases for the cache of the BPN Discovery lookups."""
+
+    def test_same_part_is_looked_up_once(self):
+        """Repeated lookups of a part are answered from the cache."""
+        cache = BpnDiscoveryCache()
+        load = Mock(return_value=["BPNL_A"])
+
+        results = [cache.get_or_load(TYPE, "MPI-1", load) for _ in range(500)]
+
+        assert results == [["BPNL_A"]] * 500
+        load.assert_called_once()
+
+    def test_concurrent_lookups_are_coalesced(self):
+        """Concurrent lookups of a part that is not cached yet share one call of the service."""
+        cache = BpnDiscoveryCache()
+        release = threading.Event()
+        calls = []
+
+        def load():
+            calls.append(1)
+            release.wait(5)
+            return ["BPNL_A"]
+
+        with ThreadPoolExecutor(max_workers=20) as executor:
+            futures = [executor.submit(cache.get_or_load, TYPE, "MPI-1", load) for _ in range(20)]
+            while cache.get_metrics()["coalesced"] + len(calls) < 20 and not all(future.done() for future in futures):
+                threading.Event().wait(0.01)
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert results == [["BPNL_A"]] * 20
+        assert len(calls) == 1
+
+    def test_misses_are_cached_with_their_own_ttl(self):
+        """Parts without BPNs are cached as well, for the negative TTL."""
+        cache = BpnDiscoveryCache(negative_ttl=0)
+        load = Mock(return_value=None)
+
+        assert cache.get_or_load(TYPE, "MPI-1", load) == []
+        assert cache.get_or_load(TYPE, "MPI-1", load) == []
+        assert load.call_count == 2
+
+        cache = BpnDiscoveryCache()
+        cache.get_or_load(TYPE, "MPI-1", load)
+        assert cache.get(TYPE, "MPI-1") == []
+        assert cache.get_metrics()["negativeHits"] == 1
+
+    def test_concurrent_negative_hits_are_all_counted(self):
+        """Hits on a part without BPNs from many threads are all counted."""
+        cache = BpnDiscoveryCache()
+        cache.put(TYPE, "MPI-1", [])
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for future in [executor.submit(lambda: [cache.get(TYPE, "MPI-1") for _ in range(1000)]) for _ in range(8)]:
+                future.result()
+
+        assert cache.get_metrics()["negativeHits"] == 8000
+
+    def test_errors_are_not_cached(self):
+        """A failed lookup is retried by the next caller."""
+        cache = BpnDiscoveryCache()
+        load = Mock(side_effect=[RuntimeError("unavailable"), ["BPNL_A"]])
+
+        with pytest.raises(RuntimeError):
+            cache.get_or_load(TYPE, "MPI-1", load)
+        assert cache.get_or_load(TYPE, "MPI-1", load) == ["BPNL_A"]
+
+    def test_invalidation(self):
+        """Invalidated parts are looked up again, a lookup started before the invalidation is not stored."""
+        cache = BpnDiscoveryCache()
+        cache.get_or_load(TYPE, "MPI-1", Mock(return_value=[]))
+        cache.invalidate(TYPE, "MPI-1")
+        assert cache.get(TYPE, "MPI-1") is None
+
+        def load():
+            cache.invalidate(TYPE, "MPI-2")
+            return []
+
+        assert cache.get_or_load(TYPE, "MPI-2", load) == []
+        assert cache.get(TYPE, "MPI-2") is None
+
+    def test_least_recently_used_part_is_evicted(self):
+        """Once full, the least recently used part is evicted."""
+        cache = BpnDiscoveryCache(max_entries=2)
+        cache.put(TYPE, "MPI-1", ["BPNL_A"])
+        cache.put(TYPE, "MPI-2", ["BPNL_B"])
+        cache.get(TYPE, "MPI-1")
+        cache.put(TYPE, "MPI-3", ["BPNL_C"])
+
+        assert cache.get(TYPE, "MPI-2") is None
+        assert cache.get(TYPE, "MPI-1") == ["BPNL_A"]
@@ -0,0 +1,95 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+from managers.addons_service.ecopass_kit.v1 import discovery
+from managers.config.config_manager import ConfigManager
+
+DPP_SEMANTIC_ID = "urn:samm:io.catenax.generic.digital_product_passport:5.0.0#DigitalProductPassport"
+
+
+class TestQueryBpnsForShells:
+    """Test cases for the first-match lookup of the DPP shell across the BPNs owning a part."""
+
+    def setup_method(self):
+        """Setup method called before each test."""
+        self.manager = discovery.DiscoveryManager()
+        self.release_slow = threading.Event()
+
+    def teardown_method(self):
+        """Teardown method called after each test."""
+        self.release_slow.set()
+
+    def _discover_shells(self, counter_party_id, query_spec, dtr_policies):
+        if counter_party_id == "BPNLSLOW":
+            self.release_slow.wait(5)
+            return {"shellsFound": 0, "shellDescriptors": []}
+        if counter_party_id == "BPNLOTHER":
+            return {"shellsFound": 1, "shellDescriptors": [self._shell("other", "urn:samm:io.catenax.other:1.0.0#Other")]}
+        if counter_party_id == "BPNLERROR":
+            raise RuntimeError("DTR unreachable")
+        return {"shellsFound": 1, "shellDescriptors": [self._shell("dpp", DPP_SEMANTIC_ID)]}
+
+    @staticmethod
+    def _shell(shell_id, semantic_id):
+        return {"id": shell_id, "submodelDescriptors": [{"id": f"{shell_id}-submodel", "semanticId": {"keys": [{"type": "GlobalReference", "value": semantic_id}]}}]}
+
+    def _query(self, bpn_list, timeout=None):
+        """Run the lookup, returning its result and the seconds it took, then let the slow lookup finish."""
+        async def query():
+            started = time.monotonic()
+            result = await self.manager._query_bpns_for_shells("task", bpn_list, [], DPP_SEMANTIC_ID)
+            elapsed = time.monotonic() - started
+            self.release_slow.set()
+            return result, elapsed
+
+        consumer = MagicMock()
+        consumer.discover_shells.side_effect = self._discover_shells
+        with patch.object(discovery.dtr_manager, "consumer", consumer), \
+                patch.object(ConfigManager, "get_config", return_value=timeout):
+            return asyncio.run(query())
+
+    def test_first_match_is_returned_without_waiting_for_slow_bpn(self):
+        """The matching shell is returned as soon as its BPN answers, the slow lookup is abandoned."""
+        (shell, bpn), elapsed = self._query(["BPNLSLOW", "BPNLERROR", "BPNLOTHER", "BPNLMATCH"])
+
+        assert shell["id"] == "dpp"
+        assert bpn == "BPNLMATCH"
+        assert elapsed < 2
+
+    def test_deadline_bounds_lookup_without_match(self):
+        """Without a matching shell the lookup gives up at the deadline instead of waiting for every BPN."""
+        (shell, bpn), elapsed = self._query(["BPNLSLOW", "BPNLOTHER"], timeout=0.2)
+
+        assert (shell, bpn) == (None, None)
+        assert elapsed < 2
+
+    def test_no_match_when_every_bpn_answered(self):
+        """When every BPN answered without a matching shell, nothing is returned."""
+        (shell, bpn), _ = self._query(["BPNLOTHER", "BPNLERROR"])
+
+        assert (shell, bpn) == (None, None)
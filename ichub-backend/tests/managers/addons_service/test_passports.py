@@ -0,0 +1,210 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+from sqlmodel import select
+
+from managers.addons_service.ecopass_kit.v1.passports import MAX_INDEX_ATTEMPTS, PassportsManager
+from managers.metadata_database.manager import RepositoryManager, RepositoryManagerFactory
+from managers.metadata_database.repositories import PassportRepository
+from models.metadata_database.provider.models import (
+    BusinessPartner,
+    CatalogPart,
+    DataExchangeAgreement,
+    PartnerCatalogPart,
+    Passport,
+    PassportIndexFailure,
+    SerializedPart,
+    Twin,
+    TwinAspect,
+    TwinExchange,
+)
+from tests.managers.metadata_database.test_part_repositories import ProviderDatabaseTest
+
+DPP_SEMANTIC_ID = "urn:samm:io.catenax.generic.digital_product_passport:6.1.0#DigitalProductPassport"
+
+
+def _passport_document(index: int) -> dict:
+    return {"metadata": {"passportId": f"passport-{index}", "issueDate": f"2025-0{index + 1}-01", "expirationDate": f"2030-0{index + 1}-01"}}
+
+
+class TestPassports(ProviderDatabaseTest):
+    """Test cases for the passport metadata and the passport listing, using SQLite as database."""
+
+    def _create_passport_aspects(self, count: int) -> None:
+        """Create twins of catalog parts (even indexes) and serialized parts (odd indexes) with a passport aspect each."""
+        for index in range(count):
+            twin = Twin()
+            catalog_part = CatalogPart(manufacturer_part_id=f"MPI-{index}", name=f"Part {index}", legal_entity_id=self.legal_entity_id)
+            if index % 2 == 0:
+                catalog_part.twin = twin
+                self.session.add(catalog_part)
+            else:
+                business_partner = BusinessPartner(name=f"Partner {index}", bpnl=f"BPNL{index:012d}")
+                partner_catalog_part = PartnerCatalogPart(catalog_part=catalog_part, business_partner=business_partner, customer_part_id=f"CPI-{index}")
+                self.session.add(SerializedPart(partner_catalog_part=partner_catalog_part, part_instance_id=f"PI-{index}", twin=twin))
+            self.session.add(TwinAspect(twin=twin, semantic_id=DPP_SEMANTIC_ID))
+            self.session.add(TwinAspect(twin=twin, semantic_id="urn:samm:io.catenax.part_type_information:1.0.0#PartTypeInformation"))
+        self.session.commit()
+
+    def _share_twin(self, twin_id: int) -> None:
+        business_partner = BusinessPartner(name="Customer", bpnl="BPNL0000000000CU")
+        agreement = DataExchangeAgreement(name="Default", business_partner=business_partner)
+        self.session.add(agreement)
+        self.session.flush()
+        self.session.add(TwinExchange(twin_id=twin_id, data_exchange_agreement_id=agreement.id))
+        self.session.commit()
+
+    def _index_all(self, repository: PassportRepository) -> None:
+        for index, twin_aspect in enumerate(repository.find_unindexed_twin_aspects()):
+            repository.index_twin_aspect(twin_aspect, _passport_document(index))
+        self.session.commit()
+
+    def _create_manager(self) -> PassportsManager:
+        manager = PassportsManager.__new__(PassportsManager)
+        manager.submodel_service_manager = MagicMock()
+        manager.submodel_service_manager.get_twin_aspect_document.side_effect = lambda submodel_id, semantic_id: _passport_document(0)
+        return manager
+
+    def test_only_passport_aspects_are_indexed_with_their_part(self):
+        """Only the passport aspects get metadata, taken from the document and the part of the twin."""
+        self._create_passport_aspects(2)
+        repository = PassportRepository(self.session)
+        twin_aspects = repository.find_unindexed_twin_aspects()
+        assert [twin_aspect.semantic_id for twin_aspect in twin_aspects] == [DPP_SEMANTIC_ID, DPP_SEMANTIC_ID]
+
+        other_aspect = self.session.exec(select(TwinAspect).where(TwinAspect.semantic_id != DPP_SEMANTIC_ID)).first()
+        assert repository.index_twin_aspect(other_aspect, _passport_document(0)) is None
+        self._index_all(repository)
+
+        passports = self.session.exec(select(Passport).order_by(Passport.twin_aspect_id)).all()
+        assert [(passport.part_type, passport.part_instance_id, passport.passport_id) for passport in passports] == [
+            ("catalog", None, "passport-0"),
+            ("serialized", "PI-1", "passport-1"),
+        ]
+        assert all(passport.catalog_part_id is not None for passport in passports)
+        assert repository.find_unindexed_twin_aspects() == []
+
+    def test_reindexing_updates_the_metadata(self):
+        """Writing a passport again replaces its metadata instead of adding a row."""
+        self._create_passport_aspects(1)
+        repository = PassportRepository(self.session)
+        self._index_all(repository)
+
+        twin_aspect = self.session.exec(select(TwinAspect).where(TwinAspect.semantic_id == DPP_SEMANTIC_ID)).one()
+        repository.index_twin_aspect(twin_aspect, {"metadata": {"passportId": "passport-new", "issueDate": "2026-01-01T10:30:00Z"}})
+        self.session.commit()
+
+        passport = self.session.exec(select(Passport)).one()
+        assert passport.passport_id == "passport-new"
+        assert passport.issue_date == date(2026, 1, 1)
+        assert passport.expiration_date is None
+
+    def test_unparseable_dates_are_not_stored(self):
+        """A date that is not ISO 8601 is stored as missing instead of being compared as text."""
+        self._create_passport_aspects(1)
+        twin_aspect = self.session.exec(select(TwinAspect).where(TwinAspect.semantic_id == DPP_SEMANTIC_ID)).one()
+        PassportRepository(self.session).index_twin_aspect(twin_aspect, {"metadata": {"issueDate": "01/02/2025", "expirationDate": "2030-12-31"}})
+        self.session.commit()
+
+        passport = self.session.exec(select(Passport)).one()
+        assert passport.issue_date is None
+        assert passport.expiration_date == date(2030, 12, 31)
+
+    def test_page_filters(self):
+        """The passports are filtered by status, part and date ranges."""
+        self._create_passport_aspects(4)
+        repository = PassportRepository(self.session)
+        self._index_all(repository)
+        shared_twin_id = self.session.exec(select(Passport).where(Passport.passport_id == "passport-2")).one().twin_id
+        self._share_twin(shared_twin_id)
+
+        def passport_ids(**filters):
+            return [passport.passport_id for passport, *_ in repository.find_page(**filters)]
+
+        assert passport_ids() == ["passport-0", "passport-1", "passport-2", "passport-3"]
+        assert passport_ids(status="shared") == ["passport-2"]
+        assert passport_ids(status="active") == ["passport-0", "passport-1", "passport-3"]
+        assert passport_ids(part_type="serialized") == ["passport-1", "passport-3"]
+        assert passport_ids(manufacturer_part_id="MPI-3") == ["passport-3"]
+        assert passport_ids(part_instance_id="PI-1") == ["passport-1"]
+        assert passport_ids(min_incl_issue_date=date(2025, 2, 1), max_excl_issue_date=date(2025, 4, 1)) == ["passport-1", "passport-2"]
+        assert passport_ids(min_incl_expiration_date=date(2030, 4, 1)) == ["passport-3"]
+        assert repository.count_page(part_type="catalog") == 2
+
+    def test_listing_pages_without_reading_the_documents(self):
+        """The listing is paged from the metadata and never reads the passport documents."""
+        self._create_passport_aspects(3)
+        self._index_all(PassportRepository(self.session))
+        self.session.expunge_all()
+        manager = self._create_manager()
+
+        with patch.object(RepositoryManagerFactory, "create", side_effect=lambda: RepositoryManager(self.session)):
+            first_page = manager.get_passports_page(limit=2, include_total=True)
+            second_page = manager.get_passports_page(limit=2, cursor=first_page.next_cursor)
+
+        assert [dpp.passport_id for dpp in first_page.items] == ["passport-0", "passport-1"]
+        assert first_page.total == 3
+        assert [dpp.passport_id for dpp in second_page.items] == ["passport-2"]
+        assert second_page.next_cursor is None
+
+        dpp = first_page.items[1]
+        assert (dpp.part_type, dpp.manufacturer_part_id, dpp.part_instance_id, dpp.name) == ("serialized", "MPI-1", "PI-1", "Part 1")
+        assert dpp.status == "active"
+        assert dpp.version == "6.1.0"
+        assert (dpp.issue_date, dpp.expiration_date) == ("2025-02-01", "2030-02-01")
+        manager.submodel_service_manager.get_twin_aspect_document.assert_not_called()
+
+    def test_missing_passports_are_indexed_from_their_documents(self):
+        """Passports without metadata are indexed once from their documents."""
+        self._create_passport_aspects(2)
+        manager = self._create_manager()
+
+        with patch.object(RepositoryManagerFactory, "create", side_effect=lambda: RepositoryManager(self.session)):
+            assert manager.index_missing_passports() == 2
+            assert manager.index_missing_passports() == 0
+
+        assert manager.submodel_service_manager.get_twin_aspect_document.call_count == 2
+        assert PassportRepository(self.session).count() == 2
+
+    def test_failing_passports_are_given_up_after_the_max_attempts(self):
+        """A passport whose document cannot be read is recorded and no longer retried after MAX_INDEX_ATTEMPTS runs."""
+        self._create_passport_aspects(1)
+        manager = self._create_manager()
+        manager.submodel_service_manager.get_twin_aspect_document.side_effect = FileNotFoundError("missing document")
+
+        with patch.object(RepositoryManagerFactory, "create", side_effect=lambda: RepositoryManager(self.session)):
+            for _ in range(MAX_INDEX_ATTEMPTS + 2):
+                assert manager.index_missing_passports() == 0
+
+        assert manager.submodel_service_manager.get_twin_aspect_document.call_count == MAX_INDEX_ATTEMPTS
+        failure = self.session.exec(select(PassportIndexFailure)).one()
+        assert (failure.attempts, failure.error) == (MAX_INDEX_ATTEMPTS, "missing document")
+
+        # Writing the passport again indexes it and clears the failure
+        twin_aspect = self.session.get(TwinAspect, failure.twin_aspect_id)
+        PassportRepository(self.session).index_twin_aspect(twin_aspect, _passport_document(0))
+        self.session.commit()
+        assert self.session.exec(select(PassportIndexFailure)).all() == []
@@ -0,0 +1,163 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import os
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+
+from managers.addons_service.ecopass_kit.v1.discovery import DiscoveryTaskManager
+from managers.addons_service.ecopass_kit.v1.task_store import MemoryDiscoveryTaskStore, PostgresDiscoveryTaskStore
+
+SHELL = {"id": "urn:uuid:shell", "submodelDescriptors": []}
+PASSPORT = {"metadata": {"passportIdentifier": "urn:uuid:passport"}, "characteristics": {"text": "x" * 2048}}
+
+
+class TestMemoryDiscoveryTaskStore:
+    """Test cases for the in-process discovery task store."""
+
+    def setup_method(self):
+        """Setup method called before each test."""
+        self.task_manager = DiscoveryTaskManager(MemoryDiscoveryTaskStore(ttl=60, max_entries=2, spill_threshold=1024))
+
+    def test_large_payloads_are_spilled_and_read_on_demand(self):
+        """Payloads above the spill threshold are kept in a file and only read with the task payloads."""
+        self.task_manager.create_task("task-1")
+        self.task_manager.update_task("task-1", "complete", "Done", 100, status="completed", digital_twin=SHELL, data=PASSPORT)
+
+        assert os.listdir(self.task_manager.store.spill_dir) != []
+        task = self.task_manager.get_task("task-1")
+        assert task["status"] == "completed"
+        assert task["digital_twin"] == SHELL
+        assert task["data"] == PASSPORT
+        assert self.task_manager.store.get("task-1", include_payloads=False)["data"] is None
+
+    def test_oldest_task_is_evicted_with_its_spilled_payload(self):
+        """Beyond the maximum number of tasks the oldest one is removed, with its payload file."""
+        self.task_manager.create_task("task-1")
+        self.task_manager.update_task("task-1", "complete", "Done", 100, status="completed", data=PASSPORT)
+        self.task_manager.create_task("task-2")
+        self.task_manager.create_task("task-3")
+
+        assert not self.task_manager.task_exists("task-1")
+        assert self.task_manager.task_exists("task-3")
+        assert os.listdir(self.task_manager.store.spill_dir) == []
+
+    def test_tasks_expire_after_their_ttl(self):
+        """A task can no longer be polled once its TTL has passed."""
+        with patch("utils.bounded_ttl_cache.time.monotonic", return_value=1000):
+            self.task_manager.create_task("task-1")
+        with patch("utils.bounded_ttl_cache.time.monotonic", return_value=1061):
+            assert self.task_manager.get_task("task-1") is None
+
+    def test_expired_tasks_are_swept_with_their_files_on_create(self):
+        """Creating a task removes the expired ones and their payload files, an expired task is not updated."""
+        with patch("utils.bounded_ttl_cache.time.monotonic", return_value=1000):
+            self.task_manager.create_task("task-1")
+            self.task_manager.update_task("task-1", "complete", "Done", 100, status="completed", data=PASSPORT)
+        with patch("utils.bounded_ttl_cache.time.monotonic", return_value=1061):
+            self.task_manager.update_task("task-1", "complete", "Done", 100, data=PASSPORT)
+            self.task_manager.create_task("task-2")
+
+            assert len(self.task_manager.store) == 1
+            assert self.task_manager.get_task("task-1") is None
+        assert os.listdir(self.task_manager.store.spill_dir) == []
+
+    def test_mark_failed_keeps_the_failing_step(self):
+        """A failed task keeps the step and progress it failed at."""
+        self.task_manager.create_task("task-1")
+        self.task_manager.update_task("task-1", "retrieving_twin", "Retrieving...", 50)
+        self.task_manager.mark_failed("task-1", "No shell found")
+
+        task = self.task_manager.get_task("task-1")
+        assert (task["status"], task["step"], task["progress"], task["error"]) == ("failed", "retrieving_twin", 50, "No shell found")
+
+
+class TestPostgresDiscoveryTaskStore:
+    """Test cases for the database-backed discovery task store shared by the workers."""
+
+    @pytest.fixture(autouse=True)
+    def setup_stores(self):
+        """Two stores on the same database, standing in for two workers of the API."""
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        self.worker = DiscoveryTaskManager(PostgresDiscoveryTaskStore(engine, ttl=60, max_entries=2, table_name="test_discovery_tasks", prune_interval=0))
+        self.other_worker = DiscoveryTaskManager(PostgresDiscoveryTaskStore(engine, ttl=60, max_entries=2, table_name="test_discovery_tasks", prune_interval=0))
+
+    def test_task_is_polled_from_another_worker(self):
+        """The status and payloads written by the worker running the task are read by the others."""
+        self.worker.create_task("task-1")
+        self.worker.update_task("task-1", "complete", "Done", 100, status="completed", digital_twin=SHELL, data=PASSPORT)
+
+        task = self.other_worker.get_task("task-1")
+        assert (task["status"], task["step"], task["progress"]) == ("completed", "complete", 100)
+        assert task["digital_twin"] == SHELL
+        assert task["data"] == PASSPORT
+        assert self.other_worker.store.get("task-1", include_payloads=False)["data"] is None
+
+    def test_expired_tasks_are_hidden_and_pruned(self):
+        """Expired tasks are not returned, and removed with their payloads when new tasks are created."""
+        self.worker.create_task("task-1")
+        self.worker.update_task("task-1", "complete", "Done", 100, status="completed", data=PASSPORT)
+
+        later = datetime.now() + timedelta(seconds=61)
+        with patch("managers.addons_service.ecopass_kit.v1.task_store.datetime") as mocked_datetime:
+            mocked_datetime.now.return_value = later
+            assert self.worker.get_task("task-1") is None
+            self.worker.create_task("task-2")
+
+        store = self.worker.store
+        assert store.get("task-2") is not None
+        with store.engine.connect() as connection:
+            assert connection.exec_driver_sql("SELECT COUNT(*) FROM test_discovery_tasks_payloads").scalar() == 0
+
+    def test_expired_tasks_are_pruned_without_new_tasks(self):
+        """Reading or updating tasks prunes the expired ones, an expired task is never updated again."""
+        self.worker.create_task("task-1")
+        self.worker.update_task("task-1", "complete", "Done", 100, status="completed", data=PASSPORT)
+        store = self.worker.store
+
+        later = datetime.now() + timedelta(seconds=61)
+        with patch("managers.addons_service.ecopass_kit.v1.task_store.datetime") as mocked_datetime:
+            mocked_datetime.now.return_value = later
+            store.prune_interval = 3600
+            store._last_prune = None
+            self.worker.update_task("task-1", "complete", "Done", 100, status="running")
+            assert self.other_worker.get_task("task-1") is None
+
+        with store.engine.connect() as connection:
+            assert connection.exec_driver_sql("SELECT COUNT(*) FROM test_discovery_tasks").scalar() == 0
+            assert connection.exec_driver_sql("SELECT COUNT(*) FROM test_discovery_tasks_payloads").scalar() == 0
+
+    def test_oldest_tasks_are_pruned_beyond_max_entries(self):
+        """Creating a task beyond the maximum number of tasks removes the oldest one."""
+        for index in range(3):
+            with patch("managers.addons_service.ecopass_kit.v1.task_store.datetime") as mocked_datetime:
+                mocked_datetime.now.return_value = datetime.now() + timedelta(seconds=index)
+                self.worker.create_task(f"task-{index}")
+
+        assert not self.other_worker.task_exists("task-0")
+        assert self.other_worker.task_exists("task-1")
+        assert self.other_worker.task_exists("task-2")
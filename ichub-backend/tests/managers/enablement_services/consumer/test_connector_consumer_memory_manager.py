@@ -0,0 +1,159 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import logging
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from managers.enablement_services.consumer.connector.memory.connector_consumer_memory_manager import ConnectorConsumerMemoryManager
+
+BPN = "BPNL0000000000AA"
+
+
+class TestConnectorConsumerMemoryManagerReadOnlyEntries:
+    """Test cases for the read-only connector cache entries shared by cache hits."""
+
+    def setup_method(self):
+        """Setup method called before each test."""
+        self.connector_discovery = Mock()
+        self.manager = ConnectorConsumerMemoryManager(
+            connector_consumer_service=Mock(),
+            connector_discovery=self.connector_discovery,
+            logger=logging.getLogger("test")
+        )
+        self.manager.add_connectors(BPN, ["https://edc-a", "https://edc-b"])
+
+    def test_cache_hits_share_the_cached_connectors(self):
+        """Cache hits return the cached read-only sequence without discovering again."""
+        first = self.manager.get_connectors(BPN)
+
+        assert first == ("https://edc-a", "https://edc-b")
+        assert self.manager.get_connectors(BPN) is first
+        self.connector_discovery.find_connector_by_bpn.assert_not_called()
+        with pytest.raises(TypeError):
+            self.manager.known_connectors[BPN][self.manager.CONNECTOR_LIST_KEY] = []
+
+    def test_delete_replaces_the_entry(self):
+        """Deleting a connector does not change sequences already handed out."""
+        before = self.manager.get_connectors(BPN)
+
+        self.manager.delete_connector(BPN, "https://edc-a")
+
+        assert before == ("https://edc-a", "https://edc-b")
+        assert self.manager.get_connectors(BPN) == ("https://edc-b",)
+
+
+class TestConnectorConsumerMemoryManagerSingleFlightDiscovery:
+    """Test cases for the de-duplication of concurrent connector discoveries of the same BPN."""
+
+    def setup_method(self):
+        """Setup method called before each test."""
+        self.connector_discovery = Mock()
+        self.manager = ConnectorConsumerMemoryManager(
+            connector_consumer_service=Mock(),
+            connector_discovery=self.connector_discovery,
+            logger=logging.getLogger("test")
+        )
+
+    def test_concurrent_calls_share_one_discovery(self):
+        """Callers arriving while a BPN is discovered wait for that discovery and get its connectors."""
+        def find_connector_by_bpn(bpn):
+            time.sleep(0.2)
+            return ["https://edc-a"]
+
+        self.connector_discovery.find_connector_by_bpn.side_effect = find_connector_by_bpn
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(self.manager.get_connectors(BPN))) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert results == [("https://edc-a",)] * 4
+        assert self.connector_discovery.find_connector_by_bpn.call_count == 1
+        metrics = self.manager.get_metrics()["connectorDiscovery"]
+        assert metrics["executions"] == 1
+        assert metrics["coalesced"] == 3
+
+    def test_bpn_without_connectors_is_discovered_again(self):
+        """An empty discovery is not cached, the next call discovers again."""
+        self.connector_discovery.find_connector_by_bpn.return_value = []
+
+        assert self.manager.get_connectors(BPN) == []
+        assert self.manager.get_connectors(BPN) == []
+        assert self.connector_discovery.find_connector_by_bpn.call_count == 2
+
+
+class TestConnectorConsumerMemoryManagerStaleWhileRevalidate:
+    """Test cases for serving expired connectors while they are refreshed in the background."""
+
+    def setup_method(self):
+        """Setup method called before each test."""
+        self.connector_discovery = Mock()
+        self.manager = ConnectorConsumerMemoryManager(
+            connector_consumer_service=Mock(),
+            connector_discovery=self.connector_discovery,
+            logger=logging.getLogger("test"),
+            stale_grace=60
+        )
+        self.manager.add_connectors(BPN, ["https://edc-a"])
+
+    def _expire(self, seconds_ago):
+        self.manager.known_connectors[BPN] = self.manager._create_connector_cache_entry(
+            refresh_interval=time.time() - seconds_ago,
+            connectors=self.manager.known_connectors[BPN][self.manager.CONNECTOR_LIST_KEY]
+        )
+
+    def test_expired_connectors_are_served_while_refreshed(self):
+        """Within the grace window the expired connectors are returned at once and refreshed in the background."""
+        refreshed = threading.Event()
+
+        def find_connector_by_bpn(bpn):
+            refreshed.set()
+            return ["https://edc-b"]
+
+        self.connector_discovery.find_connector_by_bpn.side_effect = find_connector_by_bpn
+        self._expire(10)
+
+        assert self.manager.get_connectors(BPN) == ("https://edc-a",)
+        assert refreshed.wait(timeout=2)
+        for _ in range(100):
+            if not self.manager._is_cache_expired(BPN):
+                break
+            time.sleep(0.01)
+        assert not self.manager._is_cache_expired(BPN)
+        assert self.manager.get_connectors(BPN) == ("https://edc-b",)
+        assert self.manager.get_metrics()["connectorCacheRefresh"]["staleHits"] == 1
+
+    def test_without_grace_window_callers_wait_for_the_discovery(self):
+        """With a grace window of 0 expired connectors are never served."""
+        self.manager.refresh_policy.stale_grace = 0
+        self.connector_discovery.find_connector_by_bpn.return_value = ["https://edc-a"]
+        self._expire(10)
+
+        assert self.manager.get_connectors(BPN) == ("https://edc-a",)
+        self.connector_discovery.find_connector_by_bpn.assert_called_once_with(bpn=BPN)
+        assert self.manager.get_metrics()["connectorDiscovery"]["background"] == 0
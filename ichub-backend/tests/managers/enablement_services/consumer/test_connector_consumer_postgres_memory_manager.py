@@ -0,0 +1,118 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import logging
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import event
+from sqlmodel import Session, select
+
+from managers.enablement_services.consumer.connector.database.connector_consumer_postgres_memory_manager import ConsumerConnectorPostgresMemoryManager
+
+
+class TestConsumerConnectorPostgresMemoryManagerPersistence:
+    """Test cases for the persistence and replica sync of ConsumerConnectorPostgresMemoryManager, using SQLite as database."""
+
+    @pytest.fixture(autouse=True, scope="class")
+    def managers(self, request, sqlite_engine):
+        """Create the managers once, the table model can only be bound to one table per process."""
+        request.cls.engine = sqlite_engine
+        request.cls.manager = self._create_manager(sqlite_engine)
+        # A second manager on the same table stands in for another replica
+        request.cls.replica = self._create_manager(sqlite_engine)
+
+    @staticmethod
+    def _create_manager(engine):
+        manager = ConsumerConnectorPostgresMemoryManager(
+            connector_consumer_service=Mock(),
+            engine=engine,
+            connector_discovery=Mock(),
+            logger=logging.getLogger("test")
+        )
+        # Persist synchronously to keep the tests deterministic
+        manager._trigger_save = lambda: None
+        return manager
+
+    def setup_method(self):
+        """Setup method called before each test."""
+        self.manager.purge_cache()
+        self.manager._save_to_db()
+        self.replica._load_from_db()
+        self.listeners = []
+
+    def teardown_method(self):
+        """Teardown method called after each test."""
+        for listener in self.listeners:
+            event.remove(self.engine, "before_cursor_execute", listener)
+
+    def _rows(self):
+        with Session(self.engine) as session:
+            return sorted((row.bpnl, tuple(row.connectors)) for row in session.exec(select(self.manager.KnownConnectorsModel)).all())
+
+    def _record_statements(self):
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append((statement, parameters))
+
+        event.listen(self.engine, "before_cursor_execute", before_cursor_execute)
+        self.listeners.append(before_cursor_execute)
+        return statements
+
+    def test_only_changed_bpns_are_written(self):
+        """Saving after a change only touches the row of the changed BPN."""
+        self.manager.add_connectors("BPNL_A", ["https://edc-a"])
+        self.manager.add_connectors("BPNL_B", ["https://edc-b"])
+        self.manager._save_to_db()
+
+        statements = self._record_statements()
+        self.manager.delete_connector("BPNL_B", "https://edc-b")
+        self.manager.add_connectors("BPNL_C", ["https://edc-c"])
+        self.manager._save_to_db()
+
+        assert not any("BPNL_A" in str(parameters) for _, parameters in statements)
+        assert self._rows() == [("BPNL_A", ("https://edc-a",)), ("BPNL_B", ()), ("BPNL_C", ("https://edc-c",))]
+
+    def test_replica_reloads_only_changed_bpns(self):
+        """Another replica picks up the changes without reading the unchanged BPNs."""
+        self.manager.add_connectors("BPNL_A", ["https://edc-a"])
+        self.manager.add_connectors("BPNL_B", ["https://edc-b"])
+        self.manager._save_to_db()
+        self.replica._load_changes_from_db()
+        assert self.replica.known_connectors["BPNL_A"][self.replica.CONNECTOR_LIST_KEY] == ("https://edc-a",)
+
+        self.manager.purge_bpn("BPNL_A")
+        self.manager.purge_bpn("BPNL_B")
+        self.manager.add_connectors("BPNL_B", ["https://edc-b2"])
+        self.manager._save_to_db()
+        statements = self._record_statements()
+        self.replica._load_changes_from_db()
+
+        assert "BPNL_A" not in self.replica.known_connectors
+        assert self.replica.known_connectors["BPNL_B"][self.replica.CONNECTOR_LIST_KEY] == ("https://edc-b2",)
+        assert len(statements) == 2
+
+        statements.clear()
+        self.replica._load_changes_from_db()
+        assert len(statements) == 1
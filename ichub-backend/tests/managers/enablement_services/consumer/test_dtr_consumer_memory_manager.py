@@ -0,0 +1,699 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import base64
+import json
+import logging
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from managers.enablement_services.consumer.dtr.memory.dtr_consumer_memory_manager import DtrConsumerMemoryManager
+from managers.enablement_services.consumer.dtr.pagination_manager import PaginationManager
+from managers.enablement_services.consumer.dtr.shell_fetch_executor import ShellFetchExecutor
+from managers.enablement_services.consumer.dtr.shell_descriptor_cache import ShellDescriptorCache
+from managers.enablement_services.consumer.edr_token_cache import EdrTokenCache
+from managers.enablement_services.consumer.negotiation_backoff import NegotiationBackoff
+from tools.exceptions import NotAvailableError
+
+BPN = "BPNL0000000000AA"
+
+
+class TestDtrConsumerMemoryManagerDiscoverShells:
+    """Test cases for the DTR fan-out in DtrConsumerMemoryManager.discover_shells."""
+
+    def setup_method(self):
+        """Setup method called before each test."""
+        self.connector_consumer_manager = Mock()
+        self.manager = DtrConsumerMemoryManager(
+            connector_consumer_manager=self.connector_consumer_manager,
+            logger=logging.getLogger("test"),
+            max_dtr_workers=5,
+            dtr_timeout=0.5
+        )
+        for index in range(3):
+            self.manager.add_dtr(BPN, f"https://edc-{index}", f"dtr-{index}", [{"odrl:permission": {}}])
+
+    def _dtr_result(self, dtr, shells, cursor=None):
+        return {
+            "connectorUrl": dtr["connector_url"],
+            "assetId": dtr["asset_id"],
+            "status": "connected",
+            "shellsFound": len(shells),
+            "shells": shells,
+            "shellDescriptors": {shell: {"id": shell} for shell in shells},
+            "paging_metadata": {"cursor": cursor} if cursor else {}
+        }
+
+    def test_dtrs_are_queried_concurrently(self):
+        """All DTRs are queried at the same time instead of one after another."""
+        barrier = threading.Barrier(3, timeout=2)
+
+        def process(connector_service, counter_party_id, dtr, query_spec, dtr_policies, limit=None, cursor=None):
+            barrier.wait()
+            return self._dtr_result(dtr, [f"shell-{dtr['asset_id']}"])
+
+        self.manager._process_dtr_with_retry = process
+
+        result = self.manager.discover_shells(BPN, [{"name": "manufacturerPartId", "value": "MPI"}])
+
+        assert [dtr["assetId"] for dtr in result["dtrs"]] == ["dtr-0", "dtr-1", "dtr-2"]
+        assert result["shellsFound"] == 3
+
+    def test_slow_dtr_is_reported_as_timeout_and_stays_resumable(self):
+        """A DTR missing its deadline does not fail the page and keeps its cursor."""
+        release = threading.Event()
+
+        def process(connector_service, counter_party_id, dtr, query_spec, dtr_policies, limit=None, cursor=None):
+            if dtr["asset_id"] == "dtr-1":
+                release.wait(5)
+            return self._dtr_result(dtr, [f"shell-{dtr['asset_id']}"], cursor="next")
+
+        self.manager._process_dtr_with_retry = process
+
+        start = time.monotonic()
+        result = self.manager.discover_shells(BPN, [], limit=9)
+        release.set()
+
+        assert time.monotonic() - start < 2
+        statuses = {dtr["assetId"]: dtr["status"] for dtr in result["dtrs"]}
+        assert statuses == {"dtr-0": "connected", "dtr-1": "timeout", "dtr-2": "connected"}
+        assert result["shellsFound"] == 2
+
+        next_page = PaginationManager.decode_page_token(result["pagination"]["next"])
+        assert next_page.dtr_states["dtr-1"].cursor is None
+        assert next_page.dtr_states["dtr-1"].exhausted is False
+        assert next_page.dtr_states["dtr-0"].cursor == "next"
+
+    def test_discoveries_share_one_bounded_pool(self):
+        """Repeated discoveries reuse the worker threads of the manager instead of starting new ones."""
+        threads = set()
+
+        def process(connector_service, counter_party_id, dtr, query_spec, dtr_policies, limit=None, cursor=None):
+            threads.add(threading.current_thread())
+            return self._dtr_result(dtr, [f"shell-{dtr['asset_id']}"])
+
+        self.manager._process_dtr_with_retry = process
+
+        for _ in range(5):
+            self.manager.discover_shells(BPN, [])
+
+        assert len(threads) <= self.manager.max_dtr_workers
+        assert all(thread.name.startswith("dtr-discovery") for thread in threads)
+
+    def test_queued_dtrs_time_out_behind_a_hung_registry(self):
+        """DTRs queued behind hung lookups are reported as timed out instead of blocking the page."""
+        manager = DtrConsumerMemoryManager(connector_consumer_manager=self.connector_consumer_manager, logger=logging.getLogger("test"), max_dtr_workers=1, dtr_timeout=0.3)
+        for index in range(3):
+            manager.add_dtr(BPN, f"https://edc-{index}", f"dtr-{index}", [{"odrl:permission": {}}])
+        release = threading.Event()
+
+        def process(connector_service, counter_party_id, dtr, query_spec, dtr_policies, limit=None, cursor=None):
+            release.wait(5)
+            return self._dtr_result(dtr, [f"shell-{dtr['asset_id']}"])
+
+        manager._process_dtr_with_retry = process
+
+        try:
+            for _ in range(2):
+                start = time.monotonic()
+                result = manager.discover_shells(BPN, [])
+                assert time.monotonic() - start < 1
+                assert {dtr["status"] for dtr in result["dtrs"]} == {"timeout"}
+        finally:
+            release.set()
+
+    def test_page_keeps_descriptors_evicted_from_the_cache(self):
+        """The page holds every fetched descriptor, even when the bounded cache cannot keep them all."""
+        self.manager.shell_descriptors = ShellDescriptorCache(max_entries=1, ttl=60)
+
+        def process(connector_service, counter_party_id, dtr, query_spec, dtr_policies, limit=None, cursor=None):
+            result = self._dtr_result(dtr, [f"shell-{dtr['asset_id']}"])
+            for shell_id, shell in result["shellDescriptors"].items():
+                self.manager.shell_descriptors.put(BPN, dtr["asset_id"], shell_id, shell)
+            return result
+
+        self.manager._process_dtr_with_retry = process
+
+        result = self.manager.discover_shells(BPN, [])
+
+        assert [shell["id"] for shell in result["shellDescriptors"]] == ["shell-dtr-0", "shell-dtr-1", "shell-dtr-2"]
+        assert all("shellDescriptors" not in dtr for dtr in result["dtrs"])
+        assert len(self.manager.shell_descriptors) == 1
+
+    def test_sequential_mode_stops_at_limit(self):
+        """With the fan-out disabled DTRs are processed in order until the limit is reached."""
+        self.manager.parallel_dtr_discovery = False
+        calls = []
+
+        def process(connector_service, counter_party_id, dtr, query_spec, dtr_policies, limit=None, cursor=None):
+            calls.append(dtr["asset_id"])
+            return self._dtr_result(dtr, [f"shell-{dtr['asset_id']}-{i}" for i in range(limit)], cursor="next")
+
+        self.manager._process_dtr_with_retry = process
+
+        result = self.manager.discover_shells(BPN, [], limit=2)
+
+        assert calls == ["dtr-0", "dtr-1"]
+        assert result["shellsFound"] == 2
+
+
+class TestShellFetchExecutor:
+    """Test cases for the shared ShellFetchExecutor."""
+
+    def test_concurrency_is_capped_per_dataplane(self):
+        """No more than max_per_dataplane requests run against one dataplane."""
+        executor = ShellFetchExecutor(max_workers=10, max_per_dataplane=2)
+        running = []
+        peak = []
+        lock = threading.Lock()
+
+        def task(item):
+            with lock:
+                running.append(item)
+                peak.append(len(running))
+            time.sleep(0.02)
+            with lock:
+                running.remove(item)
+            return item
+
+        results = executor.run("https://dataplane", task, list(range(8)))
+        executor.shutdown()
+
+        assert [item for item, _, _ in results] == list(range(8))
+        assert max(peak) <= 2
+        metrics = executor.get_metrics()
+        assert metrics["poolSize"] == 10
+        assert metrics["inFlight"] == 0
+        assert metrics["succeeded"] == 8
+
+    def test_failures_are_reported_per_item(self):
+        """A failing item is reported with its error and does not hide the others."""
+        executor = ShellFetchExecutor(max_workers=2, max_per_dataplane=2)
+
+        def task(item):
+            if item == "bad":
+                raise ValueError("boom")
+            return item
+
+        results = executor.run("https://dataplane", task, ["good", "bad"])
+        executor.shutdown()
+
+        assert results == [("good", "good", None), ("bad", None, "boom")]
+        assert executor.get_metrics()["failed"] == 1
+
+    def test_cancelled_items_release_their_slot(self):
+        """Items cancelled by a shutdown free their dataplane slot and count as failed."""
+        executor = ShellFetchExecutor(max_workers=1, max_per_dataplane=5)
+        started = threading.Event()
+        release = threading.Event()
+        results = []
+
+        def task(item):
+            started.set()
+            release.wait(2)
+            return item
+
+        runner = threading.Thread(target=lambda: results.extend(executor.run("https://dataplane", task, ["first", "queued"])))
+        runner.start()
+        assert started.wait(2)
+        executor.shutdown(wait=False)
+        release.set()
+        runner.join(timeout=5)
+
+        assert results[1][2] == "CancelledError"
+        metrics = executor.get_metrics()
+        assert metrics["inFlight"] == 0
+        assert metrics["inFlightByDataplane"] == {}
+        assert metrics["failed"] == 1
+
+
+class TestDtrConsumerMemoryManagerFetchShellDescriptors:
+    """Test cases for DtrConsumerMemoryManager._fetch_shell_descriptors."""
+
+    def test_missing_shells_are_reported_with_an_error(self):
+        """Shells that can not be fetched are listed in the errors instead of being dropped silently."""
+        manager = DtrConsumerMemoryManager(
+            connector_consumer_manager=Mock(),
+            logger=logging.getLogger("test"),
+            shell_fetch_executor=ShellFetchExecutor(max_workers=4, max_per_dataplane=2)
+        )
+        manager._fetch_shell_descriptor = lambda shell_id, dataplane_url, token: {"id": shell_id} if shell_id != "missing" else None
+
+        shells, errors = manager._fetch_shell_descriptors({"result": ["a", "missing", "b"]}, "https://dataplane", "token")
+
+        assert shells == [{"id": "a"}, {"id": "b"}]
+        assert errors == [{"shellId": "missing", "error": "Shell descriptor not found or not accessible"}]
+
+
+class TestDtrConsumerMemoryManagerBatchedShellFetch:
+    """Test cases for reading shell descriptors page by page from registries supporting it."""
+
+    REGISTRY_PROFILE = "https://admin-shell.io/aas/API/3/0/AssetAdministrationShellRegistryServiceSpecification/SSP-002"
+
+    def setup_method(self):
+        """Setup method called before each test."""
+        self.manager = DtrConsumerMemoryManager(
+            connector_consumer_manager=Mock(),
+            logger=logging.getLogger("test"),
+            shell_fetch_executor=ShellFetchExecutor(max_workers=4, max_per_dataplane=2),
+            batch_fetch_threshold=2,
+            batch_page_size=2
+        )
+        self.single_fetches = []
+
+        def fetch_single(shell_id, dataplane_url, token):
+            self.single_fetches.append(shell_id)
+            return {"id": shell_id}
+
+        self.manager._fetch_shell_descriptor = fetch_single
+
+    def _response(self, body, status_code=200):
+        response = Mock(status_code=status_code)
+        response.json.return_value = body
+        return response
+
+    @patch("managers.enablement_services.consumer.dtr.memory.dtr_consumer_memory_manager.HttpTools")
+    def test_descriptors_are_paged_and_capabilities_cached(self, mock_http):
+        """Registries listing descriptors are read page by page, the description is probed once."""
+        pages = {
+            None: self._response({"result": [{"id": "a"}, {"id": "x"}], "paging_metadata": {"cursor": "c1"}}),
+            "c1": self._response({"result": [{"id": "b"}], "paging_metadata": {}}),
+        }
+
+        def do_get(url, headers=None, params=None):
+            if url.endswith("/description"):
+                return self._response({"profiles": [self.REGISTRY_PROFILE]})
+            return pages[params.get("cursor")]
+
+        mock_http.do_get.side_effect = do_get
+
+        for _ in range(2):
+            shells, errors = self.manager._fetch_shell_descriptors(["a", "b"], "https://dataplane", "token", counter_party_id=BPN, dtr_asset_id="dtr-0")
+            assert sorted(shell["id"] for shell in shells) == ["a", "b"]
+            assert errors == []
+
+        description_calls = [call for call in mock_http.do_get.call_args_list if call.kwargs["url"].endswith("/description")]
+        assert len(description_calls) == 1
+        assert self.single_fetches == []
+
+    @patch("managers.enablement_services.consumer.dtr.memory.dtr_consumer_memory_manager.HttpTools")
+    def test_registry_without_listing_falls_back_to_single_fetches(self, mock_http):
+        """Registries without the listing profile keep using one request per shell."""
+        mock_http.do_get.return_value = self._response({}, status_code=404)
+
+        shells, errors = self.manager._fetch_shell_descriptors(["a", "b"], "https://dataplane", "token", counter_party_id=BPN, dtr_asset_id="dtr-0")
+
+        assert sorted(self.single_fetches) == ["a", "b"]
+        assert len(shells) == 2
+        assert self.manager.dtr_capabilities[(BPN, "dtr-0")]["shellDescriptorListing"] is False
+
+
+class TestShellDescriptorCache:
+    """Test cases for the bounded shell descriptor cache."""
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Once full, the least recently used descriptor is evicted."""
+        cache = ShellDescriptorCache(max_entries=2, ttl=60)
+        cache.put(BPN, "dtr-0", "a", {"id": "a"})
+        cache.put(BPN, "dtr-0", "b", {"id": "b"})
+        cache.get(BPN, "dtr-0", "a")
+        cache.put(BPN, "dtr-0", "c", {"id": "c"})
+
+        assert cache.get(BPN, "dtr-0", "b") is None
+        assert cache.get(BPN, "dtr-0", "a") == {"id": "a"}
+        metrics = cache.get_metrics()
+        assert metrics["evictions"] == 1
+        assert metrics["hits"] == 2
+        assert metrics["misses"] == 1
+
+    def test_expired_entries_are_not_served(self):
+        """Descriptors older than the TTL are dropped on access."""
+        cache = ShellDescriptorCache(max_entries=10, ttl=0)
+        cache.put(BPN, "dtr-0", "a", {"id": "a"})
+
+        assert cache.get(BPN, "dtr-0", "a") is None
+        assert cache.get_metrics()["expirations"] == 1
+        assert len(cache) == 0
+
+    def test_discover_shell_is_served_from_cache(self):
+        """A repeated lookup of the same AAS ID does not negotiate again."""
+        connector_consumer_manager = Mock()
+        connector_consumer_manager.connector_service.do_dsp.return_value = ("https://dataplane", "token")
+        manager = DtrConsumerMemoryManager(connector_consumer_manager=connector_consumer_manager, logger=logging.getLogger("test"))
+        manager.add_dtr(BPN, "https://edc-0", "dtr-0", [{"odrl:permission": {}}])
+        manager._fetch_shell_descriptor = Mock(return_value={"id": "urn:uuid:shell"})
+
+        first = manager.discover_shell(BPN, "urn:uuid:shell")
+        second = manager.discover_shell(BPN, "urn:uuid:shell")
+
+        assert first == second
+        assert second["dtr"]["assetId"] == "dtr-0"
+        connector_consumer_manager.connector_service.do_dsp.assert_called_once()
+        manager._fetch_shell_descriptor.assert_called_once()
+
+
+class TestDtrConsumerMemoryManagerReadOnlyEntries:
+    """Test cases for the read-only DTR cache entries shared by cache hits."""
+
+    POLICIES = [{"odrl:permission": {"odrl:action": {"@id": "odrl:use"}, "odrl:constraint": [{"odrl:leftOperand": "cx-policy:UsagePurpose"}]}}]
+
+    def setup_method(self):
+        """Setup method called before each test."""
+        self.connector_consumer_manager = Mock()
+        self.manager = DtrConsumerMemoryManager(connector_consumer_manager=self.connector_consumer_manager, logger=logging.getLogger("test"))
+        self.manager.add_dtr(BPN, "https://edc-0", "dtr-0", self.POLICIES)
+
+    def test_cache_hits_share_read_only_entries(self):
+        """Cache hits return the cached entries themselves, which can not be modified."""
+        first = self.manager.get_dtrs(BPN)
+        second = self.manager.get_dtrs(BPN)
+
+        assert first[0] is second[0]
+        assert first[0] is self.manager.get_dtr_by_asset_id(BPN, "dtr-0")
+        with pytest.raises(TypeError):
+            first[0]["asset_id"] = "other"
+        with pytest.raises(TypeError):
+            first[0]["policies"][0]["odrl:permission"]["odrl:action"] = {}
+
+    def test_policies_are_negotiated_as_plain_structures(self):
+        """The connector SDK receives the cached policies as plain dictionaries and lists."""
+        connector_service = Mock()
+        connector_service.do_dsp.side_effect = RuntimeError("stop")
+
+        self.manager._process_dtr_with_retry(connector_service, BPN, self.manager.get_dtrs(BPN)[0], [], max_retries=0)
+
+        policies = connector_service.do_dsp.call_args.kwargs["policies"]
+        assert policies == self.POLICIES
+        assert type(policies) is list
+        assert type(policies[0]["odrl:permission"]["odrl:constraint"]) is list
+
+
+class TestDtrConsumerMemoryManagerSingleFlightDiscovery:
+    """Test cases for the de-duplication of concurrent DTR discoveries of the same BPN."""
+
+    CATALOG = {"dcat:dataset": [{"@id": "dtr-0", "dct:type": {"@id": "https://w3id.org/catenax/taxonomy#DigitalTwinRegistry"}, "odrl:hasPolicy": [{"odrl:permission": {}}]}]}
+
+    def setup_method(self):
+        """Setup method called before each test."""
+        self.connector_consumer_manager = Mock()
+        self.connector_consumer_manager.get_connectors.return_value = ("https://edc-0",)
+        self.connector_consumer_manager.get_metrics.return_value = {}
+        self.manager = DtrConsumerMemoryManager(connector_consumer_manager=self.connector_consumer_manager, logger=logging.getLogger("test"))
+
+    def _get_dtrs_concurrently(self, callers):
+        results, errors = [], []
+
+        def call():
+            try:
+                results.append(self.manager.get_dtrs(BPN))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=call) for _ in range(callers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+        return results, errors
+
+    def test_concurrent_calls_share_one_discovery(self):
+        """Callers arriving while a BPN is discovered wait for that discovery instead of starting their own."""
+        started = threading.Event()
+
+        def get_catalogs(**kwargs):
+            started.set()
+            time.sleep(0.2)
+            return {"https://edc-0": self.CATALOG}
+
+        self.manager.get_catalogs_by_filter_expression = Mock(side_effect=get_catalogs)
+
+        results, errors = self._get_dtrs_concurrently(5)
+
+        assert errors == []
+        assert self.manager.get_catalogs_by_filter_expression.call_count == 1
+        assert [[dtr["asset_id"] for dtr in result] for result in results] == [["dtr-0"]] * 5
+        metrics = self.manager.get_metrics()["dtrDiscovery"]
+        assert metrics["executions"] == 1
+        assert metrics["coalesced"] == 4
+        assert metrics["inFlight"] == 0
+
+    def test_failed_discovery_is_shared_and_not_cached(self):
+        """A failed discovery answers all the waiting callers, the next call discovers again."""
+        def get_catalogs(**kwargs):
+            time.sleep(0.2)
+            raise RuntimeError("catalog down")
+
+        self.manager.get_catalogs_by_filter_expression = Mock(side_effect=get_catalogs)
+
+        results, errors = self._get_dtrs_concurrently(3)
+
+        assert errors == []
+        assert results == [[]] * 3
+        assert self.manager.get_catalogs_by_filter_expression.call_count == 1
+
+        self.manager.get_catalogs_by_filter_expression = Mock(return_value={"https://edc-0": self.CATALOG})
+        assert [dtr["asset_id"] for dtr in self.manager.get_dtrs(BPN)] == ["dtr-0"]
+
+    def test_discovery_runs_without_verbose_logging(self):
+        """DTRs are discovered whether verbose logging is enabled or not."""
+        self.manager.verbose = False
+        self.manager.get_catalogs_by_filter_expression = Mock(return_value={"https://edc-0": self.CATALOG})
+
+        assert [dtr["asset_id"] for dtr in self.manager.get_dtrs(BPN)] == ["dtr-0"]
+
+
+class TestDtrConsumerMemoryManagerStaleWhileRevalidate:
+    """Test cases for serving expired DTRs while they are refreshed in the background."""
+
+    CATALOG = TestDtrConsumerMemoryManagerSingleFlightDiscovery.CATALOG
+
+    def setup_method(self):
+        """Setup method called before each test."""
+        self.connector_consumer_manager = Mock()
+        self.connector_consumer_manager.get_connectors.return_value = ("https://edc-0",)
+        self.connector_consumer_manager.get_metrics.return_value = {}
+        self.manager = DtrConsumerMemoryManager(connector_consumer_manager=self.connector_consumer_manager, logger=logging.getLogger("test"), stale_grace=60)
+        self.manager.add_dtr(BPN, "https://edc-old", "dtr-old", [])
+
+    def _expire(self, seconds_ago):
+        self.manager.known_dtrs[BPN][self.manager.REFRESH_INTERVAL_KEY] = time.time() - seconds_ago
+
+    def test_expired_dtrs_are_served_while_refreshed(self):
+        """Within the grace window the expired DTRs are returned at once and refreshed in the background."""
+        release = threading.Event()
+
+        def get_catalogs(**kwargs):
+            release.wait(timeout=2)
+            return {"https://edc-0": self.CATALOG}
+
+        self.manager.get_catalogs_by_filter_expression = Mock(side_effect=get_catalogs)
+        self._expire(10)
+
+        assert [dtr["asset_id"] for dtr in self.manager.get_dtrs(BPN)] == ["dtr-old"]
+        assert [dtr["asset_id"] for dtr in self.manager.get_dtrs(BPN)] == ["dtr-old"]
+
+        release.set()
+        for _ in range(100):
+            if self.manager.get_metrics()["dtrDiscovery"]["inFlight"] == 0:
+                break
+            time.sleep(0.01)
+        metrics = self.manager.get_metrics()
+        assert self.manager.get_catalogs_by_filter_expression.call_count == 1
+        assert metrics["dtrDiscovery"]["background"] == 1
+        assert metrics["dtrCacheRefresh"]["staleHits"] == 2
+        assert not self.manager._is_cache_expired(BPN)
+        assert "dtr-0" in self.manager.get_all_asset_ids(BPN)
+
+    def test_dtrs_expired_beyond_the_grace_window_are_discovered_again(self):
+        """After the grace window callers wait for the new discovery."""
+        self.manager.get_catalogs_by_filter_expression = Mock(return_value={"https://edc-0": self.CATALOG})
+        self._expire(120)
+
+        assert "dtr-0" in [dtr["asset_id"] for dtr in self.manager.get_dtrs(BPN)]
+        assert self.manager.get_metrics()["dtrCacheRefresh"]["staleHits"] == 0
+
+    def test_refresh_is_jittered(self):
+        """Entries expire at different times within the jitter, never later than the expiration time."""
+        manager = DtrConsumerMemoryManager(connector_consumer_manager=self.connector_consumer_manager, logger=logging.getLogger("test"), expiration_time=60, refresh_jitter=0.5)
+        for index in range(20):
+            manager.add_dtr(f"BPNL{index}", "https://edc-0", "dtr-0", [])
+
+        remaining = [manager.known_dtrs[f"BPNL{index}"][manager.REFRESH_INTERVAL_KEY] - time.time() for index in range(20)]
+        assert all(1799 <= seconds <= 3600 for seconds in remaining)
+        assert len({round(seconds) for seconds in remaining}) > 1
+
+
+def _jwt(expires_in):
+    claims = base64.urlsafe_b64encode(json.dumps({"exp": time.time() + expires_in}).encode()).decode().rstrip("=")
+    return f"header.{claims}.signature"
+
+
+class TestEdrTokenCache:
+    """Test cases for the EDR token cache."""
+
+    def test_expiry_is_read_from_the_token(self):
+        """Tokens are kept until their exp claim and flagged for refresh within the margin."""
+        cache = EdrTokenCache(refresh_margin=30)
+        key = EdrTokenCache.key(BPN, "https://edc-0", "asset-1", [{"odrl:permission": {}}])
+
+        fresh = cache.put(key, "https://dataplane", _jwt(300))
+        assert cache.get(key) == fresh
+        assert not cache.needs_refresh(fresh)
+
+        lapsing = cache.put(key, "https://dataplane", _jwt(10))
+        assert cache.needs_refresh(lapsing)
+
+        cache.put(key, "https://dataplane", _jwt(-1))
+        assert cache.get(key) is None
+
+    def test_refresh_is_claimed_once_per_margin(self):
+        """A lapsing token is handed out for refresh once until the margin passed or it is invalidated."""
+        cache = EdrTokenCache(refresh_margin=30)
+        key = EdrTokenCache.key(BPN, "https://edc-0", "asset-1", [])
+        lapsing = cache.put(key, "https://dataplane", _jwt(10))
+
+        assert cache.claim_refresh(key, lapsing)
+        assert not cache.claim_refresh(key, lapsing)
+
+        cache.invalidate(key)
+        assert cache.claim_refresh(key, cache.put(key, "https://dataplane", _jwt(10)))
+
+    def test_tokens_without_expiry_use_the_default_ttl(self):
+        """Opaque tokens are kept for the default TTL."""
+        cache = EdrTokenCache(default_ttl=120)
+        key = EdrTokenCache.key(BPN, "https://edc-0", "asset-1", [])
+
+        token = cache.put(key, "https://dataplane", "opaque-token")
+
+        assert 119 <= token.expires_at - time.monotonic() <= 120
+
+
+class TestNegotiationBackoff:
+    """Test cases for the non-blocking negotiation backoff."""
+
+    def test_delay_doubles_after_the_first_retry(self):
+        """The first retry is immediate, further failures double the delay up to the maximum."""
+        backoff = NegotiationBackoff(base_delay=1, max_delay=3)
+
+        assert [backoff.record_failure("key") for _ in range(5)] == [0, 1, 2, 3, 3]
+        assert backoff.remaining("key") > 0
+        backoff.record_success("key")
+        assert backoff.remaining("key") == 0
+
+
+class TestDtrConsumerMemoryManagerEdrTokens:
+    """Test cases for the reuse of negotiated EDR tokens when fetching submodels."""
+
+    def setup_method(self):
+        """Setup method called before each test."""
+        self.connector_consumer_manager = Mock()
+        self.connector_service = self.connector_consumer_manager.connector_service
+        self.connector_consumer_manager.get_metrics.return_value = {}
+        self.manager = DtrConsumerMemoryManager(connector_consumer_manager=self.connector_consumer_manager, logger=logging.getLogger("test"), edr_refresh_margin=30)
+
+    def _negotiate(self):
+        return self.manager._negotiate_asset(BPN, "asset-1", "https://edc-0", [{"odrl:permission": {}}])
+
+    def test_cached_token_is_reused(self):
+        """Repeated fetches of an asset negotiate it once."""
+        token = _jwt(300)
+        self.connector_service.do_dsp_by_asset_id.return_value = ("https://dataplane", token)
+
+        assert self._negotiate() == token
+        assert self._negotiate() == token
+        assert self.connector_service.do_dsp_by_asset_id.call_count == 1
+
+    def test_lapsing_token_is_refreshed_in_the_background(self):
+        """A token expiring within the margin is returned while a new one is negotiated."""
+        lapsing, renewed = _jwt(10), _jwt(300)
+        self.connector_service.do_dsp_by_asset_id.side_effect = [("https://dataplane", lapsing), ("https://dataplane", renewed)]
+
+        assert self._negotiate() == lapsing
+        assert self._negotiate() == lapsing
+        for _ in range(100):
+            if self.manager.get_metrics()["edrNegotiation"]["inFlight"] == 0 and self.connector_service.do_dsp_by_asset_id.call_count == 2:
+                break
+            time.sleep(0.01)
+        assert self._negotiate() == renewed
+
+    def test_failed_refresh_is_not_retried_on_every_use(self):
+        """A lapsing token whose refresh failed does not trigger a negotiation on every use."""
+        lapsing = _jwt(10)
+        self.connector_service.do_dsp_by_asset_id.side_effect = [("https://dataplane", lapsing), ("https://dataplane", None)]
+
+        self._negotiate()
+        self._negotiate()
+        for _ in range(100):
+            if self.manager.get_metrics()["edrNegotiation"]["inFlight"] == 0 and self.connector_service.do_dsp_by_asset_id.call_count == 2:
+                break
+            time.sleep(0.01)
+        for _ in range(5):
+            assert self._negotiate() == lapsing
+
+        assert self.connector_service.do_dsp_by_asset_id.call_count == 2
+
+    @patch("managers.enablement_services.consumer.dtr.memory.dtr_consumer_memory_manager.HttpTools")
+    def test_rejected_token_is_renegotiated_once(self, mock_http_tools):
+        """A token rejected by the dataplane is dropped and the asset renegotiated for a single retry."""
+        policies = [{"odrl:permission": {}}]
+        rejected, renewed = _jwt(300), _jwt(300)
+        self.connector_service.do_dsp_by_asset_id.side_effect = [("https://dataplane", rejected), ("https://dataplane", renewed)]
+        mock_http_tools.do_get.side_effect = [Mock(status_code=401), Mock(status_code=200, json=Mock(return_value={"id": "data"}))]
+        item = {"submodel_id": "sm-1", "assetId": "asset-1", "connectorUrl": "https://edc-0", "policies": policies, "href": "https://dataplane/sm-1"}
+        response = {"submodels": {}, "submodelDescriptors": {"sm-1": {"status": "pending"}}}
+
+        self.manager._fetch_data_parallel(BPN, [item], {"asset-1": self._negotiate()}, response)
+
+        assert response["submodels"]["sm-1"] == {"id": "data"}
+        assert mock_http_tools.do_get.call_args_list[1].kwargs["headers"] == {"Authorization": renewed}
+        assert self.connector_service.do_dsp_by_asset_id.call_count == 2
+        assert self._negotiate() == renewed
+
+    def test_purge_drops_the_cached_token(self):
+        """Purging an asset forces a new negotiation."""
+        self.connector_service.do_dsp_by_asset_id.return_value = ("https://dataplane", _jwt(300))
+        self.connector_service.connection_manager = Mock(spec=["delete_connection"])
+        self.connector_service.connection_manager.delete_connection.return_value = True
+        self._negotiate()
+
+        self.manager._purge_asset_cache(BPN, "asset-1", "https://edc-0", [{"odrl:permission": {}}])
+        self._negotiate()
+
+        assert self.connector_service.do_dsp_by_asset_id.call_count == 2
+
+    def test_failing_negotiation_is_backed_off_without_sleeping(self):
+        """After repeated failures new negotiations fail fast instead of waiting."""
+        self.connector_service.do_dsp_by_asset_id.side_effect = RuntimeError("negotiation failed")
+
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                self._negotiate()
+        started = time.monotonic()
+        with pytest.raises(NotAvailableError):
+            self._negotiate()
+
+        assert time.monotonic() - started < 0.5
+        assert self.connector_service.do_dsp_by_asset_id.call_count == 2
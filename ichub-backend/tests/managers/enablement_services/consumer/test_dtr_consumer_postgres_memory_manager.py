@@ -0,0 +1,237 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import json
+import logging
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import event, inspect, text
+from sqlmodel import Session, select
+
+from managers.enablement_services.consumer.dtr.database.dtr_consumer_postgres_memory_manager import DtrConsumerPostgresMemoryManager
+from managers.enablement_services.consumer.cache_change_log import CacheChangeLog
+
+POLICIES = [{"odrl:permission": {"odrl:action": {"@id": "odrl:use"}}}]
+
+
+class TestDtrConsumerPostgresMemoryManagerPersistence:
+    """Test cases for the incremental persistence of DtrConsumerPostgresMemoryManager, using SQLite as database."""
+
+    @pytest.fixture(autouse=True, scope="class")
+    def managers(self, request, sqlite_engine):
+        """Create the managers once, the table model can only be bound to one table per process."""
+        request.cls.engine = sqlite_engine
+        request.cls.manager = self._create_manager(sqlite_engine)
+        # A second manager on the same table stands in for another replica
+        request.cls.replica = self._create_manager(sqlite_engine)
+
+    @staticmethod
+    def _create_manager(engine):
+        manager = DtrConsumerPostgresMemoryManager(
+            engine=engine,
+            connector_consumer_manager=Mock(),
+            logger=logging.getLogger("test")
+        )
+        # Persist synchronously to keep the tests deterministic
+        manager._trigger_save = lambda: None
+        return manager
+
+    def setup_method(self):
+        """Setup method called before each test."""
+        self.manager.purge_cache()
+        self.manager._save_to_db()
+        self.replica._load_from_db()
+        self.listeners = []
+
+    def teardown_method(self):
+        """Teardown method called after each test."""
+        for listener in self.listeners:
+            event.remove(self.engine, "before_cursor_execute", listener)
+
+    def _rows(self):
+        with Session(self.engine) as session:
+            return sorted((row.bpnl, row.asset_id) for row in session.exec(select(self.manager.KnownDtrsModel)).all())
+
+    def _record_statements(self):
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append((statement, parameters))
+
+        event.listen(self.engine, "before_cursor_execute", before_cursor_execute)
+        self.listeners.append(before_cursor_execute)
+        return statements
+
+    def test_several_dtrs_per_bpn_are_persisted(self):
+        """All DTRs of a BPN are stored and loaded back."""
+        self.manager.add_dtr("BPNL_A", "https://edc-a", "dtr-1", POLICIES)
+        self.manager.add_dtr("BPNL_A", "https://edc-a", "dtr-2", POLICIES)
+        self.manager._save_to_db()
+
+        assert self._rows() == [("BPNL_A", "dtr-1"), ("BPNL_A", "dtr-2")]
+        self.manager.known_dtrs.clear()
+        self.manager._load_from_db()
+        assert sorted(self.manager.get_all_asset_ids("BPNL_A")) == ["dtr-1", "dtr-2"]
+
+    def test_only_changed_bpns_are_written(self):
+        """Saving after a change only touches the rows of the changed BPN."""
+        self.manager.add_dtr("BPNL_A", "https://edc-a", "dtr-1", POLICIES)
+        self.manager.add_dtr("BPNL_B", "https://edc-b", "dtr-2", POLICIES)
+        self.manager._save_to_db()
+
+        statements = self._record_statements()
+        self.manager.add_dtr("BPNL_B", "https://edc-b", "dtr-3", POLICIES)
+        self.manager._save_to_db()
+
+        assert statements
+        assert not any("BPNL_A" in str(parameters) for _, parameters in statements)
+        assert self._rows() == [("BPNL_A", "dtr-1"), ("BPNL_B", "dtr-2"), ("BPNL_B", "dtr-3")]
+
+    def test_nothing_is_written_without_changes(self):
+        """A save without pending changes does not hit the database."""
+        self.manager.add_dtr("BPNL_A", "https://edc-a", "dtr-1", POLICIES)
+        self.manager._save_to_db()
+
+        statements = self._record_statements()
+        self.manager._save_to_db()
+
+        assert statements == []
+
+    def test_deletes_and_purges_are_persisted(self):
+        """Deleted DTRs and purged BPNs are removed from the database."""
+        self.manager.add_dtr("BPNL_A", "https://edc-a", "dtr-1", POLICIES)
+        self.manager.add_dtr("BPNL_A", "https://edc-a", "dtr-2", POLICIES)
+        self.manager.add_dtr("BPNL_B", "https://edc-b", "dtr-3", POLICIES)
+        self.manager._save_to_db()
+
+        self.manager.delete_dtr("BPNL_A", "dtr-1")
+        self.manager.purge_bpn("BPNL_B")
+        self.manager._save_to_db()
+        assert self._rows() == [("BPNL_A", "dtr-2")]
+
+        self.manager.purge_cache()
+        self.manager._save_to_db()
+        assert self._rows() == []
+
+    def test_reload_keeps_unsaved_changes(self):
+        """Reloading from the database does not drop changes that were not saved yet."""
+        self.manager.add_dtr("BPNL_A", "https://edc-a", "dtr-1", POLICIES)
+
+        self.manager._load_from_db()
+
+        assert self.manager.get_all_asset_ids("BPNL_A") == ["dtr-1"]
+
+    def test_replica_reloads_only_changed_bpns(self):
+        """Another replica picks up the changes by reloading only the changed BPNs."""
+        self.manager.add_dtr("BPNL_A", "https://edc-a", "dtr-1", POLICIES)
+        self.manager.add_dtr("BPNL_B", "https://edc-b", "dtr-2", POLICIES)
+        self.manager._save_to_db()
+        self.replica._load_changes_from_db()
+        assert self.replica.get_all_asset_ids("BPNL_A") == ["dtr-1"]
+
+        self.manager.add_dtr("BPNL_B", "https://edc-b", "dtr-3", POLICIES)
+        self.manager._save_to_db()
+        statements = self._record_statements()
+        self.replica._load_changes_from_db()
+
+        assert sorted(self.replica.get_all_asset_ids("BPNL_B")) == ["dtr-2", "dtr-3"]
+        assert self.replica.get_all_asset_ids("BPNL_A") == ["dtr-1"]
+        cache_reads = [parameters for statement, parameters in statements if f"{self.manager.table_name}_changes" not in statement]
+        assert len(cache_reads) == 1
+        assert "BPNL_A" not in str(cache_reads[0])
+
+    def test_replica_sync_without_changes_only_reads_the_change_log(self):
+        """Without changes a sync is a single query on the change log."""
+        self.manager.add_dtr("BPNL_A", "https://edc-a", "dtr-1", POLICIES)
+        self.manager._save_to_db()
+        self.replica._load_changes_from_db()
+
+        statements = self._record_statements()
+        self.replica._load_changes_from_db()
+
+        assert len(statements) == 1
+        assert f"{self.manager.table_name}_changes" in statements[0][0]
+
+    def test_replica_applies_deletes_and_purges(self):
+        """Purged BPNs disappear from the replica, a purge of the whole cache triggers a full reload."""
+        self.manager.add_dtr("BPNL_A", "https://edc-a", "dtr-1", POLICIES)
+        self.manager.add_dtr("BPNL_B", "https://edc-b", "dtr-2", POLICIES)
+        self.manager._save_to_db()
+        self.replica._load_changes_from_db()
+
+        self.manager.purge_bpn("BPNL_A")
+        self.manager._save_to_db()
+        self.replica._load_changes_from_db()
+        assert self.replica.get_all_asset_ids("BPNL_A") == []
+        assert self.replica.get_all_asset_ids("BPNL_B") == ["dtr-2"]
+
+        self.manager.purge_cache()
+        self.manager._save_to_db()
+        self.replica._load_changes_from_db()
+        assert self.replica.get_known_dtrs() == {}
+
+    def test_change_log_waits_for_changes_committed_out_of_order(self):
+        """A change number committed after a higher one is still picked up."""
+        change_log: CacheChangeLog = self.replica._change_log
+        with Session(self.engine) as session:
+            change_log.reset(session)
+            last_id = change_log.last_id
+            session.add(change_log.model(id=last_id + 2, bpnl="BPNL_LATE", changed_at=datetime.now()))
+            session.commit()
+            assert change_log.poll(session) == {"BPNL_LATE"}
+
+            session.add(change_log.model(id=last_id + 1, bpnl="BPNL_SLOW", changed_at=datetime.now()))
+            session.commit()
+            assert change_log.poll(session) == {"BPNL_SLOW"}
+            assert change_log.poll(session) == set()
+
+
+    def test_table_with_bpnl_primary_key_is_migrated(self):
+        """A table created when bpnl alone was the primary key keeps its rows and can then store several DTRs per BPN."""
+        with self.engine.begin() as connection:
+            connection.execute(text("DROP TABLE known_dtrs"))
+            connection.execute(text(
+                "CREATE TABLE known_dtrs (bpnl VARCHAR NOT NULL PRIMARY KEY, edc_url VARCHAR NOT NULL, "
+                "asset_id VARCHAR NOT NULL, policies JSON, expires_at DATETIME NOT NULL)"
+            ))
+            connection.execute(
+                text("INSERT INTO known_dtrs VALUES (:bpnl, :edc_url, :asset_id, :policies, :expires_at)"),
+                {"bpnl": "BPNL_A", "edc_url": "https://edc-a", "asset_id": "dtr-1", "policies": json.dumps(POLICIES),
+                 "expires_at": (datetime.now() + timedelta(hours=1)).isoformat(sep=" ")}
+            )
+
+        self.manager._migrate_primary_key()
+        self.manager._load_from_db()
+
+        assert inspect(self.engine).get_pk_constraint("known_dtrs")["constrained_columns"] == ["bpnl", "asset_id"]
+        assert self.manager.get_all_asset_ids("BPNL_A") == ["dtr-1"]
+
+        self.manager.add_dtr("BPNL_A", "https://edc-a", "dtr-2", POLICIES)
+        self.manager._save_to_db()
+        assert self._rows() == [("BPNL_A", "dtr-1"), ("BPNL_A", "dtr-2")]
+
+        # A migrated table is left untouched
+        self.manager._migrate_primary_key()
+        assert self._rows() == [("BPNL_A", "dtr-1"), ("BPNL_A", "dtr-2")]
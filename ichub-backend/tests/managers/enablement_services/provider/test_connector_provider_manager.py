@@ -0,0 +1,123 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+
+from unittest.mock import Mock
+
+import pytest
+
+from managers.enablement_services.provider.connector_provider_manager import ConnectorProviderManager
+from managers.enablement_services.provider.edc_registration_cache import EdcRegistrationCache
+
+SEMANTIC_ID = "urn:samm:io.catenax.serial_part:3.0.0#SerialPart"
+AGREEMENTS = [{
+    "semanticid": SEMANTIC_ID,
+    "usage": {"permission": [{"action": "odrl:use", "constraints": [{"leftOperand": "cx-policy:Membership", "operator": "odrl:eq", "rightOperand": "active"}]}]},
+    "access": {"permission": []}
+}]
+
+
+class TestConnectorProviderManagerRegistrationCache:
+    """Test cases for the cache of the offers registered in the provider connector."""
+
+    def setup_method(self):
+        """Setup method called before each test."""
+        self.connector_service = Mock()
+        self.connector_service.assets.get_by_id.return_value = Mock(status_code=200)
+        self.connector_service.policies.get_by_id.return_value = Mock(status_code=200)
+        self.connector_service.contract_definitions.get_by_id.return_value = Mock(status_code=200)
+        self.manager = ConnectorProviderManager(
+            connector_provider_service=self.connector_service,
+            ichub_url="https://ichub",
+            agreements=[dict(agreement) for agreement in AGREEMENTS]
+        )
+
+    def _lookups(self):
+        return (self.connector_service.assets.get_by_id.call_count
+                + self.connector_service.policies.get_by_id.call_count
+                + self.connector_service.contract_definitions.get_by_id.call_count)
+
+    def test_registered_offer_is_checked_once(self):
+        """Registering the same offer again does not query the connector."""
+        first = self.manager.register_submodel_bundle_circular_offer(SEMANTIC_ID)
+        lookups = self._lookups()
+
+        second = self.manager.register_submodel_bundle_circular_offer(SEMANTIC_ID)
+
+        assert first == second
+        assert lookups == 4
+        assert self._lookups() == lookups
+        metrics = self.manager.get_metrics()["registrationCache"]
+        assert metrics["hits"] == {"asset": 1, "policy": 2, "contract": 1}
+        assert metrics["misses"] == {"asset": 1, "policy": 2, "contract": 1}
+
+    def test_created_offer_is_cached(self):
+        """Offers created in the connector are not checked again."""
+        for controller in (self.connector_service.assets, self.connector_service.policies, self.connector_service.contract_definitions):
+            controller.get_by_id.return_value = Mock(status_code=404)
+        self.connector_service.create_asset.return_value = {}
+        self.connector_service.create_policy.return_value = {}
+        self.connector_service.create_contract.return_value = {}
+
+        self.manager.register_submodel_bundle_circular_offer(SEMANTIC_ID)
+        lookups = self._lookups()
+        self.manager.register_submodel_bundle_circular_offer(SEMANTIC_ID)
+
+        assert self._lookups() == lookups
+        assert self.connector_service.create_contract.call_count == 1
+
+    def test_configuration_change_drops_the_cache(self):
+        """Changing the configuration the offers are built from checks them again."""
+        self.manager.register_submodel_bundle_circular_offer(SEMANTIC_ID)
+        lookups = self._lookups()
+
+        self.manager.authorization = True
+        self.manager.register_submodel_bundle_circular_offer(SEMANTIC_ID)
+
+        assert self._lookups() == 2 * lookups
+        assert self.manager.get_metrics()["registrationCache"]["invalidations"] == 1
+
+    def test_cached_id_missing_in_the_connector_drops_the_cache(self):
+        """A cached ID reported missing by the connector drops every cached entry."""
+        self.manager.registration_cache.ttl = 0
+        self.manager.register_submodel_bundle_circular_offer(SEMANTIC_ID)
+        self.connector_service.assets.get_by_id.return_value = Mock(status_code=404)
+        self.connector_service.create_asset.return_value = {}
+
+        self.manager.register_submodel_bundle_circular_offer(SEMANTIC_ID)
+
+        assert self.manager.get_metrics()["registrationCache"]["invalidations"] == 1
+        self.connector_service.create_asset.assert_called_once()
+
+    def test_failed_creation_drops_the_cache(self):
+        """A creation rejected by the connector drops the cache, the referenced entries may be gone."""
+        self.manager.register_submodel_bundle_circular_offer(SEMANTIC_ID)
+        self.manager.registration_cache.clear()
+        self.manager.registration_cache.mark_registered(EdcRegistrationCache.ASSET, "ichub:asset:other")
+        self.connector_service.contract_definitions.get_by_id.return_value = Mock(status_code=404)
+        self.connector_service.create_contract.side_effect = ValueError("Failed to create contract")
+
+        with pytest.raises(ValueError):
+            self.manager.register_submodel_bundle_circular_offer(SEMANTIC_ID)
+
+        assert self.manager.get_metrics()["registrationCache"]["size"] == 0
@@ -0,0 +1,204 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import json
+import os
+from datetime import datetime, timezone
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from managers.config.config_manager import ConfigManager
+from managers.enablement_services.submodel_document_cache import SubmodelDocument, SubmodelDocumentCache, SubmodelFile
+from managers.enablement_services.submodel_service_manager import SubmodelServiceManager
+from tools.exceptions import NotFoundError
+
+SEMANTIC_ID = "urn:samm:io.catenax.part_type_information:1.0.0#PartTypeInformation"
+LAST_MODIFIED = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _document(payload) -> SubmodelDocument:
+    return SubmodelDocument.from_payload(payload, LAST_MODIFIED)
+
+
+class TestSubmodelDocument:
+    """Test cases for the serialized submodel documents."""
+
+    def test_etag_depends_on_the_content(self):
+        """Equal payloads get the same entity tag, different payloads a different one."""
+        assert _document({"a": 1}).etag == _document({"a": 1}).etag
+        assert _document({"a": 1}).etag != _document({"a": 2}).etag
+        assert _document({"a": 1}).body == b'{"a":1}'
+
+    def test_if_none_match(self):
+        """Strong and weak tags, lists of tags and the wildcard match."""
+        document = _document({"a": 1})
+
+        assert document.matches(document.etag)
+        assert document.matches(f'"other", W/{document.etag}')
+        assert document.matches("*")
+        assert not document.matches('"other"')
+        assert not document.matches(None)
+
+
+class TestSubmodelDocumentCache:
+    """Test cases for the submodel document cache."""
+
+    def test_least_recently_used_document_is_evicted(self):
+        """Reading a document keeps it, the least recently used one is evicted."""
+        cache = SubmodelDocumentCache(max_entries=2)
+        first, second, third = uuid4(), uuid4(), uuid4()
+        cache.put(SEMANTIC_ID, first, _document(1), cache.generation)
+        cache.put(SEMANTIC_ID, second, _document(2), cache.generation)
+        cache.get(SEMANTIC_ID, first)
+        cache.put(SEMANTIC_ID, third, _document(3), cache.generation)
+
+        assert cache.get(SEMANTIC_ID, second) is None
+        assert cache.get(SEMANTIC_ID, first) is not None
+        assert cache.get_metrics()["evictions"] == 1
+
+    def test_size_is_bounded_by_bytes(self):
+        """Documents are evicted once their total size exceeds the limit, larger ones are not cached."""
+        cache = SubmodelDocumentCache(max_bytes=15)
+        first, second, large = uuid4(), uuid4(), uuid4()
+        cache.put(SEMANTIC_ID, first, _document("x" * 8), cache.generation)
+        cache.put(SEMANTIC_ID, second, _document("y" * 8), cache.generation)
+        cache.put(SEMANTIC_ID, large, _document("z" * 30), cache.generation)
+
+        assert cache.get(SEMANTIC_ID, first) is None
+        assert cache.get(SEMANTIC_ID, second) is not None
+        assert cache.get(SEMANTIC_ID, large) is None
+        assert cache.get_metrics()["bytes"] == 10
+
+    def test_expired_document_is_not_served(self):
+        """Documents older than the TTL are dropped."""
+        cache = SubmodelDocumentCache(ttl=0)
+        submodel_id = uuid4()
+        cache.put(SEMANTIC_ID, submodel_id, _document(1), cache.generation)
+
+        assert cache.get(SEMANTIC_ID, submodel_id) is None
+        assert cache.get_metrics()["expirations"] == 1
+
+    def test_document_read_before_an_invalidation_is_not_stored(self):
+        """A document read while its submodel was written may be outdated and is dropped."""
+        cache = SubmodelDocumentCache()
+        submodel_id = uuid4()
+        generation = cache.generation
+        cache.invalidate(SEMANTIC_ID, submodel_id)
+        cache.put(SEMANTIC_ID, submodel_id, _document(1), generation)
+
+        assert cache.get(SEMANTIC_ID, submodel_id) is None
+
+
+class TestSubmodelServiceManagerDocumentCache:
+    """Test cases for the read-through document cache of SubmodelServiceManager."""
+
+    @pytest.fixture
+    def manager(self, tmp_path):
+        config = {
+            "provider.submodel_dispatcher.mode": "filesystem",
+            "provider.submodel_dispatcher.path": str(tmp_path)
+        }
+        # Patched on the class, other test modules replace the manager module in sys.modules
+        with patch.object(ConfigManager, "get_config", side_effect=lambda key, default=None: config.get(key, default)):
+            yield SubmodelServiceManager()
+        SubmodelServiceManager._document_caches.clear()
+
+    def test_documents_are_read_through_and_invalidated_by_writes(self, manager):
+        """A cached document is served until the submodel is written again."""
+        submodel_id = uuid4()
+        manager.upload_twin_aspect_document(submodel_id, SEMANTIC_ID, {"version": 1})
+
+        first = manager.get_cached_twin_aspect_document(submodel_id, SEMANTIC_ID)
+        assert manager.peek_twin_aspect_document(submodel_id, SEMANTIC_ID) == first
+
+        manager.upload_twin_aspect_document(submodel_id, SEMANTIC_ID, {"version": 2})
+        assert manager.peek_twin_aspect_document(submodel_id, SEMANTIC_ID) is None
+        second = manager.get_cached_twin_aspect_document(submodel_id, SEMANTIC_ID)
+        assert second.body == b'{"version":2}'
+        assert second.etag != first.etag
+
+    def test_managers_of_the_same_storage_share_the_cache(self, manager, tmp_path):
+        """A delete through another manager of the same storage invalidates the cached document."""
+        submodel_id = uuid4()
+        manager.upload_twin_aspect_document(submodel_id, SEMANTIC_ID, {"version": 1})
+        manager.get_cached_twin_aspect_document(submodel_id, SEMANTIC_ID)
+
+        config = {"provider.submodel_dispatcher.path": str(tmp_path)}
+        # Patched on the class, other test modules replace the manager module in sys.modules
+        with patch.object(ConfigManager, "get_config", side_effect=lambda key, default=None: config.get(key, default)):
+            other = SubmodelServiceManager()
+        other.delete_twin_aspect_document(submodel_id, SEMANTIC_ID)
+
+        assert manager.peek_twin_aspect_document(submodel_id, SEMANTIC_ID) is None
+
+    def test_stored_file_is_replaced_on_every_write(self, manager, tmp_path):
+        """Writes replace the file atomically, leaving no temporary file and changing its entity tag."""
+        submodel_id = uuid4()
+        manager.upload_twin_aspect_document(submodel_id, SEMANTIC_ID, {"version": 1})
+        first = manager.get_twin_aspect_document_file(submodel_id, SEMANTIC_ID)
+
+        manager.upload_twin_aspect_document(submodel_id, SEMANTIC_ID, {"version": 2})
+        second = manager.get_twin_aspect_document_file(submodel_id, SEMANTIC_ID)
+
+        assert manager.stores_files
+        assert second.path == first.path
+        assert second.etag != first.etag
+        assert second.size == os.path.getsize(second.path)
+        assert os.listdir(os.path.dirname(second.path)) == [os.path.basename(second.path)]
+
+    def test_only_small_files_are_read_at_once(self, manager):
+        """Small files come with their content, larger ones are left to be streamed from their path."""
+        submodel_id = uuid4()
+        manager.upload_twin_aspect_document(submodel_id, SEMANTIC_ID, {"version": 1})
+
+        small = manager.get_twin_aspect_document_file(submodel_id, SEMANTIC_ID)
+        with patch.object(SubmodelFile, "INLINE_FILE_SIZE", 0):
+            large = manager.get_twin_aspect_document_file(submodel_id, SEMANTIC_ID)
+
+        with open(small.path, "rb") as file:
+            assert small.body == file.read()
+        assert small.file is None
+        assert large.body is None
+        assert large.etag == small.etag
+        assert b"".join(large.iter_content()) == small.body
+        assert large.file.closed
+
+    def test_large_file_streams_the_version_of_its_entity_tag(self, manager):
+        """A file replaced after its metadata was read is still streamed with the content its entity tag names."""
+        submodel_id = uuid4()
+        manager.upload_twin_aspect_document(submodel_id, SEMANTIC_ID, {"version": 1})
+        with patch.object(SubmodelFile, "INLINE_FILE_SIZE", 0), patch.object(SubmodelFile, "CHUNK_SIZE", 4):
+            old = manager.get_twin_aspect_document_file(submodel_id, SEMANTIC_ID)
+            manager.upload_twin_aspect_document(submodel_id, SEMANTIC_ID, {"version": 2})
+
+            assert json.loads(b"".join(old.iter_content())) == {"version": 1}
+            new = manager.get_twin_aspect_document_file(submodel_id, SEMANTIC_ID)
+            new.close()
+            assert new.etag != old.etag
+
+    def test_missing_file_is_not_found(self, manager):
+        """Looking up the file of an unknown submodel raises NotFoundError."""
+        with pytest.raises(NotFoundError):
+            manager.get_twin_aspect_document_file(uuid4(), SEMANTIC_ID)
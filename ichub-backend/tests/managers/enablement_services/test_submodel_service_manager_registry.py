@@ -0,0 +1,75 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+from unittest.mock import patch
+
+import pytest
+
+from managers.config.config_manager import ConfigManager
+from managers.enablement_services.adapters.http_submodel_adapter import HttpSubmodelAdapter
+from managers.enablement_services.submodel_service_manager import SubmodelServiceManager, SubmodelServiceManagerRegistry
+
+
+class TestSubmodelServiceManagerRegistry:
+    """Test cases for the shared submodel service managers."""
+
+    @pytest.fixture(autouse=True)
+    def configuration(self, tmp_path):
+        config = {
+            "provider.submodel_dispatcher.mode": "filesystem",
+            "provider.submodel_dispatcher.path": str(tmp_path)
+        }
+        # Patched on the class, other test modules replace the manager module in sys.modules
+        with patch.object(ConfigManager, "get_config", side_effect=lambda key, default=None: config.get(key, default)):
+            yield
+        SubmodelServiceManagerRegistry.close_all()
+        SubmodelServiceManager._document_caches.clear()
+
+    def test_a_single_manager_is_shared(self):
+        """Every caller gets the same manager."""
+        manager = SubmodelServiceManagerRegistry.get()
+
+        assert SubmodelServiceManagerRegistry.get() is manager
+
+    def test_close_all_closes_the_managers(self):
+        """Closing the registry closes every manager, the next manager is a new one."""
+        manager = SubmodelServiceManagerRegistry.get()
+
+        with patch.object(SubmodelServiceManager, "close") as close:
+            SubmodelServiceManagerRegistry.close_all()
+
+        close.assert_called_once()
+        assert SubmodelServiceManagerRegistry.get() is not manager
+
+
+class TestHttpSubmodelAdapterConnections:
+    """Test cases for the connection pool of HttpSubmodelAdapter."""
+
+    def test_close_closes_the_client(self):
+        """Closing the adapter closes its HTTP client, closing it twice is harmless."""
+        adapter = HttpSubmodelAdapter(base_url="https://submodels.example.com", auth_type="none", max_connections=5)
+
+        adapter.close()
+        adapter.close()
+
+        assert adapter.client.is_closed
@@ -0,0 +1,233 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+from datetime import datetime, timedelta
+from typing import Optional
+
+import pytest
+from sqlalchemy import event
+from sqlmodel import Session, SQLModel, create_engine, select
+from sqlmodel.pool import StaticPool
+
+from managers.metadata_database.repositories import BusinessPartnerRepository, CatalogPartRepository, SerializedPartRepository, TwinRepository
+from models.metadata_database.provider import models as provider_models
+from models.metadata_database.provider.models import (
+    BusinessPartner,
+    CatalogPart,
+    LegalEntity,
+    PartnerCatalogPart,
+    SerializedPart,
+    Twin
+)
+from tools.exceptions import InvalidError
+from utils.pagination import cut_page, decode_cursor, encode_cursor
+
+
+class ProviderDatabaseTest:
+    """Base class of the repository tests, using an empty SQLite database for each test."""
+
+    @pytest.fixture(autouse=True)
+    def session(self):
+        """Create an empty database for each test."""
+        self.engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        # Only the provider tables, the consumer cache tests register further tables in the same metadata
+        SQLModel.metadata.create_all(self.engine, tables=[
+            model.__table__ for model in vars(provider_models).values()
+            if isinstance(model, type) and issubclass(model, SQLModel) and hasattr(model, "__table__") and model.__module__ == provider_models.__name__
+        ])
+        with Session(self.engine) as session:
+            self.session = session
+            legal_entity = LegalEntity(bpnl="BPNL000000000001")
+            session.add(legal_entity)
+            session.commit()
+            self.legal_entity_id = legal_entity.id
+            self.part_count = 0
+            yield session
+
+    def _create_parts(self, count: int, created_date: Optional[datetime] = None):
+        """Create serialized parts, with twins created at created_date if given."""
+        for index in range(self.part_count, self.part_count + count):
+            twin = Twin(created_date=created_date) if created_date else None
+            catalog_part = CatalogPart(manufacturer_part_id=f"MPI-{index}", legal_entity_id=self.legal_entity_id, twin_id=None)
+            business_partner = BusinessPartner(name=f"Partner {index}", bpnl=f"BPNL{index:012d}")
+            partner_catalog_part = PartnerCatalogPart(catalog_part=catalog_part, business_partner=business_partner, customer_part_id=f"CPI-{index}")
+            self.session.add(SerializedPart(partner_catalog_part=partner_catalog_part, part_instance_id=f"PI-{index}", twin=twin))
+        self.session.commit()
+        self.part_count += count
+        # Start from an empty identity map, as a request does
+        self.session.expunge_all()
+
+
+# The status queries use DISTINCT ON, which SQLite ignores with a warning
+@pytest.mark.filterwarnings("ignore:DISTINCT ON is currently supported only by the PostgreSQL dialect")
+class TestPartListingQueries(ProviderDatabaseTest):
+    """Test cases for the number of queries of the part listings, using SQLite as database."""
+
+    def _count_statements(self, function) -> int:
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(self.engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            function()
+        finally:
+            event.remove(self.engine, "before_cursor_execute", before_cursor_execute)
+        return len(statements)
+
+    def _list_serialized_parts(self):
+        # Touch the relations read when building the serialized part read models
+        for serialized_part, _ in SerializedPartRepository(self.session).find_with_status(eager_load=True):
+            partner_catalog_part = serialized_part.partner_catalog_part
+            assert partner_catalog_part.catalog_part.legal_entity.bpnl
+            assert partner_catalog_part.catalog_part.manufacturer_part_id
+            assert partner_catalog_part.business_partner.name
+
+    def _list_catalog_parts(self):
+        # Touch the relations read when building the catalog part read models
+        for catalog_part, _ in CatalogPartRepository(self.session).find_by_manufacturer_id_manufacturer_part_id(
+                None, None, join_partner_catalog_parts=True, eager_load=True):
+            assert catalog_part.legal_entity.bpnl
+            for partner_catalog_part in catalog_part.partner_catalog_parts:
+                assert partner_catalog_part.business_partner.bpnl
+
+    def _statements_for(self, count: int, function) -> int:
+        self._create_parts(count)
+        return self._count_statements(function)
+
+    def test_serialized_part_listing_query_count_is_constant(self):
+        """Listing serialized parts takes the same number of queries for one part and for many more."""
+        single = self._statements_for(1, self._list_serialized_parts)
+        many = self._statements_for(20, self._list_serialized_parts)
+
+        assert single == many
+
+    def test_catalog_part_listing_query_count_is_constant(self):
+        """Listing catalog parts takes the same number of queries for one part and for many more."""
+        single = self._statements_for(1, self._list_catalog_parts)
+        many = self._statements_for(20, self._list_catalog_parts)
+
+        assert single == many
+
+
+    def _find_twins_with_manufacturer(self, batch_size: int):
+        # Touch the relations read to get the manufacturer ID of each twin
+        twins = TwinRepository(self.session).find_by_global_ids(self.global_ids, batch_size=batch_size, include_parts=True)
+        assert len(twins) == len(self.global_ids)
+        for twin in twins:
+            assert twin.serialized_part.partner_catalog_part.catalog_part.legal_entity.bpnl
+
+    def test_twins_by_global_ids_are_loaded_with_their_parts_in_batches(self):
+        """Finding twins by global IDs queries each batch of IDs once, together with their parts."""
+        self._create_parts(5, created_date=datetime(2025, 1, 1))
+        self.global_ids = list(self.session.exec(select(Twin.global_id)).all())
+        self.session.expunge_all()
+
+        one_batch = self._count_statements(lambda: self._find_twins_with_manufacturer(batch_size=5))
+        self.session.expunge_all()
+        three_batches = self._count_statements(lambda: self._find_twins_with_manufacturer(batch_size=2))
+
+        assert three_batches == 3 * one_batch
+
+
+@pytest.mark.filterwarnings("ignore:DISTINCT ON is currently supported only by the PostgreSQL dialect")
+class TestListingKeysetPagination(ProviderDatabaseTest):
+    """Test cases for the keyset pagination of the provider listings, using SQLite as database."""
+
+    @staticmethod
+    def _read_all_pages(find, limit: int, sort_key, decode):
+        """Follow the cursors until the last page, as a client does."""
+        pages = []
+        cursor = None
+        while True:
+            rows, cursor = cut_page(find(limit + 1, decode(cursor) if cursor else None), limit, sort_key)
+            pages.append(rows)
+            if not cursor:
+                return pages
+
+    def test_serialized_parts_are_paged_by_id(self):
+        """Every serialized part is returned exactly once, in pages of at most the limit."""
+        self._create_parts(20)
+        repository = SerializedPartRepository(self.session)
+
+        pages = self._read_all_pages(
+            lambda limit, after: repository.find_with_status(limit=limit, after_id=after[0] if after else None),
+            limit=7, sort_key=lambda row: (row[0].id,), decode=lambda cursor: decode_cursor(cursor, int))
+
+        assert [len(page) for page in pages] == [7, 7, 6]
+        part_ids = [serialized_part.id for page in pages for serialized_part, _ in page]
+        assert part_ids == sorted(part_ids) and len(set(part_ids)) == 20
+        assert repository.count_with_status() == 20
+
+    def test_business_partners_are_paged_by_id(self):
+        """Business partners are paged by ID, the last page does not return a cursor."""
+        self._create_parts(4)
+        repository = BusinessPartnerRepository(self.session)
+
+        pages = self._read_all_pages(
+            lambda limit, after: repository.find_all(limit=limit, after_id=after[0] if after else None),
+            limit=2, sort_key=lambda partner: (partner.id,), decode=lambda cursor: decode_cursor(cursor, int))
+
+        assert [[partner.name for partner in page] for page in pages] == [["Partner 0", "Partner 1"], ["Partner 2", "Partner 3"]]
+
+    def test_twins_are_paged_newest_first_with_id_tiebreak(self):
+        """Twins created at the same time are neither skipped nor repeated across pages."""
+        now = datetime(2025, 1, 1)
+        self._create_parts(3, created_date=now - timedelta(days=1))
+        self._create_parts(5, created_date=now)
+        repository = TwinRepository(self.session)
+
+        pages = self._read_all_pages(
+            lambda limit, after: repository.find_serialized_part_twins(limit=limit, after=after),
+            limit=3, sort_key=lambda twin: (twin.created_date, twin.id), decode=lambda cursor: decode_cursor(cursor, datetime, int))
+
+        twins = [twin for page in pages for twin in page]
+        assert [len(page) for page in pages] == [3, 3, 2]
+        assert [(twin.created_date, twin.id) for twin in twins] == sorted(((twin.created_date, twin.id) for twin in twins), reverse=True)
+        assert len({twin.id for twin in twins}) == 8
+        assert repository.count_serialized_part_twins() == 8
+
+    def test_streamed_rows_are_read_in_batches(self):
+        """With yield_per the rows are returned as an iterator over all the matching parts and twins."""
+        self._create_parts(12, created_date=datetime(2025, 1, 1))
+
+        serialized_parts = SerializedPartRepository(self.session).find_with_status(eager_load=True, yield_per=5)
+        twins = TwinRepository(self.session).find_serialized_part_twins(limit=None, yield_per=5, include_parts=True)
+
+        assert not isinstance(serialized_parts, list)
+        assert sorted(serialized_part.part_instance_id for serialized_part, _ in serialized_parts) == sorted(f"PI-{index}" for index in range(12))
+        assert len({twin.serialized_part.partner_catalog_part.business_partner.bpnl for twin in twins}) == 12
+
+    def test_cursor_round_trip(self):
+        """Cursors are opaque URL safe strings decoded back to the sort key values."""
+        cursor = encode_cursor(datetime(2025, 1, 1, 12, 30), 42)
+
+        assert cursor.replace("-", "").replace("_", "").isalnum()
+        assert decode_cursor(cursor, datetime, int) == (datetime(2025, 1, 1, 12, 30), 42)
+
+    @pytest.mark.parametrize("cursor", ["not a cursor", encode_cursor(1, 2), encode_cursor("1")])
+    def test_invalid_cursor_is_rejected(self, cursor):
+        """Malformed cursors and cursors of another listing are rejected."""
+        with pytest.raises(InvalidError):
+            decode_cursor(cursor, int)
@@ -21,11 +21,16 @@
 ###############################################################
 
 import pytest
+from contextlib import contextmanager
+from types import SimpleNamespace
 from unittest.mock import Mock, patch, MagicMock
 from uuid import UUID
 from datetime import datetime
 import sys
 
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine, select
+
 # Mock problematic imports
 mock_modules = [
     'tractusx_sdk',
@@ -60,13 +65,14 @@ mock_modules = [
 for module in mock_modules:
     sys.modules[module] = MagicMock()
 
-from services.provider.twin_management_service import TwinManagementService
+from services.provider.twin_management_service import TwinManagementService, SerializedPartTwinBulkJobManager
 from models.services.provider.twin_management import (
     CatalogPartTwinCreate,
     CatalogPartTwinRead,
     CatalogPartTwinShareCreate,
     SerializedPartTwinCreate,
     SerializedPartTwinRead,
+    SerializedPartTwinBulkStatus,
     TwinRead,
     TwinAspectCreate,
     TwinAspectRead,
@@ -74,6 +80,8 @@ from models.services.provider.twin_management import (
     TwinsAspectRegistrationMode,
 )
 from models.services.provider.part_management import SerializedPartQuery
+from models.metadata_database.provider.models import SerializedPartTwinBulkJob, SerializedPartTwinBulkJobItem
+from managers.metadata_database.repositories import SerializedPartTwinBulkJobRepository
 
 # Mock the exceptions as real exception classes
 class NotFoundError(Exception):
@@ -83,12 +91,33 @@ class NotAvailableError(Exception):
     pass
 
 
+class BulkJobDatabase:
+    """Empty SQLite database of the bulk jobs, standing in for the metadata database."""
+
+    def __init__(self):
+        self.engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        SQLModel.metadata.create_all(self.engine, tables=[SerializedPartTwinBulkJob.__table__, SerializedPartTwinBulkJobItem.__table__])
+
+    @contextmanager
+    def create_repository_manager(self):
+        with Session(self.engine) as session:
+            yield SimpleNamespace(
+                serialized_part_twin_bulk_job_repository=SerializedPartTwinBulkJobRepository(session),
+                commit=session.commit
+            )
+
+    def create_job_manager(self, **kwargs) -> SerializedPartTwinBulkJobManager:
+        return SerializedPartTwinBulkJobManager(repository_manager_factory=self.create_repository_manager, **kwargs)
+
+
 class TestTwinManagementService:
     """Test cases for TwinManagementService."""
 
     def setup_method(self):
         """Setup method called before each test."""
         self.service = TwinManagementService()
+        self.bulk_job_database = BulkJobDatabase()
+        self.service.serialized_part_twin_bulk_jobs = self.bulk_job_database.create_job_manager()
 
     @pytest.fixture
     def sample_global_id(self):
@@ -1066,3 +1095,348 @@ class TestTwinManagementService:
         )
         mock_repo.commit.assert_called_once()
         mock_repo.refresh.assert_called_once_with(mock_new_aspect)
+
+    def _mock_bulk_repo(self, mock_repo_factory, mock_twin, existing_aspects):
+        """Mock the repositories used by the bulk twin aspect creation."""
+        mock_repo = Mock()
+        mock_repo_factory.return_value.__enter__.return_value = mock_repo
+        mock_repo.twin_repository.find_by_global_ids.return_value = [mock_twin]
+        mock_repo.twin_aspect_repository.find_by_twin_ids.return_value = existing_aspects
+
+        def create_aspect(twin_id, semantic_id, submodel_id=None):
+            return Mock(id=100, twin_id=twin_id, semantic_id=semantic_id, submodel_id=UUID("00000000-0000-0000-0000-000000000100"))
+
+        mock_repo.twin_aspect_repository.create_new.side_effect = create_aspect
+        mock_repo.twin_aspect_registration_repository.create_new.return_value = Mock(
+            status=TwinAspectRegistrationStatus.PLANNED.value
+        )
+        return mock_repo
+
+    @patch('services.provider.twin_management_service.RepositoryManagerFactory.create')
+    @patch('services.provider.twin_management_service.connector_manager')
+    @patch('services.provider.twin_management_service.dtr_provider_manager')
+    @patch('services.provider.twin_management_service._create_submodel_service_manager')
+    @patch('services.provider.twin_management_service.ConfigManager')
+    def test_create_twin_aspects_bulk(self, mock_config, mock_submodel_manager, mock_dtr_provider,
+                                      mock_connector, mock_repo_factory, mock_twin, mock_enablement_service_stack,
+                                      sample_global_id, sample_semantic_id, sample_payload):
+        """Test the bulk creation registers shared resources once and reports every item."""
+        # Arrange
+        other_semantic_id = "urn:samm:io.catenax.serial_part:3.0.0#SerialPart"
+        stored_registration = Mock(status=TwinAspectRegistrationStatus.STORED.value)
+        existing_aspect = Mock(id=101, twin_id=mock_twin.id, semantic_id=other_semantic_id,
+                               submodel_id=UUID("00000000-0000-0000-0000-000000000101"))
+        existing_aspect.find_registration_by_stack_id.return_value = stored_registration
+        mock_repo = self._mock_bulk_repo(mock_repo_factory, mock_twin, [existing_aspect])
+
+        mock_config.get_config.side_effect = lambda key, default=None: (
+            {"max_workers": 4, "batch_size": 2} if key == "provider.twinManagement.bulk"
+            else {"asset_config": {"dct_type": "test"}}
+        )
+        mock_connector.provider.register_dtr_offer.return_value = ("dtr_asset_id", None, None, None)
+        mock_connector.provider.register_submodel_bundle_circular_offer.return_value = ("asset_id", "policy_id", "access_id", "contract_id")
+        mock_submodel_service = Mock()
+        mock_submodel_manager.return_value = mock_submodel_service
+
+        unknown_global_id = UUID("00000000-0000-0000-0000-000000000999")
+        twin_aspect_creates = [
+            TwinAspectCreate(globalId=sample_global_id, semanticId=sample_semantic_id, payload=sample_payload),
+            TwinAspectCreate(globalId=sample_global_id, semanticId=other_semantic_id, payload=sample_payload),
+            TwinAspectCreate(globalId=unknown_global_id, semanticId=sample_semantic_id, payload=sample_payload),
+            TwinAspectCreate(globalId=sample_global_id, semanticId=sample_semantic_id, payload=sample_payload),
+        ]
+
+        with patch.object(self.service, '_get_manufacturer_id_from_twin', return_value="BPNL123456789012"):
+            with patch.object(self.service, 'get_or_create_enablement_stack', return_value=mock_enablement_service_stack) as mock_get_stack:
+                # Act
+                results = self.service.create_twin_aspects(twin_aspect_creates)
+
+        # Assert
+        assert [result.index for result in results] == [0, 1, 2, 3]
+        assert results[0].status == TwinAspectRegistrationStatus.DTR_REGISTERED
+        assert results[0].error is None
+        assert results[1].status == TwinAspectRegistrationStatus.DTR_REGISTERED
+        assert results[1].submodel_id == existing_aspect.submodel_id
+        assert results[2].status is None and "not found" in results[2].error
+        assert results[3].status is None and "Duplicate" in results[3].error
+
+        mock_get_stack.assert_called_once()
+        mock_repo.twin_aspect_repository.create_new.assert_called_once()
+        mock_repo.twin_aspect_registration_repository.create_new.assert_called_once()
+        mock_connector.provider.register_dtr_offer.assert_called_once()
+        assert mock_connector.provider.register_submodel_bundle_circular_offer.call_count == 2
+        # The aspect already stored in the submodel service is not uploaded again
+        mock_submodel_service.upload_twin_aspect_document.assert_called_once()
+        assert mock_dtr_provider.create_submodel_descriptor.call_count == 2
+        mock_repo.twin_aspect_registration_repository.update_status.assert_called_once()
+        stack_id, twin_aspect_ids, status = mock_repo.twin_aspect_registration_repository.update_status.call_args[0]
+        assert stack_id == mock_enablement_service_stack.id
+        assert sorted(twin_aspect_ids) == [100, 101]
+        assert status == TwinAspectRegistrationStatus.DTR_REGISTERED.value
+
+    @patch('services.provider.twin_management_service.RepositoryManagerFactory.create')
+    @patch('services.provider.twin_management_service.connector_manager')
+    @patch('services.provider.twin_management_service.dtr_provider_manager')
+    @patch('services.provider.twin_management_service._create_submodel_service_manager')
+    @patch('services.provider.twin_management_service.ConfigManager')
+    def test_create_twin_aspects_bulk_keeps_reached_status_on_failure(self, mock_config, mock_submodel_manager, mock_dtr_provider,
+                                                                      mock_connector, mock_repo_factory, mock_twin,
+                                                                      mock_enablement_service_stack, sample_global_id,
+                                                                      sample_semantic_id, sample_payload):
+        """Test a failing DTR registration is reported and the reached status is stored."""
+        # Arrange
+        mock_repo = self._mock_bulk_repo(mock_repo_factory, mock_twin, [])
+        mock_config.get_config.side_effect = lambda key, default=None: (
+            default if key == "provider.twinManagement.bulk" else {"asset_config": {"dct_type": "test"}}
+        )
+        mock_connector.provider.register_dtr_offer.return_value = ("dtr_asset_id", None, None, None)
+        mock_connector.provider.register_submodel_bundle_circular_offer.return_value = ("asset_id", "policy_id", "access_id", "contract_id")
+        mock_dtr_provider.create_submodel_descriptor.side_effect = Exception("DTR unavailable")
+
+        with patch.object(self.service, '_get_manufacturer_id_from_twin', return_value="BPNL123456789012"):
+            with patch.object(self.service, 'get_or_create_enablement_stack', return_value=mock_enablement_service_stack):
+                # Act
+                results = self.service.create_twin_aspects([
+                    TwinAspectCreate(globalId=sample_global_id, semanticId=sample_semantic_id, payload=sample_payload)
+                ])
+
+        # Assert
+        assert results[0].status == TwinAspectRegistrationStatus.EDC_REGISTERED
+        assert results[0].error == "DTR unavailable"
+        mock_repo.twin_aspect_registration_repository.update_status.assert_called_once_with(
+            mock_enablement_service_stack.id, [100], TwinAspectRegistrationStatus.EDC_REGISTERED.value
+        )
+
+    @patch('services.provider.twin_management_service.RepositoryManagerFactory.create')
+    @patch('services.provider.twin_management_service.connector_manager')
+    @patch('services.provider.twin_management_service.dtr_provider_manager')
+    @patch('services.provider.twin_management_service._create_submodel_service_manager')
+    @patch('services.provider.twin_management_service.ConfigManager')
+    def test_create_twin_aspects_bulk_update_uploads_registered_aspects_again(self, mock_config, mock_submodel_manager, mock_dtr_provider,
+                                                                              mock_connector, mock_repo_factory, mock_twin,
+                                                                              mock_enablement_service_stack, sample_global_id,
+                                                                              sample_semantic_id, sample_payload):
+        """Test the update mode uploads the payload of a registered aspect again without registering it again."""
+        # Arrange
+        registered_registration = Mock(status=TwinAspectRegistrationStatus.DTR_REGISTERED.value)
+        existing_aspect = Mock(id=101, twin_id=mock_twin.id, semantic_id=sample_semantic_id,
+                               submodel_id=UUID("00000000-0000-0000-0000-000000000101"))
+        existing_aspect.find_registration_by_stack_id.return_value = registered_registration
+        mock_repo = self._mock_bulk_repo(mock_repo_factory, mock_twin, [existing_aspect])
+        mock_config.get_config.side_effect = lambda key, default=None: default
+        mock_submodel_service = Mock()
+        mock_submodel_manager.return_value = mock_submodel_service
+        twin_aspect_creates = [TwinAspectCreate(globalId=sample_global_id, semanticId=sample_semantic_id, payload=sample_payload)]
+
+        with patch.object(self.service, '_get_manufacturer_id_from_twin', return_value="BPNL123456789012"):
+            with patch.object(self.service, 'get_or_create_enablement_stack', return_value=mock_enablement_service_stack):
+                # Act
+                unchanged = self.service.create_twin_aspects(twin_aspect_creates)
+                mock_submodel_service.upload_twin_aspect_document.assert_not_called()
+                updated = self.service.create_twin_aspects(twin_aspect_creates, update=True)
+
+        # Assert
+        assert unchanged[0].updated is False
+        assert updated[0].updated is True
+        assert updated[0].status == TwinAspectRegistrationStatus.DTR_REGISTERED
+        assert updated[0].error is None
+        mock_submodel_service.upload_twin_aspect_document.assert_called_once_with(
+            existing_aspect.submodel_id, sample_semantic_id, sample_payload
+        )
+        mock_connector.provider.register_submodel_bundle_circular_offer.assert_not_called()
+        mock_dtr_provider.create_submodel_descriptor.assert_not_called()
+        mock_repo.twin_aspect_registration_repository.update_status.assert_called_once_with(
+            mock_enablement_service_stack.id, [101], TwinAspectRegistrationStatus.DTR_REGISTERED.value
+        )
+
+    def _mock_bulk_serialized_part_repo(self, mock_repo_factory, manufacturer_id, manufacturer_part_id, part_instance_id):
+        """Mock the repositories used by the bulk serialized part twin registration."""
+        mock_repo = Mock()
+        mock_repo_factory.return_value.__enter__.return_value = mock_repo
+
+        db_serialized_part = Mock()
+        db_serialized_part.part_instance_id = part_instance_id
+        db_serialized_part.van = None
+        db_serialized_part.twin = None
+        db_serialized_part.partner_catalog_part.customer_part_id = "CUSTOMER001"
+        db_serialized_part.partner_catalog_part.business_partner.bpnl = "BPNL987654321098"
+        db_serialized_part.partner_catalog_part.catalog_part.name = "Test Part"
+        db_serialized_part.partner_catalog_part.catalog_part.category = "product"
+        mock_repo.serialized_part_repository.find_by_keys.return_value = [
+            (db_serialized_part, manufacturer_id, manufacturer_part_id)
+        ]
+        mock_repo.twin_repository.create_new.return_value = Mock(
+            id=5, global_id=UUID("00000000-0000-0000-0000-000000000005"), aas_id=UUID("00000000-0000-0000-0000-000000000006")
+        )
+        mock_repo.twin_registration_repository.create_new.return_value = Mock(dtr_registered=False)
+        return mock_repo, db_serialized_part
+
+    @patch('services.provider.twin_management_service.RepositoryManagerFactory.create')
+    @patch('services.provider.twin_management_service.dtr_provider_manager')
+    @patch('services.provider.twin_management_service.ConfigManager')
+    def test_run_serialized_part_twins_job(self, mock_config, mock_dtr_provider, mock_repo_factory,
+                                           mock_enablement_service_stack, sample_manufacturer_id,
+                                           sample_manufacturer_part_id, sample_part_instance_id):
+        """Test a bulk job registers the found parts and reports the others."""
+        # Arrange
+        mock_config.get_config.side_effect = lambda key, default=None: default
+        mock_repo, db_serialized_part = self._mock_bulk_serialized_part_repo(
+            mock_repo_factory, sample_manufacturer_id, sample_manufacturer_part_id, sample_part_instance_id
+        )
+        part = SerializedPartTwinCreate(manufacturerId=sample_manufacturer_id, manufacturerPartId=sample_manufacturer_part_id,
+                                        partInstanceId=sample_part_instance_id)
+        unknown_part = SerializedPartTwinCreate(manufacturerId=sample_manufacturer_id, manufacturerPartId=sample_manufacturer_part_id,
+                                                partInstanceId="UNKNOWN")
+
+        job = self.service.create_serialized_part_twins_job([part, unknown_part, part])
+        assert job.status == "in_progress"
+
+        # Act
+        with patch.object(self.service, 'get_or_create_enablement_stack', return_value=mock_enablement_service_stack):
+            self.service.run_serialized_part_twins_job(job.job_id)
+        result = self.service.get_serialized_part_twins_job(job.job_id)
+
+        # Assert
+        assert result.status == "completed"
+        assert (result.total, result.registered, result.failed) == (3, 1, 2)
+        assert result.results[0].status == SerializedPartTwinBulkStatus.REGISTERED
+        assert result.results[0].global_id == UUID("00000000-0000-0000-0000-000000000005")
+        assert result.results[1].error == "Serialized Part not found."
+        assert "Duplicate" in result.results[2].error
+
+        mock_repo.serialized_part_repository.find_by_keys.assert_called_once()
+        mock_repo.twin_repository.create_new.assert_called_once()
+        assert db_serialized_part.twin_id == 5
+        mock_dtr_provider.create_or_update_shell_descriptor.assert_called_once()
+        assert mock_dtr_provider.create_or_update_shell_descriptor.call_args.kwargs["customer_part_ids"] == {"CUSTOMER001": "BPNL987654321098"}
+        mock_repo.twin_registration_repository.mark_dtr_registered.assert_called_once_with(mock_enablement_service_stack.id, [5])
+
+    @patch('services.provider.twin_management_service.RepositoryManagerFactory.create')
+    @patch('services.provider.twin_management_service.dtr_provider_manager')
+    @patch('services.provider.twin_management_service.ConfigManager')
+    def test_resume_serialized_part_twins_job(self, mock_config, mock_dtr_provider, mock_repo_factory,
+                                              mock_enablement_service_stack, sample_manufacturer_id,
+                                              sample_manufacturer_part_id, sample_part_instance_id):
+        """Test a resumed job retries the failed parts but not the duplicates."""
+        # Arrange
+        mock_config.get_config.side_effect = lambda key, default=None: default
+        mock_repo, _ = self._mock_bulk_serialized_part_repo(
+            mock_repo_factory, sample_manufacturer_id, sample_manufacturer_part_id, sample_part_instance_id
+        )
+        mock_dtr_provider.create_or_update_shell_descriptor.side_effect = [Exception("DTR unavailable"), None]
+        part = SerializedPartTwinCreate(manufacturerId=sample_manufacturer_id, manufacturerPartId=sample_manufacturer_part_id,
+                                        partInstanceId=sample_part_instance_id)
+        job = self.service.create_serialized_part_twins_job([part, part])
+
+        with patch('services.provider.twin_management_service.NotAvailableError', NotAvailableError):
+            with pytest.raises(NotAvailableError):
+                self.service.resume_serialized_part_twins_job(job.job_id)
+
+        with patch.object(self.service, 'get_or_create_enablement_stack', return_value=mock_enablement_service_stack):
+            self.service.run_serialized_part_twins_job(job.job_id)
+            assert self.service.get_serialized_part_twins_job(job.job_id).results[0].error == "DTR unavailable"
+            mock_repo.twin_registration_repository.mark_dtr_registered.assert_not_called()
+
+            # Act
+            resumed = self.service.resume_serialized_part_twins_job(job.job_id)
+            self.service.run_serialized_part_twins_job(job.job_id)
+
+        # Assert
+        assert resumed.results[0].status == SerializedPartTwinBulkStatus.PENDING
+        assert resumed.results[1].status == SerializedPartTwinBulkStatus.FAILED
+        result = self.service.get_serialized_part_twins_job(job.job_id)
+        assert result.results[0].status == SerializedPartTwinBulkStatus.REGISTERED
+        assert result.results[1].status == SerializedPartTwinBulkStatus.FAILED
+        mock_repo.twin_registration_repository.mark_dtr_registered.assert_called_once()
+
+    @patch('services.provider.twin_management_service.SEM_ID_SERIAL_PART_V3', "urn:samm:io.catenax.serial_part:3.0.0#SerialPart")
+    @patch('services.provider.twin_management_service.RepositoryManagerFactory.create')
+    @patch('services.provider.twin_management_service.dtr_provider_manager')
+    @patch('services.provider.twin_management_service.ConfigManager')
+    def test_run_serialized_part_twins_job_creates_serial_part_aspects(self, mock_config, mock_dtr_provider, mock_repo_factory,
+                                                                        mock_enablement_service_stack, sample_manufacturer_id,
+                                                                        sample_manufacturer_part_id, sample_part_instance_id):
+        """Test a bulk job with auto creation creates the SerialPart aspects and fails the parts whose aspect fails."""
+        # Arrange
+        mock_config.get_config.side_effect = lambda key, default=None: default
+        self._mock_bulk_serialized_part_repo(
+            mock_repo_factory, sample_manufacturer_id, sample_manufacturer_part_id, sample_part_instance_id
+        )
+        part = SerializedPartTwinCreate(manufacturerId=sample_manufacturer_id, manufacturerPartId=sample_manufacturer_part_id,
+                                        partInstanceId=sample_part_instance_id)
+        job = self.service.create_serialized_part_twins_job([part], auto_create_serial_part_aspect=True)
+
+        # Act
+        with patch.object(self.service, 'get_or_create_enablement_stack', return_value=mock_enablement_service_stack), \
+             patch.object(self.service.submodel_document_generator, 'generate_serial_part_v3', return_value={"catenaXId": "5"}), \
+             patch.object(self.service, 'create_twin_aspects', return_value=[Mock(error="Submodel service unavailable")]) as mock_create_twin_aspects:
+            self.service.run_serialized_part_twins_job(job.job_id)
+        result = self.service.get_serialized_part_twins_job(job.job_id)
+
+        # Assert
+        twin_aspect_creates = mock_create_twin_aspects.call_args.args[0]
+        assert [twin_aspect_create.semantic_id for twin_aspect_create in twin_aspect_creates] == ["urn:samm:io.catenax.serial_part:3.0.0#SerialPart"]
+        assert twin_aspect_creates[0].global_id == UUID("00000000-0000-0000-0000-000000000005")
+        assert result.results[0].status == SerializedPartTwinBulkStatus.FAILED
+        assert "Submodel service unavailable" in result.results[0].error
+
+    @patch('services.provider.twin_management_service.connector_manager')
+    def test_get_offer_registration_metrics(self, mock_connector):
+        """Test the registration cache counters of the provider connector are reported."""
+        mock_connector.provider.get_metrics.return_value = {"registrationCache": {"size": 3}}
+
+        assert self.service.get_offer_registration_metrics() == {"registrationCache": {"size": 3}}
+
+    def test_job_is_started_only_once(self):
+        """Test a finished job can be started again only once until it is finished, by any worker."""
+        jobs = self.bulk_job_database.create_job_manager()
+        other_worker_jobs = self.bulk_job_database.create_job_manager()
+        job = jobs.create_job([])
+
+        assert not other_worker_jobs.start_job(job.job_id, stale_after=900)
+        jobs.finish_job(job.job_id)
+        assert other_worker_jobs.start_job(job.job_id, stale_after=900)
+        assert not jobs.start_job(job.job_id, stale_after=900)
+
+    def test_lost_job_can_be_resumed_by_another_worker(self, sample_manufacturer_id, sample_manufacturer_part_id):
+        """Test a job whose run stopped advancing is reported and resumed from the database by another worker."""
+        jobs = self.bulk_job_database.create_job_manager()
+        parts = [
+            SerializedPartTwinCreate(manufacturerId=sample_manufacturer_id, manufacturerPartId=sample_manufacturer_part_id, partInstanceId=f"SN{index}")
+            for index in range(2)
+        ]
+        job = jobs.create_job(parts, auto_create_serial_part_aspect=True)
+        registered = job.results[0].model_copy(update={"status": SerializedPartTwinBulkStatus.REGISTERED, "global_id": UUID(int=1)})
+        jobs.save_results(job.job_id, [registered])
+
+        other_worker_jobs = self.bulk_job_database.create_job_manager()
+        reported = other_worker_jobs.get_job(job.job_id)
+        assert reported.job.status == "in_progress"
+        assert (reported.job.registered, reported.job.results[0].global_id) == (1, UUID(int=1))
+        assert reported.auto_create_serial_part_aspect
+        assert [create_input.part_instance_id for create_input in reported.create_inputs] == ["SN0", "SN1"]
+
+        assert not other_worker_jobs.start_job(job.job_id, stale_after=900)
+        assert other_worker_jobs.start_job(job.job_id, stale_after=0)
+        resumed = other_worker_jobs.get_job(job.job_id).job
+        assert [result.status for result in resumed.results] == [SerializedPartTwinBulkStatus.REGISTERED, SerializedPartTwinBulkStatus.PENDING]
+
+    def test_only_the_most_recent_finished_jobs_are_kept(self):
+        """Test the oldest finished jobs are deleted with their parts when a job is created."""
+        jobs = self.bulk_job_database.create_job_manager(max_jobs=1)
+        first = jobs.create_job([SerializedPartTwinCreate(manufacturerId="BPNL1", manufacturerPartId="MPI", partInstanceId="SN")])
+        jobs.finish_job(first.job_id)
+        second = jobs.create_job([])
+        jobs.finish_job(second.job_id)
+        jobs.create_job([])
+
+        assert jobs.get_job(first.job_id) is None
+        assert jobs.get_job(second.job_id) is not None
+        with Session(self.bulk_job_database.engine) as session:
+            assert session.exec(select(SerializedPartTwinBulkJobItem)).all() == []
+
+    def test_get_serialized_part_twins_job_not_found(self):
+        """Test an unknown bulk job raises NotFoundError."""
+        with patch('services.provider.twin_management_service.NotFoundError', NotFoundError):
+            with pytest.raises(NotFoundError):
+                self.service.get_serialized_part_twins_job("unknown")
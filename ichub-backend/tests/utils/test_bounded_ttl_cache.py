@@ -0,0 +1,82 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+from unittest.mock import patch
+
+from utils.bounded_ttl_cache import BoundedTtlCache
+
+
+class TestBoundedTtlCache:
+    """Test cases for the bounded TTL cache shared by the consumer and provider caches."""
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Once the cache is full the entry read least recently is removed."""
+        cache = BoundedTtlCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert cache.keys() == ["a", "c"]
+        assert cache.get_metrics()["evictions"] == 1
+
+    def test_size_bound_evicts_until_values_fit(self):
+        """With a sizeof function the total size of the values is bounded as well."""
+        cache = BoundedTtlCache(max_entries=10, max_size=10, sizeof=len)
+        cache.put("a", b"12345")
+        cache.put("b", b"12345")
+        cache.put("c", b"123")
+
+        assert cache.keys() == ["b", "c"]
+        assert cache.get_metrics()["bytes"] == 8
+        assert cache.put("d", b"12345678901") is False
+
+    def test_entries_expire_after_their_ttl(self):
+        """An entry is served until its own TTL, or the TTL of the cache, has passed."""
+        cache = BoundedTtlCache(ttl=60)
+        with patch("utils.bounded_ttl_cache.time.monotonic", return_value=1000):
+            cache.put("long", 1)
+            cache.put("short", 2, ttl=5)
+        with patch("utils.bounded_ttl_cache.time.monotonic", return_value=1010):
+            assert cache.get("long") == 1
+            assert cache.get("short") is None
+
+        assert cache.get_metrics()["expirations"] == 1
+
+    def test_put_with_outdated_generation_is_dropped(self):
+        """A value read before an invalidation does not overwrite it."""
+        cache = BoundedTtlCache()
+        generation = cache.generation
+        cache.invalidate("a")
+
+        assert cache.put("a", 1, generation=generation) is False
+        assert cache.get("a") is None
+
+    def test_invalidate_where_removes_matching_keys(self):
+        """Every key matching the predicate is removed."""
+        cache = BoundedTtlCache()
+        cache.put(("BPNL1", "x"), 1)
+        cache.put(("BPNL2", "y"), 2)
+        cache.invalidate_where(lambda key: key[0] == "BPNL1")
+
+        assert cache.keys() == [("BPNL2", "y")]
@@ -0,0 +1,74 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import json
+from typing import List
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from models.services.provider.part_management import CatalogPartRead, CatalogPartReadWithStatus
+from utils.streaming import NDJSON_MEDIA_TYPE, accepts_ndjson, ndjson_response
+
+
+class TestNdjsonStreaming:
+    """Test cases for the NDJSON streaming mode of the listing endpoints."""
+
+    def setup_method(self):
+        """Setup method called before each test."""
+        self.closed = False
+        app = FastAPI()
+
+        @app.get("/parts", response_model=List[CatalogPartRead])
+        async def get_parts(request: Request) -> List[CatalogPartRead]:
+            if accepts_ndjson(request):
+                return ndjson_response(self._parts(250), CatalogPartRead, chunk_size=100)
+            return list(self._parts(3))
+
+        self.client = TestClient(app)
+
+    def _parts(self, count: int):
+        try:
+            for index in range(count):
+                yield CatalogPartReadWithStatus(manufacturerId="BPNL000000000001", manufacturerPartId=f"MPI-{index}", name=f"Part {index}", status=1)
+        finally:
+            self.closed = True
+
+    def test_items_are_streamed_one_per_line(self):
+        """Every item is written as one JSON object per line, serialized as the response model."""
+        response = self.client.get("/parts", headers={"Accept": NDJSON_MEDIA_TYPE})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith(NDJSON_MEDIA_TYPE)
+        lines = response.text.splitlines()
+        assert len(lines) == 250
+        assert json.loads(lines[0]) == {"manufacturerId": "BPNL000000000001", "manufacturerPartId": "MPI-0", "name": "Part 0", "category": None, "bpns": None}
+        assert json.loads(lines[-1])["manufacturerPartId"] == "MPI-249"
+        assert self.closed
+
+    def test_json_array_without_ndjson_accept_header(self):
+        """Without the NDJSON media type in the Accept header the endpoint answers with a JSON array."""
+        response = self.client.get("/parts", headers={"Accept": "application/json"})
+
+        assert response.status_code == 200
+        assert [part["manufacturerPartId"] for part in response.json()] == ["MPI-0", "MPI-1", "MPI-2"]
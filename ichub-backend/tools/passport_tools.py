@@ -0,0 +1,103 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+from datetime import date, datetime
+from typing import Any, Dict, Optional
+
+# Marker of the Digital Product Passport semantic IDs, e.g.
+# urn:samm:io.catenax.generic.digital_product_passport:6.1.0#DigitalProductPassport
+DPP_SEMANTIC_ID_MARKER = "digital_product_passport"
+
+
+def is_passport_semantic_id(semantic_id: str) -> bool:
+    """Check if a semantic ID is the one of a Digital Product Passport."""
+    return DPP_SEMANTIC_ID_MARKER in semantic_id
+
+
+def extract_passport_id(aspect_data: Dict[str, Any]) -> str:
+    """
+    Extract the passport ID from a passport document.
+
+    Args:
+        aspect_data: The passport document
+
+    Returns:
+        The passport ID (UUID) or empty string if not found
+    """
+    return aspect_data.get("metadata", {}).get("passportId", "")
+
+
+def parse_passport_date(value: Any) -> Optional[date]:
+    """
+    Parse a date written in a passport document, as an ISO 8601 date or date and time.
+
+    Args:
+        value: The date as written in the document
+
+    Returns:
+        The date, or None if the value is missing or not an ISO 8601 date
+    """
+    if not isinstance(value, str):
+        return None
+    try:
+        return datetime.fromisoformat(value.strip()).date()
+    except ValueError:
+        return None
+
+
+def extract_issue_date(aspect_data: Dict[str, Any]) -> Optional[date]:
+    """
+    Extract the issue date from a passport document, trying the paths where it is usually stored.
+
+    Args:
+        aspect_data: The passport document
+
+    Returns:
+        The issue date or None if not found or not an ISO 8601 date
+    """
+    return parse_passport_date(
+        aspect_data.get("metadata", {}).get("issueDate")
+        or aspect_data.get("metadata", {}).get("issuedDate")
+        or aspect_data.get("issueDate")
+        or aspect_data.get("issuedDate")
+        or aspect_data.get("validity", {}).get("issueDate")
+    )
+
+
+def extract_expiration_date(aspect_data: Dict[str, Any]) -> Optional[date]:
+    """
+    Extract the expiration date from a passport document, trying the paths where it is usually stored.
+
+    Args:
+        aspect_data: The passport document
+
+    Returns:
+        The expiration date or None if not found or not an ISO 8601 date
+    """
+    return parse_passport_date(
+        aspect_data.get("metadata", {}).get("expirationDate")
+        or aspect_data.get("metadata", {}).get("validUntil")
+        or aspect_data.get("expirationDate")
+        or aspect_data.get("validUntil")
+        or aspect_data.get("validity", {}).get("expirationDate")
+    )
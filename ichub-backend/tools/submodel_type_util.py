@@ -23,13 +23,14 @@
 #################################################################################
 
 from dataclasses import dataclass
+from functools import lru_cache
 import re
 
 from tools.exceptions import InvalidError
 
 REG_EX_SEMANTIC_ID = re.compile(r'^(([^:]+):)*(\d+(?:\.\d+){1,2})#([\w\-]+)$')
 
-@dataclass
+@dataclass(frozen=True)
 class SubmodelType():
     semantic_id: str
     submodel_name: str
@@ -37,6 +38,8 @@ class SubmodelType():
     version: str
     namespace_prefix: str
 
+# The same few semantic IDs are parsed on every submodel request, invalid ones raise and are not cached
+@lru_cache(maxsize=1024)
 def get_submodel_type(semantic_id: str) -> SubmodelType:
     try:
         match: re.Match = REG_EX_SEMANTIC_ID.fullmatch(semantic_id)
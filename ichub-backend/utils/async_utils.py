@@ -22,15 +22,46 @@
 
 import asyncio
 import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
-from typing import Callable, Any
+from typing import Callable, Any, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_WORKER_THREADS = 100
+
+_blocking_executor: Optional[ThreadPoolExecutor] = None
+_blocking_executor_lock = threading.Lock()
+
+def get_blocking_executor() -> ThreadPoolExecutor:
+    """
+    Get the bounded thread pool running the blocking (database and HTTP) calls of the API endpoints.
+
+    The pool is created on first use with ``server.workers.worker_threads`` threads. It is used
+    instead of the default executor of the event loop, which is created by uvicorn and therefore
+    cannot be sized upfront.
+    """
+    global _blocking_executor
+    if _blocking_executor is None:
+        with _blocking_executor_lock:
+            if _blocking_executor is None:
+                from managers.config.config_manager import ConfigManager
+                worker_threads = ConfigManager.get_config("server.workers.worker_threads", default=DEFAULT_WORKER_THREADS)
+                if not isinstance(worker_threads, int) or worker_threads < 1:
+                    worker_threads = DEFAULT_WORKER_THREADS
+                _blocking_executor = ThreadPoolExecutor(max_workers=worker_threads, thread_name_prefix="blocking-call")
+                logger.info(f"Blocking calls run on a pool of {worker_threads} threads")
+    return _blocking_executor
+
+def _run_in_blocking_executor(bound_func: Callable) -> "asyncio.Future":
+    """Schedule a bound blocking call on the blocking call pool of the running event loop."""
+    return asyncio.get_running_loop().run_in_executor(get_blocking_executor(), bound_func)
+
 def async_blocking(func: Callable) -> Callable:
     """
-    Decorator to automatically run blocking functions in the default thread pool.
+    Decorator to automatically run blocking functions in the blocking call thread pool.
     
     This eliminates the need to manually call loop.run_in_executor in every endpoint.
     Simply decorate any blocking function call and it will automatically run asynchronously.
@@ -46,10 +77,9 @@ def async_blocking(func: Callable) -> Callable:
     """
     @wraps(func)
     async def wrapper(*args, **kwargs):
-        loop = asyncio.get_event_loop()
         # Use functools.partial to bind keyword arguments
         bound_func = functools.partial(func, *args, **kwargs)
-        return await loop.run_in_executor(None, bound_func)
+        return await _run_in_blocking_executor(bound_func)
     return wrapper
 
 async def run_blocking(func: Callable, *args, **kwargs) -> Any:
@@ -59,16 +89,18 @@ async def run_blocking(func: Callable, *args, **kwargs) -> Any:
     Usage:
         result = await run_blocking(blocking_function, arg1, arg2, kwarg1=value1)
     """
-    loop = asyncio.get_event_loop()
     # Use functools.partial to bind keyword arguments
     bound_func = functools.partial(func, *args, **kwargs)
-    return await loop.run_in_executor(None, bound_func)
+    return await _run_in_blocking_executor(bound_func)
 
 class AsyncManagerWrapper:
     """
     Universal wrapper class that automatically makes ANY manager's methods async-friendly.
     This provides a clean interface without modifying the original managers.
     
+    Async endpoints call their synchronous services through this wrapper so that a slow
+    database, DTR or EDC call runs on the blocking call pool instead of stalling the event loop.
+    
     Usage:
         # Wrap any manager
         async_manager = AsyncManagerWrapper(some_manager)
@@ -90,10 +122,9 @@ class AsyncManagerWrapper:
             raise AttributeError(f"{self._name} has no method '{method_name}'")
         
         method = getattr(self._manager, method_name)
-        loop = asyncio.get_event_loop()
         # Use functools.partial to bind keyword arguments
         bound_method = functools.partial(method, *args, **kwargs)
-        return await loop.run_in_executor(None, bound_method)
+        return await _run_in_blocking_executor(bound_method)
     
     def __getattr__(self, name):
         """Dynamically create async versions of manager methods."""
@@ -101,10 +132,9 @@ class AsyncManagerWrapper:
             original_method = getattr(self._manager, name)
             if callable(original_method):
                 async def async_method(*args, **kwargs):
-                    loop = asyncio.get_event_loop()
                     # Use functools.partial to bind keyword arguments
                     bound_method = functools.partial(original_method, *args, **kwargs)
-                    return await loop.run_in_executor(None, bound_method)
+                    return await _run_in_blocking_executor(bound_method)
                 return async_method
         raise AttributeError(f"'{self._name}' object has no attribute '{name}'")
 
@@ -0,0 +1,199 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, Hashable, List, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class BoundedTtlCache(Generic[K, V]):
+    """
+    Thread-safe least recently used cache whose entries expire after a TTL.
+
+    The cache is bounded by ``max_entries`` and, when a ``sizeof`` function is given, by the
+    total ``max_size`` of its values. Every invalidation bumps ``generation``: a value read from
+    its source before an invalidation can be put with the generation seen before the read, and is
+    then dropped instead of overwriting the invalidation with outdated data.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl: float = 300, max_size: Optional[int] = None,
+                 sizeof: Optional[Callable[[V], int]] = None, on_remove: Optional[Callable[[K, V], None]] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries (int, optional): Maximum number of cached values. Defaults to 10000.
+            ttl (float, optional): Seconds a value is served from the cache. Defaults to 300.
+            max_size (Optional[int], optional): Maximum total size of the values, measured with ``sizeof``. Defaults to None.
+            sizeof (Optional[Callable], optional): Size of a value, required to bound the cache by ``max_size``. Defaults to None.
+            on_remove (Optional[Callable], optional): Called with the key and value of every value leaving the cache,
+                evicted, expired, invalidated or replaced, e.g. to release resources held by the value. Defaults to None.
+        """
+        self.max_entries = max(1, max_entries)
+        self.ttl = ttl
+        self.max_size = max_size
+        self._sizeof = sizeof
+        self._on_remove = on_remove
+        self._entries: 'OrderedDict[K, Tuple[float, V]]' = OrderedDict()
+        self._size = 0
+        self._lock = threading.RLock()
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: K) -> Optional[V]:
+        """
+        Get a cached value.
+
+        Returns:
+            Optional[V]: The value, or None if it is not cached or expired
+        """
+        with self._lock:
+            value = self._get_fresh(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def _get_fresh(self, key: K) -> Optional[V]:
+        """Get a value that has not expired yet without counting the access, the caller holds the lock."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            self._remove(key)
+            self.expirations += 1
+            return None
+        return value
+
+    def put(self, key: K, value: V, ttl: Optional[float] = None, generation: Optional[int] = None) -> bool:
+        """
+        Store a value, evicting the least recently used entries if the cache is full.
+
+        Args:
+            key (K): Key of the value
+            value (V): The value
+            ttl (Optional[float], optional): Seconds the value is served, the TTL of the cache by default
+            generation (Optional[int], optional): Value of ``generation`` before the value was read from its source,
+                the value is dropped if the cache was invalidated meanwhile
+
+        Returns:
+            bool: Whether the value was stored
+        """
+        size = self._sizeof(value) if self._sizeof is not None else 0
+        if self.max_size is not None and size > self.max_size:
+            return False
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return False
+            self._remove(key)
+            self._entries[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+            self._size += size
+            while len(self._entries) > self.max_entries or (self.max_size is not None and self._size > self.max_size):
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self.evictions += 1
+            return True
+
+    def invalidate(self, key: K) -> None:
+        """Remove a value."""
+        with self._lock:
+            self.generation += 1
+            self._remove(key)
+
+    def invalidate_where(self, predicate: Callable[[K], bool]) -> None:
+        """Remove the values whose key matches a predicate."""
+        with self._lock:
+            self.generation += 1
+            for key in [key for key in self._entries if predicate(key)]:
+                self._remove(key)
+
+    def clear(self) -> None:
+        """Remove every cached value."""
+        with self._lock:
+            self.generation += 1
+            for key in list(self._entries):
+                self._remove(key)
+
+    def purge_expired(self) -> int:
+        """
+        Remove every expired value now instead of when it is next accessed.
+
+        Returns:
+            int: The number of removed values
+        """
+        with self._lock:
+            now = time.monotonic()
+            expired = [key for key, (expires_at, _) in self._entries.items() if now >= expires_at]
+            for key in expired:
+                self._remove(key)
+            self.expirations += len(expired)
+            return len(expired)
+
+    def keys(self) -> List[K]:
+        """Get the keys of the cached values, expired ones included."""
+        with self._lock:
+            return list(self._entries)
+
+    def _remove(self, key: K) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        if self._sizeof is not None:
+            self._size -= self._sizeof(entry[1])
+        if self._on_remove is not None:
+            self._on_remove(key, entry[1])
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get the cache counters.
+
+        Returns:
+            Dict[str, Any]: Size, limits and hit/miss/eviction/expiration counters
+        """
+        with self._lock:
+            metrics = {
+                "size": len(self._entries),
+                "maxEntries": self.max_entries,
+                "ttlSeconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations
+            }
+            if self._sizeof is not None:
+                metrics["bytes"] = self._size
+                metrics["maxBytes"] = self.max_size
+            return metrics
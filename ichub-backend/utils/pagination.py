@@ -0,0 +1,155 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Generic, List, Optional, Sequence, Tuple, TypeVar
+
+from fastapi import Query, Response
+
+from tools.exceptions import InvalidError
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+TOTAL_COUNT_HEADER = "X-Total-Count"
+
+
+@dataclass
+class Page(Generic[T]):
+    """A page of a listing, with the cursor of the next page and optionally the total number of items."""
+    items: List[T]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+
+
+class PageQuery:
+    """
+    Pagination query parameters of the listing endpoints.
+
+    Without ``limit`` and ``cursor`` the endpoints return their default listing (usually all the items)
+    as before. The cursor of the next page is returned in the ``X-Next-Cursor`` header, the total in the
+    ``X-Total-Count`` header.
+    """
+
+    def __init__(self,
+        limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description=f"Maximum number of items returned, at most {MAX_PAGE_SIZE}."),
+        cursor: Optional[str] = Query(None, description="Cursor of the page to return, taken from the X-Next-Cursor header of the previous page."),
+        include_total: bool = Query(False, alias="includeTotal", description="Count all the matching items and return the total in the X-Total-Count header.")):
+        self.limit = limit
+        self.cursor = cursor
+        self.include_total = include_total
+
+    def get_limit(self, default: Optional[int] = None) -> Optional[int]:
+        """
+        Get the page size.
+
+        Args:
+            default (Optional[int], optional): Page size of the endpoint when no limit is given, None for the whole listing.
+
+        Returns:
+            Optional[int]: The page size, at least DEFAULT_PAGE_SIZE when only a cursor is given
+        """
+        if self.limit is not None:
+            return self.limit
+        if default is None and self.cursor is not None:
+            return DEFAULT_PAGE_SIZE
+        return default
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    Encode the sort key values of the last item of a page into an opaque cursor.
+
+    Args:
+        *values: Sort key values, integers, strings or datetimes
+
+    Returns:
+        str: URL safe cursor
+    """
+    payload = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *types: type) -> Tuple[Any, ...]:
+    """
+    Decode a cursor created by ``encode_cursor``.
+
+    Args:
+        cursor (str): The cursor
+        *types (type): Expected types of the sort key values
+
+    Returns:
+        Tuple[Any, ...]: The sort key values
+
+    Raises:
+        InvalidError: If the cursor is malformed or was created for another listing
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if not isinstance(payload, list) or len(payload) != len(types):
+            raise ValueError("unexpected number of values")
+        values = []
+        for value, value_type in zip(payload, types):
+            if value_type is datetime:
+                value = datetime.fromisoformat(value)
+            elif not isinstance(value, value_type) or isinstance(value, bool):
+                raise ValueError("unexpected value type")
+            values.append(value)
+        return tuple(values)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise InvalidError(f"Invalid pagination cursor: {e}") from e
+
+
+def cut_page(rows: List[T], limit: Optional[int], sort_key: Callable[[T], Sequence[Any]]) -> Tuple[List[T], Optional[str]]:
+    """
+    Cut the extra row fetched to detect a further page and create the cursor of that page.
+
+    The repositories are queried with ``limit + 1`` rows, so a further page exists only if more than ``limit`` rows came back.
+
+    Args:
+        rows (List[T]): Rows returned by the repository
+        limit (Optional[int]): Page size, None for an unpaged listing
+        sort_key (Callable): Returns the sort key values of a row
+
+    Returns:
+        Tuple[List[T], Optional[str]]: The rows of the page and the cursor of the next page, if any
+    """
+    if limit is None or len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(*sort_key(rows[-1]))
+
+
+def set_page_headers(response: Response, page: Page) -> None:
+    """Return the cursor of the next page and the total, if counted, in the response headers."""
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    if page.total is not None:
+        response.headers[TOTAL_COUNT_HEADER] = str(page.total)
@@ -0,0 +1,88 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+from itertools import islice
+from typing import Any, AsyncIterator, Dict, Iterator, Type
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+
+from utils.async_utils import run_blocking
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Rows fetched from the database cursor at once by the streaming listings
+STREAM_BATCH_SIZE = 500
+# Items serialized per chunk written to the client
+STREAM_CHUNK_SIZE = 100
+
+ndjson_responses: Dict[int | str, Dict[str, Any]] = {
+    200: {
+        "description": f"The items, as a JSON array or, if the request accepts {NDJSON_MEDIA_TYPE}, streamed one JSON object per line",
+        "content": {NDJSON_MEDIA_TYPE: {}}
+    }
+}
+
+
+def accepts_ndjson(request: Request) -> bool:
+    """Check if the client asked for the streaming NDJSON mode of a listing."""
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def _next_chunk(items: Iterator[Any], adapter: TypeAdapter, chunk_size: int) -> bytes:
+    """Serialize the next items as NDJSON lines, an empty chunk once the items are exhausted."""
+    return b"".join(adapter.dump_json(item, by_alias=True) + b"\n" for item in islice(items, chunk_size))
+
+
+def ndjson_response(items: Iterator[Any], model: Type[Any], chunk_size: int = STREAM_CHUNK_SIZE) -> StreamingResponse:
+    """
+    Stream items to the client as NDJSON, one JSON object per line.
+
+    The items are usually a generator reading a server-side database cursor. They are pulled and
+    serialized in chunks on the blocking call pool, so only one chunk is held in memory at a time
+    and the event loop is never blocked. The generator is closed when the client disconnects.
+
+    Args:
+        items (Iterator[Any]): Items to stream
+        model (Type[Any]): Response model the items are serialized as, like the response_model of the JSON mode
+        chunk_size (int, optional): Items serialized per chunk. Defaults to STREAM_CHUNK_SIZE.
+
+    Returns:
+        StreamingResponse: The streaming response
+    """
+    adapter = TypeAdapter(model)
+
+    async def stream() -> AsyncIterator[bytes]:
+        try:
+            while True:
+                chunk = await run_blocking(_next_chunk, items, adapter, chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            close = getattr(items, "close", None)
+            if close is not None:
+                await run_blocking(close)
+
+    return StreamingResponse(stream(), media_type=NDJSON_MEDIA_TYPE)